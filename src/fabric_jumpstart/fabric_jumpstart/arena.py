@@ -0,0 +1,325 @@
+"""Managed scratch space for install working directories.
+
+Every clone or staged copy is created inside one arena root through
+:func:`fabric_jumpstart.utils.create_working_directory`. Directories created
+while an install holds a :meth:`WorkspaceArena.lease` belong to that install
+and are removed when it finishes (optionally kept on failure for debugging).
+A disk quota evicts the oldest directories not owned by a running install.
+The arena keeps a running total of the bytes it holds and only walks its
+directories to evict once that total exceeds the quota.
+"""
+
+import contextvars
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the arena root directory.
+SCRATCH_DIR_ENV_VAR = "FABRIC_JUMPSTART_SCRATCH_DIR"
+# Environment variable overriding the arena disk quota, in megabytes.
+SCRATCH_QUOTA_ENV_VAR = "FABRIC_JUMPSTART_SCRATCH_QUOTA_MB"
+
+_DEFAULT_QUOTA_MB = 4096
+# Directories from other (possibly still running) processes are only evicted
+# once they are at least this old.
+_FOREIGN_MIN_AGE_SECONDS = 6 * 3600
+
+_current_lease: contextvars.ContextVar[Optional["Lease"]] = contextvars.ContextVar(
+    "fabric_jumpstart_arena_lease", default=None
+)
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class Lease:
+    """Ownership of the directories created during one install (or prewarm)."""
+
+    def __init__(self, arena: "WorkspaceArena", owner: str):
+        self.arena = arena
+        self.owner = owner
+        self.paths: List[Path] = []
+
+    @contextmanager
+    def activate(self) -> Iterator["Lease"]:
+        """Make this the current lease for directories allocated inside the block."""
+        token = _current_lease.set(self)
+        try:
+            yield self
+        finally:
+            _current_lease.reset(token)
+
+    def release(self, keep: bool = False) -> None:
+        """Remove the owned directories, or with ``keep`` leave them unowned."""
+        self.arena._release(self, keep)
+
+
+class WorkspaceArena:
+    """Allocates, tracks and reclaims install scratch directories.
+
+    Args:
+        root: Arena directory; defaults to ``FABRIC_JUMPSTART_SCRATCH_DIR`` or
+            ``<tempdir>/fabric-jumpstart``
+        quota_bytes: Disk quota; defaults to ``FABRIC_JUMPSTART_SCRATCH_QUOTA_MB``
+            or 4 GiB. None-or-zero from the environment disables eviction.
+    """
+
+    def __init__(self, root: Optional[Path] = None, quota_bytes: Optional[int] = None):
+        if root is None:
+            env_root = os.environ.get(SCRATCH_DIR_ENV_VAR, "").strip()
+            root = Path(env_root) if env_root else Path(tempfile.gettempdir()) / "fabric-jumpstart"
+        if quota_bytes is None:
+            env_quota = os.environ.get(SCRATCH_QUOTA_ENV_VAR, "").strip()
+            quota_bytes = int(float(env_quota) * 1024 * 1024) if env_quota else _DEFAULT_QUOTA_MB * 1024 * 1024
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self._owned: Dict[Path, Optional[Lease]] = {}
+        # Last measured size per directory and their running total (None until
+        # the first walk). Directories in use are measured when released.
+        self._sizes: Dict[Path, int] = {}
+        self._held: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = {"allocated": 0, "removed": 0, "kept": 0, "evicted": 0, "evicted_bytes": 0}
+
+    # ------------------------------------------------------------------
+    # Allocation and ownership
+    # ------------------------------------------------------------------
+
+    def allocate(self, prefix: str = "fabric-jumpstart-") -> Path:
+        """Create a scratch directory, owned by the current lease if any.
+
+        Args:
+            prefix: Directory name prefix
+
+        Returns:
+            Path to the new, empty directory
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = Path(tempfile.mkdtemp(prefix=prefix, dir=self.root))
+        lease = _current_lease.get()
+        with self._lock:
+            self._owned[path] = lease
+            self._stats["allocated"] += 1
+            if lease is not None:
+                lease.paths.append(path)
+        if self._over_quota():
+            self.enforce_quota()
+        return path
+
+    def adopt(self, path: Path) -> None:
+        """Transfer a directory (e.g. a prewarmed copy) to the current lease.
+
+        Without a current lease the directory becomes unowned and therefore
+        eligible for quota eviction.
+        """
+        lease = _current_lease.get()
+        path = Path(path)
+        with self._lock:
+            previous = self._owned.get(path)
+            if previous is not None and path in previous.paths:
+                previous.paths.remove(path)
+            self._owned[path] = lease
+            if lease is not None:
+                lease.paths.append(path)
+        if lease is None:
+            self._measure([path])
+
+    def open_lease(self, owner: str) -> Lease:
+        """Create a lease whose lifetime the caller manages (see :meth:`lease`)."""
+        return Lease(self, owner)
+
+    @contextmanager
+    def lease(self, owner: str, keep_on_failure: bool = False) -> Iterator[Lease]:
+        """Own every directory allocated inside the block and release them at exit.
+
+        Directories are removed when the block exits. If it exits with an
+        exception and ``keep_on_failure`` is True they are kept (and logged)
+        for debugging; kept directories become eligible for quota eviction.
+
+        Args:
+            owner: Label used in logs (e.g. the jumpstart logical id)
+            keep_on_failure: Keep the directories when the block raises
+        """
+        lease = self.open_lease(owner)
+        failed = False
+        try:
+            with lease.activate():
+                yield lease
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            lease.release(keep=failed and keep_on_failure)
+
+    def _release(self, lease: Lease, keep: bool) -> None:
+        with self._lock:
+            paths = list(lease.paths)
+            lease.paths.clear()
+            for path in paths:
+                self._owned[path] = None
+        if keep:
+            if paths:
+                logger.info("Keeping scratch directories of '%s': %s", lease.owner, [str(p) for p in paths])
+            with self._lock:
+                self._stats["kept"] += len(paths)
+            self._measure(paths)
+            if self._over_quota():
+                self.enforce_quota()
+            return
+        for path in paths:
+            self._remove(path)
+            with self._lock:
+                self._stats["removed"] += 1
+
+    def _remove(self, path: Path) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        with self._lock:
+            self._owned.pop(path, None)
+            size = self._sizes.pop(path, 0)
+            if self._held is not None:
+                self._held -= size
+
+    # ------------------------------------------------------------------
+    # Quota
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> List[Path]:
+        try:
+            return [p for p in self.root.iterdir() if p.is_dir()]
+        except FileNotFoundError:
+            return []
+
+    def _in_use(self) -> Set[Path]:
+        with self._lock:
+            return {p for p, lease in self._owned.items() if lease is not None}
+
+    def _measure(self, paths: Iterable[Path]) -> None:
+        """Update the running total with the current size of ``paths``."""
+        sizes = {p: _tree_size(p) for p in paths}
+        with self._lock:
+            for path, size in sizes.items():
+                if self._held is not None:
+                    self._held += size - self._sizes.get(path, 0)
+                self._sizes[path] = size
+
+    def _over_quota(self) -> bool:
+        """Whether the running total (or a missing first walk) calls for :meth:`enforce_quota`."""
+        if not self.quota_bytes:
+            return False
+        with self._lock:
+            return self._held is None or self._held > self.quota_bytes
+
+    def enforce_quota(self) -> int:
+        """Evict the oldest unowned directories until the arena fits its quota.
+
+        Directories owned by a running install are never evicted. Directories
+        unknown to this process (left by other processes) are only evicted
+        once they are older than a few hours. Walks the whole arena and resets
+        the running total; allocation and release only call this once the
+        total exceeds the quota.
+
+        Returns:
+            Number of bytes freed
+        """
+        if not self.quota_bytes:
+            return 0
+        entries = self._entries()
+        sizes = {p: _tree_size(p) for p in entries}
+        total = sum(sizes.values())
+        with self._lock:
+            self._sizes = dict(sizes)
+            self._held = total
+        if total <= self.quota_bytes:
+            return 0
+
+        in_use = self._in_use()
+        with self._lock:
+            known = set(self._owned)
+        now = time.time()
+        candidates = []
+        for path in entries:
+            if path in in_use:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if path not in known and now - mtime < _FOREIGN_MIN_AGE_SECONDS:
+                continue
+            candidates.append((mtime, path))
+
+        freed = 0
+        for _, path in sorted(candidates):
+            if total - freed <= self.quota_bytes:
+                break
+            logger.info("Evicting scratch directory %s (%d bytes) to stay under quota", path, sizes[path])
+            self._remove(path)
+            freed += sizes[path]
+            with self._lock:
+                self._stats["evicted"] += 1
+                self._stats["evicted_bytes"] += sizes[path]
+        if total - freed > self.quota_bytes:
+            logger.warning(
+                "Scratch space %s holds %d bytes, above its %d byte quota, but the rest is in use",
+                self.root, total - freed, self.quota_bytes,
+            )
+        return freed
+
+    def stats(self) -> Dict[str, int]:
+        """Return arena metrics.
+
+        Returns:
+            Dict with ``bytes_held`` and ``directories`` (current arena
+            contents), ``in_use`` (directories owned by running installs),
+            ``quota_bytes`` and lifetime ``allocated``, ``removed``, ``kept``,
+            ``evicted`` and ``evicted_bytes`` counters
+        """
+        entries = self._entries()
+        with self._lock:
+            counters = dict(self._stats)
+        return {
+            **counters,
+            "bytes_held": sum(_tree_size(p) for p in entries),
+            "directories": len(entries),
+            "in_use": len(self._in_use()),
+            "quota_bytes": self.quota_bytes or 0,
+        }
+
+
+_arena: Optional[WorkspaceArena] = None
+_arena_lock = threading.Lock()
+
+
+def get_arena() -> WorkspaceArena:
+    """Return the process-wide scratch arena."""
+    global _arena
+    arena = _arena
+    if arena is None:
+        with _arena_lock:
+            if _arena is None:
+                _arena = WorkspaceArena()
+            arena = _arena
+    return arena
+
+
+def reset_arena() -> None:
+    """Discard the process-wide arena (directories on disk are left alone)."""
+    global _arena
+    with _arena_lock:
+        _arena = None
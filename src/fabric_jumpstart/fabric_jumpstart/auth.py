@@ -0,0 +1,187 @@
+"""Process-wide token cache shared by every install phase.
+
+Credential construction and token acquisition are expensive (``AzureCliCredential``
+spawns the ``az`` CLI for every call), so a single :class:`TokenManager`
+resolves the credential once and caches access tokens per scope until they
+near expiry. Tokens entering the refresh window are renewed on a background
+thread while the cached token keeps being served.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FABRIC_API_SCOPE = "https://api.fabric.microsoft.com/.default"
+STORAGE_SCOPE = "https://storage.azure.com/.default"
+
+# A cached token is never served with less than this many seconds left.
+_EXPIRY_MARGIN_SECONDS = 120
+# Tokens with less than this many seconds left are refreshed in the background.
+_REFRESH_AHEAD_SECONDS = 600
+
+_CacheKey = Tuple[Tuple[str, ...], Optional[str]]
+
+
+class TokenManager:
+    """Caching ``TokenCredential`` wrapper with hit/miss counters.
+
+    Implements ``get_token`` so it can be passed anywhere a credential is
+    expected (e.g. ``FabricWorkspace(token_credential=...)``).
+
+    Args:
+        credential: Underlying credential; resolved lazily via
+            :func:`fabric_jumpstart.utils.resolve_token_credential` when None
+        expiry_margin: Seconds before expiry at which a token is no longer served
+        refresh_ahead: Seconds before expiry at which a background refresh starts
+    """
+
+    def __init__(
+        self,
+        credential: Any = None,
+        expiry_margin: float = _EXPIRY_MARGIN_SECONDS,
+        refresh_ahead: float = _REFRESH_AHEAD_SECONDS,
+    ):
+        self._credential = credential
+        self._expiry_margin = expiry_margin
+        self._refresh_ahead = max(refresh_ahead, expiry_margin)
+        self._tokens: Dict[_CacheKey, Any] = {}
+        self._key_locks: Dict[_CacheKey, threading.Lock] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "background_refreshes": 0, "failures": 0}
+
+    @property
+    def credential(self) -> Any:
+        """The underlying credential, resolved on first use."""
+        if self._credential is None:
+            with self._lock:
+                if self._credential is None:
+                    from . import utils
+
+                    self._credential = utils.resolve_token_credential()
+        return self._credential
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> Any:
+        """Return a cached ``AccessToken`` for the scopes, acquiring one if needed.
+
+        Args:
+            *scopes: Token scopes (e.g. ``FABRIC_API_SCOPE``)
+            **kwargs: Passed to the underlying credential (``tenant_id`` is part
+                of the cache key)
+
+        Returns:
+            An ``AccessToken`` with ``token`` and ``expires_on`` attributes
+        """
+        key: _CacheKey = (tuple(scopes), kwargs.get("tenant_id"))
+        token = self._tokens.get(key)
+        if token is not None and self._remaining(token) > self._expiry_margin:
+            self._count("hits")
+            if self._remaining(token) <= self._refresh_ahead:
+                self._refresh_in_background(key, scopes, kwargs)
+            return token
+
+        with self._key_lock(key):
+            # Another thread may have acquired it while we waited.
+            token = self._tokens.get(key)
+            if token is not None and self._remaining(token) > self._expiry_margin:
+                self._count("hits")
+                return token
+            self._count("misses")
+            return self._acquire(key, scopes, kwargs)
+
+    def _acquire(self, key: _CacheKey, scopes: Tuple[str, ...], kwargs: Dict[str, Any]) -> Any:
+        try:
+            token = self.credential.get_token(*scopes, **kwargs)
+        except Exception:
+            self._count("failures")
+            raise
+        self._tokens[key] = token
+        logger.debug("Acquired token for %s (expires in %ds)", ", ".join(scopes), self._remaining(token))
+        return token
+
+    def _refresh_in_background(self, key: _CacheKey, scopes: Tuple[str, ...], kwargs: Dict[str, Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _worker():
+            try:
+                with self._key_lock(key):
+                    self._acquire(key, scopes, kwargs)
+                self._count("background_refreshes")
+            except Exception as e:
+                logger.debug("Background token refresh failed for %s: %s", ", ".join(scopes), e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_worker, name="fabric-jumpstart-token-refresh", daemon=True).start()
+
+    def _key_lock(self, key: _CacheKey) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _remaining(token: Any) -> float:
+        return float(getattr(token, "expires_on", 0) or 0) - time.time()
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters for diagnostics.
+
+        Returns:
+            Dict with ``hits``, ``misses``, ``background_refreshes``,
+            ``failures`` and ``cached_scopes``
+        """
+        with self._lock:
+            return {**self._stats, "cached_scopes": len(self._tokens)}
+
+    def clear(self) -> None:
+        """Drop cached tokens (the resolved credential is kept)."""
+        with self._lock:
+            self._tokens.clear()
+
+
+_manager: Optional[TokenManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_token_manager() -> TokenManager:
+    """Return the process-wide token manager."""
+    global _manager
+    manager = _manager
+    if manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = TokenManager()
+            manager = _manager
+    return manager
+
+
+def reset_token_manager() -> None:
+    """Discard the process-wide manager, forcing credential re-resolution.
+
+    Use after changing ``FABRIC_JUMPSTART_TOKEN_CREDENTIAL`` in a running kernel.
+    """
+    global _manager
+    with _manager_lock:
+        _manager = None
+
+
+def set_token_manager(manager: Optional[TokenManager]) -> Optional[TokenManager]:
+    """Install ``manager`` as the process-wide manager (None resets it).
+
+    Returns:
+        The manager it replaces, for restoring later
+    """
+    global _manager
+    with _manager_lock:
+        previous, _manager = _manager, manager
+    return previous
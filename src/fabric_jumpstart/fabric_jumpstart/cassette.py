@@ -0,0 +1,370 @@
+"""Record and replay the HTTP exchanges of an install.
+
+``record_http(path)`` captures every request sent through ``requests``
+while the block runs: jumpstart's own Fabric, OneLake and telemetry calls,
+and fabric_cicd's Fabric API calls. It saves them to a JSON cassette on
+exit. ``replay_http(path)`` answers the same requests from the cassette
+without touching the network. Each response waits for its recorded latency
+multiplied by ``latency_scale``, and ``Retry-After`` hints are scaled to
+match. The process-wide token manager is swapped for a stub credential
+while replaying, so no sign-in is needed.
+
+Secrets are scrubbed before anything is written:
+- token-endpoint exchanges are not recorded
+- authorization and cookie headers are dropped
+- SAS signatures and token query parameters are redacted
+- secret JSON fields and anything shaped like a JWT are replaced
+
+Requests are matched on method and URL. Repeated requests, such as polling
+a long-running operation, get the recorded responses in order, and the
+last one again once they run out. Request bodies are not compared. Git
+clones are not HTTP traffic here; point the jumpstart's source at a local
+clone for fully offline runs.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+REDACTED = "REDACTED"
+REPLAY_TOKEN = "replayed-token"
+
+# Token endpoints (Entra ID, managed identity) are passed through and never recorded.
+_AUTH_HOSTS = ("login.microsoftonline.com", "login.windows.net", "169.254.169.254")
+_SECRET_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie", "set-cookie", "x-ms-authorization-auxiliary"})
+_SECRET_PARAMS = frozenset({"sig", "code", "token", "access_token", "client_secret"})
+_SECRET_FIELDS = frozenset({
+    "access_token", "refresh_token", "id_token", "client_secret", "password",
+    "accesstoken", "sastoken", "connectionstring",
+})
+_JWT_RE = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+# Headers describing the wire encoding of a body rather than the decoded body kept here.
+_WIRE_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length", "connection", "keep-alive"})
+# Seconds to wait for queued telemetry to go out before a cassette is closed.
+_TELEMETRY_FLUSH_SECONDS = 5.0
+
+_Key = Tuple[str, str]
+
+
+class CassetteMissError(RuntimeError):
+    """A request had no recorded response in the cassette being replayed."""
+
+
+def scrub_url(url: str) -> str:
+    """Redact secret query parameters (SAS signatures, tokens) from a URL."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (name, REDACTED if name.lower() in _SECRET_PARAMS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _scrub_json(value: Any) -> Tuple[Any, bool]:
+    if isinstance(value, dict):
+        changed = False
+        scrubbed = {}
+        for name, item in value.items():
+            if isinstance(name, str) and name.lower() in _SECRET_FIELDS:
+                scrubbed[name], changed = REDACTED, True
+            else:
+                scrubbed[name], item_changed = _scrub_json(item)
+                changed = changed or item_changed
+        return scrubbed, changed
+    if isinstance(value, list):
+        items = [_scrub_json(item) for item in value]
+        return [item for item, _ in items], any(changed for _, changed in items)
+    return value, False
+
+
+def scrub_text(text: str) -> str:
+    """Redact secret JSON fields and JWT-shaped strings from a body."""
+    try:
+        document = json.loads(text)
+    except ValueError:
+        pass
+    else:
+        document, changed = _scrub_json(document)
+        if changed:
+            text = json.dumps(document)
+    return _JWT_RE.sub(REDACTED, text)
+
+
+def _match_key(method: str, url: str) -> _Key:
+    return method.upper(), scrub_url(url)
+
+
+def _body_fields(body: Any, headers: Any) -> Dict[str, Any]:
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        return {"body_bytes": len(body), "body_sha256": hashlib.sha256(body).hexdigest()}
+    length = headers.get("Content-Length")
+    return {"body_bytes": int(length) if length and length.isdigit() else None, "body_sha256": None}
+
+
+def load_cassette(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a cassette written by :func:`record_http`.
+
+    Raises:
+        ValueError: If the file is not a cassette of a supported version
+    """
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(document, dict) or document.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"{path} is not a version {CASSETTE_VERSION} HTTP cassette")
+    return document
+
+
+class _Recorder:
+    """Passes requests through and keeps scrubbed copies of each exchange."""
+
+    def __init__(self):
+        self.interactions: List[Dict[str, Any]] = []
+        self._origin = time.monotonic()
+        self._lock = threading.Lock()
+
+    def send(self, send: Any, adapter: HTTPAdapter, request: Any, *args: Any, **kwargs: Any) -> Any:
+        offset = time.monotonic() - self._origin
+        start = time.perf_counter()
+        response = send(adapter, request, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if urlsplit(request.url).hostname in _AUTH_HOSTS:
+            return response
+        # Reading the body here leaves it cached on the response for the caller.
+        content = response.content or b""
+        body: Dict[str, Any]
+        try:
+            body = {"body": scrub_text(content.decode("utf-8"))}
+        except UnicodeDecodeError:
+            body = {"body_base64": base64.b64encode(content).decode("ascii")}
+        interaction = {
+            "offset_seconds": round(offset, 4),
+            "elapsed_seconds": round(elapsed, 4),
+            "request": {
+                "method": request.method.upper(),
+                "url": scrub_url(request.url),
+                **_body_fields(request.body, request.headers),
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: _JWT_RE.sub(REDACTED, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _SECRET_HEADERS and name.lower() not in _WIRE_HEADERS
+                },
+                **body,
+            },
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+        return response
+
+    def save(self, path: Union[str, Path]) -> None:
+        with self._lock:
+            interactions = sorted(self.interactions, key=lambda i: i["offset_seconds"])
+        document = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "interactions": interactions,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document, indent=1), encoding="utf-8")
+
+
+class _Player:
+    """Answers requests from recorded exchanges, in order per method and URL.
+
+    Args:
+        interactions: Recorded exchanges from a cassette
+        latency_scale: Multiplier on recorded latencies and ``Retry-After`` hints
+            (1.0 replays them as recorded, 0 answers immediately)
+        source: Cassette name used in error messages
+    """
+
+    def __init__(self, interactions: List[Dict[str, Any]], latency_scale: float = 1.0, source: str = ""):
+        self.latency_scale = latency_scale
+        self.source = source
+        self.replayed = 0
+        self.repeated = 0
+        self._queues: Dict[_Key, Deque[Dict[str, Any]]] = {}
+        self._last: Dict[_Key, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        for interaction in interactions:
+            request = interaction["request"]
+            self._queues.setdefault(_match_key(request["method"], request["url"]), deque()).append(interaction)
+
+    def unused(self) -> int:
+        """Return how many recorded exchanges were never replayed."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def send(self, send: Any, adapter: HTTPAdapter, request: Any, *args: Any, **kwargs: Any) -> Any:
+        key = _match_key(request.method, request.url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = self._last[key] = queue.popleft()
+                self.replayed += 1
+            else:
+                interaction = self._last.get(key)
+                self.repeated += interaction is not None
+        if interaction is None:
+            raise CassetteMissError(f"No recorded response for {key[0]} {key[1]} in cassette {self.source}")
+        delay = interaction["elapsed_seconds"] * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return self._response(interaction["response"], request, delay)
+
+    def _response(self, recorded: Dict[str, Any], request: Any, elapsed: float) -> requests.Response:
+        if "body_base64" in recorded:
+            content = base64.b64decode(recorded["body_base64"])
+        else:
+            content = recorded.get("body", "").encode("utf-8")
+        headers = CaseInsensitiveDict(recorded.get("headers") or {})
+        headers["Content-Length"] = str(len(content))
+        retry_after = headers.get("Retry-After")
+        if retry_after and self.latency_scale != 1.0:
+            try:
+                headers["Retry-After"] = f"{float(retry_after) * self.latency_scale:g}"
+            except ValueError:
+                pass
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("reason") or ""
+        response.headers = headers
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=elapsed)
+        return response
+
+
+class _ReplayCredential:
+    """Credential returning a fixed token, so replays need no sign-in."""
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> Any:
+        from azure.core.credentials import AccessToken
+
+        return AccessToken(REPLAY_TOKEN, int(time.time()) + 3600)
+
+
+_active: Optional[Union[_Recorder, _Player]] = None
+_active_lock = threading.Lock()
+_original_send = HTTPAdapter.send
+
+
+def _cassette_send(adapter: HTTPAdapter, request: Any, *args: Any, **kwargs: Any) -> Any:
+    handler = _active
+    if handler is None:
+        return _original_send(adapter, request, *args, **kwargs)
+    return handler.send(_original_send, adapter, request, *args, **kwargs)
+
+
+def cassette_active() -> bool:
+    """Return whether HTTP traffic is being recorded or replayed."""
+    return _active is not None
+
+
+def _reset_pooled_sessions() -> None:
+    # Pooled HTTP/2 sessions bypass requests; new sessions are created for the cassette.
+    from .http_client import get_http_client
+
+    get_http_client().close()
+
+
+@contextmanager
+def _activate(handler: Union[_Recorder, _Player]) -> Iterator[None]:
+    global _active
+    with _active_lock:
+        if _active is not None:
+            raise RuntimeError("An HTTP cassette is already being recorded or replayed")
+        _active = handler
+        HTTPAdapter.send = _cassette_send  # type: ignore[method-assign]
+    _reset_pooled_sessions()
+    try:
+        yield
+    finally:
+        from . import telemetry
+
+        telemetry.flush(_TELEMETRY_FLUSH_SECONDS)
+        with _active_lock:
+            _active = None
+            HTTPAdapter.send = _original_send
+        _reset_pooled_sessions()
+
+
+@contextmanager
+def record_http(path: Union[str, Path]) -> Iterator[_Recorder]:
+    """Record this process's HTTP exchanges to a cassette while the block runs.
+
+    Args:
+        path: Cassette file to write (JSON) when the block exits
+
+    Yields:
+        The recorder; ``interactions`` holds the scrubbed exchanges so far
+
+    Raises:
+        RuntimeError: If a cassette is already active
+    """
+    recorder = _Recorder()
+    with _activate(recorder):
+        try:
+            yield recorder
+        finally:
+            recorder.save(path)
+            logger.info(f"Recorded {len(recorder.interactions)} HTTP exchange(s) to {path}")
+
+
+@contextmanager
+def replay_http(path: Union[str, Path], latency_scale: float = 1.0) -> Iterator[_Player]:
+    """Answer this process's HTTP requests from a cassette while the block runs.
+
+    Args:
+        path: Cassette written by :func:`record_http`
+        latency_scale: Multiplier on recorded latencies and ``Retry-After``
+            hints; 1.0 replays the original timing, 0 answers immediately
+
+    Yields:
+        The player; ``replayed``, ``repeated`` and ``unused()`` show how
+        closely the run followed the recording
+
+    Raises:
+        RuntimeError: If a cassette is already active
+        ValueError: If ``path`` is not a supported cassette
+        CassetteMissError: From a request without a recorded response
+    """
+    from .auth import TokenManager, set_token_manager
+
+    player = _Player(load_cassette(path)["interactions"], latency_scale, source=str(path))
+    previous = set_token_manager(TokenManager(_ReplayCredential()))
+    try:
+        with _activate(player):
+            yield player
+    finally:
+        set_token_manager(previous)
+    logger.info(
+        f"Replayed {player.replayed} HTTP exchange(s) from {path} "
+        f"({player.repeated} repeated, {player.unused()} unused)"
+    )
@@ -1,18 +1,93 @@
 """Core jumpstart class for listing and installing jumpstarts."""
 
+import ast
+import linecache
 import logging
+import re
 import traceback
+import types
+import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
+from .arena import get_arena
+from .events import InstallEvents, install_events, phase_records
+from .history import format_history_summary, get_history_store, new_record
 from .installer import JumpstartInstaller
 from .logger import log_capture_context
-from .registry import JumpstartRegistry
+from .manifest import get_manifest_store
+from .prewarm import get_prewarmer
+from .profiling import format_profile_summary, install_profile
+from .registry import JumpstartRegistry, is_new_since
+from .spec import JumpstartSpec
 from .telemetry import track_install
-from .ui import ConflictUI, render_install_status_html, render_jumpstart_list
+from .ui import ConflictUI, render_install_status_html, render_jumpstart_list, render_profile_summary_html
 
 logger = logging.getLogger(__name__)
 
+_PACKAGE_NAME = __name__.partition('.')[0]
+
+# Public methods whose receiver names the jumpstart instance at the call site.
+_INSTANCE_METHODS = frozenset({
+    'list',
+    'install',
+    'search',
+    '_get_instance_name',
+    '_install_from_github',
+})
+
+_CALL_RECEIVER_RE = re.compile(r'([A-Za-z_]\w*)\.([A-Za-z_]\w*)\s*\(')
+
+# (code object, line number) -> resolved instance name
+_INSTANCE_NAME_CACHE: Dict[Tuple[types.CodeType, int], str] = {}
+_INSTANCE_NAME_CACHE_SIZE = 256
+
+# Number of leading catalog entries prefetched by list(prewarm=True).
+_LIST_PREWARM_COUNT = 3
+
+# Uninstalls run at once by a batch uninstall(); each fans out its own deletes.
+_MAX_CONCURRENT_UNINSTALLS = 4
+
+
+def _referenced_names(frame) -> List[str]:
+    """Return candidate receiver names from the frame's calling line, best first.
+
+    Names used as the receiver of a jumpstart method call (``js.install(...)``)
+    come first, followed by any other names on the line.
+    """
+    line = linecache.getline(frame.f_code.co_filename, frame.f_lineno, frame.f_globals).strip()
+    if not line:
+        return []
+    logger.debug(f"Parsing line: {line}")
+
+    try:
+        tree = ast.parse(line)
+    except SyntaxError:
+        # Partial statement (e.g. one line of a multi-line call): fall back to
+        # extracting method-call receivers textually.
+        return [m.group(1) for m in _CALL_RECEIVER_RE.finditer(line) if m.group(2) in _INSTANCE_METHODS]
+
+    receivers: List[str] = []
+    others: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.attr in _INSTANCE_METHODS and node.value.id not in receivers:
+                receivers.append(node.value.id)
+        elif isinstance(node, ast.Name) and node.id not in others:
+            others.append(node.id)
+    return receivers + [n for n in others if n not in receivers]
+
+
+def _learned_estimates(logical_id: str) -> Tuple[Dict[str, float], Optional[float]]:
+    """Return (per-phase seconds, total seconds) learned from earlier installs."""
+    try:
+        store = get_history_store()
+        return store.phase_estimates(logical_id), store.duration_estimate(logical_id)
+    except Exception as e:
+        logger.debug(f"Install history unavailable: {e}")
+        return {}, None
+
+
 class jumpstart:
     """Main jumpstart interface for discovering and installing jumpstarts."""
     
@@ -29,35 +104,42 @@ class jumpstart:
         """Display all available jumpstarts."""
         print("Available jumpstarts:")
         for j in self._registry:
-            if j.get('include_in_listing', True):
-                logical_id = j.get('logical_id', j.get('id', 'unknown'))
+            if j.include_in_listing:
+                logical_id = j.logical_id or j.get('id', 'unknown')
                 numeric_id = j.get('id', '?')
-                print(f"  • {logical_id} (#{numeric_id}): {j.get('name', 'Unknown')} - {j.get('description', 'No description')}")
+                print(f"  • {logical_id} (#{numeric_id}): {j.name or 'Unknown'} - {j.description or 'No description'}")
 
     def list(self, **kwargs):
-        """Display an interactive HTML UI of available jumpstarts."""
+        """Display an interactive HTML UI of available jumpstarts.
+
+        Args:
+            **kwargs: Display options
+                - show_unlisted: If True, include jumpstarts hidden from the listing
+                - instance_name: Variable name to use in the copyable install snippets
+                  (skips call-site inspection)
+                - prewarm: Prefetch sources in the background so the next install
+                  starts faster. True prewarms the first few listed jumpstarts; a
+                  list of logical ids prewarms exactly those (pinned entries).
+        """
         from IPython.display import HTML, display
         
         # Get the instance variable name dynamically
-        instance_name = self._get_instance_name()
+        instance_name = self._get_instance_name(kwargs.get("instance_name"))
         
         # Filter jumpstarts that should be listed
         show_unlisted = kwargs.get("show_unlisted", False)
-        jumpstarts = [j for j in self._registry if j.get("include_in_listing", True) or show_unlisted]
-        
         # Determine NEW threshold (60 days ago)
         new_threshold = datetime.now() - timedelta(days=60)
         
-        # Mark and sort jumpstarts
-        for j in jumpstarts:
-            try:
-                date_added = datetime.strptime(j['date_added'], "%m/%d/%Y")
-                j['is_new'] = date_added >= new_threshold
-            except (ValueError, KeyError):
-                j['is_new'] = False
+        # Mark copies: registry records are read-only
+        jumpstarts = [
+            j.replace(is_new=is_new_since(j, new_threshold))
+            for j in self._registry
+            if j.include_in_listing or show_unlisted
+        ]
         
         # Sort: NEW first, then numeric id, then logical_id for stability
-        jumpstarts.sort(key=lambda x: (not x['is_new'], x.get('id', 0), x.get('logical_id', '')))
+        jumpstarts.sort(key=lambda x: (not x.is_new, x.id, x.logical_id))
         
         # Group by scenario, workload, and type
         grouped_scenario = {}
@@ -66,105 +148,150 @@ class jumpstart:
         
         for j in jumpstarts:
             # Group by scenario
-            scenario_tags = j.get("scenario_tags", ["Uncategorized"])
+            scenario_tags = j.scenario_tags or ("Uncategorized",)
             for tag in scenario_tags:
                 if tag not in grouped_scenario:
                     grouped_scenario[tag] = []
                 grouped_scenario[tag].append(j)
             
             # Group by primary workload (first tag only to avoid duplicates)
-            primary_workload = j.get("workload_tags", ["Uncategorized"])[0]
+            primary_workload = (j.workload_tags or ("Uncategorized",))[0]
             if primary_workload not in grouped_workload:
                 grouped_workload[primary_workload] = []
             grouped_workload[primary_workload].append(j)
 
-            type_tag = j.get("type") or "Unspecified"
+            type_tag = j.type or "Unspecified"
             grouped_type.setdefault(type_tag, []).append(j)
         
         # Generate and display HTML
-        html = render_jumpstart_list(grouped_scenario, grouped_workload, grouped_type, instance_name)
+        html = render_jumpstart_list(
+            grouped_scenario,
+            grouped_workload,
+            grouped_type,
+            instance_name,
+            search_index=self._registry_manager.search_index,
+        )
         display(HTML(html))
-    
-    def _get_instance_name(self):
-        """Get the variable name of this jumpstart instance."""
+
+        prewarm = kwargs.get("prewarm", False)
+        if prewarm:
+            if prewarm is True:
+                names = [j.logical_id for j in jumpstarts[:_LIST_PREWARM_COUNT]]
+            else:
+                names = [prewarm] if isinstance(prewarm, str) else list(prewarm)
+            for name in names:
+                try:
+                    self.prewarm(name)
+                except ValueError as e:
+                    logger.warning(str(e))
+
+    def search(self, query: str, limit: Optional[int] = None, include_unlisted: bool = False) -> List[JumpstartSpec]:
+        """Search the catalog by keyword (e.g. "KQL", "RocksDB", "fraud").
+
+        Args:
+            query: Free-text search query
+            limit: Maximum number of results (None for all matches)
+            include_unlisted: If True, include jumpstarts hidden from the listing
+
+        Returns:
+            Matching jumpstart records, best match first
+        """
+        return self._registry_manager.search(query, limit=limit, include_unlisted=include_unlisted)
+
+    def prewarm(self, name: str, repo_ref: Optional[str] = None) -> dict:
+        """Fetch and stage a jumpstart's source in the background.
+
+        A following ``install(name)`` with the same ``repo_ref`` reuses the
+        staged copy instead of cloning, waiting for the prewarm if it is
+        still running.
+
+        Args:
+            name: Logical id of the jumpstart from registry
+            repo_ref: Optional git ref overriding the registered one
+
+        Returns:
+            Status dictionary (see :meth:`prewarm_status`)
+
+        Raises:
+            ValueError: If the jumpstart is unknown
+        """
+        config = self._get_jumpstart_by_logical_id(name)
+        if not config:
+            raise ValueError(f"Unknown jumpstart '{name}'. Use fabric_jumpstart.list() to list available jumpstarts.")
+        return get_prewarmer().prewarm(config, repo_ref)
+
+    def prewarm_status(self, name: Optional[str] = None):
+        """Report prewarm progress.
+
+        Args:
+            name: Logical id to report on; None for every prewarmed jumpstart
+
+        Returns:
+            A status dictionary with ``status`` one of fetching, ready,
+            claimed, failed or not_started, or a list of them when ``name``
+            is None
+        """
+        prewarmer = get_prewarmer()
+        return prewarmer.status_all() if name is None else prewarmer.status(name)
+
+    def _get_instance_name(self, instance_name: Optional[str] = None):
+        """Get the variable name of this jumpstart instance in the caller's code.
+
+        Resolution parses the calling line's AST and only checks the names it
+        references, so large notebook namespaces are never scanned. Results are
+        cached per (code object, line). An explicit ``instance_name`` skips
+        inspection entirely.
+        """
+        if instance_name:
+            return instance_name
+
         import inspect
-        import re
         current = inspect.currentframe()
-        caller = current.f_back if current else None
-
-        # Prefer the user frame first (caller of the public API), then the immediate caller.
-        frames = []
-        if caller and caller.f_back:
-            frames.append(caller.f_back)
-        if caller:
-            frames.append(caller)
-
-        # Collect direct references to the instance and module aliases that expose it
-        instance_names = set()
-        module_aliases = set()
-        for frame in frames:
-            if not frame:
-                continue
-            for scope in [frame.f_locals, frame.f_globals]:
-                for var_name, var_value in scope.items():
-                    if var_name == "self":
-                        continue
-                    if var_value is self and not var_name.startswith('_'):
-                        instance_names.add(var_name)
-                    # Handle "import fabric_jumpstart as js" where js.jumpstart is the instance
-                    try:
-                        if inspect.ismodule(var_value) and getattr(var_value, "jumpstart", None) is self:
-                            module_aliases.add(var_name)
-                    except Exception:
-                        # Best-effort alias detection; ignore inspection issues
-                        pass
-
-        logger.debug(f"Found instance names: {instance_names}; module aliases: {module_aliases}")
-
-        # Parse the calling line to see which name was used (favor outer frames first)
-        try:
-            import linecache
-            for frame in frames:
-                if not frame or not frame.f_code:
-                    continue
-                call_line = frame.f_lineno
-                filename = frame.f_code.co_filename
-                line = linecache.getline(filename, call_line).strip()
-
-                logger.debug(f"Parsing line: {line}")
-
-                patterns = [
-                    r'(\w+)\.list\s*\(',
-                    r'(\w+)\._get_instance_name\s*\(',
-                    r'(\w+)\.install\s*\(',
-                    r'(\w+)\._install_from_github\s*\(',
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, line)
-                    if match:
-                        calling_var = match.group(1)
-                        logger.debug(f"Found calling variable: {calling_var}")
-                        if calling_var in instance_names or calling_var in module_aliases:
-                            logger.debug(f"Using matched variable name: {calling_var}")
-                            return calling_var
+        frame = current.f_back if current else None
+        # Skip frames inside this package to reach the user's calling frame.
+        while frame is not None and frame.f_globals.get('__name__', '').partition('.')[0] == _PACKAGE_NAME:
+            frame = frame.f_back
+        del current
+        if frame is None:
+            return "jumpstart"
 
+        try:
+            cache_key = (frame.f_code, frame.f_lineno)
+            cached = _INSTANCE_NAME_CACHE.get(cache_key)
+            if cached is not None and self._name_refers_to_self(frame, cached):
+                logger.debug(f"Using cached instance name: {cached}")
+                return cached
+
+            for candidate in _referenced_names(frame):
+                if self._name_refers_to_self(frame, candidate):
+                    if len(_INSTANCE_NAME_CACHE) >= _INSTANCE_NAME_CACHE_SIZE:
+                        _INSTANCE_NAME_CACHE.clear()
+                    _INSTANCE_NAME_CACHE[cache_key] = candidate
+                    logger.debug(f"Using matched variable name: {candidate}")
+                    return candidate
         except Exception as e:
-            logger.debug(f"Error parsing calling line: {e}")
-
-        # Prefer explicit references, then module aliases, then default
-        if instance_names:
-            shortest = min(instance_names, key=len)
-            logger.debug(f"Using shortest instance name: {shortest}")
-            return shortest
-        if module_aliases:
-            shortest = min(module_aliases, key=len)
-            logger.debug(f"Using shortest module alias: {shortest}")
-            return shortest
+            logger.debug(f"Error resolving instance name: {e}")
+        finally:
+            del frame
 
         logger.debug("No candidates found, using default 'jumpstart'")
         return "jumpstart"
 
+    def _name_refers_to_self(self, frame, name: str) -> bool:
+        """Check whether ``name`` in the frame is this instance or a module exposing it.
+
+        Only plain dictionary lookups are used so no user properties are evaluated.
+        """
+        for scope in (frame.f_locals, frame.f_globals):
+            if name in scope:
+                value = scope[name]
+                if value is self:
+                    return True
+                if isinstance(value, types.ModuleType):
+                    return vars(value).get("jumpstart") is self
+                return False
+        return False
+
     def _get_jumpstart_by_logical_id(self, jumpstart_id: str):
         """Get jumpstart config by logical_id, with backward compatibility for old id lookups."""
         return self._registry_manager.get_by_id(jumpstart_id)
@@ -183,6 +310,17 @@ class jumpstart:
                 - auto_prefix_on_conflict: If True, auto-generate a prefix when conflicts are detected
                 - debug: If True, include all jumpstart logs (INFO+) in the rendered output; otherwise only fabric-cicd logs
                 - repo_ref: Override the registered source repo_ref (git tag/branch/commit) at runtime
+                - keep_temp_on_failure: If True, keep the install's scratch directories when it fails (for debugging)
+                - only_items: Only publish these "ItemName.ItemType" entries, e.g. the "redeploy" list of a
+                  status() report (combine with update_existing=True)
+                - instance_name: Variable name to use in rendered code snippets (skips call-site inspection)
+                - events: Destination for a JSON lines event stream (phases, progress, uploads, published
+                  items, timings): a file path, file descriptor, writable file, callable or a shared
+                  fabric_jumpstart.events.EventStream
+                - profile: If True, sample the install's stacks and per-phase peak memory and write a
+                  flamegraph-ready collapsed-stack file and a summary table to the cache directory's
+                  "profiles" folder (or to the directory given instead of True); the hot spots are
+                  shown on the status card
         """
         config = self._get_jumpstart_by_logical_id(name)
         if not config:
@@ -190,7 +328,133 @@ class jumpstart:
             raise ValueError(error_msg)
         return self._install_with_config(config, workspace_id, **kwargs)
 
-    def _install_with_config(self, config: dict, workspace_id: Optional[str] = None, non_registered_install: bool = False, **kwargs):
+    def status(self, name: str, workspace_id: Optional[str] = None, check_content: bool = True, max_workers: int = 8) -> dict:
+        """
+        Compare a workspace against an installed jumpstart without redeploying.
+
+        Uses the manifest recorded by ``install()``: one workspace inventory
+        call finds missing, renamed and extra items, then only the recorded
+        items still present are re-hashed (concurrently) and compared with
+        the hashes captured at install time.
+
+        Args:
+            name: Logical id of the installed jumpstart
+            workspace_id: Workspace GUID (optional in a Fabric notebook)
+            check_content: Compare item definitions; False for an
+                inventory-only check
+            max_workers: Concurrent definition fetches
+
+        Returns:
+            Report dictionary with ``unchanged``, ``modified``, ``missing``,
+            ``extra`` and ``unchecked`` item lists and a ``redeploy`` list to
+            pass as ``install(name, update_existing=True, only_items=...)``
+
+        Raises:
+            ValueError: If no manifest was recorded for the name and workspace
+        """
+        from .drift import check_drift, format_status_report
+        from .utils import resolve_workspace_id
+
+        workspace_id = resolve_workspace_id(workspace_id)
+        manifest = get_manifest_store().load(workspace_id, name)
+        if manifest is None:
+            raise ValueError(
+                f"No install manifest for '{name}' in workspace '{workspace_id}'. "
+                "Only jumpstarts installed from this environment can be checked."
+            )
+        report = check_drift(manifest, check_content=check_content, max_workers=max_workers)
+        logger.info(format_status_report(report))
+        return report
+
+    def history(self, name: Optional[str] = None, workspace_id: Optional[str] = None) -> List[Dict]:
+        """
+        Summarise the installs recorded in this environment.
+
+        Every install is stored in a local SQLite history. Installs are
+        grouped per jumpstart and fabric-jumpstart/fabric-cicd version pair,
+        so comparing groups shows whether an upgrade made installs slower.
+
+        Args:
+            name: Only this jumpstart's logical id
+            workspace_id: Only installs into this workspace
+
+        Returns:
+            List of summaries with install and failure counts and p50/p95
+            seconds for the whole install and each phase; see
+            ``history.HistoryStore.summary``
+        """
+        summaries = get_history_store().summary(name, workspace_id)
+        logger.info(format_history_summary(summaries))
+        return summaries
+
+    def uninstall(
+        self,
+        name: Union[str, List[str]],
+        workspace_id: Optional[Union[str, List[str]]] = None,
+        dry_run: bool = False,
+        include_preexisting: bool = False,
+        max_workers: int = 8,
+    ):
+        """
+        Delete the items and lakehouse files an install created.
+
+        Uses the manifest recorded by ``install()`` in this environment, so only
+        what the install deployed is removed. Items that already existed and
+        were only updated by the install are kept unless ``include_preexisting``
+        is set. Deletes run concurrently in dependency-safe order.
+
+        Args:
+            name: Logical id, or a list of them for a batch uninstall
+            workspace_id: Workspace GUID, or a list of them; every name is
+                uninstalled from every workspace (optional in a Fabric notebook)
+            dry_run: Only report what would be deleted
+            include_preexisting: Also delete items the install only updated
+            max_workers: Concurrent delete requests per uninstall; a batch
+                runs at most four uninstalls at a time
+
+        Returns:
+            Report dictionary (a list of them for a batch) with per-item
+            status and timings; see ``uninstall.uninstall_manifest``
+
+        Raises:
+            ValueError: If no manifest was recorded for a name and workspace
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .uninstall import format_uninstall_report, uninstall_manifest
+        from .utils import resolve_workspace_id
+
+        names = [name] if isinstance(name, str) else list(name)
+        if isinstance(workspace_id, (list, tuple)):
+            workspace_ids = list(workspace_id)
+        else:
+            workspace_ids = [resolve_workspace_id(workspace_id)]
+
+        store = get_manifest_store()
+        manifests = []
+        for ws_id in workspace_ids:
+            for logical_id in names:
+                manifest = store.load(ws_id, logical_id)
+                if manifest is None:
+                    raise ValueError(
+                        f"No install manifest for '{logical_id}' in workspace '{ws_id}'. "
+                        "Only jumpstarts installed from this environment can be uninstalled."
+                    )
+                manifests.append(manifest)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(manifests), _MAX_CONCURRENT_UNINSTALLS))) as pool:
+            reports = list(pool.map(
+                lambda m: uninstall_manifest(m, dry_run=dry_run, include_preexisting=include_preexisting, max_workers=max_workers),
+                manifests,
+            ))
+        for report in reports:
+            logger.info(format_uninstall_report(report))
+
+        if isinstance(name, str) and not isinstance(workspace_id, (list, tuple)):
+            return reports[0]
+        return reports
+
+    def _install_with_config(self, config: Mapping, workspace_id: Optional[str] = None, non_registered_install: bool = False, **kwargs):
         """
         Core install orchestration. Runs all installation phases for a given config dict.
 
@@ -199,15 +463,23 @@ class jumpstart:
         was obtained.
 
         Args:
-            config: Full jumpstart configuration dictionary (same shape as registry entries)
+            config: Jumpstart record, or a dict of the same shape as registry entries
             workspace_id: Target workspace GUID (optional)
             non_registered_install: True when called via _install_from_github (not from registry)
             **kwargs: Forwarded to JumpstartInstaller
         """
-        logical_id = config.get('logical_id', '')
-        instance_name = self._get_instance_name()
+        config = JumpstartSpec.coerce(config)
+        logical_id = config.logical_id
+        instance_name = self._get_instance_name(kwargs.pop('instance_name', None))
+        event_sink = kwargs.pop('events', None)
+        profile = kwargs.pop('profile', False)
         installer = JumpstartInstaller(config, workspace_id, instance_name, **kwargs)
-        
+        install_id = uuid.uuid4().hex
+        repo_ref = installer.repo_ref_override or config.source.get('repo_ref')
+        phase_estimates, duration_estimate = _learned_estimates(logical_id)
+        # Phase and counter state; bound to the install's tracker once it starts
+        active_events: Optional[InstallEvents] = None
+
         # Setup state for rendering
         unattended = installer.unattended
         log_buffer = installer.log_buffer
@@ -226,17 +498,24 @@ class jumpstart:
             elapsed = time.monotonic() - _install_start_time if _install_start_time else 0.0
             html = render_install_status_html(
                 status=status_label,
-                jumpstart_name=config.get('name', logical_id),
-                type=config.get('type', '').lower(),
+                jumpstart_name=config.name or logical_id,
+                type=(config.type or '').lower(),
                 workspace_id=installer.workspace_id,
                 entry_point=entry,
-                minutes_complete=config.get('minutes_to_complete_jumpstart'),
-                minutes_deploy=config.get('minutes_to_deploy'),
+                minutes_complete=config.minutes_to_complete_jumpstart,
+                minutes_deploy=config.minutes_to_deploy,
                 docs_uri=installer.effective_docs_uri,
                 logs=log_buffer,
                 error_message=err,
                 extra_html=extra_html,
                 elapsed_seconds=elapsed,
+                progress_override=active_events.percent() if active_events is not None else None,
+                progress_detail=(
+                    active_events.progress.describe()
+                    if active_events is not None and status_label == 'installing'
+                    else None
+                ),
+                estimate_seconds=duration_estimate,
             )
             try:
                 live_handle.update(HTML_cls(html))
@@ -281,15 +560,66 @@ class jumpstart:
             logging.getLogger(__name__),
         ]
         
-        with log_capture_context(log_buffer, target_loggers, on_emit=on_emit, debug=installer.debug_logs):
+        # Scratch directories created by this install are removed when it
+        # finishes (kept on failure when keep_temp_on_failure is set).
+        scratch = get_arena().lease(logical_id, keep_on_failure=installer.keep_temp_on_failure)
+        emitter = install_events(
+            event_sink,
+            install_id,
+            logical_id,
+            phase_estimates=phase_estimates,
+            on_progress=on_emit,
+            workspace_id=installer.workspace_id,
+            repo_ref=repo_ref,
+        )
+
+        if profile:
+            from .utils import get_cache_dir
+            profile_dir = get_cache_dir('profiles') if profile is True else profile
+        else:
+            profile_dir = None
+        profile_ctx = install_profile(profile_dir, install_id, logical_id)
+
+        def _finish_profile() -> Optional[str]:
+            """Stop the profiler, report where its files went and render its summary."""
+            if profiler is None:
+                return None
+            summary = profiler.stop()
+            logger.info(format_profile_summary(summary, logical_id, install_id))
+            tracker.emit('profile', collapsed_path=summary.get('collapsed_path'), summary_path=summary.get('summary_path'))
+            return render_profile_summary_html(summary)
+
+        def _timing_fields() -> Dict:
+            return {
+                'duration_seconds': round(_time.monotonic() - _telemetry_start_time, 3),
+                'phases': phase_records(installer.phase_timings, installer.critical_path),
+            }
+
+        def _record_history(status: str, timing: Dict, error: Optional[str] = None) -> None:
             try:
-                # Phase 1: Validate and prepare
-                installer.validate()
-                installer.prepare_workspace()
-                installer.initialize_workspace_manager()
-                
-                # Phase 2: Check for conflicts
-                planned_items_base, existing_items, conflicts, had_conflicts = installer.check_conflicts()
+                get_history_store().record(new_record(
+                    logical_id,
+                    status,
+                    timing['duration_seconds'],
+                    timing['phases'],
+                    counters=active_events.counters if active_events is not None else None,
+                    install_id=install_id,
+                    workspace_id=installer.workspace_id,
+                    repo_ref=repo_ref,
+                    error=error,
+                ))
+            except Exception as e:
+                logger.warning(f"Could not record install history for '{logical_id}': {e}")
+
+        capture = log_capture_context(
+            log_buffer, target_loggers, on_emit=on_emit, debug=installer.debug_logs, install_id=install_id
+        )
+        with capture, scratch, emitter as tracker, profile_ctx as profiler:
+            active_events = tracker
+            try:
+                # Phases 1-2: Validate, clone, list existing items and check conflicts
+                # (independent phases overlap; see JumpstartInstaller.run_preparation)
+                planned_items_base, existing_items, conflicts, had_conflicts = installer.run_preparation()
                 
                 # Phase 3: Resolve conflicts
                 resolved_prefix, remaining_conflicts = installer.resolve_conflicts(
@@ -315,7 +645,7 @@ class jumpstart:
                     current_status['label'] = 'conflict'  # Prevent on_emit from overwriting
                     _update_live(
                         status_label='conflict',
-                        entry=config.get('entry_point'),
+                        entry=config.entry_point,
                         err=None,
                         extra_html=conflict_html
                     )
@@ -323,93 +653,19 @@ class jumpstart:
                     # Raise error to mark cell as failed
                     raise RuntimeError(f"Conflicting items detected: {', '.join(remaining_conflicts)}")
                 
-                # Phase 4: Apply prefix to files
-                installer.apply_prefix_to_files(resolved_prefix)
-                
-                # Phase 5: Deploy
+                # Phases 4-7: Apply prefix, deploy, upload files and generate entry URL
                 logger.info(f"Deploying items from {installer.temp_workspace_path} to workspace '{installer.workspace_id}'")
-                target_ws = installer.deploy()
+                _, entry_url = installer.run_deployment(resolved_prefix)
                 logger.info(f"Successfully installed '{logical_id}'")
-                
-                # Phase 6: Upload files to lakehouse (if configured)
-                installer.upload_files(target_ws, resolved_prefix)
-
-                # Phase 7: Generate entry URL
-                entry_url = installer.generate_entry_url(target_ws, resolved_prefix)
-
-                # Telemetry: record successful install
-                install_mode = "update" if had_conflicts and installer.update_existing else "new"
-
-                track_install(
-                    jumpstart_id=logical_id,
-                    jumpstart_numeric_id=config.get("id", 0),
-                    jumpstart_type=config.get("type", ""),
-                    status="success",
-                    duration_seconds=round(_time.monotonic() - _telemetry_start_time, 1),
-                    install_mode=install_mode,
-                    non_registered_install=non_registered_install,
-                )
-                
-                # Render success — animate progress bar to 100% first
-                current_status['label'] = 'success'  # Prevent on_emit from overwriting
-
-                # Smooth fill: run ~2.5s of rapid updates to animate bar to 100%
-                if live_handle and HTML_cls is not None:
-                    import time as _t
-                    fill_start = _t.monotonic()
-                    fill_duration = 2.5
-                    while True:
-                        elapsed_fill = _t.monotonic() - fill_start
-                        if elapsed_fill >= fill_duration:
-                            break
-                        # Lerp from current progress to 100%
-                        base_elapsed = _t.monotonic() - _install_start_time
-                        html = render_install_status_html(
-                            status='installing',
-                            jumpstart_name=config.get('name', logical_id),
-                            type=config.get('type', '').lower(),
-                            workspace_id=installer.workspace_id,
-                            entry_point=None,
-                            minutes_complete=config.get('minutes_to_complete_jumpstart'),
-                            minutes_deploy=config.get('minutes_to_deploy'),
-                            docs_uri=installer.effective_docs_uri,
-                            logs=log_buffer,
-                            elapsed_seconds=base_elapsed,
-                            progress_override=min(95 + (elapsed_fill / fill_duration) * 5, 100),
-                        )
-                        try:
-                            live_handle.update(HTML_cls(html))
-                        except Exception:
-                            pass
-                        _t.sleep(0.3)
-
-                status_html = render_install_status_html(
-                    status='success',
-                    jumpstart_name=config.get('name', logical_id),
-                    type=config.get('type', '').lower(),
-                    workspace_id=installer.workspace_id,
-                    entry_point=entry_url,
-                    minutes_complete=config.get('minutes_to_complete_jumpstart'),
-                    minutes_deploy=config.get('minutes_to_deploy'),
-                    docs_uri=installer.effective_docs_uri,
-                    logs=log_buffer,
-                )
-                
-                _update_live(status_label='success', entry=entry_url)
-                
-                if unattended:
-                    print(f"Installed '{logical_id}' to workspace '{installer.workspace_id}'")
-                    return None
-                
-                if live_rendering:
-                    return None
-                
                 try:
-                    from IPython.display import HTML
-                    return HTML(status_html)
-                except Exception:
-                    return status_html
-                    
+                    get_manifest_store().save(installer.build_manifest(resolved_prefix))
+                except Exception as e:
+                    logger.warning(f"Could not record install manifest for '{logical_id}': {e}")
+                if installer.critical_path:
+                    logger.info(
+                        "Install critical path: %s",
+                        " -> ".join(f"{t.name} ({t.duration:.1f}s)" for t in installer.critical_path),
+                    )
             except Exception as e:
                 # Skip telemetry for conflict-aborted installs (never reached deploy)
                 if not conflict_already_rendered:
@@ -417,8 +673,8 @@ class jumpstart:
 
                     track_install(
                         jumpstart_id=logical_id,
-                        jumpstart_numeric_id=config.get("id", 0),
-                        jumpstart_type=config.get("type", ""),
+                        jumpstart_numeric_id=config.id,
+                        jumpstart_type=config.type or "",
                         status="failure",
                         duration_seconds=round(_time.monotonic() - _telemetry_start_time, 1),
                         install_mode=fail_install_mode,
@@ -426,6 +682,11 @@ class jumpstart:
                     )
                 logger.exception(f"Failed to install jumpstart '{logical_id}'")
                 error_text = str(e).strip() or e.__class__.__name__
+                timing = _timing_fields()
+                final_status = 'conflict' if conflict_already_rendered else 'failure'
+                tracker.finish(final_status, error=error_text, **timing)
+                _record_history(final_status, timing, error=error_text)
+                profile_html = _finish_profile()
                 
                 # Don't update_existing conflict UI if it's already been rendered
                 if conflict_already_rendered:
@@ -438,8 +699,9 @@ class jumpstart:
                             log_buffer.append({"level": "ERROR", "message": clean_line})
                     _update_live(
                         status_label='error',
-                        entry=config.get('entry_point'),
-                        err=error_text
+                        entry=config.entry_point,
+                        err=error_text,
+                        extra_html=profile_html,
                     )
                 except Exception:
                     pass
@@ -450,17 +712,18 @@ class jumpstart:
                 
                 status_html = render_install_status_html(
                     status='error',
-                    jumpstart_name=config.get('name', logical_id),
-                    type=config.get('type', '').lower(),
+                    jumpstart_name=config.name or logical_id,
+                    type=(config.type or '').lower(),
                     workspace_id=installer.workspace_id,
-                    entry_point=config.get('entry_point'),
-                    minutes_complete=config.get('minutes_to_complete_jumpstart'),
-                    minutes_deploy=config.get('minutes_to_deploy'),
+                    entry_point=config.entry_point,
+                    minutes_complete=config.minutes_to_complete_jumpstart,
+                    minutes_deploy=config.minutes_to_deploy,
                     docs_uri=installer.effective_docs_uri,
                     logs=log_buffer,
                     error_message=error_text,
+                    extra_html=profile_html,
                 )
-                _update_live(status_label='error', entry=config.get('entry_point'), err=error_text)
+                _update_live(status_label='error', entry=config.entry_point, err=error_text, extra_html=profile_html)
                 
                 if live_rendering:
                     raise RuntimeError(error_text)
@@ -472,6 +735,55 @@ class jumpstart:
                     pass
                 
                 raise RuntimeError(error_text)
+            else:
+                # Outside the try so a later error cannot record the install again as a failure
+                timing = _timing_fields()
+                tracker.finish('success', entry_url=entry_url, **timing)
+                _record_history('success', timing)
+                profile_html = _finish_profile()
+
+                # Telemetry: record successful install
+                install_mode = "update" if had_conflicts and installer.update_existing else "new"
+
+                track_install(
+                    jumpstart_id=logical_id,
+                    jumpstart_numeric_id=config.id,
+                    jumpstart_type=config.type or "",
+                    status="success",
+                    duration_seconds=round(_time.monotonic() - _telemetry_start_time, 1),
+                    install_mode=install_mode,
+                    non_registered_install=non_registered_install,
+                )
+                
+                current_status['label'] = 'success'  # Prevent on_emit from overwriting
+
+                status_html = render_install_status_html(
+                    status='success',
+                    jumpstart_name=config.name or logical_id,
+                    type=(config.type or '').lower(),
+                    workspace_id=installer.workspace_id,
+                    entry_point=entry_url,
+                    minutes_complete=config.minutes_to_complete_jumpstart,
+                    minutes_deploy=config.minutes_to_deploy,
+                    docs_uri=installer.effective_docs_uri,
+                    logs=log_buffer,
+                    extra_html=profile_html,
+                )
+                
+                _update_live(status_label='success', entry=entry_url, extra_html=profile_html)
+                
+                if unattended:
+                    print(f"Installed '{logical_id}' to workspace '{installer.workspace_id}'")
+                    return None
+                
+                if live_rendering:
+                    return None
+                
+                try:
+                    from IPython.display import HTML
+                    return HTML(status_html)
+                except Exception:
+                    return status_html
 
     def _install_from_github(
         self,
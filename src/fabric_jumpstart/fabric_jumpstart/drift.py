@@ -0,0 +1,140 @@
+"""Compare a workspace against an install manifest without redeploying.
+
+One inventory call establishes which recorded items are missing, renamed or
+joined by extra items; item definitions are then fetched concurrently, only
+for recorded items still present that have a stored content hash, and
+compared against the hashes captured at install time.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .workspace_manager import definition_hash, get_item_definition, list_workspace_item_records
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 8
+
+STATE_UNCHANGED = "unchanged"
+STATE_MODIFIED = "modified"
+STATE_MISSING = "missing"
+STATE_UNCHECKED = "unchecked"
+
+
+def _item_hash(workspace_id: str, item_id: str) -> Optional[str]:
+    try:
+        return definition_hash(get_item_definition(workspace_id, item_id))
+    except Exception as e:
+        logger.debug("Could not hash item %s: %s", item_id, e)
+        return None
+
+
+def capture_item_hashes(workspace_id: str, item_ids: List[str], max_workers: int = _DEFAULT_MAX_WORKERS) -> Dict[str, str]:
+    """Fetch and hash the definitions of deployed items.
+
+    Args:
+        workspace_id: Workspace GUID
+        item_ids: Item GUIDs to hash
+        max_workers: Concurrent definition fetches
+
+    Returns:
+        Mapping of item id to content hash (items without a definition API
+        or that could not be fetched are left out)
+    """
+    if not item_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jumpstart-hash") as pool:
+        hashes = dict(zip(item_ids, pool.map(lambda item_id: _item_hash(workspace_id, item_id), item_ids)))
+    return {item_id: h for item_id, h in hashes.items() if h}
+
+
+def check_drift(manifest: Dict, check_content: bool = True, max_workers: int = _DEFAULT_MAX_WORKERS) -> Dict:
+    """Classify every recorded item as unchanged, modified, missing or unchecked.
+
+    Extra items are live items placed in the same workspace folders as the
+    recorded items that the manifest does not know about; items at the
+    workspace root are never reported as extra.
+
+    Args:
+        manifest: Install manifest
+        check_content: Compare definition hashes; False gives an
+            inventory-only check (present items are then ``unchecked``)
+        max_workers: Concurrent definition fetches
+
+    Returns:
+        Report dictionary with ``logical_id``, ``workspace_id``, ``repo_ref``,
+        lists of ``"Name.Type"`` under ``unchanged``, ``modified``,
+        ``missing``, ``extra`` and ``unchecked``, ``redeploy`` (modified plus
+        missing, in the format ``install(only_items=...)`` takes), ``renamed``
+        (recorded name to live name) and ``seconds``
+    """
+    start = time.perf_counter()
+    workspace_id = manifest["workspace_id"]
+    live = {item["id"]: item for item in list_workspace_item_records(workspace_id) if item.get("id")}
+
+    states: Dict[str, str] = {}
+    renamed: Dict[str, str] = {}
+    to_hash: List[Dict] = []
+    folders = set()
+    for item in manifest.get("items", []):
+        key = f"{item['name']}.{item['type']}"
+        current = live.get(item.get("id"))
+        if current is None:
+            states[key] = STATE_MISSING
+            continue
+        if current.get("folderId"):
+            folders.add(current["folderId"])
+        if current.get("displayName") != item["name"]:
+            renamed[key] = f"{current.get('displayName')}.{item['type']}"
+        if check_content and item.get("hash"):
+            to_hash.append(item)
+        else:
+            states[key] = STATE_UNCHECKED
+
+    hashes = capture_item_hashes(workspace_id, [i["id"] for i in to_hash], max_workers) if to_hash else {}
+    for item in to_hash:
+        key = f"{item['name']}.{item['type']}"
+        current_hash = hashes.get(item["id"])
+        if current_hash is None:
+            states[key] = STATE_UNCHECKED
+        else:
+            states[key] = STATE_UNCHANGED if current_hash == item["hash"] else STATE_MODIFIED
+
+    recorded_ids = {i.get("id") for i in manifest.get("items", [])}
+    extra = sorted(
+        f"{item.get('displayName')}.{item.get('type')}"
+        for item_id, item in live.items()
+        if item_id not in recorded_ids and item.get("folderId") in folders
+    )
+
+    def _with(state: str) -> List[str]:
+        return sorted(k for k, v in states.items() if v == state)
+
+    modified, missing = _with(STATE_MODIFIED), _with(STATE_MISSING)
+    return {
+        "logical_id": manifest["logical_id"],
+        "workspace_id": workspace_id,
+        "repo_ref": manifest.get("repo_ref"),
+        STATE_UNCHANGED: _with(STATE_UNCHANGED),
+        STATE_MODIFIED: modified,
+        STATE_MISSING: missing,
+        "extra": extra,
+        STATE_UNCHECKED: _with(STATE_UNCHECKED),
+        "renamed": renamed,
+        "seconds": round(time.perf_counter() - start, 3),
+        "redeploy": sorted(modified + missing),
+    }
+
+
+def format_status_report(report: Dict) -> str:
+    """Render a drift report as a short multi-line summary."""
+    ref = f" @ {report['repo_ref']}" if report.get("repo_ref") else ""
+    lines = [f"'{report['logical_id']}'{ref} in workspace '{report['workspace_id']}' ({report['seconds']:.1f}s)"]
+    for state in (STATE_UNCHANGED, STATE_MODIFIED, STATE_MISSING, "extra", STATE_UNCHECKED):
+        if report[state]:
+            lines.append(f"  {state:<9} {len(report[state])}: {', '.join(report[state])}")
+    for old, new in sorted(report["renamed"].items()):
+        lines.append(f"  renamed   {old} -> {new}")
+    return "\n".join(lines)
@@ -0,0 +1,425 @@
+"""Machine-readable install event stream.
+
+An install started with ``events=<sink>`` reports its progress as JSON
+objects, one per line: phase start/end, progress percent, bytes uploaded,
+item publish results and the final timings. The sink is a file path, an
+open file descriptor, a writable file object, a callable receiving each
+event dict, or an :class:`EventStream` shared by many installs (every event
+carries the ``install_id`` it belongs to).
+
+Events are queued to a background writer which batches the writes, so
+emitting never blocks the install; when the queue is full the event is
+dropped and counted instead.
+
+``progress`` events carry the overall ``percent`` (weighted by expected
+phase durations, see :mod:`fabric_jumpstart.progress`) and, while a phase
+reports its work, the running ``phase`` with ``done``/``total`` in its
+``unit`` (objects, files, items or bytes) and the ``rate`` per second.
+
+Example event::
+
+    {"ts": 1760870000.123, "seq": 7, "install_id": "3f2c...", "jumpstart": "retail-sales",
+     "event": "upload_progress", "path": "data/sales.csv", "bytes": 1048576,
+     "files_done": 3, "bytes_done": 4194304}
+"""
+
+import contextvars
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .progress import ProgressModel
+
+logger = logging.getLogger(__name__)
+
+# Writer tuning: bounded queue, max events per write, and the close deadline.
+_QUEUE_MAXSIZE = 10000
+_BATCH_MAX_EVENTS = 500
+_CLOSE_TIMEOUT_SECONDS = 5.0
+
+EventCallback = Callable[[Dict[str, Any]], None]
+EventSink = Union["EventStream", str, "os.PathLike[str]", int, IO[str], EventCallback]
+
+_STOP = object()
+
+
+class EventStream:
+    """Background writer of JSON line events.
+
+    Args:
+        sink: File path (appended to), file descriptor (left open), writable
+            text file object (left open), or callable receiving each event
+        maxsize: Maximum number of queued events; further events are dropped
+    """
+
+    def __init__(self, sink: Union[str, "os.PathLike[str]", int, IO[str], EventCallback], maxsize: int = _QUEUE_MAXSIZE):
+        self._callback: Optional[EventCallback] = None
+        self._file: Optional[IO[str]] = None
+        self._owns_file = False
+        if isinstance(sink, int):
+            self._file = os.fdopen(sink, "a", encoding="utf-8", closefd=False)
+            self._owns_file = True
+        elif isinstance(sink, (str, os.PathLike)):
+            self._file = open(os.fspath(sink), "a", encoding="utf-8")
+            self._owns_file = True
+        elif hasattr(sink, "write"):
+            self._file = sink  # type: ignore[assignment]
+        elif callable(sink):
+            self._callback = sink
+        else:
+            raise TypeError(f"Unsupported event sink: {sink!r}")
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self.dropped = 0
+        self.errors = 0
+
+    def emit(self, event: Dict[str, Any]) -> bool:
+        """Queue an event for writing without blocking.
+
+        Returns:
+            False if the stream is closed or full and the event was dropped
+        """
+        if self._closed:
+            self.dropped += 1
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="fabric-jumpstart-events", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _BATCH_MAX_EVENTS:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(e is _STOP for e in batch)
+            try:
+                self._write([e for e in batch if e is not _STOP])
+            except Exception:
+                self.errors += 1
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        if self._callback is not None:
+            for event in batch:
+                try:
+                    self._callback(event)
+                except Exception:
+                    self.errors += 1
+            return
+        if batch and self._file is not None:
+            self._file.write("".join(json.dumps(e, default=str) + "\n" for e in batch))
+            self._file.flush()
+
+    def flush(self, timeout: float = _CLOSE_TIMEOUT_SECONDS) -> bool:
+        """Wait up to ``timeout`` seconds for queued events to be written.
+
+        Returns:
+            True if the queue drained before the deadline
+        """
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    break
+                self._queue.all_tasks_done.wait(remaining)
+            return not self._queue.unfinished_tasks
+
+    def close(self, timeout: float = _CLOSE_TIMEOUT_SECONDS) -> bool:
+        """Write pending events, stop the writer and close a file it opened.
+
+        Returns:
+            True if every queued event was written before the deadline
+        """
+        with self._lock:
+            if self._closed:
+                return True
+            self._closed = True
+        drained = True
+        if self._thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+            drained = not self._thread.is_alive()
+        if self._owns_file and self._file is not None and drained:
+            self._file.close()
+        return drained
+
+
+class InstallEvents:
+    """Tracks one install's progress and work counters and emits its events.
+
+    Progress (see :class:`fabric_jumpstart.progress.ProgressModel`) and
+    counters are kept whether or not a stream is attached, since the status
+    card reads them too; events are only written when ``stream`` is set.
+
+    Args:
+        stream: Destination stream, or None to only track
+        install_id: Identifier of the install
+        jumpstart: Logical id of the jumpstart being installed
+        phase_estimates: Expected seconds per phase (learned from the install
+            history) used to weight progress
+        on_progress: Called (from the reporting thread) when progress advances
+    """
+
+    def __init__(
+        self,
+        stream: Optional[EventStream],
+        install_id: str,
+        jumpstart: str,
+        phase_estimates: Optional[Mapping[str, float]] = None,
+        on_progress: Optional[Callable[[], None]] = None,
+    ):
+        self.stream = stream
+        self.install_id = install_id
+        self.jumpstart = jumpstart
+        self.progress = ProgressModel(phase_estimates)
+        self.counters: Dict[str, int] = {}
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._reported_percent = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.stream is not None
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Queue one event (never raises, never blocks)."""
+        if self.stream is None:
+            return
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        record = {
+            "ts": round(time.time(), 3),
+            "seq": seq,
+            "install_id": self.install_id,
+            "jumpstart": self.jumpstart,
+            "event": event,
+        }
+        record.update(fields)
+        try:
+            self.stream.emit(record)
+        except Exception:
+            pass
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to a work counter (e.g. ``bytes_uploaded``)."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def plan_phases(self, names: Iterable[str]) -> None:
+        """Set the phases the install is expected to run."""
+        self.progress.plan(names)
+
+    def phase_started(self, name: str) -> None:
+        self.progress.start(name)
+        self.emit("phase_start", phase=name)
+
+    def phase_finished(self, name: str, duration: float, ok: bool) -> None:
+        """Record a finished phase and report progress when it advances."""
+        if ok:
+            self.progress.finish(name)
+        self.emit("phase_end", phase=name, ok=ok, duration_seconds=round(duration, 3))
+        if ok:
+            self._report_progress()
+
+    def work_total(self, phase: str, total: float, unit: str) -> None:
+        """Declare how much work ``phase`` will do, in ``unit`` (e.g. bytes)."""
+        self.progress.set_total(phase, total, unit)
+
+    def work_done(self, phase: str, amount: float = 1) -> None:
+        """Record work done by ``phase`` and report progress when it advances."""
+        self.progress.advance(phase, amount)
+        self._report_progress()
+
+    def percent(self) -> int:
+        """Return the install's progress so far (never decreasing)."""
+        return int(self.progress.percent())
+
+    def _report_progress(self) -> None:
+        percent = self.percent()
+        with self._lock:
+            if percent <= self._reported_percent:
+                return
+            self._reported_percent = percent
+        if self.stream is not None:
+            self.emit("progress", percent=percent, **(self.progress.current() or {}))
+        if self._on_progress is not None:
+            try:
+                self._on_progress()
+            except Exception:
+                pass
+
+    def finish(self, status: str, **fields: Any) -> None:
+        """Emit the final ``install_end`` event (preceded by 100% on success)."""
+        if status == "success":
+            self.progress.complete()
+            self.emit("progress", percent=100)
+        self.emit("install_end", status=status, counters=dict(self.counters), **fields)
+
+
+_current_events: contextvars.ContextVar[Optional[InstallEvents]] = contextvars.ContextVar(
+    "fabric_jumpstart_install_events", default=None
+)
+# Phase running in this context; set by PhaseGraph inside each phase's own context copy.
+_current_phase: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "fabric_jumpstart_install_phase", default=None
+)
+
+
+def current_events() -> Optional[InstallEvents]:
+    """Return the emitter of the install running in this context, if any."""
+    return _current_events.get()
+
+
+def current_phase() -> Optional[str]:
+    """Return the name of the install phase running in this context, if any."""
+    return _current_phase.get()
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Emit an event for the install running in this context (no-op otherwise)."""
+    events = _current_events.get()
+    if events is not None:
+        events.emit(event, **fields)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add to a work counter of the install running in this context (no-op otherwise)."""
+    events = _current_events.get()
+    if events is not None:
+        events.count(name, amount)
+
+
+def plan_phases(names: Iterable[str]) -> None:
+    """Set the phases the install running in this context is expected to run."""
+    events = _current_events.get()
+    if events is not None:
+        events.plan_phases(names)
+
+
+def phase_started(name: str) -> None:
+    """Mark ``name`` as the phase running in this context and record its start.
+
+    Only call from a context that is discarded when the phase ends (PhaseGraph
+    runs each phase in its own copy).
+    """
+    _current_phase.set(name)
+    events = _current_events.get()
+    if events is not None:
+        events.phase_started(name)
+
+
+def phase_finished(name: str, duration: float, ok: bool) -> None:
+    """Record the end of a phase started with :func:`phase_started`."""
+    events = _current_events.get()
+    if events is not None:
+        events.phase_finished(name, duration, ok)
+
+
+def work_total(total: float, unit: str) -> None:
+    """Declare the amount of work the current phase will do (no-op outside a phase)."""
+    events, phase = _current_events.get(), _current_phase.get()
+    if events is not None and phase is not None:
+        events.work_total(phase, total, unit)
+
+
+def work_done(amount: float = 1) -> None:
+    """Record work done by the current phase (no-op outside a phase)."""
+    events, phase = _current_events.get(), _current_phase.get()
+    if events is not None and phase is not None:
+        events.work_done(phase, amount)
+
+
+@contextmanager
+def install_events(
+    sink: Optional[EventSink],
+    install_id: str,
+    jumpstart: str,
+    phase_estimates: Optional[Mapping[str, float]] = None,
+    on_progress: Optional[Callable[[], None]] = None,
+    **fields: Any,
+) -> Iterator[InstallEvents]:
+    """Route this context's events to ``sink`` for the duration of one install.
+
+    Emits ``install_start`` (with ``fields``) on entry. A stream opened here
+    from a path, descriptor, file object or callable is flushed and closed
+    on exit; a shared :class:`EventStream` is left open.
+
+    Args:
+        sink: Event destination, or None to disable events
+        install_id: Identifier stamped on every event
+        jumpstart: Logical id of the jumpstart
+        phase_estimates: Expected seconds per phase, to weight progress
+        on_progress: Called when progress advances
+        **fields: Extra ``install_start`` fields
+
+    Yields:
+        The install's emitter
+    """
+    owned: Optional[EventStream] = None
+    if sink is None or isinstance(sink, EventStream):
+        stream = sink
+    else:
+        stream = owned = EventStream(sink)
+    events = InstallEvents(stream, install_id, jumpstart, phase_estimates, on_progress)
+    token = _current_events.set(events)
+    try:
+        events.emit("install_start", **fields)
+        yield events
+    finally:
+        _current_events.reset(token)
+        if owned is not None:
+            owned.close()
+
+
+def phase_records(timings: Sequence[Any], critical: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+    """Describe phase timings as JSON-ready dicts, offsets relative to the first start."""
+    if not timings:
+        return []
+    origin = min(t.start for t in timings)
+    critical_names = {t.name for t in critical}
+    return [
+        {
+            "phase": t.name,
+            "start_seconds": round(t.start - origin, 3),
+            "duration_seconds": round(t.duration, 3),
+            "critical": t.name in critical_names,
+        }
+        for t in sorted(timings, key=lambda t: t.start)
+    ]
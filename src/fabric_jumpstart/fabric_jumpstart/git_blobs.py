@@ -0,0 +1,224 @@
+"""Read file contents straight from a clone's git object database.
+
+Data folders uploaded to a lakehouse are left out of the checkout (see
+``clone_repository(exclude_paths=...)``); their contents are streamed from
+the object store through a single long-running ``git cat-file --batch``
+process instead of being written to disk and read back.
+"""
+
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import IO, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DRAIN_CHUNK = 1024 * 1024
+
+
+class TreeEntry(NamedTuple):
+    """A blob under a tree path: its path relative to that tree, object id and size."""
+
+    path: str
+    sha: str
+    size: int
+
+
+def list_tree(repo_dir: Path, tree_path: str, rev: str = "HEAD") -> List[TreeEntry]:
+    """List every blob under ``tree_path`` at ``rev``.
+
+    Args:
+        repo_dir: Repository working directory (or git dir)
+        tree_path: Folder (or file) path within the repository
+        rev: Commit-ish to read
+
+    Returns:
+        Entries with paths relative to ``tree_path`` (the file name when
+        ``tree_path`` is a file); symlinks and submodules are skipped
+
+    Raises:
+        FileNotFoundError: If nothing exists at ``tree_path``
+        RuntimeError: If git fails
+    """
+    spec = tree_path.strip("/\\").replace("\\", "/")
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo_dir), "ls-tree", "-r", "-l", "-z", rev, "--", spec],
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git ls-tree failed for '{spec}' at {rev}: {e.stderr.decode(errors='replace')}") from e
+
+    entries: List[TreeEntry] = []
+    for record in result.stdout.split(b"\0"):
+        if not record:
+            continue
+        meta, _, path = record.decode("utf-8").partition("\t")
+        mode, obj_type, sha, size = meta.split()
+        if obj_type != "blob" or mode == "120000":
+            continue
+        if path == spec:
+            rel = path.rsplit("/", 1)[-1]
+        else:
+            rel = path[len(spec):].lstrip("/") if spec else path
+        entries.append(TreeEntry(rel, sha, int(size)))
+    if not entries:
+        raise FileNotFoundError(f"Source path does not exist at {rev}: {spec}")
+    return entries
+
+
+class GitBlobReader:
+    """Streams blobs out of one repository through ``git cat-file --batch``.
+
+    Only one blob can be open at a time; opening another first drains the
+    unread remainder of the previous one.
+
+    Args:
+        repo_dir: Repository working directory (or git dir)
+    """
+
+    def __init__(self, repo_dir: Path):
+        self.repo_dir = Path(repo_dir)
+        self._proc: Optional[subprocess.Popen] = None
+        self._active: Optional["BlobStream"] = None
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _pipes(self) -> Tuple[IO[bytes], IO[bytes]]:
+        """Return ``(stdin, stdout)`` of the ``cat-file`` process, starting it if needed."""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_dir), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        assert stdin is not None and stdout is not None  # both opened as PIPE above
+        return stdin, stdout
+
+    def _request(self, sha: str) -> int:
+        """Ask for ``sha`` and return its size; the content follows on stdout."""
+        with self._lock:
+            if self._active is not None:
+                self._active._drain()
+            stdin, stdout = self._pipes()
+            stdin.write(f"{sha}\n".encode("ascii"))
+            stdin.flush()
+            header = stdout.readline().decode("ascii").split()
+            if len(header) != 3 or header[1] != "blob":
+                raise FileNotFoundError(f"Blob {sha} not found in {self.repo_dir}")
+            return int(header[2])
+
+    def open(self, sha: str) -> "BlobStream":
+        """Start streaming a blob.
+
+        Raises:
+            FileNotFoundError: If the object is missing or not a blob
+        """
+        with self._lock:
+            stream = BlobStream(self, sha, self._request(sha))
+            self._active = stream
+            return stream
+
+    def read_bytes(self, sha: str) -> bytes:
+        """Return a whole blob."""
+        return self.open(sha).read()
+
+    def close(self) -> None:
+        """Stop the ``cat-file`` process."""
+        with self._lock:
+            self._active = None
+            if self._proc is not None:
+                try:
+                    if self._proc.stdin is not None:
+                        self._proc.stdin.close()
+                    self._proc.wait(timeout=5)
+                except Exception:
+                    self._proc.kill()
+                self._proc = None
+
+
+class BlobStream:
+    """Read-only, rewindable file object over one blob.
+
+    ``len()`` gives the blob size so HTTP clients send a ``Content-Length``
+    and stream the body; ``seek(0)`` re-requests the blob for retries.
+    """
+
+    def __init__(self, reader: GitBlobReader, sha: str, size: int):
+        self._reader = reader
+        self.sha = sha
+        self.size = size
+        self._pos = 0
+        self._done = size == 0
+        if self._done:
+            self._finish()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tell(self) -> int:
+        return self._pos
+
+    def _finish(self) -> None:
+        # Each object in --batch output is followed by a newline.
+        self._reader._pipes()[1].read(1)
+        self._done = True
+        if self._reader._active is self:
+            self._reader._active = None
+
+    def read(self, n: int = -1) -> bytes:
+        with self._reader._lock:
+            if self._done:
+                return b""
+            remaining = self.size - self._pos
+            want = remaining if n is None or n < 0 else min(n, remaining)
+            stdout = self._reader._pipes()[1]
+            chunks = []
+            while want:
+                chunk = stdout.read(want)
+                if not chunk:
+                    raise RuntimeError(f"git cat-file ended while reading blob {self.sha}")
+                chunks.append(chunk)
+                want -= len(chunk)
+                self._pos += len(chunk)
+            if self._pos == self.size:
+                self._finish()
+            return b"".join(chunks)
+
+    def _drain(self) -> None:
+        while not self._done:
+            self.read(_DRAIN_CHUNK)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Rewind to the start (the only supported position besides the current one)."""
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += self.size
+        if offset == self._pos:
+            return self._pos
+        if offset != 0:
+            raise OSError("BlobStream only supports seeking to the start")
+        with self._reader._lock:
+            if not self._done:
+                self._drain()
+            self._reader._request(self.sha)
+            self._pos = 0
+            self._done = self.size == 0
+            self._reader._active = self
+            if self._done:
+                self._finish()
+        return 0
+
+    def close(self) -> None:
+        with self._reader._lock:
+            self._drain()
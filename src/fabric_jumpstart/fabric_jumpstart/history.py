@@ -0,0 +1,359 @@
+"""Local history of installs, for learned progress estimates and trends.
+
+Every install, successful or not, is recorded in a SQLite database at
+``get_cache_dir()/history.sqlite3``. A record holds the jumpstart, source
+ref, workspace, status, total and per-phase durations, bytes and files
+uploaded, items published, and the fabric-jumpstart and fabric-cicd
+versions. The install progress bar weights phases by their median duration
+over recent successful installs of the same jumpstart.
+:meth:`HistoryStore.summary` (``jumpstart.history()``) reports p50/p95
+timings per jumpstart and version pair, so a regression after an upgrade
+stands out.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SCHEMA_VERSION = 1
+_HISTORY_FILENAME = "history.sqlite3"
+
+# Successful installs used for the learned estimates, newest first.
+_ESTIMATE_SAMPLE = 20
+# Oldest installs are pruned beyond this many records.
+_MAX_INSTALLS = 10000
+
+_COUNTERS = ("bytes_uploaded", "files_uploaded", "items_published")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS installs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    install_id TEXT,
+    jumpstart TEXT NOT NULL,
+    repo_ref TEXT,
+    workspace_id TEXT,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_seconds REAL,
+    bytes_uploaded INTEGER NOT NULL DEFAULT 0,
+    files_uploaded INTEGER NOT NULL DEFAULT 0,
+    items_published INTEGER NOT NULL DEFAULT 0,
+    jumpstart_version TEXT,
+    fabric_cicd_version TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS installs_by_jumpstart ON installs (jumpstart, status, id);
+CREATE TABLE IF NOT EXISTS phases (
+    install INTEGER NOT NULL REFERENCES installs (id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    start_seconds REAL,
+    duration_seconds REAL NOT NULL,
+    critical INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS phases_by_install ON phases (install);
+"""
+
+
+def _package_version(distribution: str) -> str:
+    try:
+        from importlib.metadata import version
+
+        return version(distribution)
+    except Exception:
+        return ""
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Return the ``q`` (0-100) percentile of ``values`` by linear interpolation.
+
+    Returns:
+        The percentile, or None for no values
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def new_record(
+    jumpstart: str,
+    status: str,
+    duration_seconds: float,
+    phases: Iterable[Mapping],
+    counters: Optional[Mapping[str, int]] = None,
+    install_id: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+    repo_ref: Optional[str] = None,
+    error: Optional[str] = None,
+) -> Dict:
+    """Build a history record for one install.
+
+    Args:
+        jumpstart: Logical id
+        status: ``success``, ``failure`` or ``conflict``
+        duration_seconds: Wall-clock duration of the install
+        phases: Phase dicts as produced by :func:`fabric_jumpstart.events.phase_records`
+        counters: Work counters (``bytes_uploaded``, ``files_uploaded``, ``items_published``)
+        install_id: Identifier of the install
+        workspace_id: Target workspace GUID
+        repo_ref: Source ref that was installed
+        error: Error message of a failed install
+
+    Returns:
+        Record dictionary accepted by :meth:`HistoryStore.record`
+    """
+    counters = counters or {}
+    return {
+        "install_id": install_id,
+        "jumpstart": jumpstart,
+        "repo_ref": repo_ref,
+        "workspace_id": workspace_id,
+        "status": status,
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "duration_seconds": round(duration_seconds, 3),
+        **{name: int(counters.get(name, 0)) for name in _COUNTERS},
+        "jumpstart_version": _package_version("fabric-jumpstart"),
+        "fabric_cicd_version": _package_version("fabric-cicd"),
+        "error": error,
+        "phases": [dict(p) for p in phases],
+    }
+
+
+class HistoryStore:
+    """Reads and writes the install history database.
+
+    A connection is opened per call, so the store can be shared across
+    threads, and concurrent processes are serialised by SQLite.
+
+    Args:
+        path: Database file; defaults to ``get_cache_dir()/history.sqlite3``
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = utils.get_cache_dir() / _HISTORY_FILENAME
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    with conn:
+                        conn.executescript(_SCHEMA)
+                        conn.execute(f"PRAGMA user_version = {HISTORY_SCHEMA_VERSION}")
+                    self._initialized = True
+        return conn
+
+    def record(self, record: Mapping) -> int:
+        """Store one install record (see :func:`new_record`).
+
+        Returns:
+            Row id of the stored install
+        """
+        columns = [c for c in record if c != "phases"]
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                f"INSERT INTO installs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [record[c] for c in columns],
+            )
+            row_id = cursor.lastrowid
+            if row_id is None:
+                raise sqlite3.Error("install history insert did not return a row id")
+            conn.executemany(
+                "INSERT INTO phases (install, phase, start_seconds, duration_seconds, critical) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (row_id, p["phase"], p.get("start_seconds"), p["duration_seconds"], int(bool(p.get("critical"))))
+                    for p in record.get("phases", ())
+                ],
+            )
+            conn.execute("DELETE FROM installs WHERE id <= ?", (row_id - _MAX_INSTALLS,))
+        return row_id
+
+    def _recent_successes(self, conn: sqlite3.Connection, jumpstart: str, limit: int) -> List[int]:
+        rows = conn.execute(
+            "SELECT id FROM installs WHERE jumpstart = ? AND status = 'success' ORDER BY id DESC LIMIT ?",
+            (jumpstart, limit),
+        )
+        return [row["id"] for row in rows]
+
+    def phase_estimates(self, jumpstart: str, limit: int = _ESTIMATE_SAMPLE) -> Dict[str, float]:
+        """Return the median duration of each phase over recent successful installs.
+
+        Args:
+            jumpstart: Logical id
+            limit: Number of recent successful installs to learn from
+
+        Returns:
+            Mapping of phase name to seconds (empty without history)
+        """
+        with closing(self._connect()) as conn:
+            ids = self._recent_successes(conn, jumpstart, limit)
+            if not ids:
+                return {}
+            durations: Dict[str, List[float]] = {}
+            rows = conn.execute(
+                f"SELECT phase, duration_seconds FROM phases WHERE install IN ({', '.join('?' * len(ids))})", ids
+            )
+            for row in rows:
+                durations.setdefault(row["phase"], []).append(row["duration_seconds"])
+        estimates: Dict[str, float] = {}
+        for phase, values in durations.items():
+            median = percentile(values, 50)
+            if median is not None:
+                estimates[phase] = median
+        return estimates
+
+    def duration_estimate(self, jumpstart: str, limit: int = _ESTIMATE_SAMPLE) -> Optional[float]:
+        """Return the median total duration of recent successful installs, or None."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT duration_seconds FROM installs WHERE jumpstart = ? AND status = 'success' "
+                "AND duration_seconds IS NOT NULL ORDER BY id DESC LIMIT ?",
+                (jumpstart, limit),
+            )
+            return percentile([row["duration_seconds"] for row in rows], 50)
+
+    def records(
+        self, jumpstart: Optional[str] = None, workspace_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Return stored installs, newest first, each with its ``phases`` list."""
+        clauses, params = [], []
+        if jumpstart is not None:
+            clauses.append("jumpstart = ?")
+            params.append(jumpstart)
+        if workspace_id is not None:
+            clauses.append("workspace_id = ?")
+            params.append(workspace_id)
+        query = "SELECT * FROM installs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            records = [dict(row) for row in conn.execute(query, params)]
+            by_id = {r["id"]: r for r in records}
+            for r in records:
+                r["phases"] = []
+            if by_id:
+                phase_rows = conn.execute(
+                    f"SELECT * FROM phases WHERE install IN ({', '.join('?' * len(by_id))}) ORDER BY rowid",
+                    list(by_id),
+                )
+                for row in phase_rows:
+                    by_id[row["install"]]["phases"].append({
+                        "phase": row["phase"],
+                        "start_seconds": row["start_seconds"],
+                        "duration_seconds": row["duration_seconds"],
+                        "critical": bool(row["critical"]),
+                    })
+        return records
+
+    def summary(self, jumpstart: Optional[str] = None, workspace_id: Optional[str] = None) -> List[Dict]:
+        """Summarise installs per jumpstart and fabric-jumpstart/fabric-cicd versions.
+
+        Timings are taken over successful installs only.
+
+        Args:
+            jumpstart: Only this logical id
+            workspace_id: Only installs into this workspace
+
+        Returns:
+            One dict per group, newest group first, with ``installs``,
+            ``failures``, ``last_installed``, ``duration`` and per-phase
+            ``phases`` p50/p95 seconds, and median ``bytes_uploaded`` and
+            ``items_published``
+        """
+        groups: Dict[tuple, List[Dict]] = {}
+        for record in self.records(jumpstart, workspace_id):
+            key = (record["jumpstart"], record["jumpstart_version"] or "", record["fabric_cicd_version"] or "")
+            groups.setdefault(key, []).append(record)
+
+        summaries = []
+        for (name, jumpstart_version, cicd_version), records in groups.items():
+            successes = [r for r in records if r["status"] == "success"]
+            phase_durations: Dict[str, List[float]] = {}
+            for r in successes:
+                for p in r["phases"]:
+                    phase_durations.setdefault(p["phase"], []).append(p["duration_seconds"])
+            summaries.append({
+                "jumpstart": name,
+                "jumpstart_version": jumpstart_version,
+                "fabric_cicd_version": cicd_version,
+                "installs": len(records),
+                "failures": len(records) - len(successes),
+                "last_installed": records[0]["started_at"],
+                "duration": _p50_p95([r["duration_seconds"] for r in successes if r["duration_seconds"] is not None]),
+                "phases": {phase: _p50_p95(values) for phase, values in phase_durations.items()},
+                "bytes_uploaded": percentile([r["bytes_uploaded"] for r in successes], 50),
+                "items_published": percentile([r["items_published"] for r in successes], 50),
+            })
+        return summaries
+
+
+def _p50_p95(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    return {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+
+
+def _seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}s"
+
+
+def format_history_summary(summaries: List[Dict]) -> str:
+    """Render :meth:`HistoryStore.summary` output as a readable table."""
+    if not summaries:
+        return "No installs recorded in this environment."
+    lines = []
+    for s in summaries:
+        versions = f"fabric-jumpstart {s['jumpstart_version'] or '?'}, fabric-cicd {s['fabric_cicd_version'] or '?'}"
+        lines.append(
+            f"{s['jumpstart']} ({versions}): {s['installs']} install(s), {s['failures']} failed, "
+            f"p50 {_seconds(s['duration']['p50'])}, p95 {_seconds(s['duration']['p95'])}"
+        )
+        for phase, stats in sorted(s["phases"].items(), key=lambda kv: -(kv[1]["p50"] or 0)):
+            lines.append(f"  {phase:<20} p50 {_seconds(stats['p50']):>8}  p95 {_seconds(stats['p95']):>8}")
+    return "\n".join(lines)
+
+
+_store: Optional[HistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore:
+    """Return the process-wide install history store."""
+    global _store
+    store = _store
+    if store is None:
+        with _store_lock:
+            if _store is None:
+                _store = HistoryStore()
+            store = _store
+    return store
+
+
+def reset_history_store() -> None:
+    """Discard the process-wide install history store."""
+    global _store
+    with _store_lock:
+        _store = None
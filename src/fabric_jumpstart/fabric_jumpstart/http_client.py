@@ -0,0 +1,397 @@
+"""Pooled HTTP client for jumpstart-owned Fabric and OneLake traffic.
+
+All requests issued by jumpstart itself (item listing, OneLake uploads,
+telemetry) go through one :class:`HttpClient`, which keeps a keep-alive
+connection pool per host, retries throttled and transient failures with
+``Retry-After``-aware jittered backoff, and reports per-request timings to
+registered hooks. HTTP/2 is used when ``httpx`` with ``h2`` is installed,
+except while an HTTP cassette is recording or replaying (see
+:mod:`fabric_jumpstart.cassette`), which only sees ``requests`` traffic.
+"""
+
+import email.utils
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cassette import cassette_active
+from .scheduler import PRIORITY_METADATA, RequestScheduler, classify_url, get_scheduler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (10.0, 120.0)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_DEFAULT_MAX_RETRIES = 4
+_DEFAULT_BACKOFF_BASE = 0.5
+_DEFAULT_BACKOFF_MAX = 30.0
+# Upper bound on a server-requested Retry-After wait.
+_MAX_RETRY_AFTER_SECONDS = 120.0
+_DEFAULT_POOL_SIZE = 16
+# Read size when streaming file-like request bodies over HTTP/2.
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+class RequestTiming(NamedTuple):
+    """Timing record passed to hooks after every request (including retries)."""
+
+    method: str
+    url: str
+    host: str
+    status_code: Optional[int]
+    elapsed: float
+    attempt: int
+    error: Optional[str] = None
+
+
+TimingHook = Callable[[RequestTiming], None]
+
+
+def _httpx_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait, or None when the header is absent or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HttpClient:
+    """Connection-pooled HTTP client with retries and timing hooks.
+
+    Args:
+        max_retries: Retries after the first attempt for retryable failures
+        backoff_base: Base delay (seconds) for exponential backoff
+        backoff_max: Cap on a single computed backoff delay
+        timeout: Default ``(connect, read)`` timeout in seconds
+        pool_size: Keep-alive connections kept per host
+        http2: Use ``httpx`` with HTTP/2; None enables it when available
+        scheduler: Request scheduler to admit calls through; defaults to the
+            process-wide one from :func:`fabric_jumpstart.scheduler.get_scheduler`
+    """
+
+    def __init__(
+        self,
+        max_retries: int = _DEFAULT_MAX_RETRIES,
+        backoff_base: float = _DEFAULT_BACKOFF_BASE,
+        backoff_max: float = _DEFAULT_BACKOFF_MAX,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+        pool_size: int = _DEFAULT_POOL_SIZE,
+        http2: Optional[bool] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.http2 = _httpx_available() if http2 is None else bool(http2)
+        self._scheduler = scheduler
+        self._sessions: Dict[str, Any] = {}
+        self._hooks: List[TimingHook] = []
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "errors": 0}
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def _session(self, host_key: str) -> Any:
+        session = self._sessions.get(host_key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = self._new_session()
+                self._sessions[host_key] = session
+        return session
+
+    def _use_http2(self) -> bool:
+        return self.http2 and not cassette_active()
+
+    def _new_session(self) -> Any:
+        if self._use_http2():
+            import httpx
+
+            limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            return httpx.Client(http2=True, limits=limits)
+        session = requests.Session()
+        # Retries are handled here, not by urllib3, so Retry-After and hooks see every attempt.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close every pooled session."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Hooks and stats
+    # ------------------------------------------------------------------
+
+    def add_timing_hook(self, hook: TimingHook) -> None:
+        """Register a callable invoked with a :class:`RequestTiming` per attempt."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_timing_hook(self, hook: TimingHook) -> None:
+        """Unregister a hook added with :meth:`add_timing_hook`."""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def _emit(self, timing: RequestTiming) -> None:
+        for hook in list(self._hooks):
+            try:
+                hook(timing)
+            except Exception as e:
+                logger.debug("HTTP timing hook failed: %s", e)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return request, retry, error and open-pool counters."""
+        with self._lock:
+            return {**self._stats, "pools": len(self._sessions)}
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _backoff(self, attempt: int, response: Any = None) -> float:
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            # Jitter on top of the server's hint avoids synchronized retries.
+            return min(retry_after, _MAX_RETRY_AFTER_SECONDS) + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _send(self, session: Any, method: str, url: str, headers: Dict[str, str], kwargs: Dict[str, Any]) -> Any:
+        timeout = kwargs.pop("timeout", self.timeout)
+        if not self._use_http2():
+            return session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+        import httpx
+
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        data = kwargs.pop("data", None)
+        stream = kwargs.pop("stream", False)
+        if isinstance(data, (bytes, bytearray, str)):
+            kwargs["content"] = data
+        elif hasattr(data, "read"):
+            # httpx streams iterables; send the length so the body is not chunked
+            kwargs["content"] = iter(lambda: data.read(_STREAM_CHUNK_BYTES), b"")
+            if hasattr(data, "__len__"):
+                headers = {**headers, "Content-Length": str(len(data))}
+        elif data is not None:
+            kwargs["data"] = data
+        if stream:
+            # Leave the body unread; the caller iterates it and closes the response
+            request = session.build_request(method, url, headers=headers, timeout=timeout, **kwargs)
+            return session.send(request, stream=True)
+        return session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+
+    def _transport_errors(self) -> Tuple[Type[Exception], ...]:
+        errors: Tuple[Type[Exception], ...] = (requests.ConnectionError, requests.Timeout)
+        if self._use_http2():
+            import httpx
+
+            errors += (httpx.TransportError,)
+        return errors
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        scope: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retries: Optional[int] = None,
+        retry_statuses: frozenset = RETRY_STATUSES,
+        priority: int = PRIORITY_METADATA,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request, retrying throttled and transient failures.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            scope: When set, a bearer token for this scope is attached from the
+                shared token manager (re-read on each attempt)
+            headers: Extra request headers
+            retries: Override ``max_retries`` for this call
+            retry_statuses: Status codes that trigger a retry
+            priority: Admission priority in the shared request scheduler
+                (``PRIORITY_BULK`` for uploads)
+            **kwargs: Passed to the underlying session (``params``, ``data``,
+                ``json``, ``timeout``, ...). A file-like ``data`` body is
+                rewound with ``seek(0)`` before each retry.
+
+        Returns:
+            The final response (callers check ``status_code``)
+
+        Raises:
+            requests.ConnectionError: If the connection keeps failing after
+                all retries (or ``httpx.TransportError`` on HTTP/2)
+        """
+        parts = urlsplit(url)
+        host_key = f"{parts.scheme}://{parts.netloc}"
+        session = self._session(host_key)
+        max_retries = self.max_retries if retries is None else retries
+        transport_errors = self._transport_errors()
+        scheduler = self._scheduler or get_scheduler()
+        endpoint = classify_url(url)
+
+        attempt = 0
+        while True:
+            request_headers = dict(headers or {})
+            if scope:
+                from .auth import get_token_manager
+
+                request_headers["Authorization"] = f"Bearer {get_token_manager().get_token(scope).token}"
+
+            body = kwargs.get("data")
+            if attempt and hasattr(body, "seek"):
+                # Streamed bodies were consumed by the previous attempt
+                body.seek(0)
+
+            self._count("requests")
+            try:
+                with scheduler.slot(endpoint, priority) as slot:
+                    start = time.perf_counter()
+                    response = self._send(session, method, url, request_headers, dict(kwargs))
+                    slot.record(response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+            except transport_errors as e:
+                elapsed = time.perf_counter() - start
+                self._emit(RequestTiming(method, url, parts.netloc, None, elapsed, attempt, type(e).__name__))
+                if attempt >= max_retries:
+                    self._count("errors")
+                    raise
+                delay = self._backoff(attempt)
+                logger.debug("%s %s failed (%s); retrying in %.2fs", method, parts.netloc, e, delay)
+                self._count("retries")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            elapsed = time.perf_counter() - start
+            status = response.status_code
+            self._emit(RequestTiming(method, url, parts.netloc, status, elapsed, attempt))
+            if status not in retry_statuses or attempt >= max_retries:
+                return response
+
+            delay = self._backoff(attempt, response)
+            logger.debug("%s %s returned %s; retrying in %.2fs", method, parts.netloc, status, delay)
+            self._count("retries")
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> Any:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    def get_json(self, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """GET a JSON document, raising for non-2xx responses.
+
+        Raises:
+            RuntimeError: If the final response status is not 2xx
+        """
+        response = self.get(url, **kwargs)
+        if not 200 <= response.status_code < 300:
+            raise RuntimeError(f"GET {url} failed: {response.status_code} {response.text}")
+        return response.json()
+
+    def download(self, url: str, dest: Union[str, Path], chunk_size: int = 1 << 16) -> None:
+        """Stream a URL to a local file.
+
+        Raises:
+            RuntimeError: If the final response status is not 2xx
+        """
+        response = self.get(url, stream=True)
+        try:
+            if not 200 <= response.status_code < 300:
+                raise RuntimeError(f"GET {url} failed: {response.status_code}")
+            chunks = response.iter_bytes(chunk_size) if self._use_http2() else response.iter_content(chunk_size)
+            with open(dest, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        finally:
+            response.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client."""
+    global _client
+    client = _client
+    if client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+            client = _client
+    return client
+
+
+def reset_http_client() -> None:
+    """Close and discard the process-wide client."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
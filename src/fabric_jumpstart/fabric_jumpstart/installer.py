@@ -1,12 +1,18 @@
 """Jumpstart installer orchestration."""
 
+import functools
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Mapping, Optional
 
 from fabric_cicd import FabricWorkspace
 
+from . import events
+from .auth import FABRIC_API_SCOPE, get_token_manager
 from .constants import ITEM_URL_ROUTING_PATH_MAP
+from .phases import PhaseGraph, PhaseTiming, format_phase_timings
+from .prewarm import get_prewarmer
+from .spec import JumpstartSpec
 from .ui import ConflictDetector, ConflictResolver
 from .utils import (
     _apply_item_prefix,
@@ -14,19 +20,24 @@ from .utils import (
     clone_files_to_temp_directory,
     clone_repository,
     upload_files_to_lakehouse,    
+    upload_git_tree_to_lakehouse,
     update_docs_uri_with_ref,
 )
-from .workspace_manager import WorkspaceManager
+from .workspace_manager import WorkspaceManager, list_workspace_items
 
 logger = logging.getLogger(__name__)
 
+# Phases of run_deployment() without an early lakehouse publish; planned for
+# progress before the deployment graph is built.
+_DEPLOYMENT_PHASES = ("apply_prefix", "deploy", "upload_files", "entry_url", "record_hashes")
+
 
 class JumpstartInstaller:
     """Orchestrates the installation of a jumpstart to a Fabric workspace."""
     
     def __init__(
         self,
-        config: Dict,
+        config: Mapping,
         workspace_id: Optional[str],
         instance_name: str,
         **options
@@ -34,12 +45,12 @@ class JumpstartInstaller:
         """Initialize the installer.
         
         Args:
-            config: Jumpstart configuration dictionary from registry
+            config: Jumpstart record from the registry, or a dict of the same shape
             workspace_id: Target workspace GUID
             instance_name: Variable name of jumpstart instance
             **options: Installation options (update_existing, auto_prefix_on_conflict, item_prefix, etc.)
         """
-        self.config = config
+        self.config = JumpstartSpec.coerce(config)
         self.workspace_id = workspace_id
         self.instance_name = instance_name
         self.options = options
@@ -51,6 +62,9 @@ class JumpstartInstaller:
         self.unattended = options.get('unattended', False)
         self.debug_logs = bool(options.get('debug', False))
         self.repo_ref_override = options.get('repo_ref')
+        self.keep_temp_on_failure = bool(options.get('keep_temp_on_failure', False))
+        # "Name.Type" entries to redeploy (e.g. a status() report's "redeploy" list)
+        self.only_items: Optional[List[str]] = options.get('only_items')
         
         # State tracking
         self.log_buffer: List[Dict] = []
@@ -60,17 +74,189 @@ class JumpstartInstaller:
         self.workspace_manager: Optional[WorkspaceManager] = None
         self.had_conflicts = False
         self.resolved_prefix: Optional[str] = None
+        self.existing_items: Optional[List[str]] = None
+        # True when files_source_path was left out of the checkout
+        self.files_in_git_only = False
+        # Recorded for the install manifest
+        self.deployed_workspaces: List[FabricWorkspace] = []
+        self.uploaded_files: Optional[Dict] = None
+        self.item_hashes: Dict[str, str] = {}
+        self.phase_timings: List[PhaseTiming] = []
+        self.critical_path: List[PhaseTiming] = []
 
     @property
     def effective_docs_uri(self) -> Optional[str]:
         """Get the docs URI, adjusted for repo_ref override if applicable."""
-        docs_uri = self.config.get('jumpstart_docs_uri')
+        docs_uri = self.config.jumpstart_docs_uri
         if self.repo_ref_override:
-            source_config = self.config.get('source', {})
+            source_config = self.config.source
             original_ref = source_config.get('repo_ref', '')
             return update_docs_uri_with_ref(docs_uri, original_ref, self.repo_ref_override)
         return docs_uri
     
+    def _run_graph(self, graph: PhaseGraph) -> Dict:
+        """Run a phase graph, accumulating its timings and critical path.
+
+        Graphs run one after another, so the install's critical path is the
+        concatenation of each graph's critical path.
+        """
+        try:
+            return graph.run()
+        finally:
+            critical = graph.critical_path()
+            self.phase_timings.extend(graph.timings)
+            self.critical_path.extend(critical)
+            logger.debug("Phase timings: %s", format_phase_timings(graph.timings, critical))
+
+    def run_preparation(self) -> tuple[List[str], List[str], List[str], bool]:
+        """Run every phase up to conflict detection as a dependency graph.
+
+        The repository clone runs concurrently with token acquisition and the
+        existing-item listing; conflict detection waits for both branches.
+
+        Returns:
+            Tuple of (planned_items, existing_items, conflicts, had_conflicts)
+        """
+        graph = PhaseGraph()
+        graph.add("validate", self.validate)
+        graph.add("token", self.acquire_token)
+        graph.add("prepare_workspace", self.prepare_workspace)
+        graph.add("list_items", self.fetch_existing_items, deps=["validate", "token"])
+        graph.add("init_manager", self.initialize_workspace_manager, deps=["validate", "prepare_workspace"])
+        graph.add("check_conflicts", self.check_conflicts, deps=["init_manager", "list_items"])
+        events.plan_phases(graph.names + list(_DEPLOYMENT_PHASES))
+        return self._run_graph(graph)["check_conflicts"]
+
+    def run_deployment(self, prefix: Optional[str]) -> tuple[FabricWorkspace, Optional[str]]:
+        """Apply the prefix, deploy, upload files and build the entry URL as a graph.
+
+        When files are uploaded to a lakehouse that this jumpstart deploys,
+        that lakehouse is published first and the upload runs concurrently
+        with publishing the remaining items. The call returns once both finish.
+
+        Args:
+            prefix: Resolved item prefix (or None)
+
+        Returns:
+            Tuple of (deployed FabricWorkspace, entry URL or None)
+        """
+        early_lakehouse = self._destination_lakehouse_name(prefix)
+        deployed: Dict[str, FabricWorkspace] = {}
+
+        def _deploy_lakehouse(lakehouse_name: str) -> FabricWorkspace:
+            deployed["lakehouse"] = self.deploy_destination_lakehouse(lakehouse_name)
+            self._report_published_items(deployed["lakehouse"], lambda name: name == lakehouse_name)
+            return deployed["lakehouse"]
+
+        def _deploy() -> FabricWorkspace:
+            deployed["ws"] = self.deploy(exclude_item_names=[early_lakehouse] if early_lakehouse else None)
+            self._report_published_items(deployed["ws"], lambda name: name != early_lakehouse)
+            return deployed["ws"]
+
+        def _upload() -> int:
+            return self.upload_files(deployed.get("lakehouse") or deployed["ws"], prefix)
+
+        graph = PhaseGraph()
+        graph.add("apply_prefix", lambda: self.apply_prefix_to_files(prefix))
+        if early_lakehouse:
+            graph.add("deploy_lakehouse", functools.partial(_deploy_lakehouse, early_lakehouse), deps=["apply_prefix"])
+            graph.add("deploy", _deploy, deps=["deploy_lakehouse"])
+            graph.add("upload_files", _upload, deps=["deploy_lakehouse"])
+        else:
+            graph.add("deploy", _deploy, deps=["apply_prefix"])
+            graph.add("upload_files", _upload, deps=["deploy"])
+        graph.add("entry_url", lambda: self.generate_entry_url(deployed["ws"], prefix), deps=["deploy"])
+        graph.add("record_hashes", lambda: self.record_item_hashes(list(deployed.values())), deps=["deploy"])
+        events.plan_phases([t.name for t in self.phase_timings] + graph.names)
+        results = self._run_graph(graph)
+        self.deployed_workspaces = [ws for ws in (deployed.get("lakehouse"), deployed.get("ws")) if ws is not None]
+        return results["deploy"], results["entry_url"]
+
+    def _published_items(self, ws: FabricWorkspace) -> List[tuple]:
+        """Return (item_type, item_name, item_id) for the items ``ws`` published."""
+        return [
+            (item_type, item_name, item.guid)
+            for item_type, items in (getattr(ws, "repository_items", None) or {}).items()
+            for item_name, item in items.items()
+            if getattr(item, "guid", "")
+            # A partial redeploy only published the requested items
+            and (self.only_items is None or f"{item_name}.{item_type}" in self.only_items)
+        ]
+
+    def _report_published_items(self, ws: FabricWorkspace, name_filter: Callable[[str], bool]) -> None:
+        """Count the items ``ws`` published and emit an ``item_published`` event for each."""
+        install_events = events.current_events()
+        if install_events is None:
+            return
+        for item_type, item_name, item_id in self._published_items(ws):
+            if name_filter(item_name):
+                install_events.count("items_published")
+                install_events.emit("item_published", item_type=item_type, item_name=item_name, item_id=item_id)
+
+    def record_item_hashes(self, workspaces: List[FabricWorkspace]) -> Dict[str, str]:
+        """Hash the deployed definitions so ``status()`` can detect later drift.
+
+        Failures are logged and never fail the install.
+
+        Args:
+            workspaces: FabricWorkspace instances used for publishing
+
+        Returns:
+            Mapping of item id to definition hash
+
+        Raises:
+            RuntimeError: If workspace_id is not set
+        """
+        from .drift import capture_item_hashes
+
+        if self.workspace_id is None:
+            raise RuntimeError("workspace_id must be set before recording item hashes")
+        # A partial redeploy must not re-baseline items it did not publish
+        item_ids = sorted({item_id for ws in workspaces for _, _, item_id in self._published_items(ws)})
+        try:
+            self.item_hashes = capture_item_hashes(self.workspace_id, item_ids)
+        except Exception as e:
+            logger.warning(f"Could not record item content hashes: {e}")
+            self.item_hashes = {}
+        return self.item_hashes
+
+    def build_manifest(self, prefix: Optional[str]) -> Dict:
+        """Describe what this install deployed, for a later uninstall or status check.
+
+        Args:
+            prefix: Applied item prefix (or None)
+
+        Returns:
+            Manifest dictionary (see :mod:`fabric_jumpstart.manifest`)
+
+        Raises:
+            RuntimeError: If workspace_id is not set
+        """
+        from .manifest import add_files, add_items_from_workspace, new_manifest
+
+        if self.workspace_id is None:
+            raise RuntimeError("workspace_id must be set before building the install manifest")
+        source_config = self.config.source
+        manifest = new_manifest(
+            self.config.logical_id,
+            self.workspace_id,
+            repo_ref=self.repo_ref_override or source_config.get("repo_ref"),
+            prefix=prefix,
+        )
+        for ws in self.deployed_workspaces:
+            add_items_from_workspace(manifest, ws, preexisting=self.existing_items or ())
+        for item in manifest["items"]:
+            if item["id"] in self.item_hashes:
+                item["hash"] = self.item_hashes[item["id"]]
+        if self.uploaded_files and self.uploaded_files["paths"]:
+            add_files(
+                manifest,
+                self.uploaded_files["lakehouse_id"],
+                self.uploaded_files["lakehouse_name"],
+                self.uploaded_files["paths"],
+            )
+        return manifest
+
     def validate(self) -> str:
         """Validate configuration and resolve workspace ID.
         
@@ -90,7 +276,7 @@ class JumpstartInstaller:
             )
         
         logger.info(
-            f"Installing '{self.config.get('logical_id')}' to workspace '{self.workspace_id}'"
+            f"Installing '{self.config.logical_id}' to workspace '{self.workspace_id}'"
         )
         return self.workspace_id
     
@@ -107,21 +293,30 @@ class JumpstartInstaller:
         config_id = self.config.get('id')
         if config_id is None:
             raise ValueError("Jumpstart config missing required 'id' field")
-        logical_id = self.config.get('logical_id', '')
+        logical_id = self.config.logical_id
         system_prefix = _set_item_prefix(config_id, logical_id)
         
-        if 'repo_url' in source_config:
+        prewarmed = get_prewarmer().claim(self.config, self.repo_ref_override)
+        if prewarmed is not None:
+            self.working_repo_path = prewarmed
+            logger.info(f"Using prewarmed source staged at {self.working_repo_path}")
+        elif 'repo_url' in source_config:
             # Remote jumpstart
             repo_url = source_config['repo_url']
             repo_ref = self.repo_ref_override or source_config['repo_ref']
             if self.repo_ref_override:
                 logger.info(f"Overriding registered repo_ref with '{self.repo_ref_override}'")
             logger.info(f"Cloning from {repo_url} (ref: {repo_ref})")
+            # Upload data is streamed from the object store, so skip checking it out
+            files_source = source_config.get('files_source_path')
+            upload_from_git = bool(files_source and source_config.get('files_destination_lakehouse'))
             self.working_repo_path = clone_repository(
                 repository_url=repo_url,
                 ref=repo_ref,
-                temp_dir_prefix=system_prefix
+                temp_dir_prefix=system_prefix,
+                exclude_paths=[files_source] if upload_from_git else None,
             )
+            self.files_in_git_only = upload_from_git
             logger.info(f"Repository cloned to {self.working_repo_path}")
         else:
             # Local jumpstart
@@ -149,7 +344,8 @@ class JumpstartInstaller:
             )
             logical_id_folder.mkdir(parents=True, exist_ok=True)
             for item in list(self.temp_workspace_path.iterdir()):
-                if item.is_dir() and item != logical_id_folder:
+                # .git stays put: upload data may be read from its object store
+                if item.is_dir() and item != logical_id_folder and item.name != '.git':
                     item.rename(logical_id_folder / item.name)
 
         self.repository_directory = self.temp_workspace_path
@@ -170,7 +366,7 @@ class JumpstartInstaller:
         if self.temp_workspace_path is None:
             raise RuntimeError("temp_workspace_path must be set before initializing workspace manager")
             
-        items_in_scope = self.config.get('items_in_scope', [])
+        items_in_scope = list(self.config.items_in_scope)
         self.workspace_manager = WorkspaceManager(
             workspace_id=self.workspace_id,
             workspace_path=self.temp_workspace_path,
@@ -179,10 +375,36 @@ class JumpstartInstaller:
         )
         return self.workspace_manager
     
+    def acquire_token(self) -> None:
+        """Warm the shared token cache for the Fabric API scope.
+
+        Runs alongside the repository clone so the first API call does not
+        pay for credential resolution.
+        """
+        get_token_manager().get_token(FABRIC_API_SCOPE)
+
+    def fetch_existing_items(self) -> List[str]:
+        """List items already in the target workspace.
+
+        Only needs the workspace ID, so it overlaps with the repository clone.
+
+        Returns:
+            List of items in format "ItemName.ItemType"
+
+        Raises:
+            RuntimeError: If workspace_id is not set
+        """
+        if self.workspace_id is None:
+            raise RuntimeError("workspace_id must be set before listing workspace items")
+        self.existing_items = list_workspace_items(self.workspace_id)
+        return self.existing_items
+
     def check_conflicts(
         self
     ) -> tuple[List[str], List[str], List[str], bool]:
         """Check for item name conflicts.
+
+        Uses the items prefetched by :meth:`fetch_existing_items` when available.
         
         Returns:
             Tuple of (planned_items, existing_items, conflicts, had_conflicts)
@@ -193,7 +415,9 @@ class JumpstartInstaller:
         if self.workspace_manager is None:
             raise RuntimeError("workspace_manager must be initialized before checking conflicts")
             
-        existing_items = self.workspace_manager.get_existing_items()
+        existing_items = self.existing_items
+        if existing_items is None:
+            existing_items = self.workspace_manager.get_existing_items()
         planned_items_base = self.workspace_manager.collect_planned_items()
         planned_items = self.workspace_manager.apply_prefix_to_names(
             planned_items_base,
@@ -240,7 +464,7 @@ class JumpstartInstaller:
             resolver = ConflictResolver(
                 self.workspace_manager,
                 config_id,
-                self.config.get('logical_id', '')
+                self.config.logical_id
             )
             prefixed_items, remaining_conflicts, prefix_used = resolver.resolve_with_prefix(
                 planned_items_base,
@@ -276,7 +500,7 @@ class JumpstartInstaller:
         if self.temp_workspace_path is None:
             raise RuntimeError("temp_workspace_path must be set before applying prefix")
             
-        entry_point = self.config.get('entry_point')
+        entry_point = self.config.entry_point
         base_names = []
         if entry_point and isinstance(entry_point, str) and '.' in entry_point:
             base_names.append(entry_point.split('.')[0])
@@ -295,8 +519,56 @@ class JumpstartInstaller:
         
         return prefix_mappings
     
-    def deploy(self) -> FabricWorkspace:
+    def _lakehouse_in_scope(self, lakehouse_name: str) -> bool:
+        """Whether a partial redeploy (``only_items``) includes this lakehouse."""
+        return self.only_items is None or f"{lakehouse_name}.Lakehouse" in self.only_items
+
+    def _destination_lakehouse_name(self, prefix: Optional[str]) -> Optional[str]:
+        """Return the prefixed upload lakehouse name if it can be published early.
+
+        Returns None when no file upload is configured, the lakehouse is not
+        part of this jumpstart, or another item type shares its name (name
+        exclusion in fabric_cicd is not type-aware).
+        """
+        source_config = self.config.source
+        dest_lakehouse = source_config.get("files_destination_lakehouse")
+        if not source_config.get("files_source_path") or not dest_lakehouse or self.workspace_manager is None:
+            return None
+        lakehouse_name = f"{prefix}{dest_lakehouse}" if prefix else dest_lakehouse
+        # Item folders may or may not have been renamed with the prefix yet.
+        planned = self.workspace_manager.collect_planned_items()
+        if prefix:
+            planned = [p if p.startswith(prefix) else f"{prefix}{p}" for p in planned]
+        if f"{lakehouse_name}.Lakehouse" not in planned:
+            return None
+        if not self._lakehouse_in_scope(lakehouse_name):
+            return None
+        if any(p.partition(".")[0] == lakehouse_name for p in planned if not p.endswith(".Lakehouse")):
+            return None
+        return lakehouse_name
+
+    def deploy_destination_lakehouse(self, lakehouse_name: str) -> FabricWorkspace:
+        """Publish the file-upload destination lakehouse ahead of other items.
+
+        Args:
+            lakehouse_name: Prefixed lakehouse display name
+
+        Returns:
+            FabricWorkspace whose deployed items include the lakehouse
+
+        Raises:
+            RuntimeError: If workspace_manager is not initialized
+        """
+        if self.workspace_manager is None:
+            raise RuntimeError("workspace_manager must be initialized before deploying")
+        feature_flags = self.options.get('feature_flags', [])
+        return self.workspace_manager.deploy_single_item(lakehouse_name, "Lakehouse", feature_flags)
+
+    def deploy(self, exclude_item_names: Optional[List[str]] = None) -> FabricWorkspace:
         """Deploy items to workspace.
+
+        Args:
+            exclude_item_names: Item names already published separately
         
         Returns:
             FabricWorkspace instance after deployment
@@ -308,7 +580,11 @@ class JumpstartInstaller:
             raise RuntimeError("workspace_manager must be initialized before deploying")
             
         feature_flags = self.options.get('feature_flags', [])
-        return self.workspace_manager.deploy_items(feature_flags)
+        return self.workspace_manager.deploy_items(
+            feature_flags,
+            exclude_item_names=exclude_item_names,
+            items_to_include=self.only_items,
+        )
     
     def upload_files(self, target_ws: FabricWorkspace, prefix: Optional[str]) -> int:
         """Upload files from cloned repo to a deployed Lakehouse.
@@ -324,7 +600,7 @@ class JumpstartInstaller:
         Returns:
             Number of files uploaded
         """
-        source_config = self.config.get("source", {})
+        source_config = self.config.source
         files_source = source_config.get("files_source_path")
         dest_lakehouse = source_config.get("files_destination_lakehouse")
         if not files_source or not dest_lakehouse:
@@ -342,6 +618,10 @@ class JumpstartInstaller:
         if prefix:
             lakehouse_name = f"{prefix}{dest_lakehouse}"
 
+        if not self._lakehouse_in_scope(lakehouse_name):
+            logger.info(f"Skipping file upload; lakehouse '{lakehouse_name}' is not being redeployed")
+            return 0
+
         # Resolve lakehouse ID from the deployed workspace
         from fabric_cicd._parameter._utils import _extract_item_attribute
 
@@ -358,12 +638,24 @@ class JumpstartInstaller:
             dest_path or "/",
         )
 
-        count = upload_files_to_lakehouse(
-            target_ws=target_ws,
-            lakehouse_id=lakehouse_id,
-            source_path=local_source,
-            destination_path=dest_path,
-        )
+        self.uploaded_files = {"lakehouse_id": lakehouse_id, "lakehouse_name": lakehouse_name, "paths": []}
+        if self.files_in_git_only and not local_source.exists():
+            count = upload_git_tree_to_lakehouse(
+                target_ws=target_ws,
+                lakehouse_id=lakehouse_id,
+                repo_dir=self.working_repo_path,
+                tree_path=files_source,
+                destination_path=dest_path,
+                uploaded_paths=self.uploaded_files["paths"],
+            )
+        else:
+            count = upload_files_to_lakehouse(
+                target_ws=target_ws,
+                lakehouse_id=lakehouse_id,
+                source_path=local_source,
+                destination_path=dest_path,
+                uploaded_paths=self.uploaded_files["paths"],
+            )
 
         logger.info("Uploaded %d file(s) to lakehouse '%s'", count, lakehouse_name)
         return count
@@ -378,7 +670,7 @@ class JumpstartInstaller:
         Returns:
             Entry point URL or None
         """
-        entry_point = self.config.get('entry_point')
+        entry_point = self.config.entry_point
         if not entry_point:
             return None
         
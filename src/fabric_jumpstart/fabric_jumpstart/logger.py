@@ -1,10 +1,14 @@
 """Logging utilities for capturing and filtering logs during operations."""
 
+import contextvars
 import io
 import logging
 import re
+import sys
+import threading
+import uuid
 from contextlib import contextmanager
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 _ANSI_RE = re.compile(r"\x1B[@-Z\\-_]|\x1B\[[0-?]*[ -/]*[@-~]")
 
@@ -132,6 +136,188 @@ class StreamToLogger:
             self._buf = ""
 
 
+class _Capture:
+    """One install's log buffer and stream proxies."""
+
+    __slots__ = ("install_id", "handler", "stdout", "stderr", "level", "logger_names")
+
+    def __init__(self, install_id, handler, stdout, stderr, level, logger_names):
+        self.install_id = install_id
+        self.handler = handler
+        self.stdout = stdout
+        self.stderr = stderr
+        self.level = level
+        self.logger_names = logger_names
+
+
+# The capture owning the current install; copied into phase threads by PhaseGraph.
+_current_capture: contextvars.ContextVar[Optional[_Capture]] = contextvars.ContextVar(
+    "fabric_jumpstart_log_capture", default=None
+)
+
+
+def current_install_id() -> Optional[str]:
+    """Return the install id of the log capture active in this context, if any."""
+    capture = _current_capture.get()
+    return capture.install_id if capture is not None else None
+
+
+class _RoutingHandler(logging.Handler):
+    """Sole handler of a captured logger while any capture is active.
+
+    Records are delivered to the capture of the context that logged them.
+    Records from outside any install go where the logger would have sent
+    them before capture started: its original handlers and, if it
+    propagated, its ancestors' handlers.
+    """
+
+    def __init__(self, router: "_LogRouter", logger: logging.Logger):
+        super().__init__()
+        self._router = router
+        self._logger = logger
+        self.saved_handlers = list(logger.handlers)
+        self.saved_propagate = logger.propagate
+        self.saved_level = logger.level
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # No handler lock: records are appended to per-install buffers, so
+        # concurrent installs never wait on each other here.
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord):
+        if not getattr(record, "_jumpstart_fallback", False):
+            capture = self._router.capture_for(self._logger.name)
+            if capture is not None:
+                if record.levelno >= capture.level:
+                    capture.handler.handle(record)
+                return
+            level = self.saved_level or (self._logger.parent.getEffectiveLevel() if self._logger.parent else 0)
+            if record.levelno < level:
+                return
+        self._fallback(record)
+
+    def _fallback(self, record: logging.LogRecord):
+        """Dispatch as Logger.callHandlers would have with the saved configuration."""
+        record._jumpstart_fallback = True
+        found = 0
+        for h in self.saved_handlers:
+            found += 1
+            if record.levelno >= h.level:
+                h.handle(record)
+        logger = self._logger.parent if self.saved_propagate else None
+        while logger is not None:
+            for h in logger.handlers:
+                found += 1
+                if record.levelno >= h.level:
+                    h.handle(record)
+            logger = logger.parent if logger.propagate else None
+        if found == 0 and logging.lastResort and record.levelno >= logging.lastResort.level:
+            logging.lastResort.handle(record)
+
+
+class _ContextStream:
+    """Stand-in for sys.stdout/sys.stderr that writes to the current capture's proxy."""
+
+    def __init__(self, router: "_LogRouter", original, attr: str):
+        self._router = router
+        self._original = original
+        self._attr = attr
+
+    def _target(self):
+        capture = self._router.capture_for(None)
+        proxy = getattr(capture, self._attr) if capture is not None else None
+        return proxy if proxy is not None else self._original
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+
+class _LogRouter:
+    """Installs the routing handlers and stream proxies while captures are active.
+
+    Logger and sys.stdout/stderr configuration is swapped when the first
+    capture starts and restored when the last one ends, so overlapping
+    installs neither steal each other's output nor restore each other's
+    state too early. Enter and exit take a lock; routing a record does not.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._captures: List[_Capture] = []
+        self._handlers: Dict[str, _RoutingHandler] = {}
+        self._logger_refs: Dict[str, int] = {}
+        self._streams: Dict[str, _ContextStream] = {}
+
+    def capture_for(self, logger_name: Optional[str]) -> Optional[_Capture]:
+        """Return the capture owning a record logged (or written) in this context.
+
+        Threads that were not started with the install's context, such as
+        fabric-cicd's publish workers, carry no capture; their output goes to
+        the only active capture, or is passed through when several installs
+        overlap and the owner cannot be told.
+        """
+        capture = _current_capture.get()
+        if capture is None:
+            captures = self._captures
+            capture = captures[0] if len(captures) == 1 else None
+        if capture is not None and logger_name is not None and logger_name not in capture.logger_names:
+            return None
+        return capture
+
+    def enter(self, capture: _Capture, loggers: List[logging.Logger]):
+        with self._lock:
+            # Replaced rather than mutated so capture_for can read it unlocked.
+            self._captures = self._captures + [capture]
+            for logger in loggers:
+                handler = self._handlers.get(logger.name)
+                if handler is None:
+                    handler = _RoutingHandler(self, logger)
+                    self._handlers[logger.name] = handler
+                    logger.handlers = [handler]
+                    logger.propagate = False
+                self._logger_refs[logger.name] = self._logger_refs.get(logger.name, 0) + 1
+                self._apply_level(logger)
+            if len(self._captures) == 1:
+                for attr in ("stdout", "stderr"):
+                    stream = _ContextStream(self, getattr(sys, attr), attr)
+                    self._streams[attr] = stream
+                    setattr(sys, attr, stream)
+
+    def exit(self, capture: _Capture, loggers: List[logging.Logger]):
+        with self._lock:
+            self._captures = [c for c in self._captures if c is not capture]
+            for logger in loggers:
+                self._logger_refs[logger.name] -= 1
+                if self._logger_refs[logger.name] == 0:
+                    del self._logger_refs[logger.name]
+                    handler = self._handlers.pop(logger.name)
+                    logger.handlers = handler.saved_handlers
+                    logger.propagate = handler.saved_propagate
+                    logger.setLevel(handler.saved_level)
+                else:
+                    self._apply_level(logger)
+            if not self._captures:
+                for attr, stream in self._streams.items():
+                    # Leave a stream someone else replaced in the meantime alone.
+                    if getattr(sys, attr) is stream:
+                        setattr(sys, attr, stream._original)
+                self._streams.clear()
+
+    def _apply_level(self, logger: logging.Logger):
+        levels = [c.level for c in self._captures if logger.name in c.logger_names]
+        logger.setLevel(min(levels))
+
+
+_router = _LogRouter()
+
+
 @contextmanager
 def log_capture_context(
     log_buffer: List[dict],
@@ -139,10 +325,15 @@ def log_capture_context(
     on_emit: Optional[Callable[[], None]] = None,
     debug: bool = False,
     capture_stdout: bool = True,
-    capture_stderr: bool = True
+    capture_stderr: bool = True,
+    install_id: Optional[str] = None,
 ):
     """Context manager for capturing logs and stdout/stderr.
     
+    Records and writes are routed by a context variable, so captures may
+    run concurrently in different threads (or asyncio tasks) and each one
+    only sees its own install's output.
+    
     Args:
         log_buffer: List to collect log records in
         target_loggers: List of loggers to capture from
@@ -150,6 +341,8 @@ def log_capture_context(
         debug: If True, set log level to DEBUG, else INFO
         capture_stdout: If True, redirect stdout to logger
         capture_stderr: If True, redirect stderr to logger
+        install_id: Identifier for this capture (see current_install_id);
+            generated when omitted
         
     Yields:
         Tuple of (handler, stdout_proxy, stderr_proxy)
@@ -164,36 +357,25 @@ def log_capture_context(
     handler = BufferedLogHandler(log_buffer, on_emit=on_emit)
     stdout_proxy = StreamToLogger(log_buffer, on_emit=on_emit, level="INFO") if capture_stdout else None
     stderr_proxy = StreamToLogger(log_buffer, on_emit=on_emit, level="ERROR") if capture_stderr else None
+    capture = _Capture(
+        install_id or uuid.uuid4().hex,
+        handler,
+        stdout_proxy,
+        stderr_proxy,
+        logging.DEBUG if debug else logging.INFO,
+        frozenset(logger.name for logger in target_loggers),
+    )
     
-    # Save original states
-    original_states = []
-    for logger in target_loggers:
-        original_states.append((logger, list(logger.handlers), logger.propagate, logger.level))
-        logger.handlers = [handler]
-        logger.propagate = False
-        logger.setLevel(logging.DEBUG if debug else logging.INFO)
-    
+    _router.enter(capture, target_loggers)
+    token = _current_capture.set(capture)
     try:
-        if capture_stdout and capture_stderr:
-            import contextlib
-            with contextlib.redirect_stdout(stdout_proxy), contextlib.redirect_stderr(stderr_proxy):
-                yield handler, stdout_proxy, stderr_proxy
-        elif capture_stdout:
-            import contextlib
-            with contextlib.redirect_stdout(stdout_proxy):
-                yield handler, stdout_proxy, None
-        elif capture_stderr:
-            import contextlib
-            with contextlib.redirect_stderr(stderr_proxy):
-                yield handler, None, stderr_proxy
-        else:
-            yield handler, None, None
+        yield handler, stdout_proxy, stderr_proxy
     finally:
-        # Restore original states
-        for logger, handlers, propagate, level in original_states:
-            logger.handlers = handlers
-            logger.propagate = propagate
-            logger.setLevel(level)
+        _current_capture.reset(token)
+        for proxy in (stdout_proxy, stderr_proxy):
+            if proxy is not None:
+                proxy.flush()
+        _router.exit(capture, target_loggers)
 
 
 @contextmanager
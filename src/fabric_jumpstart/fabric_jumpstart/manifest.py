@@ -0,0 +1,199 @@
+"""Per-workspace records of what each install created.
+
+After a successful install, the deployed item ids, their definition content
+hashes and uploaded lakehouse files are written to
+``get_cache_dir("manifests")/<workspace_id>/<logical_id>.json``.
+:mod:`fabric_jumpstart.uninstall` reads these manifests to delete exactly
+what an install created and :mod:`fabric_jumpstart.drift` to detect changes.
+Reinstalling into the same workspace merges into the existing manifest.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+_MANIFESTS_DIRNAME = "manifests"
+
+
+def _safe_name(value: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in value)
+
+
+def new_manifest(logical_id: str, workspace_id: str, repo_ref: Optional[str] = None, prefix: Optional[str] = None) -> Dict:
+    """Return an empty manifest for one install."""
+    return {
+        "version": MANIFEST_VERSION,
+        "logical_id": logical_id,
+        "workspace_id": workspace_id,
+        "repo_ref": repo_ref,
+        "prefixes": [prefix] if prefix else [],
+        "installed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "items": [],
+        "files": [],
+    }
+
+
+def add_items_from_workspace(manifest: Dict, fabric_workspace, preexisting: Iterable[str] = ()) -> None:
+    """Record every published item of a ``FabricWorkspace`` that has an id.
+
+    Args:
+        manifest: Manifest to update
+        fabric_workspace: Deployed FabricWorkspace
+        preexisting: ``"Name.Type"`` entries that existed before the install;
+            such items are marked so uninstall leaves them alone by default
+    """
+    preexisting = set(preexisting)
+    known = {(i["type"], i["name"]): i for i in manifest["items"]}
+    for item_type, items in (getattr(fabric_workspace, "repository_items", None) or {}).items():
+        for item_name, item in items.items():
+            guid = getattr(item, "guid", "")
+            if not guid:
+                continue
+            record = known.get((item_type, item_name))
+            if record is None:
+                record = {"type": item_type, "name": item_name}
+                manifest["items"].append(record)
+                known[(item_type, item_name)] = record
+                record["preexisting"] = f"{item_name}.{item_type}" in preexisting
+            record["id"] = guid
+
+
+def add_files(manifest: Dict, lakehouse_id: str, lakehouse_name: str, paths: Iterable[str]) -> None:
+    """Record files uploaded under a lakehouse's Files area."""
+    for entry in manifest["files"]:
+        if entry["lakehouse_id"] == lakehouse_id:
+            entry["paths"] = sorted(set(entry["paths"]) | set(paths))
+            return
+    manifest["files"].append({"lakehouse_id": lakehouse_id, "lakehouse_name": lakehouse_name, "paths": sorted(paths)})
+
+
+def merge_manifests(old: Dict, new: Dict) -> Dict:
+    """Combine an existing manifest with a newer install of the same jumpstart.
+
+    Items keep their original ``preexisting`` flag, so an item created by an
+    earlier install stays deletable after an ``update_existing`` reinstall,
+    and keep their content hash unless the newer install recorded one.
+    """
+    merged = dict(new)
+    by_key = {(i["type"], i["name"]): dict(i) for i in old.get("items", [])}
+    for item in new.get("items", []):
+        key = (item["type"], item["name"])
+        previous = by_key.get(key)
+        if previous is None:
+            by_key[key] = dict(item)
+            continue
+        by_key[key] = {**item, "preexisting": previous["preexisting"]}
+        if "hash" not in item and "hash" in previous:
+            by_key[key]["hash"] = previous["hash"]
+    merged["items"] = list(by_key.values())
+    merged["prefixes"] = sorted(set(old.get("prefixes", [])) | set(new.get("prefixes", [])))
+    merged["files"] = [dict(f) for f in old.get("files", [])]
+    for entry in new.get("files", []):
+        add_files(merged, entry["lakehouse_id"], entry["lakehouse_name"], entry["paths"])
+    return merged
+
+
+class ManifestStore:
+    """Reads and writes install manifests on local disk.
+
+    Args:
+        root: Directory holding manifests; defaults to ``get_cache_dir("manifests")``
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        if self._root is None:
+            self._root = utils.get_cache_dir(_MANIFESTS_DIRNAME)
+        return self._root
+
+    def path(self, workspace_id: str, logical_id: str) -> Path:
+        return self.root / _safe_name(workspace_id) / f"{_safe_name(logical_id)}.json"
+
+    def load(self, workspace_id: str, logical_id: str) -> Optional[Dict]:
+        """Return the manifest for a jumpstart in a workspace, or None."""
+        path = self.path(workspace_id, logical_id)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable manifest %s: %s", path, e)
+            return None
+
+    def save(self, manifest: Dict, merge: bool = True) -> Path:
+        """Write a manifest, merging with an existing one for the same install.
+
+        Args:
+            manifest: Manifest to write
+            merge: Combine with the stored manifest instead of replacing it
+
+        Returns:
+            Path of the manifest file
+        """
+        path = self.path(manifest["workspace_id"], manifest["logical_id"])
+        with self._lock:
+            if merge:
+                existing = self.load(manifest["workspace_id"], manifest["logical_id"])
+                if existing is not None:
+                    manifest = merge_manifests(existing, manifest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, path)
+        return path
+
+    def delete(self, workspace_id: str, logical_id: str) -> None:
+        """Remove a manifest (no-op when missing)."""
+        with self._lock:
+            self.path(workspace_id, logical_id).unlink(missing_ok=True)
+
+    def list(self, workspace_id: Optional[str] = None) -> List[Dict]:
+        """Return stored manifests, optionally for a single workspace."""
+        if workspace_id is not None:
+            folders = [self.root / _safe_name(workspace_id)]
+        else:
+            folders = [p for p in self.root.iterdir() if p.is_dir()] if self.root.exists() else []
+        manifests = []
+        for folder in folders:
+            for path in sorted(folder.glob("*.json")):
+                try:
+                    manifests.append(json.loads(path.read_text(encoding="utf-8")))
+                except (OSError, ValueError):
+                    continue
+        return manifests
+
+
+_store: Optional[ManifestStore] = None
+_store_lock = threading.Lock()
+
+
+def get_manifest_store() -> ManifestStore:
+    """Return the process-wide manifest store."""
+    global _store
+    store = _store
+    if store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ManifestStore()
+            store = _store
+    return store
+
+
+def reset_manifest_store() -> None:
+    """Discard the process-wide manifest store."""
+    global _store
+    with _store_lock:
+        _store = None
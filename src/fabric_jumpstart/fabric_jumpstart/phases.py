@@ -0,0 +1,200 @@
+"""Dependency-graph execution of install phases.
+
+Install phases declare which phases they depend on; :class:`PhaseGraph` runs
+every phase as soon as its dependencies finish, overlapping independent work
+(repository clone, token acquisition, workspace item listing) on a small
+thread pool. Start and end times are recorded per phase so the critical path
+of an install can be reported.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import events, profiling
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 4
+
+
+class PhaseTiming(NamedTuple):
+    """Wall-clock record of one executed phase (``time.monotonic`` seconds)."""
+
+    name: str
+    start: float
+    end: float
+    thread: str
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class _Phase(NamedTuple):
+    name: str
+    func: Callable[[], Any]
+    deps: Tuple[str, ...]
+
+
+class PhaseGraph:
+    """A set of named phases with dependencies, run with maximal overlap.
+
+    Example:
+        >>> graph = PhaseGraph()
+        >>> graph.add("clone", clone)
+        >>> graph.add("token", acquire_token)
+        >>> graph.add("list_items", list_items, deps=["token"])
+        >>> results = graph.run()
+    """
+
+    def __init__(self):
+        self._phases: Dict[str, _Phase] = {}
+        self.timings: List[PhaseTiming] = []
+        self._timings_lock = threading.Lock()
+
+    def add(self, name: str, func: Callable[[], Any], deps: Iterable[str] = ()) -> "PhaseGraph":
+        """Register a phase.
+
+        Args:
+            name: Unique phase name
+            func: Zero-argument callable; its return value is stored under ``name``
+            deps: Names of phases that must complete first
+
+        Returns:
+            The graph, for chaining
+
+        Raises:
+            ValueError: If a phase with the same name is already registered
+        """
+        if name in self._phases:
+            raise ValueError(f"Duplicate phase: {name}")
+        self._phases[name] = _Phase(name, func, tuple(deps))
+        return self
+
+    def _check(self) -> None:
+        """Validate that all dependencies exist and the graph is acyclic."""
+        for phase in self._phases.values():
+            missing = [d for d in phase.deps if d not in self._phases]
+            if missing:
+                raise ValueError(f"Phase '{phase.name}' depends on unknown phase(s): {missing}")
+
+        visiting, done = set(), set()
+
+        def _visit(name: str, path: List[str]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Phase dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self._phases[name].deps:
+                _visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._phases:
+            _visit(name, [])
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the registered phases, in registration order."""
+        return list(self._phases)
+
+    def _timed(self, phase: _Phase) -> Any:
+        events.phase_started(phase.name)
+        profiling.phase_started(phase.name)
+        start = time.monotonic()
+        ok = False
+        try:
+            result = phase.func()
+            ok = True
+            return result
+        finally:
+            timing = PhaseTiming(phase.name, start, time.monotonic(), threading.current_thread().name)
+            with self._timings_lock:
+                self.timings.append(timing)
+            logger.debug("Phase '%s' finished in %.2fs", phase.name, timing.duration)
+            profiling.phase_finished(phase.name)
+            events.phase_finished(phase.name, timing.duration, ok)
+
+    def run(self, max_workers: int = _DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
+        """Execute all phases, starting each as soon as its dependencies finish.
+
+        Phases run in a copy of the caller's ``contextvars`` context. When a
+        phase fails, no further phases are started; running phases are
+        allowed to finish and the first error is re-raised.
+
+        Args:
+            max_workers: Maximum phases running at once
+
+        Returns:
+            Mapping of phase name to its return value
+
+        Raises:
+            ValueError: If the graph has unknown dependencies or a cycle
+            Exception: The first exception raised by a phase
+        """
+        self._check()
+        results: Dict[str, Any] = {}
+        pending = dict(self._phases)
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jumpstart-phase") as pool:
+            while pending or running:
+                if error is None:
+                    ready = [p for p in pending.values() if all(d in results for d in p.deps)]
+                    for phase in ready:
+                        del pending[phase.name]
+                        ctx = contextvars.copy_context()
+                        running[pool.submit(ctx.run, self._timed, phase)] = phase.name
+                if not running:
+                    break
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        error = error or exc
+                    else:
+                        results[name] = future.result()
+
+        if error is not None:
+            raise error
+        return results
+
+    def critical_path(self) -> List[PhaseTiming]:
+        """Return the chain of phases that determined the total run time.
+
+        Starting from the phase that finished last, repeatedly steps to the
+        dependency that finished last.
+
+        Returns:
+            Phase timings in execution order (empty before :meth:`run`)
+        """
+        by_name = {t.name: t for t in self.timings}
+        if not by_name:
+            return []
+        current: Optional[PhaseTiming] = max(by_name.values(), key=lambda t: t.end)
+        path: List[PhaseTiming] = []
+        while current is not None:
+            path.append(current)
+            deps = [by_name[d] for d in self._phases[current.name].deps if d in by_name]
+            current = max(deps, key=lambda t: t.end) if deps else None
+        return list(reversed(path))
+
+
+def format_phase_timings(timings: Sequence[PhaseTiming], critical: Sequence[PhaseTiming] = ()) -> str:
+    """Render timings as a compact one-line summary, marking critical phases with ``*``."""
+    if not timings:
+        return ""
+    origin = min(t.start for t in timings)
+    critical_names = {t.name for t in critical}
+    parts = []
+    for t in sorted(timings, key=lambda t: t.start):
+        marker = "*" if t.name in critical_names else ""
+        parts.append(f"{t.name}{marker} {t.start - origin:.2f}-{t.end - origin:.2f}s")
+    return "; ".join(parts)
@@ -0,0 +1,299 @@
+"""Background source prefetch so installs can start at the conflict check.
+
+:func:`get_prewarmer` returns a process-wide :class:`Prewarmer` that fetches a
+jumpstart's source on a background thread and stages a ready-to-use working
+copy. Remote sources are kept as pristine clones in the local cache
+(``get_cache_dir("sources")``) so later stagings are local copies; only the
+most recently used clones are kept.
+:meth:`JumpstartInstaller.prepare_workspace` claims a staged copy when one
+exists, skipping the clone entirely.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from . import utils
+from .arena import get_arena
+
+logger = logging.getLogger(__name__)
+
+STATUS_FETCHING = "fetching"
+STATUS_READY = "ready"
+STATUS_CLAIMED = "claimed"
+STATUS_FAILED = "failed"
+STATUS_NOT_STARTED = "not_started"
+
+_SOURCES_DIRNAME = "sources"
+# Cached clones of branch refs can go stale; refetch after this many seconds.
+_SOURCE_TTL_SECONDS = 3600
+_DEFAULT_MAX_WORKERS = 2
+_DEFAULT_MAX_SOURCES = 8
+# How long an install waits for an in-flight prewarm before cloning itself.
+_CLAIM_TIMEOUT_SECONDS = 120.0
+
+
+def source_key(config: Mapping, repo_ref: Optional[str] = None) -> str:
+    """Identify the source a config (and optional ref override) resolves to."""
+    source = config.get("source", {})
+    if "repo_url" in source:
+        return f"{source['repo_url']}@{repo_ref or source.get('repo_ref') or 'main'}"
+    return f"local:{config.get('logical_id', '')}"
+
+
+class _Entry:
+    """Prewarm bookkeeping for one source."""
+
+    def __init__(self, key: str, logical_id: str):
+        self.key = key
+        self.logical_id = logical_id
+        self.status = STATUS_FETCHING
+        self.staged_path: Optional[Path] = None
+        self.error: Optional[str] = None
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self.future: Optional[Future] = None
+        # Keeps the staged copy safe from quota eviction until it is claimed.
+        self.lease = get_arena().open_lease(f"prewarm:{logical_id}")
+
+    def as_dict(self) -> Dict:
+        return {
+            "logical_id": self.logical_id,
+            "source": self.key,
+            "status": self.status,
+            "staged_path": str(self.staged_path) if self.staged_path else None,
+            "error": self.error,
+            "seconds": round((self.finished or time.time()) - self.started, 2),
+        }
+
+
+class Prewarmer:
+    """Fetches and stages jumpstart sources on background threads.
+
+    Args:
+        max_workers: Concurrent prefetches
+        cache_dir: Directory for pristine source clones; defaults to
+            ``get_cache_dir("sources")``
+        max_sources: Pristine clones kept in ``cache_dir``; the least
+            recently used ones beyond this are deleted
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        cache_dir: Optional[Path] = None,
+        max_sources: int = _DEFAULT_MAX_SOURCES,
+    ):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jumpstart-prewarm")
+        self._cache_dir = cache_dir
+        self.max_sources = max_sources
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = utils.get_cache_dir(_SOURCES_DIRNAME)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        return self._cache_dir
+
+    def prewarm(self, config: Mapping, repo_ref: Optional[str] = None) -> Dict:
+        """Start fetching and staging a jumpstart's source in the background.
+
+        Calling again for a source that is fetching or ready is a no-op.
+
+        Args:
+            config: Jumpstart configuration (dict or JumpstartSpec)
+            repo_ref: Optional git ref overriding the registered one
+
+        Returns:
+            Status dictionary (see :meth:`status`)
+        """
+        key = source_key(config, repo_ref)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.status in (STATUS_FETCHING, STATUS_READY):
+                return entry.as_dict()
+            entry = _Entry(key, config.get("logical_id", ""))
+            self._entries[key] = entry
+            entry.future = self._pool.submit(self._fetch, entry, config, repo_ref)
+        logger.info("Prewarming '%s' from %s", entry.logical_id, key)
+        return entry.as_dict()
+
+    def status(self, logical_id: str) -> Dict:
+        """Return the prewarm status of one jumpstart.
+
+        Args:
+            logical_id: Jumpstart to report on
+
+        Returns:
+            The most recent status dictionary for ``logical_id``, with
+            ``logical_id``, ``source``, ``status`` (fetching, ready, claimed,
+            failed, or not_started if it was never prewarmed),
+            ``staged_path``, ``error`` and ``seconds``
+        """
+        matches = [e for e in self.status_all() if e["logical_id"] == logical_id]
+        if matches:
+            return matches[-1]
+        return {
+            "logical_id": logical_id,
+            "source": None,
+            "status": STATUS_NOT_STARTED,
+            "staged_path": None,
+            "error": None,
+            "seconds": 0.0,
+        }
+
+    def status_all(self) -> List[Dict]:
+        """Return the status dictionary (see :meth:`status`) of every prewarmed source."""
+        with self._lock:
+            return [e.as_dict() for e in self._entries.values()]
+
+    def claim(
+        self, config: Mapping, repo_ref: Optional[str] = None, timeout: Optional[float] = _CLAIM_TIMEOUT_SECONDS
+    ) -> Optional[Path]:
+        """Take ownership of a staged working copy, waiting for an in-flight prewarm.
+
+        Each staged copy is handed out once; the caller may modify it freely.
+        Ownership of the directory moves to the caller's arena lease.
+
+        Args:
+            config: Jumpstart configuration (dict or JumpstartSpec)
+            repo_ref: Optional git ref override (must match the prewarm call)
+            timeout: Maximum seconds to wait for an in-flight prewarm (None
+                waits indefinitely)
+
+        Returns:
+            Path to the staged source, or None when nothing usable was prewarmed
+            or the prewarm did not finish within ``timeout``
+        """
+        key = source_key(config, repo_ref)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.future is None:
+            return None
+        try:
+            entry.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning(
+                "Prewarm of '%s' is still running after %ss; fetching the source directly", entry.logical_id, timeout
+            )
+            return None
+        except Exception:
+            return None
+        with self._lock:
+            if entry.status != STATUS_READY or entry.staged_path is None or not entry.staged_path.exists():
+                return None
+            entry.status = STATUS_CLAIMED
+            staged = entry.staged_path
+        get_arena().adopt(staged)
+        entry.lease.release()
+        return staged
+
+    def _fetch(self, entry: _Entry, config: Mapping, repo_ref: Optional[str]) -> None:
+        try:
+            prefix = utils._set_item_prefix(config.get("id", 0), config.get("logical_id", ""))
+            source = config.get("source", {})
+            with entry.lease.activate():
+                if "repo_url" in source:
+                    origin = self._cached_clone(source["repo_url"], repo_ref or source.get("repo_ref"), entry.key)
+                else:
+                    origin = Path(__file__).parent / "jumpstarts" / config.get("logical_id", "")
+                staged = utils.clone_files_to_temp_directory(origin, temp_dir_prefix=prefix)
+            with self._lock:
+                entry.staged_path = staged
+                entry.status = STATUS_READY
+        except Exception as e:
+            logger.warning("Prewarm of '%s' failed: %s", entry.logical_id, e)
+            entry.lease.release()
+            with self._lock:
+                entry.status = STATUS_FAILED
+                entry.error = str(e)
+            raise
+        finally:
+            entry.finished = time.time()
+
+    def _cached_clone(self, repo_url: str, ref: Optional[str], key: str) -> Path:
+        """Return a fresh pristine clone from the cache, cloning when missing or stale."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        target = self.cache_dir / digest
+        # Kept outside the clone so it is never staged into a workspace.
+        marker = self.cache_dir / f"{digest}.fetched"
+        with self._cache_lock:
+            if target.exists() and marker.exists() and time.time() - marker.stat().st_mtime < _SOURCE_TTL_SECONDS:
+                # The clone's own mtime records its last use for eviction.
+                os.utime(target)
+                return target
+
+        cloned = utils.clone_repository(repository_url=repo_url, ref=ref)
+        with self._cache_lock:
+            marker.unlink(missing_ok=True)
+            if target.exists():
+                shutil.rmtree(target, ignore_errors=True)
+            shutil.move(str(cloned), str(target))
+            os.utime(target)
+            marker.write_text(key, encoding="utf-8")
+            self._evict_sources()
+        return target
+
+    def _evict_sources(self) -> None:
+        """Delete the least recently used clones beyond ``max_sources`` (cache lock held)."""
+        clones = sorted(
+            (p for p in self.cache_dir.iterdir() if p.is_dir()),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for clone in clones[self.max_sources:]:
+            logger.debug("Evicting cached source clone %s", clone)
+            (self.cache_dir / f"{clone.name}.fetched").unlink(missing_ok=True)
+            shutil.rmtree(clone, ignore_errors=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool, cancelling queued prewarms.
+
+        With ``wait``, running prewarms finish first and every staged copy
+        that was not claimed is removed.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        if not wait:
+            return
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            if entry.status != STATUS_CLAIMED:
+                entry.lease.release()
+
+
+_prewarmer: Optional[Prewarmer] = None
+_prewarmer_lock = threading.Lock()
+
+
+def get_prewarmer() -> Prewarmer:
+    """Return the process-wide prewarmer."""
+    global _prewarmer
+    prewarmer = _prewarmer
+    if prewarmer is None:
+        with _prewarmer_lock:
+            if _prewarmer is None:
+                _prewarmer = Prewarmer()
+            prewarmer = _prewarmer
+    return prewarmer
+
+
+def reset_prewarmer() -> None:
+    """Stop the process-wide prewarmer and remove its unclaimed staged copies."""
+    global _prewarmer
+    with _prewarmer_lock:
+        prewarmer = _prewarmer
+        _prewarmer = None
+    if prewarmer is not None:
+        prewarmer.shutdown()
@@ -0,0 +1,339 @@
+"""Sampling profiler for one install.
+
+``install(..., profile=True)`` runs the install under :class:`InstallProfiler`.
+A background thread samples the Python stack of the install's threads every
+few milliseconds. Samples are wall-clock, so a thread blocked on an HTTP
+response or sleeping between publish polls counts as much as one running
+regexes or parsing YAML. tracemalloc tracks the peak memory reached while
+each phase ran. When the install ends the profiler writes two files:
+
+- ``<jumpstart>-<install>.collapsed``: one ``frame;frame;... count`` line per
+  distinct stack, rooted at the install phase, for flamegraph.pl, inferno
+  or speedscope
+- ``<jumpstart>-<install>.txt``: per-phase seconds, samples and peak memory,
+  and the functions and packages with the most self samples
+
+Threads outside the install's phases, such as fabric_cicd's workers, are
+rooted at their thread name. Threads parked waiting for work are skipped.
+"""
+
+import contextvars
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .progress import format_bytes
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_INTERVAL_SECONDS = 0.005
+_MAX_STACK_DEPTH = 128
+_HOT_SPOTS = 10
+_JOIN_TIMEOUT_SECONDS = 5.0
+
+# Frames above a phase's own code (thread pool, context copy) are dropped.
+_PHASE_ENTRY = "fabric_jumpstart.phases:PhaseGraph._timed"
+# A thread outside a phase whose innermost frame is in one of these modules is
+# waiting for work (idle pool workers, the install thread waiting on its phases).
+_IDLE_MODULES = frozenset({"threading", "queue", "concurrent.futures._base", "concurrent.futures.thread"})
+
+
+def _module_of(label: str) -> str:
+    return label.split(":", 1)[0]
+
+
+class InstallProfiler:
+    """Samples the stacks and memory of one install's phases.
+
+    Args:
+        jumpstart: Logical id of the jumpstart (names the output files)
+        install_id: Identifier of the install (names the output files)
+        output_dir: Directory receiving the collapsed stacks and summary
+        interval: Seconds between samples
+    """
+
+    def __init__(
+        self,
+        jumpstart: str,
+        install_id: str,
+        output_dir: Union[str, Path],
+        interval: float = _DEFAULT_INTERVAL_SECONDS,
+    ):
+        self.jumpstart = jumpstart
+        self.install_id = install_id
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.peak_memory = 0
+        self._phase_threads: Dict[int, str] = {}
+        self._phase_started: Dict[str, float] = {}
+        self._phase_seconds: Dict[str, float] = {}
+        self._phase_peaks: Dict[str, int] = {}
+        self._labels: Dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._owner: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+        self._summary: Optional[Dict] = None
+
+    def start(self) -> "InstallProfiler":
+        """Start sampling; the calling thread is the install's own thread."""
+        self._owner = threading.get_ident()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        self._thread = threading.Thread(target=self._run, name="fabric-jumpstart-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict:
+        """Stop sampling, write the output files and return :meth:`summary`.
+
+        Safe to call more than once; later calls return the first summary.
+        """
+        if self._summary is not None:
+            return self._summary
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(_JOIN_TIMEOUT_SECONDS)
+        self._fold_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        summary = self.summary()
+        try:
+            summary.update(self.write())
+        except OSError as e:
+            logger.warning(f"Could not write install profile to {self.output_dir}: {e}")
+        self._summary = summary
+        return summary
+
+    def phase_started(self, name: str) -> None:
+        self._fold_memory()
+        with self._lock:
+            self._phase_threads[threading.get_ident()] = name
+            self._phase_started[name] = time.monotonic()
+            self._phase_peaks.setdefault(name, 0)
+
+    def phase_finished(self, name: str) -> None:
+        self._fold_memory()
+        with self._lock:
+            self._phase_threads.pop(threading.get_ident(), None)
+            started = self._phase_started.pop(name, None)
+            if started is not None:
+                self._phase_seconds[name] = self._phase_seconds.get(name, 0.0) + time.monotonic() - started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample(own)
+                self._fold_memory()
+            except Exception as e:  # never let profiling break the install
+                logger.debug(f"Profiler sample failed: {e}")
+
+    def _fold_memory(self) -> None:
+        """Credit the traced-memory peak since the last fold to every running phase."""
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            self.peak_memory = max(self.peak_memory, peak)
+            for name in self._phase_started:
+                self._phase_peaks[name] = max(self._phase_peaks[name], peak)
+
+    def _label(self, code: CodeType, module: str) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = f"{module}:{name}".replace(";", ",").replace(" ", "_")
+        return label
+
+    def _stack(self, frame) -> List[str]:
+        labels = []
+        while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+            labels.append(self._label(frame.f_code, frame.f_globals.get("__name__", "?")))
+            frame = frame.f_back
+        labels.reverse()
+        return labels
+
+    def _sample(self, own: int) -> None:
+        frames = sys._current_frames()
+        with self._lock:
+            phase_threads = dict(self._phase_threads)
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        sampled: List[Tuple[str, ...]] = []
+        for ident, frame in frames.items():
+            if ident == own:
+                continue
+            stack = self._stack(frame)
+            phase = phase_threads.get(ident)
+            if phase is not None:
+                if _PHASE_ENTRY in stack:
+                    stack = stack[len(stack) - stack[::-1].index(_PHASE_ENTRY):]
+                root = phase
+            elif not stack or _module_of(stack[-1]) in _IDLE_MODULES:
+                continue
+            else:
+                root = "install" if ident == self._owner else f"thread:{thread_names.get(ident, ident)}"
+            sampled.append((root, *stack))
+        with self._lock:
+            self.stacks.update(sampled)
+            self.samples += len(sampled)
+
+    def summary(self) -> Dict:
+        """Summarise the samples so far.
+
+        Returns:
+            Dict with ``samples``, ``interval_seconds``, ``peak_memory_bytes``,
+            ``phases`` (``phase``, ``seconds``, ``samples``,
+            ``peak_memory_bytes``, longest first), ``hot_spots`` (innermost
+            ``frame`` with ``samples`` and ``share``) and ``packages`` (the
+            same per top-level package)
+        """
+        with self._lock:
+            stacks = dict(self.stacks)
+            total = self.samples
+            phase_seconds = dict(self._phase_seconds)
+            phase_peaks = dict(self._phase_peaks)
+        roots: Counter = Counter()
+        leaves: Counter = Counter()
+        packages: Counter = Counter()
+        for stack, count in stacks.items():
+            roots[stack[0]] += count
+            leaf = stack[-1]
+            leaves[leaf] += count
+            packages[_module_of(leaf).split(".", 1)[0]] += count
+
+        def _ranked(counter: Counter, key: str) -> List[Dict]:
+            return [
+                {key: name, "samples": n, "share": round(n / total, 4) if total else 0.0}
+                for name, n in counter.most_common(_HOT_SPOTS)
+            ]
+
+        phases = [
+            {
+                "phase": name,
+                "seconds": round(phase_seconds.get(name, 0.0), 3),
+                "samples": roots.get(name, 0),
+                "peak_memory_bytes": phase_peaks.get(name, 0),
+            }
+            for name in set(phase_seconds) | set(phase_peaks)
+        ]
+        phases.sort(key=lambda p: -p["seconds"])
+        return {
+            "samples": total,
+            "interval_seconds": self.interval,
+            "peak_memory_bytes": self.peak_memory,
+            "phases": phases,
+            "hot_spots": _ranked(leaves, "frame"),
+            "packages": _ranked(packages, "package"),
+        }
+
+    def write(self) -> Dict[str, str]:
+        """Write the collapsed stacks and the summary table.
+
+        Returns:
+            Dict with ``collapsed_path`` and ``summary_path``
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.jumpstart}-{self.install_id[:8]}"
+        collapsed_path = self.output_dir / f"{stem}.collapsed"
+        summary_path = self.output_dir / f"{stem}.txt"
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        collapsed_path.write_text(
+            "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks), encoding="utf-8"
+        )
+        summary_path.write_text(
+            format_profile_summary(self.summary(), self.jumpstart, self.install_id) + "\n", encoding="utf-8"
+        )
+        return {"collapsed_path": str(collapsed_path), "summary_path": str(summary_path)}
+
+
+def format_profile_summary(summary: Dict, jumpstart: str = "", install_id: str = "") -> str:
+    """Render :meth:`InstallProfiler.summary` output as a readable table."""
+    title = f"Profile of '{jumpstart}' (install {install_id[:8]})" if jumpstart else "Install profile"
+    lines = [
+        f"{title}: {summary['samples']} samples every {summary['interval_seconds'] * 1000:g} ms, "
+        f"peak traced memory {format_bytes(summary['peak_memory_bytes'])}",
+        "",
+        f"{'Phase':<20} {'Seconds':>8} {'Samples':>8} {'Peak memory':>12}",
+    ]
+    for p in summary["phases"]:
+        lines.append(
+            f"{p['phase']:<20} {p['seconds']:>8.2f} {p['samples']:>8} {format_bytes(p['peak_memory_bytes']):>12}"
+        )
+    for title, key, rows in (
+        ("Hot spots (self samples)", "frame", summary["hot_spots"]),
+        ("By package", "package", summary["packages"]),
+    ):
+        lines += ["", title]
+        lines += [f"  {row['share'] * 100:5.1f}%  {row[key]}" for row in rows]
+    return "\n".join(lines)
+
+
+_current_profiler: contextvars.ContextVar[Optional[InstallProfiler]] = contextvars.ContextVar(
+    "fabric_jumpstart_install_profiler", default=None
+)
+
+
+def current_profiler() -> Optional[InstallProfiler]:
+    """Return the profiler of the install running in this context, if any."""
+    return _current_profiler.get()
+
+
+def phase_started(name: str) -> None:
+    """Attribute this thread's samples to ``name`` (no-op when not profiling)."""
+    profiler = _current_profiler.get()
+    if profiler is not None:
+        profiler.phase_started(name)
+
+
+def phase_finished(name: str) -> None:
+    """End the phase started on this thread (no-op when not profiling)."""
+    profiler = _current_profiler.get()
+    if profiler is not None:
+        profiler.phase_finished(name)
+
+
+@contextmanager
+def install_profile(
+    output_dir: Optional[Union[str, Path]],
+    install_id: str,
+    jumpstart: str,
+    interval: float = _DEFAULT_INTERVAL_SECONDS,
+) -> Iterator[Optional[InstallProfiler]]:
+    """Profile this context's install phases until the block exits.
+
+    Args:
+        output_dir: Directory for the profile files, or None to disable profiling
+        install_id: Identifier of the install
+        jumpstart: Logical id of the jumpstart
+        interval: Seconds between samples
+
+    Yields:
+        The running profiler, or None when disabled. Call
+        :meth:`InstallProfiler.stop` for the summary before the block ends;
+        otherwise it is stopped on exit.
+    """
+    if output_dir is None:
+        yield None
+        return
+    profiler = InstallProfiler(jumpstart, install_id, output_dir, interval).start()
+    token = _current_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current_profiler.reset(token)
+        profiler.stop()
@@ -0,0 +1,193 @@
+"""Phase-weighted install progress from real work counters.
+
+Each install phase carries a weight: the seconds it is expected to take,
+learned from the install history when available and otherwise taken from
+:data:`DEFAULT_PHASE_SECONDS`. A phase that reports its work (objects
+cloned, files rewritten, items published, bytes uploaded) contributes
+``weight * done / total``. A phase that does not report its work advances
+with elapsed time against its weight, and stops just short of done until it
+finishes. Overall progress is the weighted sum over the phases the install
+plans to run, and it never decreases.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Mapping, Optional
+
+# Typical seconds per phase, used until the history has learned durations.
+DEFAULT_PHASE_SECONDS: Dict[str, float] = {
+    "validate": 0.5,
+    "token": 2.0,
+    "prepare_workspace": 10.0,
+    "list_items": 2.0,
+    "init_manager": 0.5,
+    "check_conflicts": 0.5,
+    "apply_prefix": 1.0,
+    "deploy_lakehouse": 15.0,
+    "deploy": 60.0,
+    "upload_files": 15.0,
+    "entry_url": 1.0,
+    "record_hashes": 3.0,
+}
+_UNKNOWN_PHASE_SECONDS = 1.0
+
+# A phase without work counters is never shown as more than this far along.
+_TIME_BASED_CAP = 0.95
+# Progress stays below 100% until the install reports success.
+_MAX_RUNNING_PERCENT = 99.0
+
+PHASE_LABELS: Dict[str, str] = {
+    "prepare_workspace": "Cloning repository",
+    "apply_prefix": "Rewriting files",
+    "deploy_lakehouse": "Publishing lakehouse",
+    "deploy": "Publishing items",
+    "upload_files": "Uploading files",
+}
+
+
+def format_bytes(value: float) -> str:
+    """Render a byte count scaled to B/KB/MB/GB."""
+    for suffix in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {suffix}" if suffix == "B" else f"{value:.1f} {suffix}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+class _PhaseWork:
+    __slots__ = ("started", "finished", "done", "total", "unit")
+
+    def __init__(self):
+        self.started: Optional[float] = None
+        self.finished = False
+        self.done = 0.0
+        self.total = 0.0
+        self.unit = ""
+
+    def fraction(self, now: float, seconds: float) -> float:
+        if self.finished:
+            return 1.0
+        if self.started is None:
+            return 0.0
+        if self.total > 0:
+            return min(self.done / self.total, 1.0)
+        return min((now - self.started) / seconds, _TIME_BASED_CAP) if seconds > 0 else 0.0
+
+    def rate(self, now: float) -> Optional[float]:
+        if self.started is None or not self.unit or self.done <= 0:
+            return None
+        elapsed = now - self.started
+        return self.done / elapsed if elapsed > 0 else None
+
+
+class ProgressModel:
+    """Combines per-phase work into one install progress percentage.
+
+    Args:
+        phase_seconds: Expected seconds per phase (e.g. learned from the
+            install history); missing phases use :data:`DEFAULT_PHASE_SECONDS`
+    """
+
+    def __init__(self, phase_seconds: Optional[Mapping[str, float]] = None):
+        self.phase_seconds: Dict[str, float] = dict(DEFAULT_PHASE_SECONDS)
+        self.phase_seconds.update(phase_seconds or {})
+        self._planned = set(DEFAULT_PHASE_SECONDS) - {"deploy_lakehouse"}
+        self._phases: Dict[str, _PhaseWork] = {}
+        self._percent = 0.0
+        self._complete = False
+        self._lock = threading.Lock()
+
+    def _phase(self, name: str) -> _PhaseWork:
+        work = self._phases.get(name)
+        if work is None:
+            work = self._phases[name] = _PhaseWork()
+            self._planned.add(name)
+        return work
+
+    def plan(self, names: Iterable[str]) -> None:
+        """Set the phases the install will run (phases already seen are kept)."""
+        with self._lock:
+            self._planned = set(names) | set(self._phases)
+
+    def start(self, name: str) -> None:
+        with self._lock:
+            self._phase(name).started = time.monotonic()
+
+    def finish(self, name: str) -> None:
+        with self._lock:
+            work = self._phase(name)
+            work.finished = True
+            if work.total > 0:
+                work.done = work.total
+
+    def set_total(self, name: str, total: float, unit: str) -> None:
+        """Declare the amount of work a phase will do (e.g. bytes to upload)."""
+        with self._lock:
+            work = self._phase(name)
+            work.total = float(total)
+            work.unit = unit
+
+    def advance(self, name: str, amount: float = 1) -> None:
+        """Record ``amount`` of a phase's work as done."""
+        with self._lock:
+            self._phase(name).done += amount
+
+    def complete(self) -> None:
+        with self._lock:
+            self._complete = True
+            self._percent = 100.0
+
+    def percent(self) -> float:
+        """Return overall progress (0-100, never decreasing, 100 only once complete)."""
+        with self._lock:
+            if self._complete:
+                return 100.0
+            now = time.monotonic()
+            total = done = 0.0
+            for name in self._planned:
+                seconds = self.phase_seconds.get(name, _UNKNOWN_PHASE_SECONDS)
+                total += seconds
+                work = self._phases.get(name)
+                if work is not None:
+                    done += seconds * work.fraction(now, seconds)
+            value = 100 * done / total if total > 0 else 0.0
+            self._percent = max(self._percent, min(value, _MAX_RUNNING_PERCENT))
+            return self._percent
+
+    def current(self) -> Optional[Dict]:
+        """Describe the running phase that reports its work, if any.
+
+        Returns:
+            Dict with ``phase``, ``done``, ``total``, ``unit`` and ``rate``
+            (units per second), or None
+        """
+        with self._lock:
+            now = time.monotonic()
+            running = [
+                (name, work) for name, work in self._phases.items()
+                if work.started is not None and not work.finished and work.unit
+            ]
+            if not running:
+                return None
+            name, work = max(running, key=lambda item: self.phase_seconds.get(item[0], _UNKNOWN_PHASE_SECONDS))
+            rate = work.rate(now)
+            return {
+                "phase": name,
+                "done": work.done,
+                "total": work.total,
+                "unit": work.unit,
+                "rate": round(rate, 3) if rate is not None else None,
+            }
+
+    def describe(self) -> Optional[str]:
+        """Return a one-line summary of the running phase's work and throughput."""
+        current = self.current()
+        if current is None:
+            return None
+        unit, done, total, rate = current["unit"], current["done"], current["total"], current["rate"]
+        label = PHASE_LABELS.get(current["phase"], current["phase"].replace("_", " ").capitalize())
+        if unit == "bytes":
+            text = f"{label}: {format_bytes(done)} of {format_bytes(total)}"
+            return text + (f" · {format_bytes(rate)}/s" if rate else "")
+        text = f"{label}: {int(done)} of {int(total)} {unit}"
+        return text + (f" · {rate:.1f} {unit}/s" if rate else "")
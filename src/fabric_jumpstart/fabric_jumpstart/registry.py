@@ -1,46 +1,75 @@
 """Jumpstart registry management for loading and querying available jumpstarts."""
 
+import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import yaml
+from .search import SearchIndex
+from .spec import HEAVY_FIELDS, HeavyFieldStore, JumpstartSpec
+from .validation import RegistryValidationError, load_and_validate
 
 logger = logging.getLogger(__name__)
 
+# Build-time artifact holding the parsed registry and its search index.
+# Generated by hatch_build.py into the wheel; absent in a source checkout.
+COMPILED_REGISTRY_FILENAME = "registry.compiled.json"
+# JSON Lines sidecar holding each entry's heavy fields (spec.HEAVY_FIELDS),
+# read one line at a time when a field is accessed.
+COMPILED_HEAVY_FILENAME = "registry.compiled.heavy.jsonl"
+COMPILED_REGISTRY_VERSION = 2
+
+
+def is_new_since(jumpstart: JumpstartSpec, threshold: datetime) -> bool:
+    """Whether a jumpstart was added on or after ``threshold``.
+
+    Entries with a missing or unparseable date_added are never new.
+    """
+    try:
+        return datetime.strptime(jumpstart.date_added, "%m/%d/%Y") >= threshold
+    except (TypeError, ValueError):
+        return False
+
 
 class JumpstartRegistry:
     """Manages the jumpstart registry and provides query operations.
     
     The registry is loaded from individual YAML files organized in core/
-    and community/ subdirectories.
+    and community/ subdirectories. Entries are read-only
+    :class:`~fabric_jumpstart.spec.JumpstartSpec` records.
     """
     
-    def __init__(self, registry_path: Optional[Path] = None):
+    def __init__(self, registry_path: Optional[Path] = None, strict: bool = True):
         """Initialize the registry.
         
         Args:
             registry_path: Path to jumpstarts directory containing core/ and community/.
                           If None, uses default location: jumpstarts/
+            strict: Raise on invalid YAML entries; when False they are skipped
+                    with a warning
         """
         if registry_path is None:
             registry_path = Path(__file__).parent / "jumpstarts"
         self._registry_path = registry_path
-        self._jumpstarts: Optional[List[Dict]] = None
+        self._strict = strict
+        self._jumpstarts: Optional[List[JumpstartSpec]] = None
+        self._search_index: Optional[SearchIndex] = None
     
-    def load(self) -> List[Dict]:
+    def load(self) -> List[JumpstartSpec]:
         """Load the jumpstart registry from directory structure.
         
-        Scans core/ and community/ subdirectories and adds the 'core' flag
-        based on folder location.
+        Uses the compiled registry artifact when one ships with the package;
+        otherwise scans core/ and community/ subdirectories and adds the 'core'
+        flag based on folder location. The search index is built once here.
         
         Returns:
-            List of jumpstart configuration dictionaries
+            List of jumpstart records
             
         Raises:
             FileNotFoundError: If jumpstarts directory doesn't exist
-            yaml.YAMLError: If any YAML file is invalid
+            RegistryValidationError: If any YAML file is unparseable or fails
+                schema validation (strict registries only)
         """
         if self._jumpstarts is None:
             logger.debug(f"Loading jumpstart registry from {self._registry_path}")
@@ -50,81 +79,216 @@ class JumpstartRegistry:
                     f"Jumpstarts directory not found at {self._registry_path}"
                 )
             
-            self._jumpstarts = self._load_from_directory(self._registry_path)
+            compiled = self._load_compiled(self._registry_path / COMPILED_REGISTRY_FILENAME)
+            if compiled is not None:
+                self._jumpstarts, self._search_index = compiled
+            else:
+                self._jumpstarts = self._load_from_directory(self._registry_path)
+                self._search_index = SearchIndex.build(self._jumpstarts)
             logger.info(f"Loaded {len(self._jumpstarts)} jumpstarts from registry")
             
         return self._jumpstarts
     
-    def _load_from_directory(self, jumpstarts_dir: Path) -> List[Dict]:
+    def _load_from_directory(self, jumpstarts_dir: Path) -> List[JumpstartSpec]:
         """Load jumpstarts from directory structure with core/community folders.
         
+        Every file is validated against the registry schema; all failures are
+        collected before anything is raised.
+        
         Args:
             jumpstarts_dir: Path to jumpstarts directory containing core/ and community/
             
         Returns:
-            List of jumpstart configuration dictionaries with 'core' flag added
+            List of jumpstart records with the 'core' flag set
+            
+        Raises:
+            RegistryValidationError: If any entry is invalid and the registry is strict
         """
-        jumpstarts = []
+        sources = []
+        for folder, is_core in (("core", True), ("community", False)):
+            folder_dir = jumpstarts_dir / folder
+            if folder_dir.is_dir():
+                sources.extend((yml_file, is_core) for yml_file in sorted(folder_dir.glob("*.yml")))
         
-        # Load from core folder
-        core_dir = jumpstarts_dir / "core"
-        if core_dir.is_dir():
-            for yml_file in sorted(core_dir.glob("*.yml")):
-                with open(yml_file, 'r', encoding='utf-8') as f:
-                    jumpstart = yaml.safe_load(f)
-                    if jumpstart:
-                        jumpstart['core'] = True
-                        jumpstarts.append(jumpstart)
-                        logger.debug(f"Loaded core jumpstart: {yml_file.name}")
+        core_flags = dict(sources)
+        loaded, errors = load_and_validate([path for path, _ in sources])
+        if errors:
+            if self._strict:
+                raise RegistryValidationError(errors)
+            for source, messages in errors.items():
+                logger.warning(f"Skipping invalid jumpstart {source}: {'; '.join(messages)}")
         
-        # Load from community folder
-        community_dir = jumpstarts_dir / "community"
-        if community_dir.is_dir():
-            for yml_file in sorted(community_dir.glob("*.yml")):
-                with open(yml_file, 'r', encoding='utf-8') as f:
-                    jumpstart = yaml.safe_load(f)
-                    if jumpstart:
-                        jumpstart['core'] = False
-                        jumpstarts.append(jumpstart)
-                        logger.debug(f"Loaded community jumpstart: {yml_file.name}")
+        jumpstarts = []
+        for yml_file, jumpstart in loaded:
+            if not jumpstart or str(yml_file) in errors:
+                continue
+            jumpstart['core'] = core_flags[yml_file]
+            jumpstarts.append(JumpstartSpec.from_dict(jumpstart))
+            logger.debug(f"Loaded {'core' if jumpstart['core'] else 'community'} jumpstart: {yml_file.name}")
         
         return jumpstarts
     
-    def get_by_id(self, jumpstart_id: str) -> Optional[Dict]:
+    def _load_compiled(self, compiled_path: Path) -> Optional[Tuple[List[JumpstartSpec], SearchIndex]]:
+        """Load the compiled registry artifact if present and readable.
+
+        Heavy fields stay in the sidecar file next to the artifact and are
+        read on access; an artifact written by :meth:`compile` with the heavy
+        fields inline is also accepted.
+
+        Args:
+            compiled_path: Path to the compiled registry JSON
+
+        Returns:
+            Tuple of (jumpstarts, search index) or None to fall back to YAML
+        """
+        if not compiled_path.is_file():
+            return None
+        try:
+            data = json.loads(compiled_path.read_text(encoding='utf-8'))
+            if data.get('version') != COMPILED_REGISTRY_VERSION:
+                logger.debug(f"Ignoring compiled registry with version {data.get('version')!r}")
+                return None
+            heavy = data.get('heavy', {})
+            lazy = data.get('heavy_index', {})
+            store = HeavyFieldStore(
+                compiled_path.with_name(COMPILED_HEAVY_FILENAME),
+                {logical_id: (offset, length) for logical_id, (offset, length, _) in lazy.items()},
+            )
+            jumpstarts = []
+            for entry in data['jumpstarts']:
+                logical_id = entry.get('logical_id')
+                fields = lazy[logical_id][2] if logical_id in lazy else ()
+                jumpstarts.append(JumpstartSpec.from_dict(
+                    {**entry, **heavy.get(logical_id, {})}, lazy=fields, loader=store,
+                ))
+            index = SearchIndex.from_dict(data['search_index'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable compiled registry {compiled_path}: {e}")
+            return None
+        logger.debug(f"Loaded compiled registry from {compiled_path}")
+        return jumpstarts, index
+
+    def compile(self) -> Dict:
+        """Build the compiled registry artifact from the YAML sources.
+
+        The sources are always validated strictly, so an invalid entry fails
+        the build instead of shipping.
+
+        Returns:
+            JSON-serialisable dict with the registry entries, their heavy
+            fields keyed by logical id, and the search index
+        """
+        strict, self._strict = self._strict, True
+        try:
+            jumpstarts = self._load_from_directory(self._registry_path)
+        finally:
+            self._strict = strict
+        heavy = {}
+        for jumpstart in jumpstarts:
+            fields = {f: jumpstart[f] for f in HEAVY_FIELDS if f in jumpstart}
+            if fields:
+                heavy[jumpstart.logical_id] = fields
+        return {
+            'version': COMPILED_REGISTRY_VERSION,
+            'jumpstarts': [j.to_dict(include_heavy=False) for j in jumpstarts],
+            'heavy': heavy,
+            'search_index': SearchIndex.build(jumpstarts).to_dict(),
+        }
+
+    def write_compiled(self, out_dir: Path) -> List[Path]:
+        """Write the compiled registry artifact and its heavy-field sidecar.
+
+        Args:
+            out_dir: Directory to write both files into
+
+        Returns:
+            Paths of the artifact and the sidecar
+        """
+        compiled = self.compile()
+        heavy_index = {}
+        lines = []
+        offset = 0
+        for logical_id, fields in compiled.pop('heavy').items():
+            line = json.dumps(fields, separators=(',', ':'), default=str).encode('utf-8') + b'\n'
+            heavy_index[logical_id] = [offset, len(line), sorted(fields)]
+            lines.append(line)
+            offset += len(line)
+        compiled['heavy_index'] = heavy_index
+
+        compiled_path = out_dir / COMPILED_REGISTRY_FILENAME
+        heavy_path = out_dir / COMPILED_HEAVY_FILENAME
+        compiled_path.write_text(json.dumps(compiled, separators=(',', ':'), default=str), encoding='utf-8')
+        heavy_path.write_bytes(b''.join(lines))
+        return [compiled_path, heavy_path]
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """The inverted search index over the loaded registry."""
+        self.load()
+        if self._search_index is None:
+            self._search_index = SearchIndex.build(self._jumpstarts or [])
+        return self._search_index
+
+    def search(self, query: str, limit: Optional[int] = None, include_unlisted: bool = False) -> List[JumpstartSpec]:
+        """Search jumpstarts by keyword with BM25 ranking.
+
+        Matches name, description, tags, items_in_scope and entry point
+        (e.g. "KQL", "RocksDB", "fraud", "Eventhouse").
+
+        Args:
+            query: Free-text search query
+            limit: Maximum number of results (None for all matches)
+            include_unlisted: If True, include jumpstarts with include_in_listing=False
+
+        Returns:
+            List of matching jumpstart records, best match first
+        """
+        by_id = {j.logical_id: j for j in self.list_all(include_unlisted=include_unlisted)}
+        results = []
+        for logical_id, _score in self.search_index.search(query):
+            jumpstart = by_id.get(logical_id)
+            if jumpstart is None:
+                continue
+            results.append(jumpstart)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def get_by_id(self, jumpstart_id: str) -> Optional[JumpstartSpec]:
         """Get a jumpstart by its logical_id or numeric id.
         
         Args:
             jumpstart_id: Logical ID (e.g., "analytics-lab") or numeric ID
             
         Returns:
-            Jumpstart configuration dict or None if not found
+            Jumpstart record or None if not found
         """
         jumpstarts = self.load()
         return next(
             (
                 item
                 for item in jumpstarts
-                if item.get('logical_id') == jumpstart_id
-                or str(item.get('id')) == str(jumpstart_id)
+                if item.logical_id == jumpstart_id
+                or str(item.id) == str(jumpstart_id)
             ),
             None,
         )
     
-    def list_all(self, include_unlisted: bool = False) -> List[Dict]:
+    def list_all(self, include_unlisted: bool = False) -> List[JumpstartSpec]:
         """Get all jumpstarts, optionally filtering by listing status.
         
         Args:
             include_unlisted: If True, include jumpstarts with include_in_listing=False
             
         Returns:
-            List of jumpstart configuration dictionaries
+            List of jumpstart records
         """
         jumpstarts = self.load()
         if include_unlisted:
             return jumpstarts
-        return [j for j in jumpstarts if j.get('include_in_listing', True)]
+        return [j for j in jumpstarts if j.include_in_listing]
     
-    def filter_by_workload(self, workload: str) -> List[Dict]:
+    def filter_by_workload(self, workload: str) -> List[JumpstartSpec]:
         """Filter jumpstarts by workload tag.
         
         Args:
@@ -136,10 +300,10 @@ class JumpstartRegistry:
         jumpstarts = self.load()
         return [
             j for j in jumpstarts
-            if workload in j.get('workload_tags', [])
+            if workload in j.workload_tags
         ]
     
-    def filter_by_scenario(self, scenario: str) -> List[Dict]:
+    def filter_by_scenario(self, scenario: str) -> List[JumpstartSpec]:
         """Filter jumpstarts by scenario tag.
         
         Args:
@@ -151,10 +315,10 @@ class JumpstartRegistry:
         jumpstarts = self.load()
         return [
             j for j in jumpstarts
-            if scenario in j.get('scenario_tags', [])
+            if scenario in j.scenario_tags
         ]
     
-    def filter_by_type(self, jumpstart_type: str) -> List[Dict]:
+    def filter_by_type(self, jumpstart_type: str) -> List[JumpstartSpec]:
         """Filter jumpstarts by type.
         
         Args:
@@ -166,29 +330,23 @@ class JumpstartRegistry:
         jumpstarts = self.load()
         return [
             j for j in jumpstarts
-            if j.get('type', '').lower() == jumpstart_type.lower()
+            if (j.type or '').lower() == jumpstart_type.lower()
         ]
     
-    def mark_new_items(self, days_threshold: int = 60) -> List[Dict]:
+    def mark_new_items(self, days_threshold: int = 60) -> List[JumpstartSpec]:
         """Mark jumpstarts as 'new' based on their date_added.
         
+        Registry records are read-only, so marked copies are returned and
+        the loaded registry is left unchanged.
+        
         Args:
             days_threshold: Number of days to consider an item "new"
             
         Returns:
-            List of all jumpstarts with 'is_new' field added
+            List of all jumpstarts with the 'is_new' field set
         """
-        jumpstarts = self.load()
         new_threshold = datetime.now() - timedelta(days=days_threshold)
-        
-        for j in jumpstarts:
-            try:
-                date_added = datetime.strptime(j['date_added'], "%m/%d/%Y")
-                j['is_new'] = date_added >= new_threshold
-            except (ValueError, KeyError):
-                j['is_new'] = False
-        
-        return jumpstarts
+        return [j.replace(is_new=is_new_since(j, new_threshold)) for j in self.load()]
     
     def sort_jumpstarts(
         self, 
@@ -0,0 +1,256 @@
+"""Process-wide request scheduling for Fabric and OneLake endpoints.
+
+Concurrent installs share one :class:`RequestScheduler`. Each endpoint class
+(Fabric items API, OneLake DFS) gets a token bucket that caps the request
+rate and an AIMD concurrency limiter that halves on throttling (429 /
+``Retry-After``) and grows back additively on success. Waiters are admitted
+in priority order so metadata calls are not starved by bulk uploads.
+fabric_cicd's own API calls are admitted per request too (see
+``workspace_manager``), so publishes from concurrent installs interleave.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Lower values are admitted first.
+PRIORITY_METADATA = 0
+PRIORITY_PUBLISH = 1
+PRIORITY_BULK = 2
+
+ENDPOINT_ITEMS = "items"
+ENDPOINT_ONELAKE = "onelake"
+
+# (requests per second, burst, initial concurrency, max concurrency)
+_ENDPOINT_LIMITS: Dict[str, Tuple[Optional[float], int, int, int]] = {
+    ENDPOINT_ITEMS: (5.0, 10, 4, 16),
+    ENDPOINT_ONELAKE: (50.0, 100, 8, 64),
+}
+
+_MAX_PAUSE_SECONDS = 120.0
+
+
+def classify_url(url: str) -> Optional[str]:
+    """Map a URL to its endpoint class.
+
+    Returns:
+        ``"items"`` for the Fabric REST API, ``"onelake"`` for OneLake DFS,
+        or None for hosts that are not scheduled (e.g. telemetry)
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    if host.startswith("onelake.") or ".dfs.fabric." in host:
+        return ENDPOINT_ONELAKE
+    if host.startswith("api.fabric.") or host.endswith(".fabric.microsoft.com") or host.startswith("api.powerbi."):
+        return ENDPOINT_ITEMS
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AimdLimiter:
+    """Priority-ordered concurrency limiter with AIMD adaptation.
+
+    The limit grows by roughly one slot per window of successful requests
+    and is multiplied by ``decrease_factor`` on throttling. A ``Retry-After``
+    hint pauses all admissions for that endpoint class.
+
+    Args:
+        initial: Starting concurrency limit
+        minimum: Lower bound for the limit
+        maximum: Upper bound for the limit
+        decrease_factor: Multiplier applied to the limit on throttling
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 64, decrease_factor: float = 0.5):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def acquire(self, priority: int = PRIORITY_METADATA) -> float:
+        """Block until a slot is free and no higher-priority caller is waiting.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    paused = self._paused_until - now
+                    if self._waiters[0] == entry and paused <= 0 and self.in_flight < int(self.limit):
+                        heapq.heappop(self._waiters)
+                        self.in_flight += 1
+                        return time.monotonic() - start
+                    self._cond.wait(paused if paused > 0 else None)
+            except BaseException:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+                raise
+
+    def release(self, throttled: bool = False, retry_after: Optional[float] = None, failed: bool = False) -> None:
+        """Return a slot and adapt the limit to the outcome.
+
+        Args:
+            throttled: The request was rejected with a throttling response
+            retry_after: Server-requested pause in seconds, if any
+            failed: The request got no response (connection error, timeout);
+                the limit is left as is
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                if retry_after:
+                    pause_until = time.monotonic() + min(retry_after, _MAX_PAUSE_SECONDS)
+                    self._paused_until = max(self._paused_until, pause_until)
+                logger.debug("Throttled; concurrency limit reduced to %.1f", self.limit)
+            elif not failed:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+class _Slot:
+    """Handle for an admitted request; call :meth:`record` with the outcome."""
+
+    def __init__(self):
+        self.throttled = False
+        self.retry_after: Optional[float] = None
+
+    def record(self, status_code: Optional[int], retry_after: Optional[float] = None) -> None:
+        self.throttled = status_code == 429 or (status_code == 503 and retry_after is not None)
+        self.retry_after = retry_after
+
+
+class RequestScheduler:
+    """Admits requests per endpoint class through a rate and concurrency limit."""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[Optional[float], int, int, int]]] = None):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._limiters: Dict[str, AimdLimiter] = {}
+        self._waited: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        for name, (rate, burst, initial, maximum) in (limits or _ENDPOINT_LIMITS).items():
+            if rate:
+                self._buckets[name] = TokenBucket(rate, burst)
+            self._limiters[name] = AimdLimiter(initial, maximum=maximum)
+            self._waited[name] = 0.0
+
+    @contextmanager
+    def slot(self, endpoint: Optional[str], priority: int = PRIORITY_METADATA) -> Iterator[_Slot]:
+        """Hold a request slot for ``endpoint`` for the duration of the block.
+
+        Unknown or None endpoint classes are admitted immediately. A block
+        that raises (e.g. a connection error) releases the slot as a failure,
+        which does not grow the limit.
+
+        Args:
+            endpoint: Endpoint class (see :func:`classify_url`)
+            priority: Admission priority (``PRIORITY_*``; lower goes first)
+        """
+        handle = _Slot()
+        limiter = self._limiters.get(endpoint) if endpoint else None
+        if endpoint is None or limiter is None:
+            yield handle
+            return
+
+        waited = limiter.acquire(priority)
+        failed = True
+        try:
+            bucket = self._buckets.get(endpoint)
+            if bucket is not None:
+                waited += bucket.acquire()
+            with self._lock:
+                self._waited[endpoint] += waited
+            yield handle
+            failed = False
+        finally:
+            limiter.release(handle.throttled, handle.retry_after, failed=failed)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the current limit, in-flight count, throttle count and total wait per class."""
+        with self._lock:
+            return {
+                name: {
+                    "limit": round(limiter.limit, 2),
+                    "in_flight": limiter.in_flight,
+                    "throttled": limiter.throttled,
+                    "waited_seconds": round(self._waited[name], 3),
+                }
+                for name, limiter in self._limiters.items()
+            }
+
+
+_scheduler: Optional[RequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """Return the process-wide request scheduler."""
+    global _scheduler
+    scheduler = _scheduler
+    if scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler()
+            scheduler = _scheduler
+    return scheduler
+
+
+def reset_scheduler() -> None:
+    """Discard the process-wide scheduler and its adapted limits."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
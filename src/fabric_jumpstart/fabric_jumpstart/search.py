@@ -0,0 +1,197 @@
+"""Inverted text index and BM25 ranking for jumpstart catalog search."""
+
+import bisect
+import math
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+SEARCH_INDEX_VERSION = 1
+
+# Relative importance of each searchable field. Weighted term frequencies are
+# summed per document (a BM25F-style simplification).
+FIELD_WEIGHTS: Dict[str, float] = {
+    "name": 3.0,
+    "logical_id": 2.0,
+    "workload_tags": 2.0,
+    "scenario_tags": 2.0,
+    "type": 1.5,
+    "items_in_scope": 1.5,
+    "entry_point": 1.5,
+    "description": 1.0,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or the this to using with".split()
+)
+
+
+def tokenize_query(text: str) -> List[str]:
+    """Split a search query into lowercase alphanumeric terms.
+
+    Queries are tokenized without camelCase splitting so the catalog JS can
+    reproduce the exact same behaviour with a single regex.
+    """
+    terms = [t.lower() for t in _WORD_RE.findall(text or "")]
+    return [t for t in terms if t not in _STOPWORDS]
+
+
+def tokenize_document(text: str) -> List[str]:
+    """Split document text into terms, expanding camelCase identifiers.
+
+    ``BankingLoanFraud.Notebook`` yields ``bankingloanfraud``, ``banking``,
+    ``loan``, ``fraud`` and ``notebook`` so both the identifier and its words
+    are searchable.
+    """
+    terms: List[str] = []
+    for word in _WORD_RE.findall(text or ""):
+        lowered = word.lower()
+        if lowered not in _STOPWORDS:
+            terms.append(lowered)
+        parts = _CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            terms.extend(p.lower() for p in parts if p.lower() not in _STOPWORDS)
+    return terms
+
+
+def _field_text(jumpstart: Mapping, field: str) -> str:
+    value = jumpstart.get(field)
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+class SearchIndex:
+    """Prebuilt inverted index over the jumpstart registry.
+
+    BM25 weights are computed once at build time and stored per posting, so a
+    query is a dictionary lookup per term plus a sum. The index serialises to
+    plain JSON-compatible data via :meth:`to_dict` for embedding in the
+    compiled registry artifact and the catalog HTML.
+    """
+
+    def __init__(self, doc_ids: List[str], postings: Dict[str, List[Tuple[int, float]]]):
+        self.doc_ids = doc_ids
+        self.postings = postings
+        self._vocabulary = sorted(postings)
+
+    @classmethod
+    def build(cls, jumpstarts: Iterable[Mapping]) -> "SearchIndex":
+        """Build an index from registry entries.
+
+        Args:
+            jumpstarts: Registry entries (dict-like, keyed by field name)
+
+        Returns:
+            A ready-to-query SearchIndex
+        """
+        doc_ids: List[str] = []
+        doc_terms: List[Dict[str, float]] = []
+        doc_lengths: List[float] = []
+
+        for jumpstart in jumpstarts:
+            doc_ids.append(str(jumpstart.get("logical_id") or jumpstart.get("id", "")))
+            weighted: Dict[str, float] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize_document(_field_text(jumpstart, field)):
+                    weighted[term] = weighted.get(term, 0.0) + weight
+            doc_terms.append(weighted)
+            doc_lengths.append(sum(weighted.values()))
+
+        n_docs = len(doc_ids)
+        avg_length = (sum(doc_lengths) / n_docs) if n_docs else 0.0
+
+        doc_freq: Dict[str, int] = {}
+        for weighted in doc_terms:
+            for term in weighted:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_idx, weighted in enumerate(doc_terms):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * (doc_lengths[doc_idx] / avg_length if avg_length else 0.0))
+            for term, tf in weighted.items():
+                df = doc_freq[term]
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                score = idf * (tf * (BM25_K1 + 1)) / (tf + norm)
+                postings.setdefault(term, []).append((doc_idx, round(score, 4)))
+
+        return cls(doc_ids, postings)
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Return vocabulary terms starting with prefix (sorted-vocabulary scan)."""
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        matches = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None, prefix: bool = True) -> List[Tuple[str, float]]:
+        """Rank documents against a free-text query.
+
+        Every query term contributes its precomputed BM25 weight. When
+        ``prefix`` is True the final term also matches longer vocabulary
+        terms (type-ahead), so ``kql`` finds ``kqldatabase``.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results (None for all matches)
+            prefix: Expand the last query term as a prefix
+
+        Returns:
+            List of (logical_id, score) tuples, best match first
+        """
+        terms = tokenize_query(query)
+        if not terms:
+            return []
+
+        scores: Dict[int, float] = {}
+        for position, term in enumerate(terms):
+            expanded = [term]
+            if prefix and position == len(terms) - 1:
+                expanded = self._expand_prefix(term) or [term]
+            best: Dict[int, float] = {}
+            for candidate in expanded:
+                for doc_idx, weight in self.postings.get(candidate, ()):
+                    if weight > best.get(doc_idx, 0.0):
+                        best[doc_idx] = weight
+            for doc_idx, weight in best.items():
+                scores[doc_idx] = scores.get(doc_idx, 0.0) + weight
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], self.doc_ids[kv[0]]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.doc_ids[doc_idx], round(score, 4)) for doc_idx, score in ranked]
+
+    def to_dict(self) -> Dict:
+        """Serialise to JSON-compatible data (shared with the catalog JS)."""
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "stopwords": sorted(_STOPWORDS),
+            "docs": self.doc_ids,
+            "postings": {term: [[d, w] for d, w in plist] for term, plist in self.postings.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SearchIndex":
+        """Restore an index produced by :meth:`to_dict`.
+
+        Raises:
+            ValueError: If the serialised index version is not supported
+        """
+        version = data.get("version")
+        if version != SEARCH_INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {version!r}")
+        postings = {
+            term: [(int(d), float(w)) for d, w in plist]
+            for term, plist in data.get("postings", {}).items()
+        }
+        return cls(list(data.get("docs", [])), postings)
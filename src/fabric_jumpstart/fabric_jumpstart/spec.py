@@ -0,0 +1,273 @@
+"""Compact, read-only records for jumpstart registry entries.
+
+A :class:`JumpstartSpec` stores one registry entry in ``__slots__`` instead
+of a per-entry dict, with list fields frozen to tuples and the source block
+to a read-only mapping. It implements :class:`collections.abc.Mapping`, so
+existing ``entry['name']`` / ``entry.get('type')`` callers keep working,
+while attribute access (``entry.type``) applies the registry defaults in one
+place.
+
+Heavy fields (:data:`HEAVY_FIELDS`) are not needed to list or install a
+jumpstart, so records built from the compiled registry keep only their
+names and fetch the values from the compiled sidecar file when accessed.
+"""
+
+import json
+import logging
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Loaded on demand rather than held for the life of the process.
+HEAVY_FIELDS: Tuple[str, ...] = ("mermaid_diagram",)
+
+# Registry schema fields (see validation.py) plus the derived 'core' and
+# 'is_new' flags, in the order they are iterated.
+FIELDS: Tuple[str, ...] = (
+    "id", "logical_id", "name", "description", "date_added", "include_in_listing",
+    "workload_tags", "scenario_tags", "type", "core", "source", "items_in_scope",
+    "feature_flags", "jumpstart_docs_uri", "entry_point", "test_suite", "owner_email",
+    "minutes_to_complete_jumpstart", "minutes_to_deploy", "video_url", "difficulty",
+    "last_updated", "is_new",
+)
+
+_LIST_FIELDS = frozenset(("workload_tags", "scenario_tags", "items_in_scope", "feature_flags"))
+# Short, highly repeated strings shared across entries.
+_INTERNED_FIELDS = frozenset(("workload_tags", "scenario_tags", "items_in_scope", "type", "difficulty"))
+
+# Values returned by attribute access for fields the entry does not set.
+_DEFAULTS: Dict[str, Any] = {
+    "id": 0,
+    "logical_id": "",
+    "name": "",
+    "description": "",
+    "date_added": "",
+    "include_in_listing": True,
+    "workload_tags": (),
+    "scenario_tags": (),
+    "type": None,
+    "core": False,
+    "source": MappingProxyType({}),
+    "items_in_scope": (),
+    "feature_flags": (),
+    "jumpstart_docs_uri": None,
+    "entry_point": None,
+    "test_suite": None,
+    "owner_email": "",
+    "minutes_to_complete_jumpstart": None,
+    "minutes_to_deploy": None,
+    "video_url": None,
+    "difficulty": None,
+    "last_updated": None,
+    "is_new": False,
+    "mermaid_diagram": None,
+}
+
+_FIELD_SET = frozenset(FIELDS)
+_KNOWN_FIELDS = _FIELD_SET | frozenset(HEAVY_FIELDS)
+
+# Placeholder for a heavy field whose value lives in the compiled sidecar.
+_LAZY = object()
+
+HeavyLoader = Callable[[str], Dict[str, Any]]
+
+
+def _freeze(field: str, value: Any) -> Any:
+    if field in _LIST_FIELDS and isinstance(value, list):
+        if field in _INTERNED_FIELDS:
+            return tuple(sys.intern(v) if isinstance(v, str) else v for v in value)
+        return tuple(value)
+    if field == "source" and isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    if field in _INTERNED_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return value
+
+
+class JumpstartSpec(Mapping):
+    """Read-only registry entry.
+
+    Construct with :meth:`from_dict`. Keys the entry does not set are absent
+    from the mapping (``'type' in spec`` is False) while the attribute
+    returns the registry default (``spec.type`` is None).
+    """
+
+    __slots__ = FIELDS + ("_heavy", "_loader")
+
+    id: int
+    logical_id: str
+    name: str
+    description: str
+    date_added: str
+    include_in_listing: bool
+    workload_tags: Tuple[str, ...]
+    scenario_tags: Tuple[str, ...]
+    type: Optional[str]
+    core: bool
+    source: Mapping
+    items_in_scope: Tuple[str, ...]
+    feature_flags: Tuple[str, ...]
+    jumpstart_docs_uri: Optional[str]
+    entry_point: Optional[str]
+    test_suite: Optional[str]
+    owner_email: str
+    minutes_to_complete_jumpstart: Optional[int]
+    minutes_to_deploy: Optional[int]
+    video_url: Optional[str]
+    difficulty: Optional[str]
+    last_updated: Optional[str]
+    is_new: bool
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping, lazy: Iterable[str] = (), loader: Optional[HeavyLoader] = None
+    ) -> "JumpstartSpec":
+        """Build a record from a registry entry.
+
+        Args:
+            data: Entry mapping
+            lazy: Heavy fields the entry sets but ``data`` omits
+            loader: Called with the logical id to fetch the lazy fields
+
+        Returns:
+            The record
+
+        Raises:
+            ValueError: If the entry has fields outside the registry schema
+        """
+        unknown = set(data) - _KNOWN_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown jumpstart field(s): {', '.join(sorted(unknown))}")
+        spec = object.__new__(cls)
+        for field in FIELDS:
+            if field in data:
+                object.__setattr__(spec, field, _freeze(field, data[field]))
+        heavy = {f: data[f] for f in HEAVY_FIELDS if f in data}
+        heavy.update((f, _LAZY) for f in lazy if f in HEAVY_FIELDS and f not in heavy)
+        object.__setattr__(spec, "_heavy", heavy or None)
+        object.__setattr__(spec, "_loader", loader)
+        return spec
+
+    @classmethod
+    def coerce(cls, config: Mapping) -> "JumpstartSpec":
+        """Return ``config`` as a record, converting plain dicts."""
+        return config if isinstance(config, cls) else cls.from_dict(config)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots and heavy fields.
+        if name in _DEFAULTS:
+            if name in HEAVY_FIELDS:
+                return self._load_heavy(name) if self._has_heavy(name) else _DEFAULTS[name]
+            return _DEFAULTS[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is read-only; use replace()")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is read-only; use replace()")
+
+    def _has_heavy(self, field: str) -> bool:
+        heavy = self._heavy
+        return heavy is not None and field in heavy
+
+    def _load_heavy(self, field: str) -> Any:
+        value = self._heavy[field]
+        if value is not _LAZY:
+            return value
+        if self._loader is None:
+            raise KeyError(field)
+        # Not cached: the point is to not keep these resident.
+        return self._loader(self.logical_id)[field]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if key in HEAVY_FIELDS and self._has_heavy(key):
+            return self._load_heavy(key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        if key in _FIELD_SET:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                return False
+            return True
+        return self._has_heavy(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field in FIELDS:
+            if field in self:
+                yield field
+        if self._heavy:
+            yield from (f for f in HEAVY_FIELDS if f in self._heavy)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(logical_id={self.logical_id!r}, id={self.id!r})"
+
+    def __reduce__(self):
+        return (type(self).from_dict, (self.to_dict(),))
+
+    def replace(self, **changes: Any) -> "JumpstartSpec":
+        """Return a copy with ``changes`` applied, sharing the heavy field loader.
+
+        Raises:
+            ValueError: If a change names a field outside the registry schema
+        """
+        data: Dict[str, Any] = {f: object.__getattribute__(self, f) for f in FIELDS if f in self}
+        data.update(changes)
+        if self._heavy:
+            for field, value in self._heavy.items():
+                data.setdefault(field, value)
+        return type(self).from_dict(data, loader=self._loader)
+
+    def to_dict(self, include_heavy: bool = True) -> Dict[str, Any]:
+        """Return the entry as a plain, JSON-serialisable dict.
+
+        Args:
+            include_heavy: Materialise heavy fields (loading them if needed)
+        """
+        data = {f: _thaw(object.__getattribute__(self, f)) for f in FIELDS if f in self}
+        if include_heavy and self._heavy:
+            for field in self._heavy:
+                data[field] = self._load_heavy(field)
+        return data
+
+
+class HeavyFieldStore:
+    """Reads heavy fields from the compiled registry's JSON Lines sidecar.
+
+    Each line holds one entry's heavy fields; the compiled index records the
+    byte range of every line, so a lookup is one seek and one small read.
+    """
+
+    def __init__(self, path: Path, offsets: Dict[str, Tuple[int, int]]):
+        self._path = path
+        self._offsets = offsets
+
+    def __call__(self, logical_id: str) -> Dict[str, Any]:
+        offset, length = self._offsets[logical_id]
+        with open(self._path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
@@ -5,19 +5,26 @@ The ingestion connection string is *not* a secret — it is a write-only
 public identifier, the same pattern used by the App Insights JS SDK in
 browsers and by Google Analytics tracking IDs.
 
+Events are queued to a single long-lived background sender which POSTs
+them in batches (the Track API accepts JSON arrays of envelopes).  Pending
+events are flushed at interpreter exit with a short deadline, and batches
+that cannot be delivered are spooled to disk and retried later.
+
 Telemetry can be disabled by setting the environment variable
 ``JUMPSTART_TELEMETRY_OPTOUT=1``.  The connection string can be
 overridden via ``APPLICATIONINSIGHTS_CONNECTION_STRING``.
 """
 
+import atexit
 import hashlib
 import json
 import logging
 import os
+import queue
 import threading
 import time
-import urllib.request
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,18 @@ _USER_HASH_SALT = "fabric-jumpstart-telemetry-v1"
 
 _FABRIC_API_SCOPE = "https://api.fabric.microsoft.com/.default"
 
+# Sender tuning: bounded queue, max envelopes per POST, how long to wait for
+# more events before sending a partial batch, and the exit flush deadline.
+_QUEUE_MAXSIZE = 1000
+_BATCH_MAX_EVENTS = 100
+_BATCH_WINDOW_SECONDS = 0.5
+_ATEXIT_FLUSH_SECONDS = 3.0
+_SEND_TIMEOUT_SECONDS = 3
+
+# Offline spool of undelivered batches, retried after the next successful send.
+_SPOOL_DIRNAME = "telemetry-spool"
+_SPOOL_MAX_FILES = 100
+
 
 def _parse_connection_string(conn_str: str) -> tuple[str, str]:
     """Return (ingestion_endpoint, instrumentation_key) from a connection string."""
@@ -71,14 +90,14 @@ def _resolve_user_hash() -> Optional[str]:
     or None if the hash cannot be determined (credential unavailable,
     token not a JWT, missing ``oid`` claim, etc.).
 
-    This function is designed to run on the telemetry daemon thread and
-    never raises.
+    This function is designed to run on the telemetry sender thread and
+    never raises. Use :func:`_get_user_hash` for the per-process cached value.
     """
     try:
-        from .utils import _decode_jwt, resolve_token_credential
+        from .auth import get_token_manager
+        from .utils import _decode_jwt
 
-        credential = resolve_token_credential()
-        token_obj = credential.get_token(_FABRIC_API_SCOPE)
+        token_obj = get_token_manager().get_token(_FABRIC_API_SCOPE)
         payload = _decode_jwt(token_obj.token)
         oid = payload.get("oid")
         if oid:
@@ -88,16 +107,40 @@ def _resolve_user_hash() -> Optional[str]:
     return None
 
 
+_user_hash_lock = threading.Lock()
+_user_hash_resolved = False
+_user_hash: Optional[str] = None
+
+
+def _get_user_hash(resolve: bool = True) -> Optional[str]:
+    """Return the hashed user id, resolving it at most once per process.
+
+    Args:
+        resolve: If False, only return an already-resolved value (never
+            acquires a token; used on the exit path)
+    """
+    global _user_hash_resolved, _user_hash
+    if _user_hash_resolved or not resolve:
+        return _user_hash
+    with _user_hash_lock:
+        if not _user_hash_resolved:
+            _user_hash = _resolve_user_hash()
+            _user_hash_resolved = True
+    return _user_hash
+
+
 def _build_envelope(
     ikey: str,
     event_name: str,
     properties: dict[str, str],
     user_hash: Optional[str] = None,
+    timestamp: Optional[float] = None,
 ) -> dict:
     """Build an Application Insights Track API envelope."""
+    event_time = time.gmtime(timestamp) if timestamp is not None else time.gmtime()
     envelope: dict = {
         "name": "Microsoft.ApplicationInsights.Event",
-        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", event_time),
         "iKey": ikey,
         "data": {
             "baseType": "EventData",
@@ -113,22 +156,31 @@ def _build_envelope(
     return envelope
 
 
-def _send(endpoint: str, payload: bytes) -> None:
-    """POST payload to the App Insights ingestion endpoint (best-effort)."""
-    req = urllib.request.Request(
-        f"{endpoint}{_TRACK_PATH}",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+def _send(endpoint: str, payload: bytes) -> bool:
+    """POST payload to the App Insights ingestion endpoint.
+
+    Returns:
+        True when the batch is done with (accepted, or rejected as malformed
+        and not worth retrying); False when it should be spooled for retry.
+    """
+    from .http_client import get_http_client
+
     try:
-        urllib.request.urlopen(req, timeout=3)
+        # No in-call retries: failed batches are spooled and retried later.
+        response = get_http_client().post(
+            f"{endpoint}{_TRACK_PATH}",
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=_SEND_TIMEOUT_SECONDS,
+            retries=0,
+        )
     except Exception:
-        pass
+        return False
+    status = response.status_code
+    return not (status == 429 or status >= 500)
 
 
-def _track_install_worker(
-    conn_str: str,
+def _build_install_properties(
     jumpstart_id: str,
     jumpstart_numeric_id: int,
     jumpstart_type: str,
@@ -136,14 +188,8 @@ def _track_install_worker(
     duration_seconds: Optional[float] = None,
     install_mode: Optional[str] = None,
     non_registered_install: bool = False,
-) -> None:
-    """Worker that resolves user hash and sends the telemetry event."""
-    endpoint, ikey = _parse_connection_string(conn_str)
-    if not ikey:
-        return
-
-    user_hash = _resolve_user_hash()
-
+) -> dict[str, str]:
+    """Build the custom properties for a ``jumpstart_installed`` event."""
     properties: dict[str, str] = {
         "jumpstart_id": jumpstart_id,
         "jumpstart_numeric_id": str(jumpstart_numeric_id),
@@ -156,15 +202,206 @@ def _track_install_worker(
         properties["install_mode"] = install_mode
     if non_registered_install:
         properties["non_registered_install"] = "true"
+    return properties
 
-    envelope = _build_envelope(
-        ikey=ikey,
-        event_name="jumpstart_installed",
-        properties=properties,
-        user_hash=user_hash,
-    )
-    payload = json.dumps(envelope).encode("utf-8")
-    _send(endpoint, payload)
+
+# (endpoint, ikey, event_name, properties, timestamp)
+_QueuedEvent = Tuple[str, str, str, dict, float]
+
+
+class _TelemetrySender:
+    """Single background sender that batches events to the Track API.
+
+    Args:
+        spool_dir: Directory for undelivered batches (None resolves the
+            default cache location lazily; spooling is skipped if unavailable)
+        maxsize: Maximum number of queued events; further events are dropped
+    """
+
+    def __init__(self, spool_dir: Optional[Path] = None, maxsize: int = _QUEUE_MAXSIZE):
+        self._queue: "queue.Queue[_QueuedEvent]" = queue.Queue(maxsize=maxsize)
+        self._spool_dir = spool_dir
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._flushing = threading.Event()
+        self.dropped = 0
+
+    def enqueue(self, endpoint: str, ikey: str, event_name: str, properties: dict) -> bool:
+        """Queue an event for delivery without blocking.
+
+        Returns:
+            False if the queue is full and the event was dropped
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((endpoint, ikey, event_name, properties, time.time()))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="fabric-jumpstart-telemetry", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        self._drain_spool()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + _BATCH_WINDOW_SECONDS
+            while len(batch) < _BATCH_MAX_EVENTS:
+                remaining = deadline - time.monotonic()
+                if self._flushing.is_set():
+                    remaining = 0
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._deliver(batch, resolve_user=True)
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, batch: List[_QueuedEvent], resolve_user: bool) -> None:
+        """Send a batch grouped by endpoint; spool whatever fails."""
+        user_hash = _get_user_hash(resolve=resolve_user)
+        by_endpoint: dict[str, list] = {}
+        for endpoint, ikey, event_name, properties, timestamp in batch:
+            by_endpoint.setdefault(endpoint, []).append(
+                _build_envelope(ikey, event_name, properties, user_hash=user_hash, timestamp=timestamp)
+            )
+        for endpoint, envelopes in by_endpoint.items():
+            if _send(endpoint, json.dumps(envelopes).encode("utf-8")):
+                self._drain_spool()
+            else:
+                self._spool(endpoint, envelopes)
+
+    def _get_spool_dir(self) -> Optional[Path]:
+        if self._spool_dir is None:
+            try:
+                from .utils import get_cache_dir
+
+                self._spool_dir = get_cache_dir(_SPOOL_DIRNAME)
+            except Exception:
+                return None
+        return self._spool_dir
+
+    def _spool(self, endpoint: str, envelopes: list) -> None:
+        """Persist an undelivered batch for a later retry (best-effort)."""
+        spool_dir = self._get_spool_dir()
+        if spool_dir is None:
+            return
+        try:
+            spool_dir.mkdir(parents=True, exist_ok=True)
+            path = spool_dir / f"{time.time_ns()}-{os.getpid()}-{threading.get_ident()}.json"
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"endpoint": endpoint, "envelopes": envelopes}), encoding="utf-8")
+            tmp.replace(path)
+            files = sorted(spool_dir.glob("*.json"))
+            for old in files[: max(0, len(files) - _SPOOL_MAX_FILES)]:
+                old.unlink(missing_ok=True)
+        except Exception:
+            pass
+
+    def _drain_spool(self) -> None:
+        """Retry spooled batches oldest-first, stopping at the first failure."""
+        spool_dir = self._get_spool_dir()
+        if spool_dir is None or not spool_dir.is_dir():
+            return
+        for path in sorted(spool_dir.glob("*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                payload = json.dumps(data["envelopes"]).encode("utf-8")
+                endpoint = data["endpoint"]
+            except Exception:
+                path.unlink(missing_ok=True)
+                continue
+            if not _send(endpoint, payload):
+                return
+            path.unlink(missing_ok=True)
+
+    def flush(self, timeout: float = _ATEXIT_FLUSH_SECONDS) -> bool:
+        """Wait up to ``timeout`` seconds for queued events to be sent.
+
+        Events still queued when the deadline passes are spooled to disk.
+
+        Returns:
+            True if the queue drained before the deadline
+        """
+        self._flushing.set()
+        try:
+            deadline = time.monotonic() + timeout
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._thread is None or not self._thread.is_alive():
+                        break
+                    self._queue.all_tasks_done.wait(remaining)
+                drained = not self._queue.unfinished_tasks
+
+            leftover: List[_QueuedEvent] = []
+            while True:
+                try:
+                    leftover.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_endpoint: dict[str, list] = {}
+            user_hash = _get_user_hash(resolve=False)
+            for endpoint, ikey, event_name, properties, timestamp in leftover:
+                by_endpoint.setdefault(endpoint, []).append(
+                    _build_envelope(ikey, event_name, properties, user_hash=user_hash, timestamp=timestamp)
+                )
+                self._queue.task_done()
+            for endpoint, envelopes in by_endpoint.items():
+                self._spool(endpoint, envelopes)
+            return drained
+        finally:
+            self._flushing.clear()
+
+
+_sender: Optional[_TelemetrySender] = None
+_sender_lock = threading.Lock()
+
+
+def _get_sender() -> _TelemetrySender:
+    """Return the process-wide sender, registering the exit flush on first use."""
+    global _sender
+    sender = _sender
+    if sender is None:
+        with _sender_lock:
+            if _sender is None:
+                _sender = _TelemetrySender()
+                atexit.register(_flush_at_exit)
+            sender = _sender
+    return sender
+
+
+def _flush_at_exit() -> None:
+    try:
+        if _sender is not None:
+            _sender.flush(timeout=_ATEXIT_FLUSH_SECONDS)
+    except Exception:
+        pass
+
+
+def flush(timeout: float = _ATEXIT_FLUSH_SECONDS) -> bool:
+    """Block up to ``timeout`` seconds until queued telemetry is sent.
+
+    Returns:
+        True if nothing is left pending
+    """
+    if _sender is None:
+        return True
+    return _sender.flush(timeout=timeout)
 
 
 def track_install(
@@ -178,20 +415,27 @@ def track_install(
 ) -> None:
     """Record a jumpstart install event (fire-and-forget).
 
-    This never raises and never blocks the install flow.  The HTTP call
-    runs on a daemon thread so the caller returns immediately.
+    This never raises and never blocks the install flow.  The event is
+    queued to the background sender, which batches the HTTP calls.
     """
     try:
         conn_str = _get_connection_string()
         if not conn_str:
             return
 
-        t = threading.Thread(
-            target=_track_install_worker,
-            args=(conn_str, jumpstart_id, jumpstart_numeric_id, jumpstart_type, status),
-            kwargs={"duration_seconds": duration_seconds, "install_mode": install_mode, "non_registered_install": non_registered_install},
-            daemon=True,
+        endpoint, ikey = _parse_connection_string(conn_str)
+        if not ikey:
+            return
+
+        properties = _build_install_properties(
+            jumpstart_id,
+            jumpstart_numeric_id,
+            jumpstart_type,
+            status,
+            duration_seconds=duration_seconds,
+            install_mode=install_mode,
+            non_registered_install=non_registered_install,
         )
-        t.start()
+        _get_sender().enqueue(endpoint, ikey, "jumpstart_installed", properties)
     except Exception:
         pass
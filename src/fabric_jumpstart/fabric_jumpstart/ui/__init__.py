@@ -8,7 +8,7 @@ This module contains all UI rendering components:
 """
 
 from .catalog import render_jumpstart_list, reload_assets
-from .install_status import render_install_status_html
+from .install_status import render_install_status_html, render_profile_summary_html
 from .conflict_resolver import ConflictDetector, ConflictResolver, ConflictUI
 from .formatting import render_copyable_code, syntax_highlight_python
 
@@ -16,6 +16,7 @@ __all__ = [
     'render_jumpstart_list',
     'reload_assets',
     'render_install_status_html',
+    'render_profile_summary_html',
     'ConflictDetector',
     'ConflictResolver',
     'ConflictUI',
@@ -3,9 +3,11 @@ const FILTER_LABELS = { type: 'Type', workload: 'Workload', scenario: 'Scenario'
 window.jumpstartFilters = {
     activeView: 'workload',
     values: { type: null, workload: null, scenario: null },
-    active: []
+    active: [],
+    search: null
 };
 window.jumpstartData = window.jumpstartData || [];
+window.jumpstartSearchIndex = null;
 
 function initJumpstartUI() {
     // Initialize all filters as active by default
@@ -14,6 +16,7 @@ function initJumpstartUI() {
     
     // Initialize data
     collectData();
+    loadSearchIndex();
     
     // Render initial state
     renderFilters();
@@ -40,6 +43,71 @@ function collectData() {
     console.log('Collected data:', window.jumpstartData.length, 'cards');
 }
 
+function loadSearchIndex() {
+    // The index is prebuilt in Python (fabric_jumpstart.search) and embedded as JSON,
+    // so the browser only tokenizes the query and sums precomputed BM25 weights.
+    const container = getJumpstartRoot();
+    const el = container ? container.querySelector('.jumpstart-search-index') : null;
+    if (!el) {
+        window.jumpstartSearchIndex = null;
+        return;
+    }
+    try {
+        const data = JSON.parse(el.textContent);
+        data.vocabulary = Object.keys(data.postings).sort();
+        data.stopwordSet = new Set(data.stopwords || []);
+        window.jumpstartSearchIndex = data;
+    } catch (err) {
+        console.warn('Failed to parse search index:', err);
+        window.jumpstartSearchIndex = null;
+    }
+}
+
+function tokenizeQuery(text, stopwordSet) {
+    // Mirrors fabric_jumpstart.search.tokenize_query
+    return ((text || '').match(/[A-Za-z0-9]+/g) || [])
+        .map(t => t.toLowerCase())
+        .filter(t => !stopwordSet.has(t));
+}
+
+function searchJumpstarts(query) {
+    // Returns a Map of logical_id -> rank (0 = best), or null when not searching.
+    const index = window.jumpstartSearchIndex;
+    if (!index) return null;
+    const terms = tokenizeQuery(query, index.stopwordSet);
+    if (!terms.length) return null;
+
+    const scores = new Map();
+    terms.forEach((term, position) => {
+        let expanded = [term];
+        if (position === terms.length - 1) {
+            const prefixed = index.vocabulary.filter(v => v.startsWith(term));
+            if (prefixed.length) expanded = prefixed;
+        }
+        const best = new Map();
+        expanded.forEach(candidate => {
+            (index.postings[candidate] || []).forEach(([doc, weight]) => {
+                if (weight > (best.get(doc) || 0)) best.set(doc, weight);
+            });
+        });
+        best.forEach((weight, doc) => scores.set(doc, (scores.get(doc) || 0) + weight));
+    });
+
+    const ranked = Array.from(scores.entries()).sort((a, b) =>
+        (b[1] - a[1]) || index.docs[a[0]].localeCompare(index.docs[b[0]]));
+    const result = new Map();
+    ranked.forEach(([doc], rank) => result.set(index.docs[doc], rank));
+    return result;
+}
+
+function updateSearch(query) {
+    if (!window.jumpstartSearchIndex) {
+        loadSearchIndex();
+    }
+    window.jumpstartFilters.search = searchJumpstarts(query);
+    applyFilters();
+}
+
 function getAvailableOptions(kind) {
     const data = window.jumpstartData || [];
     const filters = window.jumpstartFilters.values;
@@ -312,8 +380,13 @@ function applyFilters() {
             const matchesType = !filters.type || filters.type === cardType;
             const matchesWorkload = !filters.workload || workloads.includes(filters.workload);
             const matchesScenario = !filters.scenario || scenarios.includes(filters.scenario);
-            const cardVisible = matchesType && matchesWorkload && matchesScenario;
+            const search = window.jumpstartFilters.search;
+            const searchRank = search ? search.get(card.dataset.logicalId || '') : undefined;
+            const matchesSearch = !search || searchRank !== undefined;
+            const cardVisible = matchesType && matchesWorkload && matchesScenario && matchesSearch;
             card.style.display = cardVisible ? '' : 'none';
+            // Order matching cards by relevance within their grid
+            card.style.order = search && searchRank !== undefined ? String(searchRank) : '';
             if (cardVisible) {
                 visibleCards += 1;
             }
@@ -420,6 +493,7 @@ window.toggleFilterMenu = toggleFilterMenu;
 window.addFilter = addFilter;
 window.removeFilter = removeFilter;
 window.updateFilter = updateFilter;
+window.updateSearch = updateSearch;
 window.copyToClipboard = copyToClipboard;
 
 // Initialize when DOM is ready
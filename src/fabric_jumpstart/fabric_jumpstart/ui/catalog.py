@@ -2,50 +2,24 @@
 
 import base64
 import html
+import json
 from functools import lru_cache
 from pathlib import Path
 
 from ..constants import DEFAULT_WORKLOAD_COLORS, WORKLOAD_COLOR_MAP
+from . import static
 from .formatting import syntax_highlight_python
 
-# Load copy icon SVG once at module level
-_current_dir = Path(__file__).parent
-_assets_path = _current_dir / 'assets'
-# Prefer packaged assets (wheel); fall back to repo-root assets for local dev.
-_packaged_workload_path = _assets_path / 'workload'
-_repo_workload_path = Path(__file__).resolve().parent.parent.parent.parent.parent / 'assets' / 'images' / 'tags' / 'workload'
-_shared_assets_path = _packaged_workload_path if _packaged_workload_path.is_dir() else _repo_workload_path
-_pkg_diagrams = Path(__file__).resolve().parent / 'assets' / 'diagrams'
-_repo_diagrams = Path(__file__).resolve().parent.parent.parent.parent.parent / 'assets' / 'images' / 'diagrams'
-_diagrams_path = _pkg_diagrams if _pkg_diagrams.is_dir() else _repo_diagrams
-_copy_icon_path = _assets_path / 'copy-icon.svg'
-_css_path = _current_dir / 'ui.css'
-_js_path = _current_dir / 'catalog.js'
-try:
-    with open(_copy_icon_path, 'r', encoding='utf-8') as f:
-        _COPY_ICON_SVG = f.read()
-        # Extract just the SVG content without XML declaration
-        if '<?xml' in _COPY_ICON_SVG:
-            _COPY_ICON_SVG = _COPY_ICON_SVG[_COPY_ICON_SVG.find('<svg'):]
-except FileNotFoundError:
-    # Fallback to a simple rectangle if file not found
-    _COPY_ICON_SVG = '<svg viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg"><rect width="16" height="16" fill="currentColor"/></svg>'
-
-def _load_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding='utf-8')
-    except FileNotFoundError:
-        return ''
-
-_JUMPSTART_CSS = _load_text(_css_path)
-_JUMPSTART_JS = _load_text(_js_path)
+_assets_path = Path(__file__).parent / 'assets'
+# Packaged workload icons (wheel) or the repo-root shared assets (local dev).
+_shared_assets_path = static.WORKLOAD_DIR
 
 
 def reload_assets():
-    """Reload CSS/JS assets from disk without restarting the kernel."""
-    global _JUMPSTART_CSS, _JUMPSTART_JS
-    _JUMPSTART_CSS = _load_text(_css_path)
-    _JUMPSTART_JS = _load_text(_js_path)
+    """Reload CSS/JS and icons from the source files without restarting the kernel."""
+    static.reload(from_source=True)
+    _load_svg.cache_clear()
+    _load_diagram_svg.cache_clear()
 
 
 # Map workload tags to icon filenames stored in shared assets
@@ -76,7 +50,7 @@ def _load_svg(filename: str) -> str:
     """Load an SVG from shared assets (workload icons) or ui assets (others)."""
     if not filename:
         return ''
-    svg_path = _shared_assets_path / filename
+    svg_path = static.WORKLOAD_DIR / filename
     if not svg_path.exists():
         svg_path = _assets_path / filename
     try:
@@ -95,12 +69,8 @@ def _svg_to_data_uri(svg_text: str) -> str:
 
 @lru_cache(maxsize=64)
 def _load_diagram_svg(logical_id: str) -> str:
-    """Load the light-mode diagram SVG as a data URI if it exists."""
-    svg_path = _diagrams_path / f"{logical_id}_light.svg"
-    if not svg_path.is_file():
-        return ''
-    encoded = base64.b64encode(svg_path.read_bytes()).decode('ascii')
-    return f"data:image/svg+xml;base64,{encoded}"
+    """Load the minified light-mode diagram SVG as a data URI if the bundle lists one."""
+    return _svg_to_data_uri(static.load_diagram(logical_id))
 
 
 
@@ -136,13 +106,22 @@ def _build_workload_badges(workload_tags):
     badges = []
     for tag in tags:
         filename = WORKLOAD_ICON_MAP.get(tag, DEFAULT_WORKLOAD_ICON)
-        svg_content = _load_svg(filename)
-        data_uri = _svg_to_data_uri(svg_content)
+        data_uri = static.WORKLOAD_ICON_URIS.get(filename) or _svg_to_data_uri(_load_svg(filename))
         badges.append((tag, data_uri))
     return badges
 
 
-def render_jumpstart_list(grouped_scenario, grouped_workload, grouped_type, instance_name):
+def _render_search_index(search_index) -> str:
+    """Embed the serialised search index as inert JSON for catalog.js."""
+    if search_index is None:
+        return ''
+    payload = json.dumps(search_index.to_dict(), separators=(',', ':'))
+    # Prevent "</script>" inside the payload from terminating the element.
+    payload = payload.replace('</', '<\\/')
+    return f'<script type="application/json" class="jumpstart-search-index">{payload}</script>'
+
+
+def render_jumpstart_list(grouped_scenario, grouped_workload, grouped_type, instance_name, search_index=None):
     """
     Generate HTML UI for jumpstarts listing with interactive toggle and tag filters.
     
@@ -150,6 +129,7 @@ def render_jumpstart_list(grouped_scenario, grouped_workload, grouped_type, inst
         grouped_scenario: Dictionary of jumpstarts grouped by scenario tags
         grouped_workload: Dictionary of jumpstarts grouped by workload tags
         instance_name: The variable name of the jumpstart instance
+        search_index: Optional prebuilt SearchIndex backing the search box
         
     Returns:
         HTML string for rendering in notebook
@@ -168,16 +148,17 @@ def render_jumpstart_list(grouped_scenario, grouped_workload, grouped_type, inst
         workload_tags,
         type_tags,
         instance_name,
+        search_index,
     )
 
 
-def _generate_html(grouped_scenario, grouped_workload, grouped_type, scenario_tags, workload_tags, type_tags, instance_name):
+def _generate_html(grouped_scenario, grouped_workload, grouped_type, scenario_tags, workload_tags, type_tags, instance_name, search_index=None):
     # Arc Jumpstart theming - load from external assets
-    style = f"<style>{_JUMPSTART_CSS}</style>" if _JUMPSTART_CSS else ""
-    script = f"<script>{_JUMPSTART_JS}</script>" if _JUMPSTART_JS else ""
+    style = static.STYLE_TAG
+    script = static.SCRIPT_TAG
 
     # Build HTML
-    html_parts = [style, script, '<div class="jumpstart-container">']
+    html_parts = [style, script, '<div class="jumpstart-container">', _render_search_index(search_index)]
     
     # Header with Arc Jumpstart styling
     html_parts.append('''
@@ -203,6 +184,7 @@ def _generate_html(grouped_scenario, grouped_workload, grouped_type, scenario_ta
     # Dropdown filter bar with "+ Add Filter" button
     html_parts.append('''
         <div class="filters-bar-row">
+            <input id="jumpstart-search" class="jumpstart-search" type="search" placeholder="Search jumpstarts (e.g. KQL, fraud, Eventhouse)" aria-label="Search jumpstarts" oninput="updateSearch(this.value)"/>
             <div id="active-filters" class="filters-active"></div>
             <div class="add-filter-wrapper">
                 <button id="add-filter-btn" class="add-filter-btn" type="button" aria-expanded="false" aria-haspopup="true" onclick="toggleFilterMenu()">+ Add Filter</button>
@@ -337,7 +319,7 @@ def _render_grouped_jumpstarts(grouped_jumpstarts, instance_name, group_by="scen
             meta_footer_html = f'<div class="jumpstart-meta-footer">{meta_footer_text}</div>' if meta_footer_text else ''
 
             html_parts.append(f'''
-                <div class="jumpstart-card" data-type="{type_value}" data-workloads="{workloads_value}" data-scenarios="{scenarios_value}">
+                <div class="jumpstart-card" data-logical-id="{html.escape(str(logical_id), quote=True)}" data-type="{type_value}" data-workloads="{workloads_value}" data-scenarios="{scenarios_value}">
                     <div class="jumpstart-image">{diagram_html}{new_badge}<div class="workload-ribbon">{workload_badges_html}</div></div>
                     <div class="jumpstart-content">
                         {meta_block}
@@ -348,7 +330,7 @@ def _render_grouped_jumpstarts(grouped_jumpstarts, instance_name, group_by="scen
                             <div class="jumpstart-install">
                                 <code>{install_code}</code>
                                 <span class="copy-btn" role="button" tabindex="0" data-code="{install_code_plain}" onclick="copyToClipboard(this)">
-                                    ''' + _COPY_ICON_SVG + f'''
+                                    ''' + static.COPY_ICON_SVG + f'''
                                 </span>
                             </div>
                         </div>
@@ -2,22 +2,8 @@
 
 import html
 import re
-from pathlib import Path
 
-# Load copy icon SVG once at module level
-_current_dir = Path(__file__).parent
-_assets_path = _current_dir / 'assets'
-_copy_icon_path = _assets_path / 'copy-icon.svg'
-
-try:
-    with open(_copy_icon_path, 'r', encoding='utf-8') as f:
-        _COPY_ICON_SVG = f.read()
-        # Extract just the SVG content without XML declaration
-        if '<?xml' in _COPY_ICON_SVG:
-            _COPY_ICON_SVG = _COPY_ICON_SVG[_COPY_ICON_SVG.find('<svg'):]
-except FileNotFoundError:
-    # Fallback to a simple rectangle if file not found
-    _COPY_ICON_SVG = '<svg viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg"><rect width="16" height="16" fill="currentColor"/></svg>'
+from . import static
 
 
 def syntax_highlight_python(code: str) -> str:
@@ -132,7 +118,7 @@ def render_copyable_code(code: str, include_syntax_highlighting: bool = True) ->
         '<div class="jumpstart-install">',
         f'<code>{highlighted}</code>',
         f'<span class="copy-btn" role="button" tabindex="0" data-code="{plain_for_attr}" onclick="{onclick}">',
-        _COPY_ICON_SVG,
+        static.COPY_ICON_SVG,
         '</span>',
         '</div>',
     ])
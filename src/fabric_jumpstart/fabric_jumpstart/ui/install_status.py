@@ -1,14 +1,13 @@
 """Render install status displays for Fabric Jumpstart."""
 
 import html
-from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
-_response_css_path = Path(__file__).parent / "ui.css"
-try:
-    _INSTALL_STATUS_CSS = f"<style>{_response_css_path.read_text(encoding='utf-8')}</style>"
-except FileNotFoundError:
-    _INSTALL_STATUS_CSS = ''
+from ..progress import format_bytes
+from . import static
+
+# Rows per column of the profile hot-spot summary.
+_PROFILE_ROWS = 3
 
 
 def _format_minutes(minutes):
@@ -21,8 +20,15 @@ def _format_minutes(minutes):
         return html.escape(str(minutes), quote=True)
 
 
-def render_install_status_html(*, status: str, jumpstart_name: str, type: str, workspace_id: Optional[str], entry_point, minutes_complete, minutes_deploy, docs_uri=None, logs=None, error_message: Optional[str] = None, extra_html: Optional[str] = None, elapsed_seconds: float = 0.0, progress_override: Optional[float] = None):
-    """Build a styled HTML status card for install results."""
+def render_install_status_html(*, status: str, jumpstart_name: str, type: str, workspace_id: Optional[str], entry_point, minutes_complete, minutes_deploy, docs_uri=None, logs=None, error_message: Optional[str] = None, extra_html: Optional[str] = None, elapsed_seconds: float = 0.0, progress_override: Optional[float] = None, estimate_seconds: Optional[float] = None, progress_detail: Optional[str] = None):
+    """Build a styled HTML status card for install results.
+
+    ``estimate_seconds`` (a duration learned from past installs) takes
+    precedence over the registry's ``minutes_deploy`` for the time estimate.
+    ``progress_override`` is the install's measured progress; when given the
+    bar is determinate even without an estimate, and ``progress_detail``
+    (e.g. "Uploading files: 12.0 MB of 40.0 MB") is shown under it.
+    """
     status_lower = status.lower()
     failure_states = {'error', 'failed', 'failure', 'conflict'}
 
@@ -162,35 +168,33 @@ def render_install_status_html(*, status: str, jumpstart_name: str, type: str, w
     progress_block = ''
     if status_lower == 'installing':
         try:
-            est_seconds = float(minutes_deploy or 0) * 60
+            est_seconds = float(estimate_seconds or 0) or float(minutes_deploy or 0) * 60
         except (TypeError, ValueError):
             est_seconds = 0
-        if est_seconds > 0:
+        elapsed_m = int(elapsed_seconds) // 60
+        elapsed_s = int(elapsed_seconds) % 60
+        label_spans = [f'<span>{elapsed_m}:{elapsed_s:02d} elapsed</span>']
+        if progress_detail:
+            label_spans.append(f'<span class="install-progress-detail">{html.escape(progress_detail)}</span>')
+        if progress_override is not None or est_seconds > 0:
             pct = progress_override if progress_override is not None else min(elapsed_seconds / est_seconds * 100, 95)
-            elapsed_m = int(elapsed_seconds) // 60
-            elapsed_s = int(elapsed_seconds) % 60
-            est_m = int(est_seconds) // 60
-            progress_block = ''.join([
-                '<div class="install-progress-wrap">',
-                f'<div class="install-progress-track"><div class="install-progress-fill" style="width:{pct:.1f}%"></div></div>',
-                '<div class="install-progress-label">',
-                f'<span>{elapsed_m}:{elapsed_s:02d} elapsed</span>',
-                f'<span>~{est_m} min est.</span>',
-                '</div>',
-                '</div>',
-            ])
+            fill = f'<div class="install-progress-fill" style="width:{pct:.1f}%"></div>'
+            if est_seconds > 0:
+                est_m = int(est_seconds) // 60
+                label_spans.append(f'<span>~{est_m} min est.</span>' if est_m else f'<span>~{int(est_seconds)} s est.</span>')
+            else:
+                label_spans.append(f'<span>{int(pct)}%</span>')
         else:
-            # No time estimate — show an indeterminate animated bar
-            elapsed_m = int(elapsed_seconds) // 60
-            elapsed_s = int(elapsed_seconds) % 60
-            progress_block = ''.join([
-                '<div class="install-progress-wrap">',
-                '<div class="install-progress-track"><div class="install-progress-fill indeterminate"></div></div>',
-                '<div class="install-progress-label">',
-                f'<span>{elapsed_m}:{elapsed_s:02d} elapsed</span>',
-                '</div>',
-                '</div>',
-            ])
+            # No progress or time estimate — show an indeterminate animated bar
+            fill = '<div class="install-progress-fill indeterminate"></div>'
+        progress_block = ''.join([
+            '<div class="install-progress-wrap">',
+            f'<div class="install-progress-track">{fill}</div>',
+            '<div class="install-progress-label">',
+            *label_spans,
+            '</div>',
+            '</div>',
+        ])
 
     # Hide entry/output sections on success; CTA already handled in hero
     outcome_block = error_block if error_message else ''
@@ -234,14 +238,55 @@ def render_install_status_html(*, status: str, jumpstart_name: str, type: str, w
         ])
     else:
         main_sections = ''.join([
+            extra_block,
             logs_section,
             outcome_block,
         ])
 
     return ''.join([
-        _INSTALL_STATUS_CSS,
+        static.STYLE_TAG,
         f'<div class="install-status-card {pill_class}" role="status" aria-live="polite">',
         hero_block,
         main_sections,
         '</div>',
     ])
+
+
+def render_profile_summary_html(summary: Mapping) -> str:
+    """Build the status card section for an ``install(..., profile=True)`` run.
+
+    Args:
+        summary: Output of ``profiling.InstallProfiler.stop``
+
+    Returns:
+        HTML with the slowest phases, the hot spots by function and package,
+        and where the profile files were written
+    """
+    def _rows(lines):
+        return '<br>'.join(html.escape(line, quote=True) for line in lines) or '—'
+
+    columns = [
+        ('Slowest phases', _rows(
+            f"{p['phase']} {p['seconds']:.1f}s · {format_bytes(p['peak_memory_bytes'])} peak"
+            for p in summary.get('phases', [])[:_PROFILE_ROWS]
+        )),
+        ('Hot spots', _rows(
+            f"{row['share'] * 100:.0f}% {row['frame']}" for row in summary.get('hot_spots', [])[:_PROFILE_ROWS]
+        )),
+        ('By package', _rows(
+            f"{row['share'] * 100:.0f}% {row['package']}" for row in summary.get('packages', [])[:_PROFILE_ROWS]
+        )),
+    ]
+    if summary.get('collapsed_path'):
+        columns.append(('Flamegraph stacks', f"<code>{html.escape(summary['collapsed_path'], quote=True)}</code>"))
+    items = ''.join(
+        f'<div class="install-status-item"><div class="install-status-label">{label}</div>'
+        f'<div class="install-status-value install-profile-rows">{value}</div></div>'
+        for label, value in columns
+    )
+    return ''.join([
+        '  <div class="install-status-section">',
+        f'    <div class="install-status-section-title">Profile ({summary.get("samples", 0)} samples)</div>',
+        f'    <div class="install-status-grid tight">{items}</div>',
+        '  </div>',
+    ])
@@ -0,0 +1,351 @@
+"""Static UI assets (CSS, JS, icons and the diagram manifest).
+
+Wheels ship a generated ``_static_bundle.py`` (written by ``hatch_build.py``
+via :func:`render_bundle_module`) holding minified CSS/JS, workload icons
+pre-encoded as data URIs and the list of available architecture diagrams, so
+importing the UI touches no files. The diagrams themselves ship minified in
+one compressed archive (:func:`build_diagram_archive`) and are read one at a
+time when a catalog card needs them. In a source checkout the same values are
+built from the source files on import instead.
+
+This module only needs the standard library, so the build hook can load it
+from its file path without the package's runtime dependencies.
+"""
+
+import base64
+import math
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+BUNDLE_MODULE_FILENAME = "_static_bundle.py"
+BUNDLE_VERSION = 1
+DIAGRAM_ARCHIVE_FILENAME = "diagrams.zip"
+
+_UI_DIR = Path(__file__).resolve().parent
+_REPO_IMAGES_DIR = _UI_DIR.parent.parent.parent.parent / "assets" / "images"
+_PACKAGED_WORKLOAD_DIR = _UI_DIR / "assets" / "workload"
+_PACKAGED_DIAGRAMS_DIR = _UI_DIR / "assets" / "diagrams"
+_PACKAGED_DIAGRAM_ARCHIVE = _UI_DIR / "assets" / DIAGRAM_ARCHIVE_FILENAME
+# Fixed member timestamp so rebuilding the archive is reproducible.
+_ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Shown when copy-icon.svg is missing.
+_FALLBACK_COPY_ICON = (
+    '<svg viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">'
+    '<rect width="16" height="16" fill="currentColor"/></svg>'
+)
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace around block punctuation.
+
+    Spaces around ``:`` are left alone since they are significant in
+    selectors (``.a :hover`` differs from ``.a:hover``).
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line ``//`` comments.
+
+    Line breaks are kept so automatic semicolon insertion and trailing
+    comments behave exactly as in the source.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+_SVG_STRIP_RE = re.compile(r"<\?xml[^>]*\?>|<!--.*?-->|<metadata\b.*?</metadata>", re.S)
+_SVG_TAG_GAP_RE = re.compile(r">\s*\n\s*<")
+_SVG_EMPTY_ELEMENT_RE = re.compile(r"<([\w:-]+)(\s[^<>]*)?></\1>")
+_SVG_ROOT_ID_RE = re.compile(r'^<svg\b[^>]*?\sid="([^"]+)"')
+_SVG_DEF_RE = re.compile(
+    r'<(linearGradient|radialGradient|filter|clipPath|pattern|marker)\b([^>]*?)\sid="([^"]+)"(.*?)</\1>', re.S
+)
+_SVG_IMAGE_RE = re.compile(r'<image href="([^"]+)" width="([^"]+)" height="([^"]+)" x="([^"]+)" y="([^"]+)"/>')
+_SVG_POLYLINE_RE = re.compile(r'(<path\b[^>]*?\sd=")(M[-\d.]+,[-\d.]+(?:L[-\d.]+,[-\d.]+)+)"')
+_SVG_POINT_RE = re.compile(r"[ML]([-\d.]+),([-\d.]+)")
+_SVG_BASE64_IMAGE_RE = re.compile(r'href="data:image/svg\+xml;base64,([A-Za-z0-9+/=]+)"')
+# Characters left as-is in percent-encoded SVG data URIs; all are legal in a
+# double-quoted XML attribute.
+_SVG_URI_SAFE = " /=:;'.,-()_!*~@?+$[]"
+_SHORT_ROOT_ID = "j"
+# Mermaid samples curved edges as polylines; points within this many user
+# units of the straight chord are dropped (coordinates are rounded to 0.01).
+_POLYLINE_TOLERANCE = 0.02
+
+
+def _collapse_polyline(d: str) -> str:
+    """Drop polyline points that lie on the chord between their neighbours."""
+    raw = _SVG_POINT_RE.findall(d)
+    points = [(float(x), float(y)) for x, y in raw]
+    kept = [0]
+    pending: List[int] = []
+    for i in range(1, len(points) - 1):
+        pending.append(i)
+        ax, ay = points[kept[-1]]
+        bx, by = points[i + 1]
+        length = math.hypot(bx - ax, by - ay)
+        if length == 0 or any(
+            abs((bx - ax) * (ay - points[j][1]) - (ax - points[j][0]) * (by - ay)) / length > _POLYLINE_TOLERANCE
+            for j in pending
+        ):
+            kept.append(i)
+            pending = []
+    kept.append(len(points) - 1)
+    return "L".join(f"{raw[i][0]},{raw[i][1]}" for i in kept).join(("M", ""))
+
+
+def _utf8_svg_uri(match) -> str:
+    """Re-encode an embedded base64 SVG image as a (shorter) percent-encoded data URI."""
+    try:
+        inner = base64.b64decode(match.group(1), validate=True).decode("utf-8")
+    except ValueError:
+        return match.group(0)
+    if "'" in inner:
+        return match.group(0)
+    inner = _SVG_TAG_GAP_RE.sub("><", inner.replace('"', "'"))
+    return 'href="data:image/svg+xml,' + quote(inner, safe=_SVG_URI_SAFE) + '"'
+
+
+def minify_svg(svg_text: str) -> str:
+    """Shrink a rendered diagram SVG without changing how it draws.
+
+    Strips XML declarations, comments and ``<metadata>``, closes empty
+    elements, re-encodes embedded base64 SVG icons as percent-encoded
+    UTF-8, collapses straight runs of sampled polyline edges, merges
+    identical gradient/filter/marker definitions, moves repeated embedded
+    icons into one ``<defs>`` entry referenced by ``<use>`` and shortens the
+    generated root id that prefixes every style rule and marker id.
+    """
+    svg = _SVG_STRIP_RE.sub("", svg_text).strip()
+    svg = _SVG_TAG_GAP_RE.sub("><", svg)
+    svg = _SVG_EMPTY_ELEMENT_RE.sub(lambda m: f"<{m.group(1)}{m.group(2) or ''}/>", svg)
+    svg = _SVG_POLYLINE_RE.sub(lambda m: f'{m.group(1)}{_collapse_polyline(m.group(2))}"', svg)
+    svg = _SVG_BASE64_IMAGE_RE.sub(_utf8_svg_uri, svg)
+
+    # Merge definitions that differ only by id, repointing references.
+    first_by_body: Dict[Tuple[str, str, str], str] = {}
+    renames: Dict[str, str] = {}
+
+    def _dedupe_def(match) -> str:
+        key = (match.group(1), match.group(2), match.group(4))
+        keep = first_by_body.setdefault(key, match.group(3))
+        if keep == match.group(3):
+            return match.group(0)
+        renames[match.group(3)] = keep
+        return ""
+
+    svg = _SVG_DEF_RE.sub(_dedupe_def, svg)
+    for old, new in renames.items():
+        svg = svg.replace(f"url(#{old})", f"url(#{new})").replace(f'href="#{old}"', f'href="#{new}"')
+
+    # Embed each repeated icon once and reference it.
+    images = _SVG_IMAGE_RE.findall(svg)
+    counts: Dict[Tuple[str, str, str], int] = {}
+    for href, width, height, _, _ in images:
+        counts[(href, width, height)] = counts.get((href, width, height), 0) + 1
+    shared = {key: f"{_SHORT_ROOT_ID}i{n}" for n, key in enumerate(k for k, c in counts.items() if c > 1)}
+    root_end = svg.find(">") + 1
+    if shared and root_end > 0 and not re.search(rf'id="{_SHORT_ROOT_ID}i\d', svg):
+        svg = _SVG_IMAGE_RE.sub(
+            lambda m: (
+                f'<use href="#{shared[m.group(1), m.group(2), m.group(3)]}" x="{m.group(4)}" y="{m.group(5)}"/>'
+                if (m.group(1), m.group(2), m.group(3)) in shared else m.group(0)
+            ),
+            svg,
+        )
+        defs = "".join(
+            f'<image id="{image_id}" href="{href}" width="{width}" height="{height}"/>'
+            for (href, width, height), image_id in shared.items()
+        )
+        svg = f"{svg[:root_end]}<defs>{defs}</defs>{svg[root_end:]}"
+
+    root_id = _SVG_ROOT_ID_RE.match(svg)
+    if root_id and len(root_id.group(1)) > len(_SHORT_ROOT_ID) and not re.search(
+        rf'id="{_SHORT_ROOT_ID}[-_"]', svg
+    ):
+        svg = svg.replace(root_id.group(1), _SHORT_ROOT_ID)
+    return svg
+
+
+def inline_svg(svg_text: str) -> str:
+    """Return the ``<svg>`` element without any XML declaration or leading comments."""
+    start = svg_text.find("<svg")
+    return svg_text[start:].strip() if start >= 0 else svg_text.strip()
+
+
+def svg_data_uri(svg_bytes: bytes) -> str:
+    """Encode SVG bytes as a base64 data URI."""
+    if not svg_bytes:
+        return ""
+    return "data:image/svg+xml;base64," + base64.b64encode(svg_bytes).decode("ascii")
+
+
+def _source_dirs() -> Tuple[Path, Path]:
+    """Return the (workload icon, diagram) directories: packaged copies when present, else the repo's."""
+    workload_dir = _PACKAGED_WORKLOAD_DIR if _PACKAGED_WORKLOAD_DIR.is_dir() else _REPO_IMAGES_DIR / "tags" / "workload"
+    diagrams_dir = _PACKAGED_DIAGRAMS_DIR if _PACKAGED_DIAGRAMS_DIR.is_dir() else _REPO_IMAGES_DIR / "diagrams"
+    return workload_dir, diagrams_dir
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+
+
+def build_bundle(
+    ui_dir: Path = _UI_DIR,
+    workload_dir: Optional[Path] = None,
+    diagrams_dir: Optional[Path] = None,
+) -> Dict:
+    """Read the UI source assets into bundle values.
+
+    Args:
+        ui_dir: Directory holding ``ui.css``, ``catalog.js`` and ``assets/``
+        workload_dir: Workload icon directory; defaults to the packaged copy
+            when present, else the repository's shared assets
+        diagrams_dir: Architecture diagram directory, chosen the same way
+
+    Returns:
+        Dictionary of bundle constants (see :func:`render_bundle_module`)
+    """
+    default_workload_dir, default_diagrams_dir = _source_dirs()
+    workload_dir = workload_dir or default_workload_dir
+    diagrams_dir = diagrams_dir or default_diagrams_dir
+
+    css = minify_css(_read_text(ui_dir / "ui.css"))
+    js = minify_js(_read_text(ui_dir / "catalog.js"))
+    copy_icon = _read_text(ui_dir / "assets" / "copy-icon.svg")
+    workload_icons = {}
+    if workload_dir.is_dir():
+        for svg_path in sorted(workload_dir.glob("*.svg")):
+            workload_icons[svg_path.name] = svg_data_uri(svg_path.read_text(encoding="utf-8").strip().encode("utf-8"))
+    diagrams = sorted(
+        p.name[: -len("_light.svg")] for p in diagrams_dir.glob("*_light.svg")
+    ) if diagrams_dir.is_dir() else []
+    return {
+        "STYLE_TAG": f"<style>{css}</style>" if css else "",
+        "SCRIPT_TAG": f"<script>{js}</script>" if js else "",
+        "COPY_ICON_SVG": inline_svg(copy_icon) if copy_icon else _FALLBACK_COPY_ICON,
+        "WORKLOAD_ICON_URIS": workload_icons,
+        "DIAGRAM_IDS": frozenset(diagrams),
+    }
+
+
+def build_diagram_archive(diagrams_dir: Path, archive_path: Path) -> int:
+    """Minify every diagram SVG into one deflate-compressed zip archive.
+
+    The zip central directory is the index: members are named like the source
+    files (``<logical_id>_<variant>.svg``) and are read individually.
+
+    Args:
+        diagrams_dir: Directory of rendered diagram SVGs
+        archive_path: Zip file to write
+
+    Returns:
+        Number of diagrams archived
+    """
+    svg_paths = sorted(diagrams_dir.glob("*.svg"))
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        for svg_path in svg_paths:
+            info = zipfile.ZipInfo(svg_path.name, date_time=_ARCHIVE_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, minify_svg(svg_path.read_text(encoding="utf-8")), compresslevel=9)
+    return len(svg_paths)
+
+
+def render_bundle_module(bundle: Dict) -> str:
+    """Render bundle values as the source of a generated Python module."""
+    lines = [
+        '"""Generated by hatch_build.py from the UI source assets; do not edit."""',
+        "",
+        f"BUNDLE_VERSION = {BUNDLE_VERSION}",
+    ]
+    for name in sorted(bundle):
+        value = bundle[name]
+        if isinstance(value, frozenset):
+            value_repr = f"frozenset({sorted(value)!r})"
+        else:
+            value_repr = repr(value)
+        lines.append(f"{name} = {value_repr}")
+    return "\n".join(lines) + "\n"
+
+
+def _compiled_bundle() -> Optional[Dict]:
+    """Return the values of the wheel-generated bundle module, if installed."""
+    try:
+        from . import _static_bundle as compiled  # type: ignore[attr-defined]
+    except ImportError:
+        return None
+    if getattr(compiled, "BUNDLE_VERSION", None) != BUNDLE_VERSION:
+        return None
+    return {name: getattr(compiled, name) for name in _BUNDLE_NAMES}
+
+
+_BUNDLE_NAMES = ("STYLE_TAG", "SCRIPT_TAG", "COPY_ICON_SVG", "WORKLOAD_ICON_URIS", "DIAGRAM_IDS")
+
+STYLE_TAG: str = ""
+SCRIPT_TAG: str = ""
+COPY_ICON_SVG: str = _FALLBACK_COPY_ICON
+WORKLOAD_ICON_URIS: Dict[str, str] = {}
+DIAGRAM_IDS: frozenset = frozenset()
+# Where raw SVGs are read from on demand: workload icons missing from the
+# bundle, and diagrams when no archive is installed (source checkouts).
+WORKLOAD_DIR: Path = _PACKAGED_WORKLOAD_DIR
+DIAGRAMS_DIR: Path = _PACKAGED_DIAGRAMS_DIR
+DIAGRAM_ARCHIVE: Optional[Path] = None
+
+
+def load_diagram(logical_id: str, variant: str = "light") -> str:
+    """Return a minified diagram SVG, or '' when the manifest lists none.
+
+    Reads one member of the packaged archive, or minifies the source file in
+    a source checkout.
+    """
+    if logical_id not in DIAGRAM_IDS:
+        return ""
+    name = f"{logical_id}_{variant}.svg"
+    if DIAGRAM_ARCHIVE is not None:
+        try:
+            with zipfile.ZipFile(DIAGRAM_ARCHIVE) as archive:
+                return archive.read(name).decode("utf-8")
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return ""
+    svg_text = _read_text(DIAGRAMS_DIR / name)
+    return minify_svg(svg_text) if svg_text else ""
+
+
+def reload(from_source: bool = False) -> None:
+    """(Re)populate the module constants.
+
+    Args:
+        from_source: Rebuild from the source files even when a generated
+            bundle is installed (used by ``reload_assets`` during UI work)
+    """
+    global WORKLOAD_DIR, DIAGRAMS_DIR, DIAGRAM_ARCHIVE
+    values = None if from_source else _compiled_bundle()
+    if values is not None:
+        # The wheel that ships the bundle also ships the icons and diagram archive.
+        WORKLOAD_DIR, DIAGRAMS_DIR = _PACKAGED_WORKLOAD_DIR, _PACKAGED_DIAGRAMS_DIR
+        DIAGRAM_ARCHIVE = _PACKAGED_DIAGRAM_ARCHIVE
+    else:
+        WORKLOAD_DIR, DIAGRAMS_DIR = _source_dirs()
+        DIAGRAM_ARCHIVE = None
+        values = build_bundle(workload_dir=WORKLOAD_DIR, diagrams_dir=DIAGRAMS_DIR)
+    globals().update(values)
+
+
+reload()
@@ -0,0 +1,244 @@
+"""Manifest-driven removal of installed jumpstarts.
+
+Deletes the items and lakehouse files recorded in an install manifest (see
+:mod:`fabric_jumpstart.manifest`). Deletions run concurrently through the
+shared, rate-limited HTTP client, tier by tier in the reverse of fabric_cicd's
+publish order so dependents (reports, pipelines, notebooks) are removed
+before what they depend on (semantic models, lakehouses, environments).
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from .auth import FABRIC_API_SCOPE, STORAGE_SCOPE
+from .http_client import get_http_client
+from .manifest import get_manifest_store
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 8
+
+
+def _publish_rank() -> Dict[str, int]:
+    from fabric_cicd import constants as cicd_constants
+
+    return {item_type.value: order for order, item_type in cicd_constants.SERIAL_ITEM_PUBLISH_ORDER.items()}
+
+
+def plan_deletions(manifest: Dict, include_preexisting: bool = False) -> Tuple[List[List[Dict]], List[Dict], List[Dict]]:
+    """Work out what to delete for a manifest, and in which order.
+
+    Files are only deleted one by one when their lakehouse is kept; deleting
+    the lakehouse removes them anyway.
+
+    Args:
+        manifest: Install manifest
+        include_preexisting: Also delete items that existed before the install
+            and were only updated by it
+
+    Returns:
+        Tuple of (item tiers to delete in order, file entries to delete first,
+        items kept because they pre-existed)
+    """
+    rank = _publish_rank()
+    kept = [i for i in manifest.get("items", []) if i.get("preexisting") and not include_preexisting]
+    targets = [i for i in manifest.get("items", []) if i not in kept and i.get("id")]
+
+    # Types fabric_cicd does not order go first: nothing published before them depends on them.
+    unknown_rank = max(rank.values(), default=0) + 1
+    tiers: Dict[int, List[Dict]] = {}
+    for item in targets:
+        tiers.setdefault(rank.get(item["type"], unknown_rank), []).append(item)
+    ordered = [sorted(tiers[r], key=lambda i: i["name"]) for r in sorted(tiers, reverse=True)]
+
+    deleted_lakehouses = {i["id"] for i in targets if i["type"] == "Lakehouse"}
+    files = [f for f in manifest.get("files", []) if f["lakehouse_id"] not in deleted_lakehouses and f.get("paths")]
+    return ordered, files, kept
+
+
+class _Timer:
+    def __init__(self):
+        self.start = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return round(time.perf_counter() - self.start, 3)
+
+
+def _run_delete(result: Dict, send) -> Dict:
+    """Issue one DELETE and record its status (a 404 means already gone) and duration."""
+    timer = _Timer()
+    try:
+        resp = send()
+        if resp.status_code in (200, 202, 204):
+            result["status"] = "deleted"
+        elif resp.status_code == 404:
+            result["status"] = "missing"
+        else:
+            result["status"] = "failed"
+            result["error"] = f"{resp.status_code} {resp.text}"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+    result["seconds"] = timer.elapsed()
+    return result
+
+
+def _delete_item(workspace_id: str, item: Dict) -> Dict:
+    from fabric_cicd.constants import DEFAULT_API_ROOT_URL
+
+    url = f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items/{item['id']}"
+    result = {"name": item["name"], "type": item["type"], "id": item["id"]}
+    return _run_delete(result, lambda: get_http_client().delete(url, scope=FABRIC_API_SCOPE))
+
+
+def _delete_file(base_url: str, lakehouse_name: str, path: str) -> Dict:
+    from .scheduler import PRIORITY_BULK
+
+    result = {"lakehouse": lakehouse_name, "path": path}
+    return _run_delete(
+        result,
+        lambda: get_http_client().delete(f"{base_url}/{path}", scope=STORAGE_SCOPE, priority=PRIORITY_BULK),
+    )
+
+
+def _delete_files(pool: ThreadPoolExecutor, workspace_id: str, entry: Dict) -> List[Dict]:
+    """Delete one lakehouse's recorded files, resolving its OneLake root once."""
+    from .utils import _onelake_files_path
+
+    try:
+        base_url = _onelake_files_path(get_http_client(), _WorkspaceRef(workspace_id), entry["lakehouse_id"])
+    except Exception as e:
+        return [
+            {"lakehouse": entry["lakehouse_name"], "path": p, "status": "failed", "error": str(e), "seconds": 0.0}
+            for p in entry["paths"]
+        ]
+    jobs = [pool.submit(_delete_file, base_url, entry["lakehouse_name"], p) for p in entry["paths"]]
+    return [j.result() for j in jobs]
+
+
+class _WorkspaceRef:
+    """Minimal stand-in for the ``FabricWorkspace`` attribute OneLake lookups need."""
+
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+
+
+def uninstall_manifest(
+    manifest: Dict,
+    dry_run: bool = False,
+    include_preexisting: bool = False,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+) -> Dict:
+    """Delete everything a manifest records.
+
+    Each tier is deleted concurrently; the next tier starts once the previous
+    one finishes. Items already gone count as ``missing``, not failures. On
+    full success the manifest is removed; otherwise it is rewritten with the
+    items that could not be deleted.
+
+    Args:
+        manifest: Install manifest
+        dry_run: Only report what would be deleted
+        include_preexisting: Also delete items the install only updated
+        max_workers: Concurrent delete requests (the shared scheduler still
+            applies its own limits)
+
+    Returns:
+        Report dictionary with ``logical_id``, ``workspace_id``, ``dry_run``,
+        ``items`` and ``files`` (per-target results with ``status`` and
+        ``seconds``), ``kept``, ``failed`` (count) and ``timings`` (``total``
+        plus per-tier seconds)
+    """
+    workspace_id = manifest["workspace_id"]
+    tiers, files, kept = plan_deletions(manifest, include_preexisting)
+    kept_names = [f"{i['name']}.{i['type']}" for i in kept]
+    if dry_run:
+        return {
+            "logical_id": manifest["logical_id"],
+            "workspace_id": workspace_id,
+            "dry_run": True,
+            "items": [
+                {"name": i["name"], "type": i["type"], "id": i["id"], "status": "planned"}
+                for tier in tiers for i in tier
+            ],
+            "files": [
+                {"lakehouse": f["lakehouse_name"], "path": p, "status": "planned"} for f in files for p in f["paths"]
+            ],
+            "kept": kept_names,
+            "failed": 0,
+            "timings": {"total": 0.0, "files": 0.0, "tiers": []},
+        }
+
+    item_results: List[Dict] = []
+    file_results: List[Dict] = []
+    tier_timings: List[Dict] = []
+    files_seconds = 0.0
+    total = _Timer()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jumpstart-uninstall") as pool:
+        if files:
+            timer = _Timer()
+            for entry in files:
+                file_results.extend(_delete_files(pool, workspace_id, entry))
+            files_seconds = timer.elapsed()
+        for tier in tiers:
+            timer = _Timer()
+            item_results.extend(pool.map(lambda item: _delete_item(workspace_id, item), tier))
+            tier_timings.append({"types": sorted({i["type"] for i in tier}), "seconds": timer.elapsed()})
+    total_seconds = total.elapsed()
+
+    failed_ids = {r["id"] for r in item_results if r["status"] == "failed"}
+    failed = len(failed_ids) + sum(1 for r in file_results if r["status"] == "failed")
+
+    store = get_manifest_store()
+    remaining = [i for i in manifest.get("items", []) if i in kept or i.get("id") in failed_ids]
+    if failed == 0 and not kept:
+        store.delete(workspace_id, manifest["logical_id"])
+    else:
+        failed_files = {(r["lakehouse"], r["path"]) for r in file_results if r["status"] == "failed"}
+        remaining_files = []
+        for entry in manifest.get("files", []):
+            paths = [p for p in entry["paths"] if (entry["lakehouse_name"], p) in failed_files]
+            if paths:
+                remaining_files.append({**entry, "paths": paths})
+        store.save({**manifest, "items": remaining, "files": remaining_files}, merge=False)
+
+    logger.info(
+        "Uninstalled '%s' from workspace '%s': %d item(s), %d file(s), %d failure(s) in %.1fs",
+        manifest["logical_id"], workspace_id,
+        sum(1 for r in item_results if r["status"] != "failed"),
+        sum(1 for r in file_results if r["status"] != "failed"),
+        failed, total_seconds,
+    )
+    return {
+        "logical_id": manifest["logical_id"],
+        "workspace_id": workspace_id,
+        "dry_run": False,
+        "items": item_results,
+        "files": file_results,
+        "kept": kept_names,
+        "failed": failed,
+        "timings": {"total": total_seconds, "files": files_seconds, "tiers": tier_timings},
+    }
+
+
+def format_uninstall_report(report: Dict) -> str:
+    """Render an uninstall report as a short multi-line summary."""
+    verb = "Would delete" if report["dry_run"] else "Deleted"
+    lines = [f"{verb} '{report['logical_id']}' from workspace '{report['workspace_id']}'"]
+    for item in report["items"]:
+        timing = f" ({item['seconds']:.2f}s)" if "seconds" in item else ""
+        error = f": {item['error']}" if item.get("error") else ""
+        lines.append(f"  {item['status']:<8} {item['name']}.{item['type']}{timing}{error}")
+    if report["files"]:
+        statuses: Dict[str, int] = {}
+        for f in report["files"]:
+            statuses[f["status"]] = statuses.get(f["status"], 0) + 1
+        lines.append("  files: " + ", ".join(f"{n} {s}" for s, n in sorted(statuses.items())))
+    for name in report["kept"]:
+        lines.append(f"  kept     {name} (existed before install)")
+    if not report["dry_run"]:
+        tiers = ", ".join(f"{'/'.join(t['types'])} {t['seconds']:.2f}s" for t in report["timings"]["tiers"])
+        lines.append(f"  total {report['timings']['total']:.2f}s" + (f" [{tiers}]" if tiers else ""))
+    return "\n".join(lines)
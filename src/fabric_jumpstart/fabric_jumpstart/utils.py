@@ -2,13 +2,15 @@ import base64
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-import requests
+from . import events
+from .arena import get_arena
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,17 @@ logger = logging.getLogger(__name__)
 # ManagedIdentityCredential, EnvironmentCredential
 CREDENTIAL_OVERRIDE_ENV_VAR = "FABRIC_JUMPSTART_TOKEN_CREDENTIAL"
 
+# Environment variable for overriding the local cache directory used for
+# telemetry spooling and other per-user state.
+CACHE_DIR_ENV_VAR = "FABRIC_JUMPSTART_CACHE_DIR"
+
+# Environment variable forcing how local jumpstart sources are staged.
+# Supported values: auto (default), reflink, hardlink, copy
+STAGING_MODE_ENV_VAR = "FABRIC_JUMPSTART_STAGING_MODE"
+
+# Linux ioctl request number for a copy-on-write file clone.
+_FICLONE = 0x40049409
+
 _CREDENTIAL_CLASS_MAP = {
     "AzureCliCredential": "azure.identity.AzureCliCredential",
     "DefaultAzureCredential": "azure.identity.DefaultAzureCredential",
@@ -68,6 +81,29 @@ def resolve_token_credential():
     return DefaultAzureCredential()
 
 
+def get_cache_dir(*parts: str) -> Path:
+    """Return (and create) a directory under the jumpstart cache root.
+
+    The root is ``FABRIC_JUMPSTART_CACHE_DIR`` when set, otherwise
+    ``$XDG_CACHE_HOME/fabric-jumpstart`` (defaulting to ``~/.cache``).
+
+    Args:
+        *parts: Sub-directory components under the cache root
+
+    Returns:
+        Path to the existing directory
+    """
+    root = os.environ.get(CACHE_DIR_ENV_VAR, "").strip()
+    if root:
+        base = Path(root)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / "fabric-jumpstart"
+    path = base.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def _is_fabric_runtime() -> bool:
     """Checks if the execution runtime is Fabric."""
     try:
@@ -81,6 +117,21 @@ def _is_fabric_runtime() -> bool:
         return False
 
 
+def resolve_workspace_id(workspace_id: Optional[str]) -> str:
+    """Return ``workspace_id``, defaulting to the current Fabric workspace.
+
+    Raises:
+        ValueError: If no workspace id is given outside a Fabric runtime
+    """
+    if workspace_id is None and _is_fabric_runtime():
+        import notebookutils  # type: ignore[import-untyped]
+
+        workspace_id = notebookutils.runtime.context['currentWorkspaceId']
+    if workspace_id is None:
+        raise ValueError("workspace_id must be provided when not running inside a Fabric runtime")
+    return workspace_id
+
+
 def _decode_jwt(token: str) -> dict:
     """Decode a JWT token and return the payload as a dictionary.
 
@@ -120,10 +171,17 @@ def _generate_fabric_credential():
             self.audience = audience
 
         def get_token(self, *scopes, **kwargs):
-            """Get token using notebookutils."""
+            """Get token using notebookutils.
+
+            OneLake storage scopes map to the ``storage`` audience; every
+            other scope uses the credential's default audience.
+            """
             import notebookutils  # type: ignore[import-untyped]
 
-            token_string = notebookutils.credentials.getToken(self.audience)
+            audience = self.audience
+            if any("storage.azure.com" in scope for scope in scopes):
+                audience = "storage"
+            token_string = notebookutils.credentials.getToken(audience)
 
             try:
                 payload = _decode_jwt(token_string)
@@ -145,11 +203,7 @@ def _generate_fabric_credential():
     return FabricTokenCredential("pbi")
 
 def download_file(url: str, dest: str):
-    with requests.get(url, stream=True) as r:
-        r.raise_for_status()
-        with open(dest, "wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                f.write(chunk)
+    get_http_client().download(url, dest)
 
 def set_workspace_in_yml(yml_path: str, workspace_name: str):
     import yaml
@@ -157,12 +211,128 @@ def set_workspace_in_yml(yml_path: str, workspace_name: str):
         data = yaml.safe_load(f)
     # Modify workspace for core section
     data['core']['workspace'] = workspace_name
-    with open(yml_path, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False)
+    _replace_file_text(Path(yml_path), yaml.safe_dump(data, sort_keys=False))
 
 def create_working_directory(temp_dir_prefix: str = "fabric-jumpstart-") -> Path:
-    dest_dir = tempfile.mkdtemp(prefix=temp_dir_prefix)
-    return Path(dest_dir)
+    """Allocate a scratch directory from the managed arena.
+
+    The directory belongs to the current install's lease (if any) and is
+    removed when that install finishes; see :mod:`fabric_jumpstart.arena`.
+    """
+    return get_arena().allocate(temp_dir_prefix)
+
+
+def _replace_file_text(path: Path, content: str) -> None:
+    """Write text by replacing the file rather than rewriting it in place.
+
+    Staged files may be hardlinks into the packaged jumpstart source, so an
+    in-place write would modify the original. Writing a sibling file and
+    renaming it over the target breaks the link for this file only.
+    """
+    tmp = path.with_name(f".{path.name}.jumpstart-tmp")
+    tmp.write_text(content, encoding='utf-8')
+    try:
+        shutil.copymode(path, tmp)
+    except OSError:
+        pass
+    os.replace(tmp, path)
+
+
+def _reflink_file(src: Path, dst: Path) -> None:
+    """Clone src to dst as a copy-on-write reflink (Linux ``FICLONE``).
+
+    Raises:
+        OSError: If the platform or filesystem does not support reflinks
+    """
+    try:
+        import fcntl
+    except ImportError as e:  # Windows
+        raise OSError("reflinks are not supported on this platform") from e
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copystat(src, dst)
+
+
+_STAGING_METHODS = {
+    "reflink": _reflink_file,
+    "hardlink": os.link,
+    "copy": shutil.copy2,
+}
+
+
+def _staging_methods() -> list[str]:
+    """Return staging methods to try, most efficient first.
+
+    Raises:
+        ValueError: If ``FABRIC_JUMPSTART_STAGING_MODE`` is not a supported value.
+    """
+    mode = os.environ.get(STAGING_MODE_ENV_VAR, "").strip().lower() or "auto"
+    if mode == "auto":
+        return ["reflink", "hardlink", "copy"]
+    if mode not in _STAGING_METHODS:
+        supported = ", ".join(["auto", *_STAGING_METHODS])
+        raise ValueError(f"Unsupported {STAGING_MODE_ENV_VAR} value '{mode}'. Supported values: {supported}")
+    return [mode] if mode == "copy" else [mode, "copy"]
+
+
+def stage_tree(source_path: Path, dest_path: Path) -> dict:
+    """Materialise source_path under dest_path without copying file data where possible.
+
+    Each file is reflinked (copy-on-write) where the filesystem supports it,
+    otherwise hardlinked, otherwise copied. A method that fails once is not
+    retried for the remaining files. Hardlinked files are only safe because
+    every jumpstart writer goes through :func:`_replace_file_text`.
+
+    Symlinks (to files or directories) are recreated as symlinks rather than
+    followed, so a link cycle cannot loop and files outside ``source_path``
+    are never linked into the staged tree.
+
+    Args:
+        source_path: Directory to stage
+        dest_path: Existing destination directory
+
+    Returns:
+        Counts per method (``reflink``, ``hardlink``, ``copy``, ``symlink``)
+        and ``bytes_copied``
+    """
+    methods = _staging_methods()
+    stats = {"reflink": 0, "hardlink": 0, "copy": 0, "symlink": 0, "bytes_copied": 0}
+    for root, dirs, files in os.walk(source_path):
+        rel_root = Path(root).relative_to(source_path)
+        target_root = dest_path / rel_root
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in dirs:
+            # os.walk lists links to directories here but does not descend into them
+            if (Path(root) / name).is_symlink():
+                os.symlink(os.readlink(Path(root) / name), target_root / name, target_is_directory=True)
+                stats["symlink"] += 1
+        for name in files:
+            src, dst = Path(root) / name, target_root / name
+            if src.is_symlink():
+                os.symlink(os.readlink(src), dst)
+                stats["symlink"] += 1
+                continue
+            while True:
+                method = methods[0]
+                try:
+                    _STAGING_METHODS[method](src, dst)
+                except OSError as e:
+                    if len(methods) == 1:
+                        raise
+                    logger.debug("Staging with %s unavailable (%s); falling back", method, e)
+                    methods.pop(0)
+                    continue
+                stats[method] += 1
+                if method == "copy":
+                    stats["bytes_copied"] += dst.stat().st_size
+                break
+    return stats
 
 def clone_files_to_temp_directory(
     source_path: Path,
@@ -170,6 +340,9 @@ def clone_files_to_temp_directory(
 ):
     """
     Clone files from source_path to a temporary directory, preserving structure.
+
+    Files are reflinked or hardlinked where possible (see :func:`stage_tree`),
+    so staging cost is proportional to the files later modified, not the tree size.
     
     Args:
         source_path: Path to source directory
@@ -181,13 +354,8 @@ def clone_files_to_temp_directory(
     if not source_path.exists():
         raise FileNotFoundError(f"Source path does not exist: {source_path}")
     dest_path = create_working_directory(temp_dir_prefix)
-    for item in source_path.iterdir():
-        dest_item = dest_path / item.name
-        if item.is_dir():
-            shutil.copytree(item, dest_item, dirs_exist_ok=True)
-        else:
-            dest_item.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, dest_item)
+    stats = stage_tree(source_path, dest_path)
+    logger.debug("Staged %s into %s: %s", source_path, dest_path, stats)
     return dest_path
 
 
@@ -258,9 +426,10 @@ def _apply_item_prefix(workspace_path: Path, item_prefix: Optional[str], base_na
         return []
 
     modified_files = []
-    for file_path in workspace_path.rglob('*'):
-        if not file_path.is_file():
-            continue
+    files = [p for p in workspace_path.rglob('*') if p.is_file()]
+    events.work_total(len(files), "files")
+    for file_path in files:
+        events.work_done()
         try:
             content = file_path.read_text(encoding='utf-8')
         except Exception:
@@ -279,8 +448,9 @@ def _apply_item_prefix(workspace_path: Path, item_prefix: Optional[str], base_na
             new_content = re.sub(pattern, new_base, new_content)
 
         if new_content != content:
-            file_path.write_text(new_content, encoding='utf-8')
+            _replace_file_text(file_path, new_content)
             modified_files.append(file_path)
+            events.count("files_rewritten")
 
     logger.info(
         "Applied item prefix '%s' to %s items under %s; renamed=%s; files_modified=%s",
@@ -292,11 +462,89 @@ def _apply_item_prefix(workspace_path: Path, item_prefix: Optional[str], base_na
     )
     return mappings
 
+def _onelake_files_path(client, target_ws, lakehouse_id: str) -> str:
+    """Resolve a lakehouse's OneLake Files root URL from its item properties."""
+    from .auth import FABRIC_API_SCOPE
+
+    import fabric_cicd.constants as cicd_constants
+
+    if target_ws is None:
+        raise RuntimeError(
+            "target_ws (FabricWorkspace) is required to resolve the OneLake endpoint"
+        )
+    workspace_id = target_ws.workspace_id
+    url = (
+        f"{cicd_constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/lakehouses/{lakehouse_id}"
+    )
+    body = client.get_json(url, scope=FABRIC_API_SCOPE)
+    return body["properties"]["oneLakeFilesPath"]
+
+
+def _upload_file(client, base_url: str, rel_path: str, file_size: int, data) -> None:
+    """Create, append and flush one file through the OneLake DFS API.
+
+    Args:
+        client: HttpClient
+        base_url: Lakehouse Files root URL
+        rel_path: Destination path under Files/
+        file_size: Length of ``data`` in bytes
+        data: Bytes or a rewindable file-like object of ``file_size`` bytes
+
+    Raises:
+        RuntimeError: If a request fails
+    """
+    from .auth import STORAGE_SCOPE
+    from .scheduler import PRIORITY_BULK
+
+    file_url = f"{base_url}/{rel_path}"
+
+    # Step 1: Create
+    resp = client.put(
+        file_url,
+        scope=STORAGE_SCOPE,
+        priority=PRIORITY_BULK,
+        params={"resource": "file"},
+    )
+    if resp.status_code not in (201, 409):
+        raise RuntimeError(
+            f"Failed to create file '{rel_path}': {resp.status_code} {resp.text}"
+        )
+
+    # Step 2: Append
+    resp = client.patch(
+        file_url,
+        scope=STORAGE_SCOPE,
+        priority=PRIORITY_BULK,
+        headers={"Content-Type": "application/octet-stream"},
+        params={"action": "append", "position": "0"},
+        data=data,
+    )
+    if resp.status_code != 202:
+        raise RuntimeError(
+            f"Failed to append data for '{rel_path}': {resp.status_code} {resp.text}"
+        )
+
+    # Step 3: Flush
+    resp = client.patch(
+        file_url,
+        scope=STORAGE_SCOPE,
+        priority=PRIORITY_BULK,
+        params={"action": "flush", "position": str(file_size)},
+    )
+    if resp.status_code != 200:
+        raise RuntimeError(
+            f"Failed to flush file '{rel_path}': {resp.status_code} {resp.text}"
+        )
+
+    logger.info("Uploaded %s", rel_path)
+
+
 def upload_files_to_lakehouse(
     target_ws,
     lakehouse_id: str,
     source_path: Path,
     destination_path: str = "",
+    uploaded_paths: Optional[List[str]] = None,
     ) -> int:
     """Upload a file or folder to a Lakehouse Files area via the OneLake DFS API.
 
@@ -305,6 +553,7 @@ def upload_files_to_lakehouse(
         lakehouse_id: Target lakehouse item GUID
         source_path: Local file or directory to upload
         destination_path: Destination path under Files/ (empty string for root)
+        uploaded_paths: When given, each uploaded path under Files/ is appended
 
     Returns:
         Number of files uploaded
@@ -317,35 +566,9 @@ def upload_files_to_lakehouse(
     if not source.exists():
         raise FileNotFoundError(f"Source path does not exist: {source}")
 
-    # Resolve bearer token
-    if _is_fabric_runtime():
-        import notebookutils  # type: ignore[import-untyped]
-
-        token = notebookutils.credentials.getToken("storage")
-    else:
-        credential = resolve_token_credential()
-        if credential is None:
-            from azure.identity import DefaultAzureCredential
-
-            credential = DefaultAzureCredential()
-        token_obj = credential.get_token("https://storage.azure.com/.default")
-        token = token_obj.token
-
-    headers = {"Authorization": f"Bearer {token}"}
-       
-    # Resolve base url from lakehouse item properties
-    import fabric_cicd.constants as cicd_constants
-
-    if target_ws is None:
-        raise RuntimeError(
-            "target_ws (FabricWorkspace) is required to resolve the OneLake endpoint"
-        )
-    workspace_id = target_ws.workspace_id
-    url = (
-        f"{cicd_constants.DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/lakehouses/{lakehouse_id}"
-    )
-    response = target_ws.endpoint.invoke(method="GET", url=url)
-    base_url = response["body"]["properties"]["oneLakeFilesPath"]
+    # Bearer tokens come from the shared token manager on every request
+    client = get_http_client()
+    base_url = _onelake_files_path(client, target_ws, lakehouse_id)
 
     dest_prefix = destination_path.strip("/")
 
@@ -364,49 +587,85 @@ def upload_files_to_lakehouse(
                 rel = f"{dest_prefix}/{rel}"
             files_to_upload.append((file_path, rel))
 
+    sizes = [local_file.stat().st_size for local_file, _ in files_to_upload]
+    events.work_total(sum(sizes), "bytes")
+    events.emit("upload_start", files_total=len(files_to_upload), bytes_total=sum(sizes))
     uploaded = 0
-    for local_file, rel_path in files_to_upload:
-        file_url = f"{base_url}/{rel_path}"
-        file_size = local_file.stat().st_size
-
-        # Step 1: Create
-        resp = requests.put(
-            file_url,
-            headers=headers,
-            params={"resource": "file"},
-        )
-        if resp.status_code not in (201, 409):
-            raise RuntimeError(
-                f"Failed to create file '{rel_path}': {resp.status_code} {resp.text}"
-            )
-
-        # Step 2: Append
+    bytes_done = 0
+    for (local_file, rel_path), size in zip(files_to_upload, sizes):
         with open(local_file, "rb") as f:
             data = f.read()
-        resp = requests.patch(
-            file_url,
-            headers={**headers, "Content-Type": "application/octet-stream"},
-            params={"action": "append", "position": "0"},
-            data=data,
-        )
-        if resp.status_code != 202:
-            raise RuntimeError(
-                f"Failed to append data for '{rel_path}': {resp.status_code} {resp.text}"
-            )
+        _upload_file(client, base_url, rel_path, size, data)
+        if uploaded_paths is not None:
+            uploaded_paths.append(rel_path)
+        uploaded += 1
+        bytes_done += size
+        events.count("files_uploaded")
+        events.count("bytes_uploaded", size)
+        events.work_done(size)
+        events.emit("upload_progress", path=rel_path, bytes=size, files_done=uploaded, bytes_done=bytes_done)
 
-        # Step 3: Flush
-        resp = requests.patch(
-            file_url,
-            headers=headers,
-            params={"action": "flush", "position": str(file_size)},
-        )
-        if resp.status_code != 200:
-            raise RuntimeError(
-                f"Failed to flush file '{rel_path}': {resp.status_code} {resp.text}"
-            )
+    return uploaded
 
-        logger.info("Uploaded %s", rel_path)
-        uploaded += 1
+
+def upload_git_tree_to_lakehouse(
+    target_ws,
+    lakehouse_id: str,
+    repo_dir: Path,
+    tree_path: str,
+    destination_path: str = "",
+    rev: str = "HEAD",
+    uploaded_paths: Optional[List[str]] = None,
+    ) -> int:
+    """Upload a repository folder to a Lakehouse straight from the git object store.
+
+    Blob contents are streamed from ``git cat-file --batch`` into the DFS
+    append calls, so the folder never needs to be checked out.
+
+    Args:
+        target_ws: FabricWorkspace instance (provides workspace_id and auth endpoint)
+        lakehouse_id: Target lakehouse item GUID
+        repo_dir: Cloned repository (working tree or git dir)
+        tree_path: Folder (or file) path within the repository
+        destination_path: Destination path under Files/ (empty string for root)
+        rev: Commit-ish to read the folder from
+        uploaded_paths: When given, each uploaded path under Files/ is appended
+
+    Returns:
+        Number of files uploaded
+
+    Raises:
+        FileNotFoundError: If tree_path does not exist at rev
+        RuntimeError: If git or an upload request fails
+    """
+    from .git_blobs import GitBlobReader, list_tree
+
+    entries = list_tree(repo_dir, tree_path, rev)
+    client = get_http_client()
+    base_url = _onelake_files_path(client, target_ws, lakehouse_id)
+    dest_prefix = destination_path.strip("/")
+
+    bytes_total = sum(e.size for e in entries)
+    events.work_total(bytes_total, "bytes")
+    events.emit("upload_start", files_total=len(entries), bytes_total=bytes_total)
+    uploaded = 0
+    bytes_done = 0
+    with GitBlobReader(repo_dir) as reader:
+        for entry in entries:
+            rel_path = f"{dest_prefix}/{entry.path}" if dest_prefix else entry.path
+            stream = reader.open(entry.sha)
+            try:
+                _upload_file(client, base_url, rel_path, entry.size, stream)
+            finally:
+                stream.close()
+            if uploaded_paths is not None:
+                uploaded_paths.append(rel_path)
+            uploaded += 1
+            bytes_done += entry.size
+            events.count("files_uploaded")
+            events.count("bytes_uploaded", entry.size)
+            events.work_done(entry.size)
+            events.emit("upload_progress", path=rel_path, bytes=entry.size, files_done=uploaded, bytes_done=bytes_done)
 
     return uploaded
 
@@ -444,10 +703,74 @@ def update_docs_uri_with_ref(
     return docs_uri
 
 
+def _sparse_checkout(repo_dir: Path, ref: str, exclude_paths: List[str]) -> None:
+    """Check out everything except ``exclude_paths`` in a ``--no-checkout`` clone."""
+    patterns = ["/*"] + ["!/" + p.strip("/\\") + "/" for p in exclude_paths]
+    subprocess.run(
+        ["git", "-C", str(repo_dir), "config", "core.sparseCheckout", "true"],
+        check=True, capture_output=True, text=True,
+    )
+    (repo_dir / ".git" / "info").mkdir(parents=True, exist_ok=True)
+    (repo_dir / ".git" / "info" / "sparse-checkout").write_text("\n".join(patterns) + "\n", encoding="utf-8")
+    subprocess.run(
+        ["git", "-C", str(repo_dir), "checkout", ref],
+        check=True, capture_output=True, text=True,
+    )
+
+
+_GIT_RECEIVING_RE = re.compile(r"Receiving objects:\s+\d+% \((\d+)/(\d+)\)(?:, ([\d.]+) (bytes|KiB|MiB|GiB))?")
+_GIT_SIZE_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3}
+
+
+def _run_git_clone(cmd: List[str]) -> None:
+    """Run a ``git clone --progress`` command, reporting received objects as phase work.
+
+    Objects received count as the current install phase's work and the
+    transferred size as its ``bytes_cloned`` counter.
+
+    Raises:
+        subprocess.CalledProcessError: If git fails (``stderr`` holds its messages)
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    messages: List[str] = []
+    objects_done = 0
+    bytes_done = 0
+    pending = b""
+    while True:
+        chunk = proc.stderr.read1(4096)  # type: ignore[union-attr]
+        if not chunk:
+            break
+        # Progress lines are redrawn with \r; messages end with \n
+        *lines, pending = re.split(rb"[\r\n]", pending + chunk)
+        for raw in lines:
+            line = raw.decode("utf-8", errors="replace").strip()
+            match = _GIT_RECEIVING_RE.search(line)
+            if match is None:
+                if line:
+                    messages.append(line)
+                continue
+            done, total = int(match.group(1)), int(match.group(2))
+            if objects_done == 0:
+                events.work_total(total, "objects")
+            events.work_done(done - objects_done)
+            objects_done = done
+            if match.group(3):
+                size = int(float(match.group(3)) * _GIT_SIZE_UNITS[match.group(4)])
+                if size > bytes_done:
+                    events.count("bytes_cloned", size - bytes_done)
+                    bytes_done = size
+    if pending.strip():
+        messages.append(pending.decode("utf-8", errors="replace").strip())
+    returncode = proc.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr="\n".join(messages))
+
+
 def clone_repository(
     repository_url: str,
     ref: Optional[str] = None,
-    temp_dir_prefix: str = "fabric-jumpstart-"
+    temp_dir_prefix: str = "fabric-jumpstart-",
+    exclude_paths: Optional[List[str]] = None,
 ) -> Path:
     """
     Clone a git repository to a destination directory.
@@ -456,6 +779,8 @@ def clone_repository(
         repository_url: URL of the git repository
         ref: Git reference (branch, tag, or commit hash). Defaults to 'main'
         temp_dir_prefix: Prefix for the temporary directory name
+        exclude_paths: Repository folders to leave out of the checkout (sparse
+            checkout); their contents stay readable from the object store
     
     Returns:
         Path to cloned repository
@@ -470,12 +795,12 @@ def clone_repository(
     try:
         # Clone with specific reference using --branch
         # Git's --branch works with branches, tags, and commit hashes
-        subprocess.run(
-            ["git", "clone", "--branch", git_ref, "--single-branch", repository_url, dest_dir],
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        clone_cmd = ["git", "clone", "--progress", "--branch", git_ref, "--single-branch"]
+        if exclude_paths:
+            clone_cmd.append("--no-checkout")
+        _run_git_clone(clone_cmd + [repository_url, str(dest_dir)])
+        if exclude_paths:
+            _sparse_checkout(Path(dest_dir), git_ref, exclude_paths)
         return dest_dir
     
     except subprocess.CalledProcessError as e:
@@ -0,0 +1,358 @@
+"""Runtime validation of jumpstart registry entries.
+
+Applies the registry schema (mirrored by the pydantic models in
+``tests/schemas.py``, which the test suite holds to the same verdicts) when
+:class:`~fabric_jumpstart.registry.JumpstartRegistry` loads YAML sources, so a
+malformed entry is reported at load time rather than deep inside ``install()``. Every rule is checked and every failure collected,
+so one load reports all problems at once.
+
+Validation is plain Python over the parsed dictionaries. Results are cached
+per process by the SHA-256 of each file's bytes, so reloading an unchanged
+catalog only reads and hashes the files; parsing and validating is spread
+over a thread pool for large catalogs.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from .constants import (
+    ITEM_URL_ROUTING_PATH_MAP,
+    VALID_JUMPSTART_TYPES,
+    VALID_SCENARIO_TAGS,
+    VALID_WORKLOAD_TAGS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when a rule changes so cached results from an older rule set are not reused.
+VALIDATOR_VERSION = 2
+
+# Below this many files the pool costs more than it saves.
+_PARALLEL_THRESHOLD = 32
+_DEFAULT_MAX_WORKERS = 8
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+# Month/day/year with optional leading zeros, as datetime.strptime("%m/%d/%Y") accepts.
+_DATE_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_DESCRIPTION_MAX_CHARS = 350
+_DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+
+_REQUIRED_FIELDS = (
+    "id", "logical_id", "name", "description", "date_added", "workload_tags",
+    "scenario_tags", "source", "entry_point", "owner_email",
+)
+_OPTIONAL_FIELDS = (
+    "include_in_listing", "type", "core", "items_in_scope", "feature_flags", "jumpstart_docs_uri",
+    "test_suite", "minutes_to_complete_jumpstart", "minutes_to_deploy", "video_url", "difficulty",
+    "last_updated", "mermaid_diagram",
+)
+_KNOWN_FIELDS = frozenset(_REQUIRED_FIELDS + _OPTIONAL_FIELDS)
+_SOURCE_STRING_FIELDS = (
+    "repo_url", "repo_ref", "files_source_path", "files_destination_lakehouse", "files_destination_path",
+)
+_SOURCE_FIELDS = frozenset(("workspace_path",) + _SOURCE_STRING_FIELDS)
+_STRING_FIELDS = ("name", "description", "entry_point", "owner_email")
+_OPTIONAL_STRING_FIELDS = (
+    "jumpstart_docs_uri", "test_suite", "video_url", "last_updated", "mermaid_diagram",
+)
+
+
+class RegistryValidationError(ValueError):
+    """Raised when one or more registry entries fail validation.
+
+    Attributes:
+        errors: Mapping of source (file path or logical id) to its error messages
+    """
+
+    def __init__(self, errors: Dict[str, List[str]]):
+        self.errors = errors
+        count = sum(len(v) for v in errors.values())
+        lines = [f"{count} registry validation error(s) in {len(errors)} entr{'y' if len(errors) == 1 else 'ies'}:"]
+        for source, messages in errors.items():
+            lines.append(f"  {source}:")
+            lines.extend(f"    - {m}" for m in messages)
+        super().__init__("\n".join(lines))
+
+
+def _check_tags(entry: Dict, field: str, allowed: List[str], errors: List[str]) -> None:
+    tags = entry.get(field)
+    if not isinstance(tags, list) or not tags:
+        errors.append(f"{field}: at least one value must be provided")
+        return
+    unknown = [str(t) for t in tags if t not in allowed]
+    if unknown:
+        errors.append(f"{field}: unknown value(s) {', '.join(unknown)}. Allowed values: {', '.join(allowed)}.")
+
+
+def _check_minutes(entry: Dict, field: str, errors: List[str]) -> None:
+    value = entry.get(field)
+    if value in (None, ""):
+        return
+    try:
+        minutes = int(value)
+    except (TypeError, ValueError):
+        errors.append(f"{field}: must be an integer")
+        return
+    if minutes < 0:
+        errors.append(f"{field}: must be non-negative")
+
+
+def _check_source(source, errors: List[str]) -> None:
+    if not isinstance(source, dict):
+        errors.append("source: must be a mapping")
+        return
+    unknown = sorted(str(k) for k in source if k not in _SOURCE_FIELDS)
+    if unknown:
+        errors.append(f"source: unknown field(s) {', '.join(unknown)}")
+    if not isinstance(source.get("workspace_path"), str):
+        errors.append("source.workspace_path: must be provided")
+    for field in _SOURCE_STRING_FIELDS:
+        if source.get(field) is not None and not isinstance(source[field], str):
+            errors.append(f"source.{field}: must be a string")
+    if source.get("repo_url") and not str(source.get("repo_ref") or "").strip():
+        errors.append("source.repo_ref: a tag of the repository must be provided when repo_url is set")
+    has_source = bool(str(source.get("files_source_path") or "").strip())
+    has_lakehouse = bool(str(source.get("files_destination_lakehouse") or "").strip())
+    if has_source != has_lakehouse:
+        errors.append("source: files_source_path and files_destination_lakehouse must both be provided or both be omitted")
+
+
+def validate_entry(entry) -> List[str]:
+    """Check one registry entry against the schema.
+
+    Args:
+        entry: Parsed YAML document
+
+    Returns:
+        Error messages, empty when the entry is valid
+    """
+    if not isinstance(entry, dict):
+        return [f"entry must be a mapping, got {type(entry).__name__}"]
+
+    errors: List[str] = []
+    missing = [f for f in _REQUIRED_FIELDS if entry.get(f) is None]
+    if missing:
+        errors.append(f"missing required field(s): {', '.join(missing)}")
+    unknown = sorted(str(k) for k in entry if k not in _KNOWN_FIELDS)
+    if unknown:
+        errors.append(f"unknown field(s): {', '.join(unknown)}")
+
+    for field in _STRING_FIELDS:
+        if field in entry and entry[field] is not None and not isinstance(entry[field], str):
+            errors.append(f"{field}: must be a string")
+    for field in _OPTIONAL_STRING_FIELDS:
+        if entry.get(field) is not None and not isinstance(entry[field], str):
+            errors.append(f"{field}: must be a string")
+
+    jumpstart_id = entry.get("id")
+    if jumpstart_id is not None and (isinstance(jumpstart_id, bool) or not isinstance(jumpstart_id, int) or jumpstart_id <= 0):
+        errors.append(f"id: must be a positive integer, got {jumpstart_id!r}")
+
+    logical_id = entry.get("logical_id")
+    if logical_id is not None and (not isinstance(logical_id, str) or not _SLUG_RE.match(logical_id)):
+        errors.append(f"logical_id: {logical_id!r} must be lowercase alphanumeric with dashes")
+
+    name = entry.get("name")
+    description = entry.get("description")
+    if isinstance(description, str):
+        if len(description) > _DESCRIPTION_MAX_CHARS:
+            errors.append(f"description: must be {_DESCRIPTION_MAX_CHARS} characters or fewer, was {len(description)}")
+        if isinstance(name, str) and name.strip() and description.lstrip().lower().startswith(name.strip().lower()):
+            errors.append("description: must not start with the jumpstart name")
+
+    date_added = entry.get("date_added")
+    if date_added is not None:
+        match = _DATE_RE.match(str(date_added))
+        try:
+            if match is None:
+                raise ValueError
+            month, day, year = (int(g) for g in match.groups())
+            datetime(year, month, day)
+        except ValueError:
+            errors.append(f"date_added: {date_added!r} must be a valid date in MM/DD/YYYY format")
+
+    email = entry.get("owner_email")
+    if isinstance(email, str):
+        local, _, domain = email.partition("@")
+        host, dot, tld = domain.partition(".")
+        if not local or not host or not dot or not tld:
+            errors.append(f"owner_email: {email!r} must be a valid email address")
+
+    entry_point = entry.get("entry_point")
+    if isinstance(entry_point, str) and not entry_point.strip().startswith(("http://", "https://")):
+        item_name, sep, item_type = entry_point.strip().rpartition(".")
+        if not sep or not item_name or item_type not in ITEM_URL_ROUTING_PATH_MAP:
+            errors.append(
+                f"entry_point: {entry_point!r} must be a URL or '<name>.<item_type>' with a known item type"
+            )
+
+    _check_tags(entry, "workload_tags", VALID_WORKLOAD_TAGS, errors)
+    _check_tags(entry, "scenario_tags", VALID_SCENARIO_TAGS, errors)
+
+    jumpstart_type = entry.get("type")
+    if jumpstart_type is not None and jumpstart_type not in VALID_JUMPSTART_TYPES:
+        errors.append(f"type: unknown value {jumpstart_type!r}. Allowed values: {', '.join(VALID_JUMPSTART_TYPES)}.")
+
+    items_in_scope = entry.get("items_in_scope")
+    if not isinstance(items_in_scope, list):
+        errors.append("items_in_scope: must be provided as a list")
+    else:
+        unknown_items = [str(i) for i in items_in_scope if i not in ITEM_URL_ROUTING_PATH_MAP]
+        if unknown_items:
+            errors.append(f"items_in_scope: unknown item type(s) {', '.join(unknown_items)}")
+
+    feature_flags = entry.get("feature_flags")
+    if feature_flags is not None and (
+        not isinstance(feature_flags, list) or not all(isinstance(f, str) for f in feature_flags)
+    ):
+        errors.append("feature_flags: must be a list of strings")
+    for field in ("include_in_listing", "core"):
+        if entry.get(field) is not None and not isinstance(entry[field], bool):
+            errors.append(f"{field}: must be true or false")
+
+    _check_minutes(entry, "minutes_to_complete_jumpstart", errors)
+    _check_minutes(entry, "minutes_to_deploy", errors)
+
+    difficulty = entry.get("difficulty")
+    if difficulty is not None and difficulty not in _DIFFICULTIES:
+        errors.append(f"difficulty: unknown value {difficulty!r}. Allowed values: {', '.join(_DIFFICULTIES)}.")
+
+    if "source" in entry and entry["source"] is not None:
+        _check_source(entry["source"], errors)
+    return errors
+
+
+def check_unique(entries: Sequence[Tuple[str, Dict]]) -> Dict[str, List[str]]:
+    """Report ``id`` and ``logical_id`` values shared by more than one entry.
+
+    Args:
+        entries: ``(source, entry)`` pairs
+
+    Returns:
+        Mapping of source to duplicate-key errors
+    """
+    errors: Dict[str, List[str]] = {}
+    for field in ("id", "logical_id"):
+        seen: Dict[object, str] = {}
+        for source, entry in entries:
+            value = entry.get(field)
+            if value is None:
+                continue
+            if value in seen:
+                errors.setdefault(source, []).append(f"{field}: {value!r} is already used by {seen[value]}")
+            else:
+                seen[value] = source
+    return errors
+
+
+class ValidationCache:
+    """Process-wide cache of parsed entries and their errors, keyed by file content hash."""
+
+    def __init__(self):
+        self._results: Dict[str, Tuple[Optional[Dict], List[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: str) -> Optional[Tuple[Optional[Dict], List[str]]]:
+        with self._lock:
+            result = self._results.get(digest)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return result
+
+    def put(self, digest: str, result: Tuple[Optional[Dict], List[str]]) -> None:
+        with self._lock:
+            self._results[digest] = result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def _load_file(path: Path, cache: ValidationCache) -> Tuple[Optional[Dict], List[str]]:
+    """Parse and validate one YAML file, reusing a cached result for identical bytes."""
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        return None, [f"could not be read: {e}"]
+    digest = hashlib.sha256(data + f"\0v{VALIDATOR_VERSION}".encode()).hexdigest()
+    cached = cache.get(digest)
+    if cached is None:
+        try:
+            entry = yaml.load(data, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            cached = (None, [f"invalid YAML: {e}"])
+        else:
+            cached = (entry, validate_entry(entry) if entry else [])
+        cache.put(digest, cached)
+    entry, errors = cached
+    # Callers annotate and mutate entries; hand out a copy so the cached one stays pristine.
+    return (dict(entry) if isinstance(entry, dict) else entry), errors
+
+
+def load_and_validate(
+    paths: Sequence[Path], max_workers: int = _DEFAULT_MAX_WORKERS
+) -> Tuple[List[Tuple[Path, Optional[Dict]]], Dict[str, List[str]]]:
+    """Parse and validate registry files, concurrently when there are many.
+
+    Args:
+        paths: YAML files to load
+        max_workers: Threads used for catalogs above the parallel threshold
+
+    Returns:
+        Tuple of (``(path, entry)`` pairs in input order, with None for empty
+        or unparseable files, and a mapping of file path to errors for every
+        file that failed, including duplicate ids across files)
+    """
+    cache = get_validation_cache()
+    if len(paths) >= _PARALLEL_THRESHOLD and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jumpstart-validate") as pool:
+            results = list(pool.map(lambda p: _load_file(p, cache), paths))
+    else:
+        results = [_load_file(p, cache) for p in paths]
+
+    errors: Dict[str, List[str]] = {}
+    loaded: List[Tuple[Path, Optional[Dict]]] = []
+    for path, (entry, entry_errors) in zip(paths, results):
+        if entry_errors:
+            errors[str(path)] = list(entry_errors)
+        loaded.append((path, entry))
+    valid = [(str(p), e) for p, e in loaded if isinstance(e, dict) and str(p) not in errors]
+    for source, duplicate_errors in check_unique(valid).items():
+        errors.setdefault(source, []).extend(duplicate_errors)
+    return loaded, errors
+
+
+_cache: Optional[ValidationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_validation_cache() -> ValidationCache:
+    """Return the process-wide validation cache."""
+    global _cache
+    cache = _cache
+    if cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ValidationCache()
+            cache = _cache
+    return cache
+
+
+def reset_validation_cache() -> None:
+    """Discard the process-wide validation cache."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -1,15 +1,244 @@
 """Workspace management for Fabric operations."""
 
+import base64
+import hashlib
 import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
+import requests
 from fabric_cicd import FabricWorkspace, append_feature_flag, publish_all_items
 
-from .utils import resolve_token_credential
+from . import events
+from .auth import FABRIC_API_SCOPE, get_token_manager
+from .http_client import get_http_client, parse_retry_after
+from .scheduler import PRIORITY_PUBLISH, classify_url, get_scheduler
 
 logger = logging.getLogger(__name__)
 
+_DEFINITION_TIMEOUT_SECONDS = 60.0
+# fabric_cicd flags a selective (items_to_include) publish needs.
+_SELECTIVE_PUBLISH_FLAGS = ["enable_experimental_features", "enable_items_to_include"]
+
+# Flags set by _scoped_feature_flags and how many running publishes use them.
+_scoped_flag_users: Dict[str, int] = {}
+_scoped_flag_lock = threading.Lock()
+
+
+def list_workspace_item_records(workspace_id: str) -> List[Dict]:
+    """List the raw item records of a workspace via the Fabric items API.
+
+    Args:
+        workspace_id: Target workspace GUID
+
+    Returns:
+        Item dictionaries as returned by the API (``id``, ``displayName``,
+        ``type``, ``folderId``, ...)
+    """
+    records: List[Dict] = []
+    from fabric_cicd.constants import DEFAULT_API_ROOT_URL
+
+    client = get_http_client()
+    next_url = f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items"
+
+    while next_url:
+        body = client.get_json(next_url, scope=FABRIC_API_SCOPE)
+        if not isinstance(body, dict):
+            break
+
+        records.extend(item for item in body.get("value", []) or [] if isinstance(item, dict))
+
+        continuation_uri = body.get("continuationUri")
+        continuation_token = body.get("continuationToken")
+
+        if continuation_uri:
+            next_url = continuation_uri
+        elif continuation_token:
+            next_url = (
+                f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items"
+                f"?continuationToken={continuation_token}"
+            )
+        else:
+            next_url = None
+
+    return records
+
+
+def list_workspace_items(workspace_id: str) -> List[str]:
+    """List item names in a workspace via the Fabric items API.
+
+    Only needs the workspace ID, so it can run before the repository is
+    cloned or a ``FabricWorkspace`` is constructed.
+
+    Args:
+        workspace_id: Target workspace GUID
+
+    Returns:
+        List of items in format "ItemName.ItemType"
+    """
+    existing_items = [
+        f"{item['displayName']}.{item.get('type')}"
+        for item in list_workspace_item_records(workspace_id)
+        if item.get("displayName")
+    ]
+    logger.debug(f"Found {len(existing_items)} existing items in workspace {workspace_id}")
+    return existing_items
+
+
+def get_item_definition(workspace_id: str, item_id: str, timeout: float = _DEFINITION_TIMEOUT_SECONDS) -> Optional[Dict]:
+    """Fetch an item's definition, following the long-running operation if needed.
+
+    Args:
+        workspace_id: Workspace GUID
+        item_id: Item GUID
+        timeout: Maximum seconds to wait for the operation
+
+    Returns:
+        The ``definition`` dictionary (with ``parts``), or None when the item
+        type has no definition API or the item no longer exists
+
+    Raises:
+        RuntimeError: If the request or operation fails otherwise
+    """
+    from fabric_cicd.constants import DEFAULT_API_ROOT_URL
+
+    client = get_http_client()
+    url = f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace_id}/items/{item_id}/getDefinition"
+    resp = client.post(url, scope=FABRIC_API_SCOPE)
+    if resp.status_code in (400, 403, 404):
+        # Unsupported item types answer 400 (e.g. OperationNotSupportedForItem)
+        logger.debug("No definition for item %s: %s", item_id, resp.status_code)
+        return None
+    if resp.status_code == 200:
+        return (resp.json() or {}).get("definition")
+    if resp.status_code != 202:
+        raise RuntimeError(f"getDefinition failed for item {item_id}: {resp.status_code} {resp.text}")
+
+    location = resp.headers.get("Location")
+    if not location:
+        raise RuntimeError(f"getDefinition for item {item_id} returned 202 without a Location header")
+    delay = parse_retry_after(resp.headers.get("Retry-After")) or 1.0
+    deadline = time.monotonic() + timeout
+    while True:
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        state = client.get(location, scope=FABRIC_API_SCOPE)
+        body = state.json() if state.status_code == 200 else {}
+        status = (body or {}).get("status")
+        if status == "Succeeded":
+            result = client.get_json(f"{location.rstrip('/')}/result", scope=FABRIC_API_SCOPE)
+            return (result or {}).get("definition")
+        if status in ("Failed", "Undefined"):
+            raise RuntimeError(f"getDefinition failed for item {item_id}: {body.get('error')}")
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"getDefinition for item {item_id} timed out after {timeout:.0f}s")
+        delay = parse_retry_after(state.headers.get("Retry-After")) or delay
+
+
+def definition_hash(definition: Optional[Dict]) -> Optional[str]:
+    """Return a stable content hash of an item definition.
+
+    Parts are hashed in path order from their decoded payloads. The
+    ``.platform`` part is skipped: it carries metadata (display name, logical
+    id) rather than content, and renames are detected from the inventory.
+
+    Returns:
+        Hex SHA-256 digest, or None for a missing definition
+    """
+    if definition is None:
+        return None
+    digest = hashlib.sha256()
+    for part in sorted(definition.get("parts", []) or [], key=lambda p: p.get("path", "")):
+        path = part.get("path", "")
+        if path.rsplit("/", 1)[-1] == ".platform":
+            continue
+        payload = part.get("payload", "") or ""
+        data = base64.b64decode(payload) if part.get("payloadType", "InlineBase64") == "InlineBase64" else payload.encode("utf-8")
+        digest.update(path.encode("utf-8") + b"\0" + hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def _report_publishes(workspace: FabricWorkspace, total: int) -> None:
+    """Count each item fabric_cicd publishes as work of the current install phase.
+
+    fabric_cicd has no progress hook, so the workspace's per-item publish
+    method is wrapped. The install is captured here rather than read from the
+    context, so items published on fabric_cicd's own threads still count.
+    """
+    install_events, phase = events.current_events(), events.current_phase()
+    publish = getattr(workspace, "_publish_item", None)
+    if install_events is None or phase is None or publish is None:
+        return
+    publish = getattr(publish, "__wrapped__", publish)
+
+    def _publish_item(*args, **kwargs):
+        result = publish(*args, **kwargs)
+        install_events.work_done(phase, 1)
+        return result
+
+    _publish_item.__wrapped__ = publish  # type: ignore[attr-defined]
+    install_events.work_total(phase, total, "items")
+    workspace._publish_item = _publish_item  # type: ignore[method-assign]
+
+
+@contextmanager
+def _scoped_feature_flags(flags: List[str]) -> Iterator[None]:
+    """Enable fabric_cicd feature flags for the duration of the block.
+
+    fabric_cicd keeps its flags in one process-wide set. Flags set here are
+    counted per concurrent user and removed when the last block using them
+    exits; flags that were already set stay set.
+    """
+    from fabric_cicd import constants
+
+    scoped = []
+    with _scoped_flag_lock:
+        for flag in flags:
+            if flag in _scoped_flag_users:
+                _scoped_flag_users[flag] += 1
+            elif flag not in constants.FEATURE_FLAG:
+                constants.FEATURE_FLAG.add(flag)
+                _scoped_flag_users[flag] = 1
+            else:
+                continue
+            scoped.append(flag)
+    try:
+        yield
+    finally:
+        with _scoped_flag_lock:
+            for flag in scoped:
+                _scoped_flag_users[flag] -= 1
+                if not _scoped_flag_users[flag]:
+                    del _scoped_flag_users[flag]
+                    constants.FEATURE_FLAG.discard(flag)
+
+
+class _ScheduledRequests:
+    """Stands in for the ``requests`` module fabric_cicd's API endpoint calls.
+
+    Every call fabric_cicd makes (publishes, operation polls, folder and
+    item listings) is admitted through the shared request scheduler, so
+    publishes from concurrent installs interleave under one adaptive limit
+    and their 429s lower it.
+    """
+
+    def request(self, method: str, url: str, **kwargs):
+        with get_scheduler().slot(classify_url(url), PRIORITY_PUBLISH) as slot:
+            response = requests.request(method, url, **kwargs)
+            slot.record(response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+        return response
+
+
+def _schedule_requests(workspace: FabricWorkspace) -> FabricWorkspace:
+    """Route ``workspace``'s fabric_cicd API calls through the request scheduler."""
+    endpoint = getattr(workspace, "endpoint", None)
+    if endpoint is not None:
+        endpoint.requests = _ScheduledRequests()
+    return workspace
+
 
 class WorkspaceManager:
     """Manages interactions with Fabric workspaces.
@@ -42,13 +271,12 @@ class WorkspaceManager:
             Initialized FabricWorkspace instance
         """
         if self._fabric_workspace is None:
-            credential = resolve_token_credential()
-            self._fabric_workspace = FabricWorkspace(
+            self._fabric_workspace = _schedule_requests(FabricWorkspace(
                 workspace_id=self.workspace_id,
                 repository_directory=str(self.repository_directory),
                 item_type_in_scope=self.items_in_scope,
-                token_credential=credential,
-            )
+                token_credential=get_token_manager(),
+            ))
         return self._fabric_workspace
     
     def get_existing_items(self) -> List[str]:
@@ -60,40 +288,7 @@ class WorkspaceManager:
         Example:
             ['MyNotebook.Notebook', 'MyLakehouse.Lakehouse']
         """
-        existing_items: List[str] = []
-        from fabric_cicd.constants import DEFAULT_API_ROOT_URL
-        
-        workspace = self.get_fabric_workspace()
-        next_url = f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace.workspace_id}/items"
-        
-        while next_url:
-            response = workspace.endpoint.invoke(method="GET", url=next_url)
-            if not isinstance(response, dict):
-                break
-            
-            body = response.get("body", {})
-            for item in body.get("value", []) or []:
-                name = item.get("displayName")
-                if name:
-                    item_type = item.get("type")
-                    item_str = f"{name}.{item_type}"
-                    existing_items.append(item_str)
-            
-            continuation_uri = body.get("continuationUri")
-            continuation_token = body.get("continuationToken")
-            
-            if continuation_uri:
-                next_url = continuation_uri
-            elif continuation_token:
-                next_url = (
-                    f"{DEFAULT_API_ROOT_URL}/v1/workspaces/{workspace.workspace_id}/items"
-                    f"?continuationToken={continuation_token}"
-                )
-            else:
-                next_url = None
-        
-        logger.debug(f"Found {len(existing_items)} existing items in workspace {self.workspace_id}")
-        return existing_items
+        return list_workspace_items(self.workspace_id)
     
     def collect_planned_items(self) -> List[str]:
         """Recursively collect planned items from workspace path.
@@ -169,11 +364,21 @@ class WorkspaceManager:
             logger.info(f"Detected {len(conflicts)} conflicts: {conflicts}")
         return conflicts
     
-    def deploy_items(self, feature_flags: Optional[List[str]] = None) -> FabricWorkspace:
+    def deploy_items(
+        self,
+        feature_flags: Optional[List[str]] = None,
+        exclude_item_names: Optional[List[str]] = None,
+        items_to_include: Optional[List[str]] = None,
+    ) -> FabricWorkspace:
         """Deploy all items to the workspace.
         
         Args:
             feature_flags: Optional list of feature flags to enable
+            exclude_item_names: Item names to skip (e.g. a lakehouse that was
+                already published by :meth:`deploy_single_item`)
+            items_to_include: Only publish these "ItemName.ItemType" entries
+                (enables fabric_cicd's experimental selective publish for
+                this call only)
             
         Returns:
             The FabricWorkspace instance after deployment
@@ -186,8 +391,54 @@ class WorkspaceManager:
                 append_feature_flag(flag)
         
         workspace = self.get_fabric_workspace()
+        exclude_regex = None
+        if exclude_item_names:
+            exclude_regex = "^(" + "|".join(re.escape(n) for n in exclude_item_names) + ")$"
         logger.info(f"Deploying items from {self.workspace_path} to workspace '{self.workspace_id}'")
-        publish_all_items(workspace)
+        planned = [
+            item for item in self.collect_planned_items()
+            if not (exclude_regex and re.match(exclude_regex, item.partition('.')[0]))
+            and (items_to_include is None or item in items_to_include)
+        ]
+        _report_publishes(workspace, len(planned))
+        with _scoped_feature_flags(_SELECTIVE_PUBLISH_FLAGS if items_to_include is not None else []):
+            publish_all_items(workspace, item_name_exclude_regex=exclude_regex, items_to_include=items_to_include)
         logger.info("Successfully deployed all items")
         
         return workspace
+
+    def deploy_single_item(
+        self,
+        item_name: str,
+        item_type: str,
+        feature_flags: Optional[List[str]] = None,
+    ) -> FabricWorkspace:
+        """Publish one item ahead of the rest of the workspace.
+
+        Uses a separate FabricWorkspace scoped to the item's type, with every
+        other name excluded, so the item exists (and has an ID) before the
+        full publish starts.
+
+        Args:
+            item_name: Item display name (already prefixed)
+            item_type: Fabric item type (e.g. "Lakehouse")
+            feature_flags: Optional list of feature flags to enable
+
+        Returns:
+            The FabricWorkspace used for the publish (its deployed items
+            include the new item)
+        """
+        if feature_flags:
+            for flag in feature_flags:
+                append_feature_flag(flag)
+
+        workspace = _schedule_requests(FabricWorkspace(
+            workspace_id=self.workspace_id,
+            repository_directory=str(self.repository_directory),
+            item_type_in_scope=[item_type],
+            token_credential=get_token_manager(),
+        ))
+        logger.info(f"Publishing {item_type} '{item_name}' ahead of remaining items")
+        _report_publishes(workspace, 1)
+        publish_all_items(workspace, item_name_exclude_regex=f"^(?!{re.escape(item_name)}$)")
+        return workspace
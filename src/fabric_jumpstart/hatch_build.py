@@ -1,10 +1,36 @@
 """Hatch build hook to include shared assets from the repository root."""
 
+import importlib
+import importlib.util
+import sys
+import tempfile
+import types
 from pathlib import Path
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
 
+def _import_package_module(package_dir: Path, module_name: str):
+    """Import ``fabric_jumpstart.<module_name>`` without running the package ``__init__``.
+
+    The package ``__init__`` pulls in runtime dependencies (fabric-cicd, IPython)
+    that are not available in the isolated build environment, so a bare
+    package shell pointing at the source directory is registered instead.
+    """
+    saved = {name: mod for name, mod in sys.modules.items() if name == "fabric_jumpstart" or name.startswith("fabric_jumpstart.")}
+    for name in saved:
+        del sys.modules[name]
+    shell = types.ModuleType("fabric_jumpstart")
+    shell.__path__ = [str(package_dir)]
+    sys.modules["fabric_jumpstart"] = shell
+    try:
+        return importlib.import_module(f"fabric_jumpstart.{module_name}")
+    finally:
+        for name in [n for n in sys.modules if n == "fabric_jumpstart" or n.startswith("fabric_jumpstart.")]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
 class CustomBuildHook(BuildHookInterface):
     def initialize(self, version, build_data):
         # When building from the repo, pull shared assets from the repository-level
@@ -16,6 +42,42 @@ class CustomBuildHook(BuildHookInterface):
         if workload_dir.is_dir():
             build_data["force_include"][str(workload_dir)] = "fabric_jumpstart/ui/assets/workload"
 
+        # Wheels ship the diagrams minified in one archive (see _compile_ui_assets).
         diagrams_dir = repo_assets / "diagrams"
-        if diagrams_dir.is_dir():
+        if diagrams_dir.is_dir() and self.target_name != "wheel":
             build_data["force_include"][str(diagrams_dir)] = "fabric_jumpstart/ui/assets/diagrams"
+
+        if self.target_name == "wheel":
+            self._compile_registry(build_data)
+            self._compile_ui_assets(build_data, workload_dir, diagrams_dir)
+
+    def _compile_registry(self, build_data):
+        """Pre-parse the YAML registry and its search index into the compiled artifacts."""
+        package_dir = Path(self.root) / "fabric_jumpstart"
+        registry = _import_package_module(package_dir, "registry")
+
+        out_dir = Path(tempfile.mkdtemp(prefix="fabric-jumpstart-build-"))
+        for out_file in registry.JumpstartRegistry(package_dir / "jumpstarts").write_compiled(out_dir):
+            build_data["force_include"][str(out_file)] = f"fabric_jumpstart/jumpstarts/{out_file.name}"
+
+    def _compile_ui_assets(self, build_data, workload_dir: Path, diagrams_dir: Path):
+        """Generate the UI static bundle module and the minified diagram archive."""
+        ui_dir = Path(self.root) / "fabric_jumpstart" / "ui"
+        spec = importlib.util.spec_from_file_location("_fabric_jumpstart_ui_static", ui_dir / "static.py")
+        static = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(static)
+
+        # From an sdist the shared assets are already inside the package tree.
+        if not workload_dir.is_dir():
+            workload_dir = ui_dir / "assets" / "workload"
+        if not diagrams_dir.is_dir():
+            diagrams_dir = ui_dir / "assets" / "diagrams"
+        bundle = static.build_bundle(ui_dir=ui_dir, workload_dir=workload_dir, diagrams_dir=diagrams_dir)
+        out_dir = Path(tempfile.mkdtemp(prefix="fabric-jumpstart-build-"))
+        out_file = out_dir / static.BUNDLE_MODULE_FILENAME
+        out_file.write_text(static.render_bundle_module(bundle), encoding="utf-8")
+        build_data["force_include"][str(out_file)] = f"fabric_jumpstart/ui/{static.BUNDLE_MODULE_FILENAME}"
+
+        archive = out_dir / static.DIAGRAM_ARCHIVE_FILENAME
+        static.build_diagram_archive(diagrams_dir, archive)
+        build_data["force_include"][str(archive)] = f"fabric_jumpstart/ui/assets/{static.DIAGRAM_ARCHIVE_FILENAME}"
@@ -0,0 +1,34 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from fabric_jumpstart.arena import SCRATCH_DIR_ENV_VAR, reset_arena
+from fabric_jumpstart.auth import reset_token_manager
+from fabric_jumpstart.history import reset_history_store
+from fabric_jumpstart.manifest import reset_manifest_store
+from fabric_jumpstart.prewarm import reset_prewarmer
+from fabric_jumpstart.scheduler import reset_scheduler
+from fabric_jumpstart.utils import CACHE_DIR_ENV_VAR
+from fabric_jumpstart.validation import reset_validation_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_state(tmp_path, monkeypatch):
+    """Isolate tests from process-wide caches, the scheduler, scratch arena and local state."""
+    monkeypatch.setenv(SCRATCH_DIR_ENV_VAR, str(tmp_path / "scratch"))
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+    reset_token_manager()
+    reset_scheduler()
+    reset_prewarmer()
+    reset_arena()
+    reset_manifest_store()
+    reset_history_store()
+    reset_validation_cache()
+    yield
+    reset_token_manager()
+    reset_scheduler()
+    reset_prewarmer()
+    reset_arena()
+    reset_manifest_store()
+    reset_history_store()
+    reset_validation_cache()
@@ -4,7 +4,7 @@ import re
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt, field_validator, model_validator
 
 from fabric_jumpstart.constants import (
     ITEM_URL_ROUTING_PATH_MAP,
@@ -17,6 +17,8 @@ from fabric_jumpstart.constants import (
 
 class JumpstartSource(BaseModel):
     """Source configuration for a jumpstart."""
+    model_config = ConfigDict(extra="forbid")
+
     workspace_path: str
     repo_url: Optional[str] = None
     repo_ref: Optional[str] = None
@@ -46,16 +48,16 @@ class Jumpstart(BaseModel):
     """Schema for a jumpstart entry."""
     model_config = ConfigDict(extra="forbid")
 
-    id: int
+    id: StrictInt
     logical_id: str
     name: str
     description: str
     date_added: str
-    include_in_listing: Optional[bool] = True # excluded from listing if False or not set
+    include_in_listing: Optional[StrictBool] = True # excluded from listing if False or not set
     workload_tags: List[str]
     scenario_tags: List[str]
     type: Optional[str] = "Accelerator"
-    core: bool = False
+    core: StrictBool = False
     source: JumpstartSource
     items_in_scope: Optional[List[str]] = None
     feature_flags: Optional[List[str]] = None
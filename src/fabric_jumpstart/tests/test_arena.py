@@ -0,0 +1,182 @@
+"""Tests for the managed scratch arena."""
+
+import os
+import threading
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+from fabric_jumpstart.arena import WorkspaceArena, _tree_size
+from fabric_jumpstart.phases import PhaseGraph
+
+
+def _fill(path, size):
+    (path / "blob.bin").write_bytes(b"\0" * size)
+
+
+class TestLease:
+    """Tests for per-install lifetimes."""
+
+    def test_directories_removed_on_success(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+        with arena.lease("demo"):
+            first = arena.allocate("a-")
+            second = arena.allocate("b-")
+            assert first.is_dir() and second.is_dir()
+
+        assert not first.exists()
+        assert not second.exists()
+        assert arena.stats()["removed"] == 2
+
+    def test_directories_removed_on_failure_by_default(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+        with pytest.raises(RuntimeError):
+            with arena.lease("demo"):
+                path = arena.allocate()
+                raise RuntimeError("boom")
+
+        assert not path.exists()
+
+    def test_keep_on_failure_leaves_directories(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+        with pytest.raises(RuntimeError):
+            with arena.lease("demo", keep_on_failure=True):
+                path = arena.allocate()
+                raise RuntimeError("boom")
+
+        assert path.is_dir()
+        stats = arena.stats()
+        assert stats["kept"] == 1
+        assert stats["in_use"] == 0
+
+    def test_phase_threads_allocate_into_the_callers_lease(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+        with arena.lease("demo") as lease:
+            graph = PhaseGraph()
+            graph.add("clone", lambda: arena.allocate("clone-"))
+            path = graph.run()["clone"]
+            assert lease.paths == [path]
+
+        assert not path.exists()
+
+    def test_adopt_transfers_ownership(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+        background = arena.open_lease("prewarm")
+        with background.activate():
+            staged = arena.allocate()
+
+        with arena.lease("install"):
+            arena.adopt(staged)
+            background.release()
+            assert staged.is_dir()
+
+        assert not staged.exists()
+
+
+class TestQuota:
+    """Tests for oldest-first eviction."""
+
+    def test_evicts_oldest_unowned_directories_first(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=2500)
+        kept = []
+        for i in range(3):
+            lease = arena.open_lease(f"failed-{i}")
+            with lease.activate():
+                path = arena.allocate(f"old{i}-")
+            _fill(path, 1000)
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+            lease.release(keep=True)
+            kept.append(path)
+
+        with arena.lease("current"):
+            current = arena.allocate("new-")
+            _fill(current, 1000)
+            arena.enforce_quota()
+            assert current.is_dir()
+
+        assert not kept[0].exists()
+        assert not kept[1].exists()
+        assert kept[2].is_dir()
+        stats = arena.stats()
+        assert stats["evicted"] == 2
+        assert stats["evicted_bytes"] == 2000
+
+    def test_arena_is_walked_only_when_the_running_total_exceeds_the_quota(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=2500)
+        with patch("fabric_jumpstart.arena._tree_size", wraps=_tree_size) as walk:
+            for i in range(2):
+                with pytest.raises(RuntimeError):
+                    with arena.lease(f"failed-{i}", keep_on_failure=True):
+                        _fill(arena.allocate(), 1000)
+                        raise RuntimeError("boom")
+            walks = walk.call_count
+            with arena.lease("install"):
+                for _ in range(5):
+                    arena.allocate()
+            assert walk.call_count == walks
+
+            with pytest.raises(RuntimeError):
+                with arena.lease("failed-2", keep_on_failure=True):
+                    _fill(arena.allocate(), 1000)
+                    raise RuntimeError("boom")
+            assert walk.call_count > walks + 1
+
+        assert arena.stats()["evicted"] == 1
+        assert arena._held == arena.stats()["bytes_held"] == 2000
+
+    def test_never_evicts_directories_in_use(self, tmp_path):
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=10)
+        with arena.lease("current"):
+            path = arena.allocate()
+            _fill(path, 1000)
+            assert arena.enforce_quota() == 0
+            assert path.is_dir()
+
+    def test_recent_foreign_directories_are_left_alone(self, tmp_path):
+        foreign = tmp_path / "other-process"
+        foreign.mkdir()
+        _fill(foreign, 1000)
+        arena = WorkspaceArena(root=tmp_path, quota_bytes=10)
+
+        assert arena.enforce_quota() == 0
+        assert foreign.is_dir()
+
+        stale = time.time() - 7 * 3600
+        os.utime(foreign, (stale, stale))
+        assert arena.enforce_quota() == 1000
+        assert not foreign.exists()
+
+
+def test_stats_report_bytes_held(tmp_path):
+    arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+    with arena.lease("demo"):
+        _fill(arena.allocate(), 1234)
+        stats = arena.stats()
+        assert stats["bytes_held"] == 1234
+        assert stats["directories"] == 1
+        assert stats["in_use"] == 1
+    assert arena.stats()["bytes_held"] == 0
+
+
+def test_concurrent_leases_are_isolated(tmp_path):
+    arena = WorkspaceArena(root=tmp_path, quota_bytes=0)
+    owned = {}
+
+    def _install(name):
+        with arena.lease(name) as lease:
+            arena.allocate(f"{name}-")
+            arena.allocate(f"{name}-")
+            owned[name] = list(lease.paths)
+
+    threads = [threading.Thread(target=_install, args=(f"js{i}",)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name, paths in owned.items():
+        assert len(paths) == 2
+        assert all(p.name.startswith(f"{name}-") for p in paths)
+    assert arena.stats()["directories"] == 0
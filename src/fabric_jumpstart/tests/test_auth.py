@@ -0,0 +1,102 @@
+"""Tests for the process-wide token manager."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from fabric_jumpstart.auth import TokenManager, get_token_manager, reset_token_manager
+
+
+def _token(value, ttl):
+    return MagicMock(token=value, expires_on=time.time() + ttl)
+
+
+class TestTokenManager:
+    """Tests for TokenManager caching and refresh."""
+
+    def test_cached_token_is_reused(self):
+        cred = MagicMock()
+        cred.get_token.return_value = _token("a", 3600)
+        manager = TokenManager(cred)
+
+        assert manager.get_token("scope").token == "a"
+        assert manager.get_token("scope").token == "a"
+
+        cred.get_token.assert_called_once_with("scope")
+        stats = manager.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_scopes_are_cached_separately(self):
+        cred = MagicMock()
+        cred.get_token.side_effect = lambda *scopes, **kw: _token(scopes[0], 3600)
+        manager = TokenManager(cred)
+
+        assert manager.get_token("fabric").token == "fabric"
+        assert manager.get_token("storage").token == "storage"
+        assert manager.stats()["cached_scopes"] == 2
+
+    def test_token_near_expiry_is_reacquired(self):
+        cred = MagicMock()
+        cred.get_token.side_effect = [_token("old", 30), _token("new", 3600)]
+        manager = TokenManager(cred, expiry_margin=120)
+
+        assert manager.get_token("scope").token == "old"
+        assert manager.get_token("scope").token == "new"
+        assert manager.stats()["misses"] == 2
+
+    def test_refresh_ahead_serves_cached_and_refreshes_in_background(self):
+        cred = MagicMock()
+        refreshed = threading.Event()
+
+        def _get_token(*scopes, **kwargs):
+            if cred.get_token.call_count == 1:
+                return _token("old", 300)
+            refreshed.set()
+            return _token("new", 3600)
+
+        cred.get_token.side_effect = _get_token
+        manager = TokenManager(cred, expiry_margin=120, refresh_ahead=600)
+
+        manager.get_token("scope")
+        assert manager.get_token("scope").token == "old"
+        assert refreshed.wait(2)
+        deadline = time.time() + 2
+        while manager.stats()["background_refreshes"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert manager.get_token("scope").token == "new"
+
+    def test_concurrent_misses_acquire_once(self):
+        cred = MagicMock()
+
+        def _slow(*scopes, **kwargs):
+            time.sleep(0.05)
+            return _token("a", 3600)
+
+        cred.get_token.side_effect = _slow
+        manager = TokenManager(cred)
+        threads = [threading.Thread(target=manager.get_token, args=("scope",)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cred.get_token.call_count == 1
+
+    def test_failures_are_counted_and_raised(self):
+        cred = MagicMock()
+        cred.get_token.side_effect = RuntimeError("boom")
+        manager = TokenManager(cred)
+
+        with pytest.raises(RuntimeError):
+            manager.get_token("scope")
+        assert manager.stats()["failures"] == 1
+
+
+def test_get_token_manager_is_a_singleton_until_reset():
+    manager = get_token_manager()
+    assert get_token_manager() is manager
+    reset_token_manager()
+    assert get_token_manager() is not manager
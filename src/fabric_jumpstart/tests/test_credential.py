@@ -162,21 +162,44 @@ class TestGenerateFabricCredential:
 
 
 class TestWorkspaceManagerCredentialPassthrough:
-    """Ensure WorkspaceManager passes resolved credential to FabricWorkspace."""
+    """Ensure WorkspaceManager passes the shared token manager to FabricWorkspace."""
 
-    @patch("fabric_jumpstart.workspace_manager.resolve_token_credential")
     @patch("fabric_jumpstart.workspace_manager.FabricWorkspace")
-    def test_credential_passed_to_fabric_workspace(self, mock_fw, mock_resolve):
-        """Resolved credential is forwarded to FabricWorkspace."""
+    def test_token_manager_passed_to_fabric_workspace(self, mock_fw):
+        """The process-wide token manager is forwarded to FabricWorkspace."""
+        from fabric_jumpstart.auth import get_token_manager
         from fabric_jumpstart.workspace_manager import WorkspaceManager
         from pathlib import Path
 
-        fake_cred = MagicMock()
-        mock_resolve.return_value = fake_cred
-
         wm = WorkspaceManager("ws-id", Path("/tmp"), ["Notebook"])
         wm.get_fabric_workspace()
 
         mock_fw.assert_called_once()
         call_kwargs = mock_fw.call_args[1]
-        assert call_kwargs["token_credential"] is fake_cred
+        assert call_kwargs["token_credential"] is get_token_manager()
+
+    @patch("fabric_jumpstart.utils.resolve_token_credential")
+    def test_token_manager_delegates_to_resolved_credential(self, mock_resolve):
+        """Tokens are acquired from the credential resolved by resolve_token_credential."""
+        from fabric_jumpstart.auth import get_token_manager
+
+        fake_cred = MagicMock()
+        fake_cred.get_token.return_value = MagicMock(token="tok", expires_on=time.time() + 3600)
+        mock_resolve.return_value = fake_cred
+
+        assert get_token_manager().get_token("scope").token == "tok"
+        assert get_token_manager().credential is fake_cred
+        fake_cred.get_token.assert_called_once_with("scope")
+
+
+class TestFabricCredentialAudience:
+    """FabricTokenCredential maps scopes to notebookutils audiences."""
+
+    def test_storage_scope_uses_storage_audience(self):
+        mock_notebookutils = MagicMock()
+        mock_notebookutils.credentials.getToken.return_value = _make_mock_jwt()
+
+        with patch.dict("sys.modules", {"notebookutils": mock_notebookutils}):
+            _generate_fabric_credential().get_token("https://storage.azure.com/.default")
+
+        mock_notebookutils.credentials.getToken.assert_called_once_with("storage")
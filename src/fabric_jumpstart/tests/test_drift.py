@@ -0,0 +1,168 @@
+"""Tests for drift detection against install manifests."""
+
+import base64
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fabric_jumpstart.core import jumpstart
+from fabric_jumpstart.drift import check_drift, format_status_report
+from fabric_jumpstart.manifest import get_manifest_store, new_manifest
+from fabric_jumpstart.workspace_manager import definition_hash, get_item_definition
+
+
+def _definition(content, platform="{}"):
+    return {
+        "parts": [
+            {"path": "notebook-content.py", "payload": base64.b64encode(content.encode()).decode(), "payloadType": "InlineBase64"},
+            {"path": ".platform", "payload": base64.b64encode(platform.encode()).decode(), "payloadType": "InlineBase64"},
+        ]
+    }
+
+
+def _manifest():
+    manifest = new_manifest("demo", "ws-1", repo_ref="v1")
+    manifest["items"] = [
+        {"type": "Notebook", "name": "Same", "id": "nb-1", "hash": definition_hash(_definition("a")), "preexisting": False},
+        {"type": "Notebook", "name": "Edited", "id": "nb-2", "hash": definition_hash(_definition("b")), "preexisting": False},
+        {"type": "Notebook", "name": "Deleted", "id": "nb-3", "hash": "x", "preexisting": False},
+        {"type": "Lakehouse", "name": "Bronze", "id": "lh-1", "preexisting": False},
+    ]
+    return manifest
+
+
+_LIVE = [
+    {"id": "nb-1", "displayName": "Same", "type": "Notebook", "folderId": "f-1"},
+    {"id": "nb-2", "displayName": "Edited (copy)", "type": "Notebook", "folderId": "f-1"},
+    {"id": "lh-1", "displayName": "Bronze", "type": "Lakehouse", "folderId": "f-1"},
+    {"id": "nb-9", "displayName": "Scratch", "type": "Notebook", "folderId": "f-1"},
+    {"id": "nb-10", "displayName": "Unrelated", "type": "Notebook"},
+]
+
+_DEFINITIONS = {"nb-1": _definition("a", platform='{"displayName": "renamed"}'), "nb-2": _definition("b2")}
+
+
+class TestDefinitionHash:
+    """Tests for definition hashing."""
+
+    def test_ignores_platform_metadata_and_part_order(self):
+        definition = _definition("a")
+        reordered = {"parts": list(reversed(definition["parts"]))}
+        assert definition_hash(definition) == definition_hash(reordered)
+        assert definition_hash(definition) == definition_hash(_definition("a", platform='{"x": 1}'))
+        assert definition_hash(definition) != definition_hash(_definition("b"))
+
+    def test_missing_definition(self):
+        assert definition_hash(None) is None
+
+
+class TestGetItemDefinition:
+    """Tests for the long-running getDefinition flow."""
+
+    @patch("fabric_jumpstart.workspace_manager.time.sleep")
+    @patch("fabric_jumpstart.workspace_manager.get_http_client")
+    def test_polls_operation_until_result(self, mock_get_client, mock_sleep):
+        client = mock_get_client.return_value
+        accepted = MagicMock(status_code=202, headers={"Location": "https://api/operations/op-1", "Retry-After": "2"})
+        client.post.return_value = accepted
+        running = MagicMock(status_code=200, headers={})
+        running.json.return_value = {"status": "Running"}
+        done = MagicMock(status_code=200, headers={})
+        done.json.return_value = {"status": "Succeeded"}
+        client.get.side_effect = [running, done]
+        client.get_json.return_value = {"definition": _definition("a")}
+
+        assert get_item_definition("ws-1", "nb-1") == _definition("a")
+        client.get_json.assert_called_once()
+        assert client.get_json.call_args.args[0] == "https://api/operations/op-1/result"
+        assert mock_sleep.call_args_list[0].args[0] == 2.0
+
+    @patch("fabric_jumpstart.workspace_manager.get_http_client")
+    def test_unsupported_item_type_returns_none(self, mock_get_client):
+        mock_get_client.return_value.post.return_value = MagicMock(status_code=400)
+        assert get_item_definition("ws-1", "wh-1") is None
+
+
+@patch("fabric_jumpstart.drift.get_item_definition", side_effect=lambda ws, item_id: _DEFINITIONS[item_id])
+@patch("fabric_jumpstart.drift.list_workspace_item_records", return_value=_LIVE)
+class TestCheckDrift:
+    """Tests for check_drift classification."""
+
+    def test_classifies_items(self, mock_list, mock_definition):
+        report = check_drift(_manifest())
+
+        assert report["unchanged"] == ["Same.Notebook"]
+        assert report["modified"] == ["Edited.Notebook"]
+        assert report["missing"] == ["Deleted.Notebook"]
+        assert report["unchecked"] == ["Bronze.Lakehouse"]
+        assert report["extra"] == ["Scratch.Notebook"]
+        assert report["renamed"] == {"Edited.Notebook": "Edited (copy).Notebook"}
+        assert report["redeploy"] == ["Deleted.Notebook", "Edited.Notebook"]
+        mock_list.assert_called_once_with("ws-1")
+        # Only recorded, present items with a stored hash are fetched
+        assert sorted(c.args[1] for c in mock_definition.call_args_list) == ["nb-1", "nb-2"]
+        assert "modified  1: Edited.Notebook" in format_status_report(report)
+
+    def test_inventory_only(self, mock_list, mock_definition):
+        report = check_drift(_manifest(), check_content=False)
+
+        mock_definition.assert_not_called()
+        assert report["missing"] == ["Deleted.Notebook"]
+        assert report["unchecked"] == ["Bronze.Lakehouse", "Edited.Notebook", "Same.Notebook"]
+
+
+class TestStatusApi:
+    """Tests for jumpstart.status."""
+
+    def test_unknown_manifest_raises(self):
+        with pytest.raises(ValueError, match="No install manifest"):
+            jumpstart().status("demo", workspace_id="ws-1")
+
+    @patch("fabric_jumpstart.drift.list_workspace_item_records", return_value=[])
+    def test_reports_from_stored_manifest(self, mock_list):
+        get_manifest_store().save(_manifest())
+        report = jumpstart().status("demo", workspace_id="ws-1")
+        assert len(report["missing"]) == 4
+
+
+def test_partial_redeploy_only_publishes_listed_items():
+    from fabric_jumpstart.installer import JumpstartInstaller
+
+    installer = JumpstartInstaller(
+        {"id": 1, "logical_id": "demo", "source": {}}, workspace_id="ws-1", instance_name="js",
+        only_items=["Edited.Notebook"],
+    )
+    installer.workspace_manager = MagicMock()
+
+    installer.deploy()
+
+    _, kwargs = installer.workspace_manager.deploy_items.call_args
+    assert kwargs["items_to_include"] == ["Edited.Notebook"]
+
+
+def test_selective_publish_flags_are_scoped_to_the_publish():
+    from fabric_cicd import constants
+
+    from fabric_jumpstart.workspace_manager import WorkspaceManager
+
+    seen = []
+    manager = WorkspaceManager("ws-1", Path("unused"), ["Notebook"])
+    with patch.object(manager, "get_fabric_workspace"), \
+            patch.object(manager, "collect_planned_items", return_value=["Edited.Notebook"]), \
+            patch("fabric_jumpstart.workspace_manager.publish_all_items",
+                  side_effect=lambda *a, **kw: seen.append(set(constants.FEATURE_FLAG))):
+        manager.deploy_items(items_to_include=["Edited.Notebook"])
+        manager.deploy_items()
+
+    assert {"enable_experimental_features", "enable_items_to_include"} <= seen[0]
+    assert "enable_items_to_include" not in seen[1]
+    assert "enable_items_to_include" not in constants.FEATURE_FLAG
+
+    from fabric_jumpstart.workspace_manager import _scoped_feature_flags
+
+    with _scoped_feature_flags(["enable_items_to_include"]):
+        with _scoped_feature_flags(["enable_items_to_include"]):
+            pass
+        assert "enable_items_to_include" in constants.FEATURE_FLAG  # still used by the outer publish
+    assert "enable_items_to_include" not in constants.FEATURE_FLAG
@@ -0,0 +1,170 @@
+"""Tests for the JSON lines install event stream."""
+
+import io
+import json
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fabric_jumpstart import events
+from fabric_jumpstart.events import EventStream, install_events
+from fabric_jumpstart.installer import JumpstartInstaller
+from fabric_jumpstart.phases import PhaseGraph
+from fabric_jumpstart.utils import upload_files_to_lakehouse
+
+
+def _read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestEventStream:
+    """Tests for the background writer."""
+
+    def test_writes_json_lines_to_a_path_in_order(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        stream = EventStream(str(path))
+        for i in range(1000):
+            assert stream.emit({"event": "tick", "i": i})
+        assert stream.close()
+
+        assert [e["i"] for e in _read_lines(path)] == list(range(1000))
+        assert not stream.emit({"event": "late"}) and stream.dropped == 1
+
+    def test_file_descriptor_is_left_open(self, tmp_path):
+        path = tmp_path / "fd.jsonl"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            stream = EventStream(fd)
+            stream.emit({"event": "one"})
+            stream.close()
+            os.write(fd, b"")  # still open
+        finally:
+            os.close(fd)
+        assert _read_lines(path) == [{"event": "one"}]
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        release = threading.Event()
+        received = []
+
+        def slow_callback(event):
+            release.wait(5)
+            received.append(event)
+
+        stream = EventStream(slow_callback, maxsize=2)
+        results = [stream.emit({"i": i}) for i in range(10)]
+        release.set()
+        stream.close()
+
+        assert results.count(False) == stream.dropped > 0
+        assert [e["i"] for e in received] == [i for i, ok in enumerate(results) if ok]
+
+    def test_callback_errors_do_not_stop_the_writer(self):
+        received = []
+
+        def callback(event):
+            if event["i"] == 0:
+                raise ValueError("boom")
+            received.append(event["i"])
+
+        stream = EventStream(callback)
+        stream.emit({"i": 0})
+        stream.emit({"i": 1})
+        stream.close()
+        assert received == [1] and stream.errors == 1
+
+
+class TestInstallEvents:
+    """Tests for per-install events."""
+
+    def test_phases_report_progress_and_are_stamped(self):
+        received = []
+        stream = EventStream(received.append)
+        with install_events(stream, "install-1", "demo", workspace_id="ws") as emitter:
+            events.plan_phases(["a", "b", "c", "d"])
+            PhaseGraph().add("a", lambda: None).add("b", lambda: None, deps=["a"]).run()
+            emitter.finish("success", duration_seconds=1.0)
+        stream.close()
+
+        assert [e["seq"] for e in received] == list(range(1, len(received) + 1))
+        assert {(e["install_id"], e["jumpstart"]) for e in received} == {("install-1", "demo")}
+        assert [(e["event"], e.get("phase") or e.get("percent") or e.get("status")) for e in received] == [
+            ("install_start", None),
+            ("phase_start", "a"), ("phase_end", "a"), ("progress", 25),
+            ("phase_start", "b"), ("phase_end", "b"), ("progress", 50),
+            ("progress", 100), ("install_end", "success"),
+        ]
+        assert received[0]["workspace_id"] == "ws" and received[2]["ok"] is True
+
+    def test_owned_stream_is_closed_and_shared_stream_is_not(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        with install_events(path, "one", "demo"):
+            events.emit("custom", value=1)
+        assert [e["event"] for e in _read_lines(path)] == ["install_start", "custom"]
+
+        shared = EventStream(io.StringIO())
+        with install_events(shared, "two", "demo"):
+            pass
+        assert shared.emit({"event": "still open"})
+        shared.close()
+
+    def test_emit_without_an_install_is_a_no_op(self):
+        assert events.current_events() is None
+        events.emit("ignored")
+        events.plan_phases(["a"])
+        events.work_done(5)
+
+
+@patch("fabric_jumpstart.utils.get_http_client")
+def test_upload_reports_bytes(mock_get_client, tmp_path):
+    mock_client = mock_get_client.return_value
+    mock_client.put.return_value = SimpleNamespace(status_code=201, text="")
+    mock_client.patch.side_effect = lambda *a, params, **kw: SimpleNamespace(
+        status_code=202 if params["action"] == "append" else 200, text=""
+    )
+    (tmp_path / "a.csv").write_text("12345")
+    (tmp_path / "b.csv").write_text("123")
+
+    received = []
+    stream = EventStream(received.append)
+    with install_events(stream, "install-1", "demo"):
+        upload_files_to_lakehouse(MagicMock(), "lh-1", tmp_path)
+    stream.close()
+
+    start = next(e for e in received if e["event"] == "upload_start")
+    progress = [e for e in received if e["event"] == "upload_progress"]
+    assert (start["files_total"], start["bytes_total"]) == (2, 8)
+    assert sorted(e["bytes"] for e in progress) == [3, 5]
+    assert progress[-1]["files_done"] == 2 and progress[-1]["bytes_done"] == 8
+
+
+def test_deployment_reports_published_items(tmp_path):
+    installer = JumpstartInstaller(
+        {"id": 1, "logical_id": "demo", "source": {"workspace_path": "demo/"}},
+        workspace_id="ws-123",
+        instance_name="js",
+    )
+    installer.temp_workspace_path = tmp_path
+    ws = SimpleNamespace(repository_items={
+        "Notebook": {"Load": SimpleNamespace(guid="nb-1")},
+        "Lakehouse": {"Bronze": SimpleNamespace(guid="")},
+    })
+    wm = MagicMock()
+    wm.collect_planned_items.return_value = ["Load.Notebook"]
+    wm.deploy_items.return_value = ws
+    installer.workspace_manager = wm
+
+    received = []
+    stream = EventStream(received.append)
+    with install_events(stream, "install-1", "demo"), \
+            patch.object(installer, "apply_prefix_to_files"), \
+            patch.object(installer, "generate_entry_url", return_value=None), \
+            patch("fabric_jumpstart.drift.capture_item_hashes", return_value={}):
+        installer.run_deployment(None)
+    stream.close()
+
+    published = [e for e in received if e["event"] == "item_published"]
+    assert [(e["item_type"], e["item_name"], e["item_id"]) for e in published] == [("Notebook", "Load", "nb-1")]
+    assert {e["phase"] for e in received if e["event"] == "phase_end"} == {
+        "apply_prefix", "deploy", "upload_files", "entry_url", "record_hashes",
+    }
@@ -0,0 +1,113 @@
+"""Tests for streaming upload data from the git object store."""
+
+import shutil
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fabric_jumpstart.git_blobs import GitBlobReader, list_tree
+from fabric_jumpstart.utils import clone_repository, upload_git_tree_to_lakehouse
+
+pytestmark = pytest.mark.skipif(not shutil.which("git"), reason="git is not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.email=dev@example.com", "-c", "user.name=dev", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def origin(tmp_path):
+    repo = tmp_path / "origin"
+    (repo / "data" / "sub").mkdir(parents=True)
+    (repo / "demo" / "Load.Notebook").mkdir(parents=True)
+    (repo / "data" / "a.csv").write_bytes(b"a,b\n1,2\n")
+    (repo / "data" / "sub" / "big.bin").write_bytes(bytes(range(256)) * 4096)
+    (repo / "data" / "empty.txt").write_bytes(b"")
+    (repo / "demo" / "Load.Notebook" / "notebook-content.py").write_text("print('hi')")
+    _git(tmp_path, "init", "-q", str(repo))
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "init")
+    _git(repo, "branch", "-M", "main")
+    return repo
+
+
+def _mock_response(status_code):
+    resp = MagicMock()
+    resp.status_code = status_code
+    return resp
+
+
+class TestGitBlobReader:
+    """Tests for list_tree and GitBlobReader."""
+
+    def test_list_tree_paths_are_relative(self, origin):
+        entries = {e.path: e for e in list_tree(origin, "data/")}
+        assert set(entries) == {"a.csv", "empty.txt", "sub/big.bin"}
+        assert entries["sub/big.bin"].size == 256 * 4096
+
+    def test_list_tree_missing_path(self, origin):
+        with pytest.raises(FileNotFoundError):
+            list_tree(origin, "nope/")
+
+    def test_streams_blobs_in_sequence(self, origin):
+        entries = {e.path: e for e in list_tree(origin, "data")}
+        with GitBlobReader(origin) as reader:
+            big = reader.open(entries["sub/big.bin"].sha)
+            assert len(big) == 256 * 4096
+            assert big.read(10) == bytes(range(10))
+            # Opening the next blob drains the unread remainder of the first
+            assert reader.read_bytes(entries["a.csv"].sha) == b"a,b\n1,2\n"
+            assert reader.read_bytes(entries["empty.txt"].sha) == b""
+
+    def test_seek_to_start_rereads_blob(self, origin):
+        sha = {e.path: e for e in list_tree(origin, "data")}["a.csv"].sha
+        with GitBlobReader(origin) as reader:
+            stream = reader.open(sha)
+            assert stream.read() == b"a,b\n1,2\n"
+            stream.seek(0)
+            assert stream.tell() == 0
+            assert stream.read() == b"a,b\n1,2\n"
+
+    def test_missing_blob(self, origin):
+        with GitBlobReader(origin) as reader:
+            with pytest.raises(FileNotFoundError):
+                reader.open("0" * 40)
+
+
+def test_clone_excludes_paths_from_checkout(origin):
+    clone = clone_repository(str(origin), ref="main", exclude_paths=["data/"])
+    try:
+        assert (clone / "demo" / "Load.Notebook" / "notebook-content.py").exists()
+        assert not (clone / "data").exists()
+        assert {e.path for e in list_tree(clone, "data")} == {"a.csv", "empty.txt", "sub/big.bin"}
+    finally:
+        shutil.rmtree(clone, ignore_errors=True)
+
+
+@patch("fabric_jumpstart.utils.get_http_client")
+def test_upload_streams_blob_contents(mock_get_client, origin):
+    mock_client = mock_get_client.return_value
+    mock_client.get_json.return_value = {"properties": {"oneLakeFilesPath": "https://onelake/files"}}
+    mock_client.put.return_value = _mock_response(201)
+    appended = {}
+
+    def _patch(url, **kwargs):
+        if kwargs["params"]["action"] == "append":
+            appended[url] = kwargs["data"].read()
+            return _mock_response(202)
+        return _mock_response(200)
+
+    mock_client.patch.side_effect = _patch
+
+    count = upload_git_tree_to_lakehouse(MagicMock(), "lh-1", origin, "data", destination_path="raw")
+
+    assert count == 3
+    assert appended["https://onelake/files/raw/a.csv"] == b"a,b\n1,2\n"
+    assert appended["https://onelake/files/raw/sub/big.bin"] == bytes(range(256)) * 4096
+    flushes = [c.kwargs["params"]["position"] for c in mock_client.patch.call_args_list if c.kwargs["params"]["action"] == "flush"]
+    assert sorted(flushes) == ["0", "1048576", "8"]
@@ -0,0 +1,127 @@
+"""Tests for the local install history."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fabric_jumpstart import events
+from fabric_jumpstart.core import jumpstart
+from fabric_jumpstart.events import InstallEvents
+from fabric_jumpstart.history import HistoryStore, get_history_store, new_record, percentile
+from fabric_jumpstart.installer import JumpstartInstaller
+
+
+def _phases(**durations):
+    return [{"phase": name, "start_seconds": 0.0, "duration_seconds": d, "critical": True} for name, d in durations.items()]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(tmp_path / "history.sqlite3")
+
+
+class TestHistoryStore:
+    """Tests for recording and querying installs."""
+
+    def test_record_round_trip(self, store):
+        record = new_record(
+            "demo", "success", 42.5, _phases(deploy=30.0, upload_files=5.0),
+            counters={"bytes_uploaded": 2048, "items_published": 3},
+            install_id="abc", workspace_id="ws-1", repo_ref="v1",
+        )
+        store.record(record)
+
+        (stored,) = store.records()
+        assert stored["install_id"] == "abc" and stored["repo_ref"] == "v1"
+        assert (stored["bytes_uploaded"], stored["files_uploaded"], stored["items_published"]) == (2048, 0, 3)
+        assert [p["phase"] for p in stored["phases"]] == ["deploy", "upload_files"]
+        assert store.records(workspace_id="ws-2") == []
+
+    def test_estimates_use_recent_successes_only(self, store):
+        for deploy in (10.0, 20.0, 30.0):
+            store.record(new_record("demo", "success", deploy + 5, _phases(deploy=deploy, token=1.0)))
+        store.record(new_record("demo", "failure", 500.0, _phases(deploy=400.0), error="boom"))
+        store.record(new_record("other", "success", 1.0, _phases(deploy=1.0)))
+
+        assert store.phase_estimates("demo") == {"deploy": 20.0, "token": 1.0}
+        assert store.phase_estimates("demo", limit=1) == {"deploy": 30.0, "token": 1.0}
+        assert store.duration_estimate("demo") == 25.0
+        assert store.phase_estimates("missing") == {} and store.duration_estimate("missing") is None
+
+    def test_summary_groups_by_versions(self, store):
+        for version, deploy in (("0.1.0", 10.0), ("0.1.0", 20.0), ("0.2.0", 60.0)):
+            with patch("fabric_jumpstart.history._package_version", return_value=version):
+                store.record(new_record("demo", "success", deploy, _phases(deploy=deploy)))
+
+        newer, older = store.summary("demo")
+        assert newer["jumpstart_version"] == "0.2.0" and newer["duration"]["p50"] == 60.0
+        assert older["installs"] == 2 and older["failures"] == 0
+        assert older["duration"] == {"p50": 15.0, "p95": pytest.approx(19.5)}
+        assert older["phases"]["deploy"]["p95"] == pytest.approx(19.5)
+
+    def test_percentile(self):
+        assert percentile([], 50) is None
+        assert percentile([5.0], 95) == 5.0
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+
+
+def test_progress_is_weighted_by_learned_phase_durations():
+    tracker = InstallEvents(None, "install-1", "demo", phase_estimates={"token": 1.0, "deploy": 9.0})
+    tracker.plan_phases(["token", "deploy"])
+    tracker.phase_started("token")
+    tracker.phase_finished("token", 1.0, ok=True)
+    assert tracker.percent() == 10
+
+    tracker.phase_started("deploy")
+    tracker.progress._phases["deploy"].started = time.monotonic() - 4.5
+    assert tracker.percent() == 55
+
+    tracker.phase_finished("deploy", 20.0, ok=True)
+    assert tracker.percent() == 99
+
+
+@patch("fabric_jumpstart.core.track_install")
+def test_installs_are_recorded_and_summarised(_mock_track):
+    def _deploy(prefix):
+        events.count("bytes_uploaded", 100)
+        events.count("items_published", 2)
+        return MagicMock(), "https://entry"
+
+    config = {"id": 1, "logical_id": "demo", "name": "Demo", "source": {"workspace_path": "demo/", "repo_ref": "v1"}}
+    with patch.object(JumpstartInstaller, "run_preparation", return_value=([], [], [], False)), \
+            patch.object(JumpstartInstaller, "resolve_conflicts", return_value=(None, [])), \
+            patch.object(JumpstartInstaller, "run_deployment", side_effect=_deploy), \
+            patch.object(JumpstartInstaller, "build_manifest", return_value={}), \
+            patch("fabric_jumpstart.core.get_manifest_store"):
+        jumpstart()._install_with_config(config, "ws-1", unattended=True, instance_name="js")
+
+    (record,) = get_history_store().records("demo")
+    assert (record["status"], record["workspace_id"], record["repo_ref"]) == ("success", "ws-1", "v1")
+    assert (record["bytes_uploaded"], record["items_published"]) == (100, 2)
+
+    (summary,) = jumpstart().history("demo")
+    assert summary["installs"] == 1 and summary["bytes_uploaded"] == 100
+
+
+@patch("fabric_jumpstart.core.track_install")
+def test_error_after_success_records_the_install_once(mock_track):
+    def _track(**fields):
+        if fields["status"] == "success":
+            raise RuntimeError("telemetry down")
+
+    mock_track.side_effect = _track
+    received = []
+    config = {"id": 1, "logical_id": "demo", "name": "Demo", "source": {"workspace_path": "demo/", "repo_ref": "v1"}}
+    with patch.object(JumpstartInstaller, "run_preparation", return_value=([], [], [], False)), \
+            patch.object(JumpstartInstaller, "resolve_conflicts", return_value=(None, [])), \
+            patch.object(JumpstartInstaller, "run_deployment", return_value=(MagicMock(), "https://entry")), \
+            patch.object(JumpstartInstaller, "build_manifest", return_value={}), \
+            patch("fabric_jumpstart.core.get_manifest_store"), \
+            pytest.raises(RuntimeError, match="telemetry down"):
+        jumpstart()._install_with_config(
+            config, "ws-1", unattended=True, instance_name="js", events=received.append
+        )
+
+    assert [r["status"] for r in get_history_store().records("demo")] == ["success"]
+    assert [e["status"] for e in received if e["event"] == "install_end"] == ["success"]
@@ -0,0 +1,160 @@
+"""Tests for the pooled jumpstart HTTP client."""
+
+import email.utils
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from fabric_jumpstart.http_client import HttpClient, parse_retry_after
+
+
+def _response(status, headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = headers or {}
+    return resp
+
+
+def _client_with_session(responses, **kwargs):
+    client = HttpClient(http2=False, **kwargs)
+    session = MagicMock()
+    session.request.side_effect = responses
+    client._sessions["https://example.com"] = session
+    return client, session
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 30, usegmt=True)
+        delay = parse_retry_after(value)
+        assert delay is not None and 25 <= delay <= 31
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_malformed(self, value):
+        assert parse_retry_after(value) is None
+
+
+@patch("fabric_jumpstart.http_client.time.sleep")
+class TestHttpClientRetries:
+    """Tests for retry and backoff behaviour."""
+
+    def test_honours_retry_after_on_429(self, mock_sleep):
+        client, session = _client_with_session(
+            [_response(429, {"Retry-After": "5"}), _response(200)], backoff_base=0.1
+        )
+
+        resp = client.get("https://example.com/items")
+
+        assert resp.status_code == 200
+        assert session.request.call_count == 2
+        delay = mock_sleep.call_args[0][0]
+        assert 5 <= delay <= 5.1
+
+    def test_retries_5xx_with_capped_backoff(self, mock_sleep):
+        client, session = _client_with_session(
+            [_response(503), _response(502), _response(200)], backoff_base=1, backoff_max=1.5
+        )
+
+        assert client.get("https://example.com/x").status_code == 200
+        assert all(0 <= c[0][0] <= 1.5 for c in mock_sleep.call_args_list)
+        assert client.stats()["retries"] == 2
+
+    def test_returns_last_response_when_retries_exhausted(self, mock_sleep):
+        client, session = _client_with_session([_response(500)] * 3, max_retries=2)
+
+        assert client.get("https://example.com/x").status_code == 500
+        assert session.request.call_count == 3
+
+    def test_non_retryable_status_is_returned_immediately(self, mock_sleep):
+        client, session = _client_with_session([_response(404)])
+
+        assert client.get("https://example.com/x").status_code == 404
+        mock_sleep.assert_not_called()
+
+    def test_connection_errors_retry_then_raise(self, mock_sleep):
+        client, session = _client_with_session(
+            [requests.ConnectionError("reset")] * 2, max_retries=1
+        )
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://example.com/x")
+        assert session.request.call_count == 2
+        assert client.stats()["errors"] == 1
+
+    def test_retries_override(self, mock_sleep):
+        client, session = _client_with_session([_response(503)])
+
+        assert client.post("https://example.com/x", retries=0).status_code == 503
+        mock_sleep.assert_not_called()
+
+
+class TestHttpClientPooling:
+    """Tests for per-host sessions, auth and hooks."""
+
+    def test_session_is_reused_per_host(self):
+        client = HttpClient(http2=False)
+        a = client._session("https://a.example.com")
+        assert client._session("https://a.example.com") is a
+        assert client._session("https://b.example.com") is not a
+        assert client.stats()["pools"] == 2
+        client.close()
+        assert client.stats()["pools"] == 0
+
+    def test_scope_attaches_bearer_token(self):
+        client, session = _client_with_session([_response(200)])
+        manager = MagicMock()
+        manager.get_token.return_value = MagicMock(token="tok")
+
+        with patch("fabric_jumpstart.auth.get_token_manager", return_value=manager):
+            client.get("https://example.com/x", scope="my-scope", headers={"X-Test": "1"})
+
+        manager.get_token.assert_called_once_with("my-scope")
+        headers = session.request.call_args[1]["headers"]
+        assert headers == {"X-Test": "1", "Authorization": "Bearer tok"}
+
+    @patch("fabric_jumpstart.http_client.time.sleep")
+    def test_timing_hook_sees_every_attempt(self, _mock_sleep):
+        client, _ = _client_with_session([_response(429), _response(201)])
+        timings = []
+        client.add_timing_hook(timings.append)
+
+        client.put("https://example.com/file")
+
+        assert [(t.method, t.host, t.status_code, t.attempt) for t in timings] == [
+            ("PUT", "example.com", 429, 0),
+            ("PUT", "example.com", 201, 1),
+        ]
+
+    def test_failing_hook_does_not_break_request(self):
+        client, _ = _client_with_session([_response(200)])
+        client.add_timing_hook(MagicMock(side_effect=RuntimeError("boom")))
+
+        assert client.get("https://example.com/x").status_code == 200
+
+    def test_get_json_raises_on_error_status(self):
+        client, _ = _client_with_session([_response(403)])
+
+        with pytest.raises(RuntimeError, match="403"):
+            client.get_json("https://example.com/x")
+
+    def test_download_streams_the_http2_body(self, tmp_path):
+        client = HttpClient(http2=True)
+        session = MagicMock()
+        response = _response(200)
+        response.iter_bytes.return_value = [b"ab", b"cd"]
+        session.send.return_value = response
+        client._sessions["https://example.com"] = session
+
+        client.download("https://example.com/blob", tmp_path / "blob")
+
+        session.request.assert_not_called()
+        assert session.send.call_args.kwargs["stream"] is True
+        assert (tmp_path / "blob").read_bytes() == b"abcd"
+        response.close.assert_called_once()
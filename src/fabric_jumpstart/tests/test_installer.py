@@ -127,3 +127,109 @@ def test_update_docs_uri_with_ref_ref_not_in_url():
     original = "https://github.com/microsoft/repo/blob/main/README.md"
     result = update_docs_uri_with_ref(original, "v1.0.0", "v2.0.0")
     assert result == original
+
+
+@patch("fabric_jumpstart.installer.get_token_manager")
+@patch("fabric_jumpstart.installer.list_workspace_items")
+@patch("fabric_jumpstart.installer.clone_repository")
+def test_run_preparation_overlaps_clone_and_item_listing(mock_clone, mock_list, _mock_tokens, tmp_path):
+    """Clone and existing-item listing run concurrently and both feed conflict detection."""
+    import time
+
+    (tmp_path / "demo" / "test-jumpstart" / "Nb.Notebook").mkdir(parents=True)
+
+    def _slow_clone(**kwargs):
+        time.sleep(0.2)
+        return tmp_path
+
+    def _slow_list(workspace_id):
+        time.sleep(0.2)
+        return ["Nb.Notebook"]
+
+    mock_clone.side_effect = _slow_clone
+    mock_list.side_effect = _slow_list
+    installer = JumpstartInstaller(
+        _make_config(items_in_scope=["Notebook"]), workspace_id="ws-123", instance_name="js"
+    )
+
+    start = time.monotonic()
+    planned, existing, conflicts, had_conflicts = installer.run_preparation()
+
+    assert time.monotonic() - start < 0.35
+    assert conflicts == ["Nb.Notebook"]
+    assert existing == ["Nb.Notebook"]
+    assert {t.name for t in installer.phase_timings} == {
+        "validate", "token", "prepare_workspace", "list_items", "init_manager", "check_conflicts",
+    }
+    assert installer.critical_path[-1].name == "check_conflicts"
+
+
+def _upload_config():
+    return _make_config(
+        source={
+            "repo_url": "https://github.com/example/repo.git",
+            "repo_ref": "v1.0.0",
+            "workspace_path": "demo/",
+            "files_source_path": "data/",
+            "files_destination_lakehouse": "Bronze",
+        }
+    )
+
+
+def test_run_deployment_publishes_lakehouse_first_and_overlaps_upload(tmp_path):
+    """The destination lakehouse is published first; upload overlaps the remaining publish."""
+    import threading
+
+    installer = JumpstartInstaller(_upload_config(), workspace_id="ws-123", instance_name="js")
+    installer.temp_workspace_path = tmp_path
+    wm = MagicMock()
+    wm.collect_planned_items.return_value = ["Bronze.Lakehouse", "Load.Notebook"]
+    lakehouse_ws, full_ws = MagicMock(name="lakehouse_ws"), MagicMock(name="full_ws")
+    wm.deploy_single_item.return_value = lakehouse_ws
+    upload_started = threading.Event()
+
+    def _slow_deploy(*args, **kwargs):
+        assert upload_started.wait(1), "upload did not start while deploying"
+        return full_ws
+
+    wm.deploy_items.side_effect = _slow_deploy
+    installer.workspace_manager = wm
+
+    with patch.object(installer, "apply_prefix_to_files"), \
+            patch.object(installer, "upload_files", side_effect=lambda ws, p: upload_started.set() or 3) as mock_upload, \
+            patch.object(installer, "generate_entry_url", return_value="https://entry") as mock_entry:
+        ws, entry = installer.run_deployment(None)
+
+    wm.deploy_single_item.assert_called_once_with("Bronze", "Lakehouse", [])
+    assert wm.deploy_items.call_args[1]["exclude_item_names"] == ["Bronze"]
+    assert mock_upload.call_args[0][0] is lakehouse_ws
+    mock_entry.assert_called_once_with(full_ws, None)
+    assert (ws, entry) == (full_ws, "https://entry")
+
+
+def test_run_deployment_without_upload_publishes_everything_once(tmp_path):
+    """Without an upload configured there is a single full publish."""
+    installer = JumpstartInstaller(_make_config(), workspace_id="ws-123", instance_name="js")
+    installer.temp_workspace_path = tmp_path
+    wm = MagicMock()
+    wm.collect_planned_items.return_value = ["Load.Notebook"]
+    installer.workspace_manager = wm
+
+    with patch.object(installer, "apply_prefix_to_files"), \
+            patch.object(installer, "generate_entry_url", return_value=None):
+        installer.run_deployment(None)
+
+    wm.deploy_single_item.assert_not_called()
+    assert wm.deploy_items.call_args[1]["exclude_item_names"] is None
+
+
+def test_destination_lakehouse_not_early_when_name_is_shared(tmp_path):
+    """A same-named item of another type disables early publish (exclusion is name-only)."""
+    installer = JumpstartInstaller(_upload_config(), workspace_id="ws-123", instance_name="js")
+    wm = MagicMock()
+    wm.collect_planned_items.return_value = ["Bronze.Lakehouse", "Bronze.Notebook"]
+    installer.workspace_manager = wm
+
+    assert installer._destination_lakehouse_name(None) is None
+    wm.collect_planned_items.return_value = ["Bronze.Lakehouse"]
+    assert installer._destination_lakehouse_name("js1_x__") == "js1_x__Bronze"
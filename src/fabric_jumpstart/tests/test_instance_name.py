@@ -1,23 +1,65 @@
 """Tests for resolving the jumpstart instance name."""
 
+from unittest.mock import patch
+
+import fabric_jumpstart
+import fabric_jumpstart as js
+from fabric_jumpstart import core, jumpstart
+
 
 def test_module_is_returned():
     """Calling the module directly should return the module name."""
-    import fabric_jumpstart
-
     assert fabric_jumpstart._get_instance_name() == "fabric_jumpstart"
 
 
 def test_module_alias_is_returned():
     """Calling via module alias should return that alias (e.g., js)."""
-    import fabric_jumpstart as js
-
     assert js._get_instance_name() == "js"
 
 
 def test_aliased_alias_is_returned():
     """Calling via a re-aliased alias should return the new variable name."""
-    import fabric_jumpstart as js
-
     js2 = js
-    assert js2._get_instance_name() == "js2"
\ No newline at end of file
+    assert js2._get_instance_name() == "js2"
+
+
+def test_explicit_instance_name_skips_inspection():
+    """An explicit instance_name is returned as-is without frame inspection."""
+    with patch("inspect.currentframe") as mock_frame:
+        assert js._get_instance_name("my_js") == "my_js"
+    mock_frame.assert_not_called()
+
+
+def test_local_alias_is_returned():
+    """A function-local binding of the instance is resolved."""
+    local_js = jumpstart
+    assert local_js._get_instance_name() == "local_js"
+
+
+def test_multiline_call_is_resolved():
+    """Receivers are found even when the calling line is not a full statement."""
+    name = js._get_instance_name(
+    )
+    assert name == "js"
+
+
+def test_result_is_cached_per_call_site():
+    """Repeated calls from the same line hit the cache."""
+    core._INSTANCE_NAME_CACHE.clear()
+    names = [js._get_instance_name() for _ in range(3)]
+    assert names == ["js", "js", "js"]
+    assert list(core._INSTANCE_NAME_CACHE.values()) == ["js"]
+
+
+def test_unrelated_globals_are_not_touched():
+    """Only names referenced on the calling line are inspected."""
+
+    class Exploding:
+        def __getattr__(self, name):
+            raise AssertionError("namespace objects must not be inspected")
+
+    globals()["_exploding_global"] = Exploding()
+    try:
+        assert js._get_instance_name() == "js"
+    finally:
+        del globals()["_exploding_global"]
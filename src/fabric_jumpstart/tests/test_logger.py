@@ -0,0 +1,104 @@
+"""Tests for context-scoped log capture."""
+
+import logging
+import sys
+import threading
+
+from fabric_jumpstart.logger import current_install_id, log_capture_context
+from fabric_jumpstart.phases import PhaseGraph
+
+_LOGGER_NAMES = ("fabric_cicd", "fabric_jumpstart")
+
+
+def _loggers():
+    return [logging.getLogger(name) for name in _LOGGER_NAMES]
+
+
+def _state():
+    return [(lg.handlers[:], lg.propagate, lg.level) for lg in _loggers()] + [sys.stdout, sys.stderr]
+
+
+def _messages(buffer):
+    return sorted(entry["message"] for entry in buffer)
+
+
+def test_single_capture_collects_logs_and_prints_then_restores():
+    before = _state()
+    buffer = []
+
+    with log_capture_context(buffer, _loggers(), install_id="one"):
+        assert current_install_id() == "one"
+        logging.getLogger("fabric_jumpstart.installer").info("from child")
+        logging.getLogger("fabric_cicd").info("from cicd")
+        logging.getLogger("fabric_jumpstart").debug("hidden")
+        print("printed")
+
+    assert _messages(buffer) == ["from child", "from cicd", "printed"]
+    assert _state() == before
+    assert current_install_id() is None
+
+
+def test_concurrent_captures_keep_their_own_output():
+    before = _state()
+    buffers = {"a": [], "b": []}
+    inside = threading.Barrier(2)
+    leave_a = threading.Event()
+
+    def install(name):
+        with log_capture_context(buffers[name], _loggers(), install_id=name):
+            inside.wait()
+            for i in range(50):
+                logging.getLogger("fabric_jumpstart.core").info(f"{name} log {i}")
+                print(f"{name} print {i}")
+            # A phase thread started with the install's context is attributed to it
+            PhaseGraph().add("work", lambda: logging.getLogger("fabric_cicd").info(f"{name} phase")).run()
+            if name == "a":
+                leave_a.set()
+            else:
+                # b outlives a: a's exit must not restore the loggers under b
+                leave_a.wait()
+                logging.getLogger("fabric_jumpstart").info("b after a")
+
+    threads = [threading.Thread(target=install, args=(n,)) for n in buffers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name, buffer in buffers.items():
+        assert all(entry["message"].startswith(name) for entry in buffer), name
+        assert f"{name} phase" in _messages(buffer)
+    assert len(buffers["a"]) == 101 and len(buffers["b"]) == 102
+    assert _state() == before
+
+
+def test_records_outside_any_install_pass_through():
+    outside = logging.getLogger("fabric_jumpstart.test_outside")
+    seen = []
+
+    class _Collect(logging.Handler):
+        def emit(self, record):
+            seen.append(record.getMessage())
+
+    handler = _Collect()
+    logging.getLogger("fabric_jumpstart").addHandler(handler)
+    release = threading.Event()
+    entered = threading.Event()
+
+    def install():
+        with log_capture_context([], _loggers()), log_capture_context([], _loggers()):
+            entered.set()
+            release.wait()
+
+    try:
+        t = threading.Thread(target=install)
+        t.start()
+        entered.wait()
+        # Two captures are active and this thread belongs to neither.
+        outside.error("not an install")
+        release.set()
+        t.join()
+    finally:
+        logging.getLogger("fabric_jumpstart").removeHandler(handler)
+
+    assert seen == ["not an install"]
@@ -0,0 +1,95 @@
+"""Tests for the install phase dependency graph."""
+
+import contextvars
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from fabric_jumpstart.phases import PhaseGraph, format_phase_timings
+
+
+def _sleeper(seconds, value=None):
+    def _run():
+        time.sleep(seconds)
+        return value
+    return _run
+
+
+class TestPhaseGraph:
+    """Tests for PhaseGraph execution."""
+
+    def test_independent_phases_overlap(self):
+        graph = PhaseGraph()
+        graph.add("a", _sleeper(0.2, "a"))
+        graph.add("b", _sleeper(0.2, "b"))
+        graph.add("c", lambda: "c", deps=["a", "b"])
+
+        start = time.monotonic()
+        results = graph.run()
+
+        assert time.monotonic() - start < 0.35
+        assert results == {"a": "a", "b": "b", "c": "c"}
+
+    def test_dependencies_run_first(self):
+        order = []
+        lock = threading.Lock()
+
+        def _record(name):
+            def _run():
+                with lock:
+                    order.append(name)
+            return _run
+
+        graph = PhaseGraph()
+        graph.add("deploy", _record("deploy"), deps=["prepare"])
+        graph.add("prepare", _record("prepare"))
+        graph.add("upload", _record("upload"), deps=["deploy"])
+        graph.run()
+
+        assert order == ["prepare", "deploy", "upload"]
+
+    def test_failure_stops_downstream_phases(self):
+        ran = []
+        graph = PhaseGraph()
+        graph.add("bad", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        graph.add("after", lambda: ran.append("after"), deps=["bad"])
+
+        with pytest.raises(ValueError, match="boom"):
+            graph.run()
+        assert ran == []
+        assert [t.name for t in graph.timings] == ["bad"]
+
+    def test_unknown_dependency_and_cycle_are_rejected(self):
+        graph = PhaseGraph().add("a", lambda: None, deps=["missing"])
+        with pytest.raises(ValueError, match="unknown"):
+            graph.run()
+
+        graph = PhaseGraph().add("a", lambda: None, deps=["b"]).add("b", lambda: None, deps=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            graph.run()
+
+    def test_duplicate_phase_is_rejected(self):
+        graph = PhaseGraph().add("a", lambda: None)
+        with pytest.raises(ValueError, match="Duplicate"):
+            graph.add("a", lambda: None)
+
+    def test_critical_path_follows_slowest_branch(self):
+        graph = PhaseGraph()
+        graph.add("clone", _sleeper(0.15))
+        graph.add("token", _sleeper(0.01))
+        graph.add("conflicts", lambda: None, deps=["clone", "token"])
+        graph.run()
+
+        assert [t.name for t in graph.critical_path()] == ["clone", "conflicts"]
+        summary = format_phase_timings(graph.timings, graph.critical_path())
+        assert "clone*" in summary
+        assert "token " in summary
+
+    def test_phases_see_callers_context(self):
+        var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("var", default=None)
+        var.set("install-1")
+        graph = PhaseGraph().add("read", var.get)
+
+        assert graph.run() == {"read": "install-1"}
@@ -0,0 +1,198 @@
+"""Tests for background source prewarming."""
+
+import threading
+from unittest.mock import patch
+
+from fabric_jumpstart.installer import JumpstartInstaller
+from fabric_jumpstart.prewarm import (
+    STATUS_CLAIMED,
+    STATUS_FAILED,
+    STATUS_FETCHING,
+    STATUS_NOT_STARTED,
+    STATUS_READY,
+    Prewarmer,
+    get_prewarmer,
+    reset_prewarmer,
+    source_key,
+)
+
+
+def _remote_config(ref="v1.0.0"):
+    return {
+        "id": 7,
+        "logical_id": "demo-remote",
+        "source": {"repo_url": "https://github.com/example/repo.git", "repo_ref": ref, "workspace_path": "ws/"},
+    }
+
+
+def _fake_clone(tmp_path, calls):
+    def _clone(repository_url, ref=None, temp_dir_prefix="fabric-jumpstart-"):
+        calls.append(ref)
+        dest = tmp_path / f"clone-{len(calls)}"
+        (dest / "ws" / "Nb.Notebook").mkdir(parents=True)
+        (dest / "ws" / "Nb.Notebook" / "content.py").write_text("print(1)")
+        return dest
+    return _clone
+
+
+def test_source_key_uses_override_ref():
+    assert source_key(_remote_config()) == "https://github.com/example/repo.git@v1.0.0"
+    assert source_key(_remote_config(), "v2") == "https://github.com/example/repo.git@v2"
+    assert source_key({"logical_id": "x", "source": {"workspace_path": "/"}}) == "local:x"
+
+
+class TestPrewarmer:
+    """Tests for Prewarmer fetch, status and claim."""
+
+    def test_prewarm_stages_copy_and_claim_hands_it_out_once(self, tmp_path):
+        calls = []
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, calls)):
+            prewarmer.prewarm(_remote_config())
+            staged = prewarmer.claim(_remote_config())
+
+        assert staged is not None
+        assert (staged / "ws" / "Nb.Notebook" / "content.py").read_text() == "print(1)"
+        assert prewarmer.status("demo-remote")["status"] == STATUS_CLAIMED
+        assert prewarmer.claim(_remote_config()) is None
+        assert calls == ["v1.0.0"]
+
+    def test_second_prewarm_reuses_cached_clone(self, tmp_path):
+        calls = []
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, calls)):
+            prewarmer.prewarm(_remote_config())
+            first = prewarmer.claim(_remote_config())
+            prewarmer.prewarm(_remote_config())
+            second = prewarmer.claim(_remote_config())
+
+        assert first != second
+        assert calls == ["v1.0.0"]
+
+    def test_prewarm_while_fetching_is_a_no_op(self, tmp_path):
+        calls = []
+        release = threading.Event()
+        clone = _fake_clone(tmp_path, calls)
+
+        def _blocking_clone(**kwargs):
+            release.wait(2)
+            return clone(**kwargs)
+
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_blocking_clone):
+            prewarmer.prewarm(_remote_config())
+            prewarmer.prewarm(_remote_config())
+            release.set()
+            prewarmer.claim(_remote_config())
+
+        assert calls == ["v1.0.0"]
+        assert len(prewarmer.status_all()) == 1
+
+    def test_failed_prewarm_reports_error_and_claims_nothing(self, tmp_path):
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=RuntimeError("no network")):
+            prewarmer.prewarm(_remote_config())
+            assert prewarmer.claim(_remote_config()) is None
+
+        status = prewarmer.status("demo-remote")
+        assert status["status"] == STATUS_FAILED
+        assert "no network" in status["error"]
+
+    def test_least_recently_used_clones_are_evicted(self, tmp_path):
+        calls = []
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache", max_sources=2)
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, calls)):
+            for ref in ("v1", "v2", "v1", "v3"):
+                prewarmer.prewarm(_remote_config(), ref)
+                prewarmer.claim(_remote_config(), ref)
+            prewarmer.prewarm(_remote_config(), "v2")
+            prewarmer.claim(_remote_config(), "v2")
+
+        # v1 was used again before v3 arrived, so v2 was the one dropped
+        assert calls == ["v1", "v2", "v3", "v2"]
+        assert len([p for p in (tmp_path / "cache").iterdir() if p.is_dir()]) == 2
+        assert len(list((tmp_path / "cache").glob("*.fetched"))) == 2
+
+    def test_claim_gives_up_on_a_hung_prewarm(self, tmp_path):
+        release = threading.Event()
+        clone = _fake_clone(tmp_path, [])
+
+        def _hung_clone(**kwargs):
+            release.wait(5)
+            return clone(**kwargs)
+
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_hung_clone):
+            prewarmer.prewarm(_remote_config())
+            assert prewarmer.claim(_remote_config(), timeout=0.05) is None
+            assert prewarmer.status("demo-remote")["status"] == STATUS_FETCHING
+            release.set()
+            prewarmer.shutdown()
+
+    def test_shutdown_removes_unclaimed_copies(self, tmp_path):
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, [])):
+            prewarmer.prewarm(_remote_config())
+            prewarmer.prewarm(_remote_config("v2"))
+            claimed = prewarmer.claim(_remote_config())
+            unclaimed = prewarmer._entries[source_key(_remote_config("v2"))]
+            assert unclaimed.future is not None
+            unclaimed.future.result()
+            prewarmer.shutdown()
+
+        assert claimed is not None and claimed.exists()
+        assert unclaimed.staged_path is not None and not unclaimed.staged_path.exists()
+        assert prewarmer.status_all() == []
+
+    def test_different_ref_is_not_claimed(self, tmp_path):
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, [])):
+            prewarmer.prewarm(_remote_config())
+            assert prewarmer.claim(_remote_config(), repo_ref="v9") is None
+            prewarmer.claim(_remote_config())
+        assert prewarmer.status("demo-remote")["status"] == STATUS_CLAIMED
+        assert prewarmer.status("unknown")["status"] == STATUS_NOT_STARTED
+
+    def test_local_source_is_staged(self, tmp_path):
+        prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+        config = {"id": 99, "logical_id": "local-demo", "source": {"workspace_path": "/"}}
+        (tmp_path / "staged").mkdir()
+        with patch(
+            "fabric_jumpstart.utils.clone_files_to_temp_directory", return_value=tmp_path / "staged"
+        ) as mock_copy:
+            prewarmer.prewarm(config)
+            assert prewarmer.claim(config) == tmp_path / "staged"
+        assert mock_copy.call_args[0][0].name == "local-demo"
+
+
+@patch("fabric_jumpstart.installer.clone_repository")
+def test_installer_uses_prewarmed_source(mock_clone, tmp_path):
+    """prepare_workspace claims a prewarmed copy instead of cloning."""
+    prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+    with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, [])):
+        prewarmer.prewarm(_remote_config())
+
+        with patch("fabric_jumpstart.installer.get_prewarmer", return_value=prewarmer):
+            installer = JumpstartInstaller(_remote_config(), workspace_id="ws-1", instance_name="js")
+            installer.prepare_workspace()
+
+    mock_clone.assert_not_called()
+    assert prewarmer.status("demo-remote")["status"] == STATUS_CLAIMED
+    assert installer.temp_workspace_path is not None
+    assert (installer.temp_workspace_path / "demo-remote" / "Nb.Notebook").is_dir()
+
+
+def test_status_is_ready_before_claim(tmp_path):
+    prewarmer = Prewarmer(cache_dir=tmp_path / "cache")
+    with patch("fabric_jumpstart.utils.clone_repository", side_effect=_fake_clone(tmp_path, [])):
+        prewarmer.prewarm(_remote_config())
+        future = prewarmer._entries[source_key(_remote_config())].future
+        assert future is not None
+        future.result()
+    assert prewarmer.status("demo-remote")["status"] == STATUS_READY
+
+
+def test_reset_prewarmer_replaces_the_process_prewarmer():
+    prewarmer = get_prewarmer()
+    reset_prewarmer()
+    assert get_prewarmer() is not prewarmer
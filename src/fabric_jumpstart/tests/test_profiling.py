@@ -0,0 +1,98 @@
+"""Tests for the install profiler."""
+
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from fabric_jumpstart import profiling
+from fabric_jumpstart.core import jumpstart
+from fabric_jumpstart.installer import JumpstartInstaller
+from fabric_jumpstart.phases import PhaseGraph
+from fabric_jumpstart.profiling import InstallProfiler, format_profile_summary, install_profile
+from fabric_jumpstart.ui import render_profile_summary_html
+
+
+def _spin(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def _allocate_and_spin():
+    buffer = bytearray(8 * 1024 * 1024)
+    _spin(0.2)
+    return len(buffer)
+
+
+def test_phases_are_sampled_with_their_peak_memory(tmp_path):
+    with install_profile(tmp_path, "0123456789abcdef", "demo", interval=0.001) as profiler:
+        PhaseGraph().add("busy", _allocate_and_spin).add("quick", lambda: None).run()
+    assert profiler is not None
+    summary = profiler.stop()
+
+    phases = {p["phase"]: p for p in summary["phases"]}
+    assert phases["busy"]["samples"] > 0 and phases["busy"]["peak_memory_bytes"] >= 8 * 1024 * 1024
+    assert summary["phases"][0]["phase"] == "busy"
+    assert summary["hot_spots"][0]["frame"] == "tests.test_profiling:_spin"
+    assert not tracemalloc.is_tracing()
+
+    collapsed = Path(summary["collapsed_path"]).read_text(encoding="utf-8").splitlines()
+    assert summary["collapsed_path"].endswith("demo-01234567.collapsed")
+    assert any(line.startswith("busy;tests.test_profiling:_allocate_and_spin;tests.test_profiling:_spin ") for line in collapsed)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in collapsed) == summary["samples"]
+    assert "busy" in Path(summary["summary_path"]).read_text(encoding="utf-8")
+
+
+def test_stop_is_idempotent_and_hooks_are_no_ops_without_a_profile(tmp_path):
+    profiler = InstallProfiler("demo", "abc", tmp_path).start()
+    assert profiler.stop() is profiler.stop()
+
+    with install_profile(None, "abc", "demo") as disabled:
+        assert disabled is None and profiling.current_profiler() is None
+        profiling.phase_started("a")
+        profiling.phase_finished("a")
+
+
+def test_summary_renders_as_text_and_html():
+    summary = {
+        "samples": 200,
+        "interval_seconds": 0.005,
+        "peak_memory_bytes": 3 * 1024 ** 2,
+        "phases": [{"phase": "deploy", "seconds": 12.5, "samples": 150, "peak_memory_bytes": 2 * 1024 ** 2}],
+        "hot_spots": [{"frame": "ssl:SSLSocket.read", "samples": 120, "share": 0.6}],
+        "packages": [{"package": "ssl", "samples": 120, "share": 0.6}],
+        "collapsed_path": "/tmp/demo-0123.collapsed",
+    }
+    text = format_profile_summary(summary, "demo", "0123456789")
+    assert "200 samples every 5 ms" in text and " 60.0%  ssl:SSLSocket.read" in text
+    assert "deploy                  12.50      150       2.0 MB" in text
+
+    html = render_profile_summary_html(summary)
+    assert "deploy 12.5s · 2.0 MB peak" in html and "60% ssl" in html
+    assert "/tmp/demo-0123.collapsed" in html
+
+
+@patch("fabric_jumpstart.core.track_install")
+def test_install_with_profile_writes_files_and_shows_hot_spots(_mock_track, tmp_path):
+    def _prepare():
+        PhaseGraph().add("validate", lambda: _spin(0.05)).run()
+        return [], [], [], False
+
+    config = {"id": 1, "logical_id": "demo", "name": "Demo", "source": {"workspace_path": "demo/"}}
+    received = []
+    with patch.object(JumpstartInstaller, "run_preparation", side_effect=_prepare), \
+            patch.object(JumpstartInstaller, "resolve_conflicts", return_value=(None, [])), \
+            patch.object(JumpstartInstaller, "run_deployment", return_value=(MagicMock(), None)), \
+            patch.object(JumpstartInstaller, "build_manifest", return_value={}), \
+            patch("fabric_jumpstart.core.get_manifest_store"), \
+            patch("fabric_jumpstart.core.render_profile_summary_html", wraps=render_profile_summary_html) as render:
+        jumpstart()._install_with_config(
+            config, "ws-1", unattended=True, instance_name="js", profile=tmp_path / "profiles", events=received.append,
+        )
+
+    (summary,) = render.call_args.args
+    assert [p["phase"] for p in summary["phases"]] == ["validate"]
+    assert sorted(path.suffix for path in (tmp_path / "profiles").iterdir()) == [".collapsed", ".txt"]
+    (event,) = [e for e in received if e["event"] == "profile"]
+    assert event["collapsed_path"] == summary["collapsed_path"]
@@ -0,0 +1,138 @@
+"""Tests for phase-weighted install progress."""
+
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from fabric_jumpstart import events
+from fabric_jumpstart.events import EventStream, install_events
+from fabric_jumpstart.progress import ProgressModel, format_bytes
+from fabric_jumpstart.ui.install_status import render_install_status_html
+from fabric_jumpstart.utils import _run_git_clone
+from fabric_jumpstart.workspace_manager import _report_publishes
+
+
+class TestProgressModel:
+    """Tests for combining phase work into one percentage."""
+
+    def test_work_counters_weight_their_phase(self):
+        model = ProgressModel({"clone": 2.0, "upload": 8.0})
+        model.plan(["clone", "upload"])
+        model.start("clone")
+        model.finish("clone")
+        assert model.percent() == 20
+
+        model.start("upload")
+        model.set_total("upload", 1000, "bytes")
+        model.advance("upload", 500)
+        assert model.percent() == 60
+
+        model.finish("upload")
+        assert model.percent() == 99
+        model.complete()
+        assert model.percent() == 100
+
+    def test_time_based_phases_stop_short_of_done(self):
+        model = ProgressModel({"token": 1.0})
+        model.plan(["token"])
+        model.start("token")
+        model._phases["token"].started = time.monotonic() - 60
+        assert model.percent() == 95
+
+    def test_percent_never_decreases_when_plan_grows(self):
+        model = ProgressModel({"a": 1.0, "b": 1.0})
+        model.plan(["a"])
+        model.start("a")
+        model.finish("a")
+        assert model.percent() == 99
+        model.plan(["a", "b"])
+        assert model.percent() == 99
+
+    def test_describe_reports_running_work_and_rate(self):
+        model = ProgressModel()
+        assert model.describe() is None
+        model.start("upload_files")
+        model.set_total("upload_files", 4 * 1024 ** 2, "bytes")
+        model.advance("upload_files", 1024 ** 2)
+        model._phases["upload_files"].started = time.monotonic() - 2
+        assert model.describe() == "Uploading files: 1.0 MB of 4.0 MB · 512.0 KB/s"
+
+        model.start("deploy")
+        model.set_total("deploy", 12, "items")
+        current = model.current()
+        assert current is not None and current["phase"] == "deploy"
+        assert model.describe() == "Publishing items: 0 of 12 items"
+
+    def test_format_bytes(self):
+        assert format_bytes(512) == "512 B"
+        assert format_bytes(1536) == "1.5 KB"
+        assert format_bytes(3 * 1024 ** 3) == "3.0 GB"
+
+
+def test_progress_events_carry_phase_work():
+    received = []
+    stream = EventStream(received.append)
+    with install_events(stream, "install-1", "demo") as tracker:
+        tracker.plan_phases(["deploy"])
+        events.phase_started("deploy")
+        events.work_total(4, "items")
+        for _ in range(4):
+            events.work_done()
+        events.phase_finished("deploy", 1.0, ok=True)
+    stream.close()
+
+    progress = [e for e in received if e["event"] == "progress"]
+    assert [e["percent"] for e in progress] == [25, 50, 75, 99]
+    assert (progress[1]["phase"], progress[1]["done"], progress[1]["total"], progress[1]["unit"]) == (
+        "deploy", 2, 4, "items",
+    )
+
+
+def test_git_clone_progress_is_reported_as_objects():
+    script = (
+        "import sys\n"
+        "sys.stderr.write('Cloning into x...\\n')\n"
+        "for i in (1, 5, 10):\n"
+        "    sys.stderr.write(f'Receiving objects:  {i * 10}% ({i}/10), {i}.00 KiB | 1 MiB/s\\r')\n"
+        "sys.stderr.write('\\n')\n"
+    )
+    with install_events(None, "install-1", "demo") as tracker:
+        events.phase_started("prepare_workspace")
+        _run_git_clone([sys.executable, "-c", script])
+        work = tracker.progress._phases["prepare_workspace"]
+        assert (work.done, work.total, work.unit) == (10, 10, "objects")
+        assert tracker.counters["bytes_cloned"] == 10 * 1024
+
+
+def test_git_clone_failure_keeps_messages():
+    script = "import sys\nsys.stderr.write('fatal: repository not found\\n')\nsys.exit(128)\n"
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        _run_git_clone([sys.executable, "-c", script])
+    assert excinfo.value.stderr == "fatal: repository not found"
+
+
+def test_published_items_count_as_phase_work():
+    published = []
+    workspace = MagicMock()
+    workspace._publish_item = lambda name: published.append(name)
+    with install_events(None, "install-1", "demo") as tracker:
+        events.phase_started("deploy")
+        _report_publishes(workspace, 2)
+        _report_publishes(workspace, 2)  # re-wrapping does not double count
+        workspace._publish_item("a")
+        workspace._publish_item("b")
+        work = tracker.progress._phases["deploy"]
+        assert published == ["a", "b"] and (work.done, work.total) == (2, 2)
+
+
+def test_status_card_shows_measured_progress_without_an_estimate():
+    html = render_install_status_html(
+        status="installing", jumpstart_name="Demo", type="", workspace_id="ws", entry_point=None,
+        minutes_complete=None, minutes_deploy=None, elapsed_seconds=5,
+        progress_override=42.0, progress_detail="Publishing items: 4 of 12 items",
+    )
+    assert "fill indeterminate" not in html and "width:42.0%" in html
+    assert "Publishing items: 4 of 12 items" in html and "42%" in html
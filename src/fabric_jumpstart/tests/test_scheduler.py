@@ -0,0 +1,175 @@
+"""Tests for the shared request scheduler."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from fabric_jumpstart.http_client import HttpClient
+from fabric_jumpstart.scheduler import (
+    ENDPOINT_ITEMS,
+    ENDPOINT_ONELAKE,
+    PRIORITY_BULK,
+    PRIORITY_METADATA,
+    AimdLimiter,
+    RequestScheduler,
+    TokenBucket,
+    classify_url,
+)
+from fabric_jumpstart.workspace_manager import _schedule_requests
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.fabric.microsoft.com/v1/workspaces/x/items", ENDPOINT_ITEMS),
+        ("https://onelake.dfs.fabric.microsoft.com/ws/lh/Files/a.csv", ENDPOINT_ONELAKE),
+        ("https://westus-0.in.applicationinsights.azure.com/v2/track", None),
+    ],
+)
+def test_classify_url(url, expected):
+    assert classify_url(url) == expected
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiting."""
+
+    def test_burst_then_waits(self):
+        bucket = TokenBucket(rate=100.0, capacity=2)
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() > 0
+
+
+class TestAimdLimiter:
+    """Tests for AIMD concurrency adaptation."""
+
+    def test_throttle_halves_and_success_grows(self):
+        limiter = AimdLimiter(initial=8)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == 4
+        assert limiter.throttled == 1
+
+        limiter.acquire()
+        limiter.release()
+        assert 4 < limiter.limit < 5
+
+    def test_limit_respects_bounds(self):
+        limiter = AimdLimiter(initial=1, minimum=1, maximum=2)
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        assert limiter.limit == 1
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == 2
+
+    def test_retry_after_pauses_admission(self):
+        limiter = AimdLimiter(initial=4)
+        limiter.acquire()
+        limiter.release(throttled=True, retry_after=0.2)
+
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.15
+
+    def test_waiters_are_admitted_by_priority(self):
+        limiter = AimdLimiter(initial=1, maximum=1)
+        limiter.acquire()
+        order = []
+
+        def _worker(priority, label):
+            limiter.acquire(priority)
+            order.append(label)
+            limiter.release()
+
+        bulk = threading.Thread(target=_worker, args=(PRIORITY_BULK, "bulk"))
+        bulk.start()
+        while not limiter._waiters:
+            time.sleep(0.001)
+        meta = threading.Thread(target=_worker, args=(PRIORITY_METADATA, "metadata"))
+        meta.start()
+        while len(limiter._waiters) < 2:
+            time.sleep(0.001)
+
+        limiter.release()
+        bulk.join(2)
+        meta.join(2)
+        assert order == ["metadata", "bulk"]
+
+
+class TestRequestScheduler:
+    """Tests for RequestScheduler slots."""
+
+    def test_unscheduled_endpoint_passes_through(self):
+        scheduler = RequestScheduler()
+        with scheduler.slot(None) as slot:
+            slot.record(429)
+        assert all(s["throttled"] == 0 for s in scheduler.stats().values())
+
+    def test_429_is_recorded_against_endpoint(self):
+        scheduler = RequestScheduler()
+        with scheduler.slot(ENDPOINT_ITEMS) as slot:
+            assert scheduler.stats()[ENDPOINT_ITEMS]["in_flight"] == 1
+            slot.record(429)
+        stats = scheduler.stats()[ENDPOINT_ITEMS]
+        assert stats["throttled"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_block_that_raises_does_not_grow_the_limit(self):
+        scheduler = RequestScheduler()
+        limit = scheduler.stats()[ENDPOINT_ITEMS]["limit"]
+        with pytest.raises(requests.ConnectionError):
+            with scheduler.slot(ENDPOINT_ITEMS):
+                raise requests.ConnectionError("reset")
+        stats = scheduler.stats()[ENDPOINT_ITEMS]
+        assert (stats["limit"], stats["in_flight"]) == (limit, 0)
+
+    @patch("fabric_jumpstart.http_client.time.sleep")
+    def test_http_client_transport_errors_do_not_grow_the_limit(self, _mock_sleep):
+        scheduler = RequestScheduler()
+        client = HttpClient(http2=False, scheduler=scheduler, max_retries=2)
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError("reset")
+        client._sessions["https://api.fabric.microsoft.com"] = session
+        limit = scheduler.stats()[ENDPOINT_ITEMS]["limit"]
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("https://api.fabric.microsoft.com/v1/workspaces")
+
+        assert session.request.call_count == 3
+        assert scheduler.stats()[ENDPOINT_ITEMS]["limit"] == limit
+
+    def test_fabric_cicd_calls_are_admitted_per_request(self):
+        scheduler = RequestScheduler()
+        workspace = _schedule_requests(MagicMock())
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0"})
+
+        with patch("fabric_jumpstart.workspace_manager.get_scheduler", return_value=scheduler), \
+                patch("fabric_jumpstart.workspace_manager.requests.request", return_value=throttled) as request:
+            response = workspace.endpoint.requests.request(
+                method="POST", url="https://api.fabric.microsoft.com/v1/workspaces/ws/items", json="{}",
+            )
+
+        assert response is throttled
+        request.assert_called_once_with("POST", "https://api.fabric.microsoft.com/v1/workspaces/ws/items", json="{}")
+        assert scheduler.stats()[ENDPOINT_ITEMS]["throttled"] == 1
+
+    @patch("fabric_jumpstart.http_client.time.sleep")
+    def test_http_client_reports_throttling(self, _mock_sleep):
+        scheduler = RequestScheduler()
+        client = HttpClient(http2=False, scheduler=scheduler)
+        session = MagicMock()
+        session.request.side_effect = [
+            MagicMock(status_code=429, headers={}),
+            MagicMock(status_code=200, headers={}),
+        ]
+        client._sessions["https://api.fabric.microsoft.com"] = session
+
+        client.get("https://api.fabric.microsoft.com/v1/workspaces")
+
+        assert scheduler.stats()[ENDPOINT_ITEMS]["throttled"] == 1
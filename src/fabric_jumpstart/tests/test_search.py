@@ -0,0 +1,148 @@
+"""Tests for the catalog search index and registry search API."""
+
+import json
+
+import pytest
+
+from fabric_jumpstart.registry import COMPILED_REGISTRY_FILENAME, JumpstartRegistry
+from fabric_jumpstart.search import SearchIndex, tokenize_document, tokenize_query
+from fabric_jumpstart.ui.catalog import render_jumpstart_list
+
+
+def _docs():
+    return [
+        {
+            "logical_id": "banking-loan-fraud",
+            "name": "Real-Time Banking Loan Fraud Detection",
+            "description": "Stream loan applications into an Eventhouse and query with KQL.",
+            "workload_tags": ["Real-Time Intelligence"],
+            "scenario_tags": ["Streaming"],
+            "items_in_scope": ["Eventhouse", "KQLDatabase", "KQLDashboard"],
+            "entry_point": "BankingLoanFraudEmulator.Notebook",
+        },
+        {
+            "logical_id": "stateful-streaming-rocksdb",
+            "name": "Stateful Streaming with RocksDB",
+            "description": "Spark structured streaming with the RocksDB state store.",
+            "workload_tags": ["Data Engineering"],
+            "scenario_tags": ["Streaming"],
+            "items_in_scope": ["Lakehouse", "Notebook"],
+            "entry_point": "Setup.Notebook",
+        },
+        {
+            "logical_id": "retail-sales",
+            "name": "Retail Sales Analytics",
+            "description": "Model retail sales in a warehouse and report in Power BI.",
+            "workload_tags": ["Data Warehouse", "Power BI"],
+            "scenario_tags": ["Modeling"],
+            "items_in_scope": ["Warehouse", "SemanticModel", "Report"],
+            "entry_point": "Sales.Report",
+        },
+    ]
+
+
+class TestTokenize:
+    """Tests for query and document tokenization."""
+
+    def test_query_is_lowercased_and_stopwords_removed(self):
+        assert tokenize_query("Fraud in the KQL") == ["fraud", "kql"]
+
+    def test_document_expands_camel_case(self):
+        terms = tokenize_document("BankingLoanFraud.Notebook")
+        assert "bankingloanfraud" in terms
+        assert {"banking", "loan", "fraud", "notebook"} <= set(terms)
+
+    def test_document_splits_acronyms(self):
+        terms = tokenize_document("KQLDatabase RocksDB")
+        assert {"kqldatabase", "kql", "database", "rocksdb", "rocks", "db"} <= set(terms)
+
+
+class TestSearchIndex:
+    """Tests for BM25 ranking over the inverted index."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("KQL", "banking-loan-fraud"),
+            ("RocksDB", "stateful-streaming-rocksdb"),
+            ("fraud", "banking-loan-fraud"),
+            ("Eventhouse", "banking-loan-fraud"),
+            ("power bi", "retail-sales"),
+        ],
+    )
+    def test_keyword_ranks_expected_first(self, query, expected):
+        results = SearchIndex.build(_docs()).search(query)
+        assert results, f"No results for {query!r}"
+        assert results[0][0] == expected
+
+    def test_shared_term_matches_multiple_documents(self):
+        ids = [doc_id for doc_id, _ in SearchIndex.build(_docs()).search("streaming")]
+        assert set(ids) == {"banking-loan-fraud", "stateful-streaming-rocksdb"}
+        # Streaming is in the name of the RocksDB jumpstart, so it ranks first
+        assert ids[0] == "stateful-streaming-rocksdb"
+
+    def test_last_term_matches_as_prefix(self):
+        index = SearchIndex.build(_docs())
+        assert index.search("rock")[0][0] == "stateful-streaming-rocksdb"
+        assert index.search("rock", prefix=False) == []
+
+    def test_empty_and_unknown_queries(self):
+        index = SearchIndex.build(_docs())
+        assert index.search("") == []
+        assert index.search("the of") == []
+        assert index.search("zzzz") == []
+
+    def test_limit(self):
+        assert len(SearchIndex.build(_docs()).search("streaming", limit=1)) == 1
+
+    def test_round_trip_serialisation(self):
+        index = SearchIndex.build(_docs())
+        restored = SearchIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+        assert restored.search("kql fraud") == index.search("kql fraud")
+
+    def test_from_dict_rejects_unknown_version(self):
+        with pytest.raises(ValueError):
+            SearchIndex.from_dict({"version": 999, "docs": [], "postings": {}})
+
+
+class TestRegistrySearch:
+    """Tests for JumpstartRegistry.search and the compiled artifact."""
+
+    def test_search_packaged_registry(self):
+        registry = JumpstartRegistry()
+        results = registry.search("RocksDB")
+        assert results
+        assert results[0]["logical_id"] == "stateful-streaming-rocksdb"
+
+    def test_search_respects_limit(self):
+        assert len(JumpstartRegistry().search("streaming", limit=2)) == 2
+
+    def test_compiled_artifact_is_preferred(self, tmp_path):
+        compiled = JumpstartRegistry().compile()
+        compiled["jumpstarts"] = compiled["jumpstarts"][:1]
+        (tmp_path / COMPILED_REGISTRY_FILENAME).write_text(json.dumps(compiled), encoding="utf-8")
+
+        registry = JumpstartRegistry(tmp_path)
+        assert len(registry.load()) == 1
+        assert registry.search_index.to_dict() == compiled["search_index"]
+
+    def test_corrupt_compiled_artifact_falls_back_to_yaml(self, tmp_path):
+        (tmp_path / "core").mkdir()
+        (tmp_path / "core" / "demo.yml").write_text(
+            "id: 1\nlogical_id: demo\nname: Demo\ndescription: Sample entry.\ndate_added: 01/01/2025\n"
+            "workload_tags: [Data Engineering]\nscenario_tags: [Streaming]\nsource: {workspace_path: src/}\n"
+            "items_in_scope: [Notebook]\nentry_point: Explore.Notebook\nowner_email: owner@example.com\n",
+            encoding="utf-8",
+        )
+        (tmp_path / COMPILED_REGISTRY_FILENAME).write_text("{not json", encoding="utf-8")
+
+        registry = JumpstartRegistry(tmp_path)
+        assert [j["logical_id"] for j in registry.load()] == ["demo"]
+        assert registry.search("demo")[0]["logical_id"] == "demo"
+
+
+def test_catalog_embeds_search_index_and_box():
+    index = SearchIndex.build(_docs())
+    html = render_jumpstart_list({}, {}, {}, "js", search_index=index)
+    assert 'id="jumpstart-search"' in html
+    assert 'class="jumpstart-search-index"' in html
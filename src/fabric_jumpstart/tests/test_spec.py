@@ -0,0 +1,127 @@
+"""Tests for read-only registry records."""
+
+import copy
+import pickle
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from fabric_jumpstart.registry import (
+    COMPILED_HEAVY_FILENAME,
+    COMPILED_REGISTRY_FILENAME,
+    JumpstartRegistry,
+)
+from fabric_jumpstart.spec import FIELDS, HEAVY_FIELDS, JumpstartSpec
+from fabric_jumpstart.validation import _KNOWN_FIELDS
+
+from .test_validation import _entry, _write_catalog
+
+
+def _spec(**overrides):
+    return JumpstartSpec.from_dict(_entry(**overrides))
+
+
+class TestJumpstartSpec:
+    """Tests for the mapping view and attribute defaults."""
+
+    def test_covers_every_schema_field(self):
+        assert set(_KNOWN_FIELDS) <= set(FIELDS) | set(HEAVY_FIELDS)
+
+    def test_behaves_like_the_source_dict(self):
+        entry = _entry(mermaid_diagram="graph LR; a-->b")
+        spec = JumpstartSpec.from_dict(entry)
+
+        assert spec.to_dict() == entry
+        assert set(spec) == set(entry) and len(spec) == len(entry)
+        assert spec["name"] == "Demo" and spec.get("type") is None and "type" not in spec
+        assert spec["workload_tags"] == ("Data Engineering",)
+        assert spec["source"]["workspace_path"] == "src/"
+        with pytest.raises(KeyError):
+            spec["difficulty"]
+
+    def test_attributes_apply_registry_defaults(self):
+        spec = JumpstartSpec.from_dict({"id": 3, "logical_id": "bare"})
+        assert spec.include_in_listing is True
+        assert spec.type is None and spec.items_in_scope == () and spec.source == {}
+        assert spec.mermaid_diagram is None and spec.is_new is False
+        with pytest.raises(AttributeError):
+            spec.colour
+
+    def test_is_read_only(self):
+        spec = _spec()
+        with pytest.raises(TypeError):
+            spec["name"] = "Other"
+        with pytest.raises(AttributeError):
+            spec.name = "Other"
+        with pytest.raises(TypeError):
+            spec.source["workspace_path"] = "elsewhere/"
+        assert not hasattr(spec, "__dict__")
+
+    def test_replace_returns_a_copy(self):
+        spec = _spec()
+        marked = spec.replace(is_new=True)
+        assert marked.is_new is True and "is_new" not in spec
+        assert marked.logical_id == spec.logical_id
+
+    def test_unknown_fields_are_rejected(self):
+        with pytest.raises(ValueError, match="colour"):
+            JumpstartSpec.from_dict(_entry(colour="blue"))
+
+    def test_round_trips_through_copy_and_pickle(self):
+        spec = _spec(mermaid_diagram="graph LR; a-->b")
+        assert spec.to_dict() == _entry(mermaid_diagram="graph LR; a-->b")
+        assert pickle.loads(pickle.dumps(spec)) == spec
+        assert copy.deepcopy(spec) == spec
+
+
+class TestLazyHeavyFields:
+    """Tests for heavy fields held in the compiled sidecar."""
+
+    def test_loader_is_only_called_on_access(self):
+        loader = MagicMock(return_value={"mermaid_diagram": "graph TD; x"})
+        spec = JumpstartSpec.from_dict(_entry(), lazy=["mermaid_diagram"], loader=loader)
+
+        assert "mermaid_diagram" in spec and "mermaid_diagram" in list(spec)
+        loader.assert_not_called()
+        assert spec["mermaid_diagram"] == "graph TD; x"
+        assert spec.replace(is_new=True).mermaid_diagram == "graph TD; x"
+        loader.assert_called_with("demo")
+
+    def test_compiled_registry_reads_diagrams_from_sidecar(self, tmp_path):
+        _write_catalog(tmp_path, [
+            _entry(mermaid_diagram="graph LR; a-->b"),
+            _entry(id=2, logical_id="plain"),
+        ])
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        paths = JumpstartRegistry(tmp_path).write_compiled(out_dir)
+        assert [p.name for p in paths] == [COMPILED_REGISTRY_FILENAME, COMPILED_HEAVY_FILENAME]
+        assert b"graph LR" not in paths[0].read_bytes()
+
+        demo, plain = JumpstartRegistry(out_dir).load()
+
+        assert demo["mermaid_diagram"] == "graph LR; a-->b"
+        assert "mermaid_diagram" not in plain and plain.mermaid_diagram is None
+
+
+def test_spec_memory_benchmark():
+    """Records take less memory than the dicts they replace, before counting
+    the heavy fields they leave on disk."""
+    entries = [
+        _entry(id=i, logical_id=f"entry-{i}", type="Demo", items_in_scope=["Notebook", "Lakehouse"])
+        for i in range(1, 1001)
+    ]
+
+    tracemalloc.start()
+    dicts = [copy.deepcopy(e) for e in entries]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    specs = [JumpstartSpec.from_dict(e) for e in entries]
+    spec_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(dicts) == len(specs)
+    assert spec_bytes < dict_bytes
@@ -0,0 +1,106 @@
+"""Tests for link-based staging of local jumpstart sources."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from fabric_jumpstart.utils import (
+    STAGING_MODE_ENV_VAR,
+    _apply_item_prefix,
+    clone_files_to_temp_directory,
+    stage_tree,
+)
+
+
+def _source(tmp_path):
+    src = tmp_path / "src"
+    (src / "Load.Notebook").mkdir(parents=True)
+    (src / "Load.Notebook" / "notebook-content.py").write_text("spark.read.table('Bronze')")
+    (src / "Bronze.Lakehouse").mkdir()
+    (src / "Bronze.Lakehouse" / ".platform").write_text('{"displayName": "Bronze"}')
+    (src / "data").mkdir()
+    (src / "data" / "big.bin").write_bytes(b"\0" * 4096)
+    return src
+
+
+class TestStageTree:
+    """Tests for stage_tree method selection."""
+
+    def test_hardlink_mode_shares_inodes(self, tmp_path):
+        src = _source(tmp_path)
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "hardlink"}):
+            stats = stage_tree(src, dest)
+
+        assert stats["hardlink"] == 3
+        assert stats["bytes_copied"] == 0
+        assert os.path.samefile(src / "data" / "big.bin", dest / "data" / "big.bin")
+
+    def test_copy_mode_copies(self, tmp_path):
+        src = _source(tmp_path)
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "copy"}):
+            stats = stage_tree(src, dest)
+
+        assert stats["copy"] == 3
+        assert stats["bytes_copied"] > 4096
+        assert not os.path.samefile(src / "data" / "big.bin", dest / "data" / "big.bin")
+
+    def test_auto_falls_back_when_links_fail(self, tmp_path):
+        src = _source(tmp_path)
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "auto"}), \
+                patch.dict("fabric_jumpstart.utils._STAGING_METHODS", {
+                    "reflink": _raise_oserror,
+                    "hardlink": _raise_oserror,
+                }):
+            stats = stage_tree(src, dest)
+
+        assert stats["copy"] == 3
+        assert (dest / "Load.Notebook" / "notebook-content.py").read_text() == "spark.read.table('Bronze')"
+
+    def test_symlinks_are_recreated_not_followed(self, tmp_path):
+        src = _source(tmp_path)
+        outside = tmp_path / "outside.txt"
+        outside.write_text("secret")
+        (src / "data" / "loop").symlink_to("..", target_is_directory=True)
+        (src / "data" / "outside.txt").symlink_to(outside)
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "hardlink"}):
+            stats = stage_tree(src, dest)
+
+        assert (stats["hardlink"], stats["symlink"]) == (3, 2)
+        assert os.readlink(dest / "data" / "loop") == ".."
+        assert os.readlink(dest / "data" / "outside.txt") == str(outside)
+        assert outside.stat().st_nlink == 1
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "teleport"}):
+            with pytest.raises(ValueError, match="Unsupported"):
+                stage_tree(tmp_path, tmp_path)
+
+
+def _raise_oserror(src, dst):
+    raise OSError("not supported")
+
+
+def test_prefix_rewrite_breaks_only_modified_links(tmp_path):
+    """Rewriting a hardlinked file leaves the packaged source untouched."""
+    src = _source(tmp_path)
+    with patch.dict(os.environ, {STAGING_MODE_ENV_VAR: "hardlink"}):
+        staged = clone_files_to_temp_directory(src)
+
+    _apply_item_prefix(staged, "js1_x__")
+
+    notebook = staged / "js1_x__Load.Notebook" / "notebook-content.py"
+    assert notebook.read_text() == "spark.read.table('js1_x__Bronze')"
+    assert (src / "Load.Notebook" / "notebook-content.py").read_text() == "spark.read.table('Bronze')"
+    assert not os.path.samefile(notebook, src / "Load.Notebook" / "notebook-content.py")
+    # Untouched files are still shared with the source
+    assert os.path.samefile(staged / "data" / "big.bin", src / "data" / "big.bin")
+    assert not list(staged.rglob("*.jumpstart-tmp"))
@@ -0,0 +1,177 @@
+"""Tests for the UI static asset bundle."""
+
+import base64
+import re
+import sys
+import types
+from unittest.mock import patch
+from xml.etree import ElementTree
+
+import pytest
+
+from fabric_jumpstart.ui import static
+from fabric_jumpstart.ui.catalog import _build_workload_badges, _load_diagram_svg
+from fabric_jumpstart.ui.install_status import render_install_status_html
+
+
+@pytest.fixture
+def compiled_bundle():
+    """Install a generated bundle module as if shipped in a wheel."""
+    bundle = static.build_bundle()
+    module = types.ModuleType("fabric_jumpstart.ui._static_bundle")
+    exec(static.render_bundle_module(bundle), module.__dict__)
+    with patch.dict(sys.modules, {module.__name__: module}):
+        yield bundle
+    static.reload()
+
+
+class TestMinify:
+    """Tests for the conservative CSS/JS minifiers."""
+
+    def test_css_keeps_descendant_pseudo_selectors(self):
+        css = "/* header */\n.a :hover ,\n.b > .c {\n  color: red;\n  margin: 0 auto;\n}\n"
+        assert static.minify_css(css) == ".a :hover,.b > .c{color: red;margin: 0 auto}"
+
+    def test_js_keeps_line_structure(self):
+        js = "// setup\nfunction f() {\n    return 1; // one\n\n}\n"
+        assert static.minify_js(js) == "function f() {\nreturn 1; // one\n}"
+
+    def test_inline_svg_drops_xml_prologue(self):
+        assert static.inline_svg('<?xml version="1.0"?><!-- c --><svg/>') == "<svg/>"
+
+
+_ICON = base64.b64encode(b'<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0h1"/></svg>').decode()
+_DIAGRAM = (
+    '<?xml version="1.0"?><!-- rendered --><svg id="diagram-123-abc" xmlns="http://www.w3.org/2000/svg">\n'
+    '<style>#diagram-123-abc .x{fill:red}</style><metadata>tool</metadata>\n'
+    '<defs><linearGradient id="g-0" x1="0"><stop offset="0"></stop></linearGradient>'
+    '<linearGradient id="g-1" x1="0"><stop offset="0"></stop></linearGradient>'
+    '<marker id="diagram-123-abc_end"><path d="M 0 0 L 10 5 z"></path></marker></defs>'
+    '<rect fill="url(#g-1)"></rect>'
+    '<path d="M0.00,0.00L1.00,1.00L2.00,2.01L3.00,3.00L3.00,5.00" marker-end="url(#diagram-123-abc_end)"></path>'
+    f'<image href="data:image/svg+xml;base64,{_ICON}" width="26" height="26" x="0" y="14"></image>'
+    f'<image href="data:image/svg+xml;base64,{_ICON}" width="26" height="26" x="40" y="14"></image>'
+    '</svg>'
+)
+
+
+class TestMinifySvg:
+    """Tests for diagram SVG minification."""
+
+    def test_output_is_smaller_and_well_formed(self):
+        svg = static.minify_svg(_DIAGRAM)
+        ElementTree.fromstring(svg)
+        assert len(svg) < len(_DIAGRAM)
+        assert "<?xml" not in svg and "<!--" not in svg and "<metadata" not in svg
+
+    def test_collapses_straight_polyline_runs(self):
+        svg = static.minify_svg(_DIAGRAM)
+        assert 'd="M0.00,0.00L3.00,3.00L3.00,5.00"' in svg
+
+    def test_merges_identical_definitions(self):
+        svg = static.minify_svg(_DIAGRAM)
+        assert 'id="g-1"' not in svg and 'fill="url(#g-0)"' in svg
+
+    def test_shares_repeated_icons(self):
+        svg = static.minify_svg(_DIAGRAM)
+        assert svg.count("<image") == 1
+        assert '<use href="#ji0" x="40" y="14"/>' in svg
+        assert "data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg'%3E" in svg
+
+    def test_shortens_root_id_consistently(self):
+        svg = static.minify_svg(_DIAGRAM)
+        assert "diagram-123-abc" not in svg
+        assert '<svg id="j"' in svg and "#j .x" in svg and 'url(#j_end)' in svg and 'id="j_end"' in svg
+
+    def test_real_diagrams_keep_every_reference(self):
+        diagrams_dir = static._REPO_IMAGES_DIR / "diagrams"
+        if not diagrams_dir.is_dir():
+            pytest.skip("repository diagrams not available")
+        for svg_path in sorted(diagrams_dir.glob("*.svg")):
+            svg = static.minify_svg(svg_path.read_text(encoding="utf-8"))
+            ElementTree.fromstring(svg)
+            ids = set(re.findall(r'\sid="([^"]+)"', svg))
+            refs = set(re.findall(r"url\(#([^)]+)\)", svg)) | set(re.findall(r'href="#([^"]+)"', svg))
+            assert refs <= ids, svg_path.name
+
+
+class TestDiagramArchive:
+    """Tests for the compressed diagram archive."""
+
+    def test_archive_round_trip(self, tmp_path):
+        source = tmp_path / "diagrams"
+        source.mkdir()
+        (source / "demo_light.svg").write_text(_DIAGRAM, encoding="utf-8")
+        (source / "demo_dark.svg").write_text(_DIAGRAM, encoding="utf-8")
+        archive = tmp_path / static.DIAGRAM_ARCHIVE_FILENAME
+
+        assert static.build_diagram_archive(source, archive) == 2
+        first = archive.read_bytes()
+        static.build_diagram_archive(source, archive)
+        assert archive.read_bytes() == first
+
+        with patch.object(static, "DIAGRAM_ARCHIVE", archive), patch.object(static, "DIAGRAM_IDS", frozenset({"demo"})):
+            assert static.load_diagram("demo") == static.minify_svg(_DIAGRAM)
+            assert static.load_diagram("demo", "dark") == static.minify_svg(_DIAGRAM)
+            assert static.load_diagram("other") == ""
+
+    def test_source_checkout_minifies_on_read(self):
+        svg = static.load_diagram("retail-sales")
+        assert svg.startswith('<svg id="j"')
+
+
+class TestBundle:
+    """Tests for building, rendering and loading the bundle."""
+
+    def test_source_bundle_contents(self):
+        bundle = static.build_bundle()
+        assert bundle["STYLE_TAG"].startswith("<style>") and "/*" not in bundle["STYLE_TAG"]
+        assert bundle["SCRIPT_TAG"].startswith("<script>")
+        assert bundle["COPY_ICON_SVG"].startswith("<svg")
+        assert all(uri.startswith("data:image/svg+xml;base64,") for uri in bundle["WORKLOAD_ICON_URIS"].values())
+        assert "retail-sales" in bundle["DIAGRAM_IDS"]
+
+    def test_rendered_module_round_trips(self):
+        bundle = static.build_bundle()
+        namespace = {}
+        exec(static.render_bundle_module(bundle), namespace)
+        assert namespace["BUNDLE_VERSION"] == static.BUNDLE_VERSION
+        assert {name: namespace[name] for name in bundle} == bundle
+
+    def test_compiled_bundle_is_used_without_reading_sources(self, compiled_bundle):
+        with patch.object(static, "build_bundle", side_effect=AssertionError("read sources")):
+            static.reload()
+        assert static.STYLE_TAG == compiled_bundle["STYLE_TAG"]
+        assert static.DIAGRAM_ARCHIVE == static._PACKAGED_DIAGRAM_ARCHIVE
+
+    def test_stale_bundle_version_falls_back_to_sources(self, compiled_bundle):
+        stale = patch.object(sys.modules["fabric_jumpstart.ui._static_bundle"], "BUNDLE_VERSION", 0)
+        with stale, patch.object(
+            static, "build_bundle", return_value=dict(compiled_bundle, STYLE_TAG="<style>x</style>")
+        ) as mock_build:
+            static.reload()
+        mock_build.assert_called_once()
+        assert static.STYLE_TAG == "<style>x</style>"
+
+
+class TestUiUsesBundle:
+    """Tests that the UI modules render from the bundle."""
+
+    def test_workload_badges_use_pre_encoded_icons(self):
+        with patch.dict(static.WORKLOAD_ICON_URIS, {"power-bi.svg": "data:bundled"}):
+            assert _build_workload_badges(["Power BI"]) == [("Power BI", "data:bundled")]
+
+    def test_unlisted_diagram_is_not_probed(self):
+        _load_diagram_svg.cache_clear()
+        with patch.object(static, "DIAGRAM_IDS", frozenset()), patch.object(static, "DIAGRAMS_DIR") as mock_dir:
+            assert _load_diagram_svg("retail-sales") == ""
+        mock_dir.__truediv__.assert_not_called()
+        _load_diagram_svg.cache_clear()
+        assert _load_diagram_svg("retail-sales").startswith("data:image/svg+xml;base64,")
+
+    def test_install_status_embeds_style_once(self):
+        html = render_install_status_html(
+            status="success", jumpstart_name="Demo", type="Demo", workspace_id="ws",
+            entry_point=None, minutes_complete=None, minutes_deploy=None,
+        )
+        assert html.count("<style>") == 1
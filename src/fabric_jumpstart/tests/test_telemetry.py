@@ -4,14 +4,19 @@ import hashlib
 import json
 from unittest.mock import MagicMock, patch
 
+import fabric_jumpstart.telemetry as telemetry
 from fabric_jumpstart.telemetry import (
     _USER_HASH_SALT,
     _build_envelope,
+    _build_install_properties,
     _hash_user_id,
     _resolve_user_hash,
-    _track_install_worker,
+    _send,
+    _TelemetrySender,
 )
 
+_ENDPOINT = "https://example.com"
+
 
 class TestHashUserId:
     """Tests for _hash_user_id."""
@@ -156,143 +161,176 @@ class TestBuildEnvelope:
         assert envelope["data"]["baseData"]["properties"]["prop1"] == "val1"
 
 
-class TestTrackInstallWorker:
-    """Tests for _track_install_worker (the daemon thread function)."""
+class TestBuildInstallProperties:
+    """Tests for _build_install_properties."""
+
+    def test_required_properties(self):
+        """Core properties are always present and stringified."""
+        props = _build_install_properties("test-js", 42, "Demo", "success")
+        assert props == {
+            "jumpstart_id": "test-js",
+            "jumpstart_numeric_id": "42",
+            "type": "Demo",
+            "status": "success",
+        }
+
+    def test_includes_optional_properties(self):
+        """duration_seconds, install_mode and non_registered_install are included when set."""
+        props = _build_install_properties(
+            "test-js", 42, "Demo", "success",
+            duration_seconds=15.3, install_mode="update", non_registered_install=True,
+        )
+        assert props["duration_seconds"] == "15.3"
+        assert props["install_mode"] == "update"
+        assert props["non_registered_install"] == "true"
 
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_includes_user_hash_in_payload(self, mock_resolve, mock_send):
-        """Worker includes user hash in the sent envelope."""
-        mock_resolve.return_value = "hashed_user_id"
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
+    def test_omits_optional_properties_when_unset(self):
+        """Optional properties are omitted when not provided."""
+        props = _build_install_properties("test-js", 42, "Demo", "success")
+        assert "duration_seconds" not in props
+        assert "install_mode" not in props
+        assert "non_registered_install" not in props
 
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="success",
-        )
 
-        mock_send.assert_called_once()
-        endpoint, payload_bytes = mock_send.call_args[0]
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        assert payload["tags"]["ai.user.id"] == "hashed_user_id"
-
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_sends_without_tags_when_hash_unavailable(self, mock_resolve, mock_send):
-        """Worker sends event without tags when user hash is None."""
-        mock_resolve.return_value = None
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="failure",
-        )
+class TestSend:
+    """Tests for _send status handling."""
 
-        mock_send.assert_called_once()
-        endpoint, payload_bytes = mock_send.call_args[0]
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        assert "tags" not in payload
-
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_does_not_send_without_ikey(self, mock_resolve, mock_send):
-        """Worker does nothing if connection string has no instrumentation key."""
-        conn_str = "IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=1,
-            jumpstart_type="Tutorial",
-            status="success",
-        )
+    @patch("fabric_jumpstart.http_client.get_http_client")
+    def test_posts_without_in_call_retries(self, mock_get_client):
+        mock_get_client.return_value.post.return_value = MagicMock(status_code=200)
 
-        mock_send.assert_not_called()
+        assert _send(_ENDPOINT, b"[]") is True
+        kwargs = mock_get_client.return_value.post.call_args[1]
+        assert kwargs["retries"] == 0
+        assert kwargs["data"] == b"[]"
 
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_includes_duration_in_properties(self, mock_resolve, mock_send):
-        """Worker includes duration_seconds in event properties."""
-        mock_resolve.return_value = None
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="success",
-            duration_seconds=15.3,
-        )
+    @patch("fabric_jumpstart.http_client.get_http_client")
+    def test_retryable_statuses_are_spooled(self, mock_get_client):
+        for status, expected in [(400, True), (429, False), (503, False)]:
+            mock_get_client.return_value.post.return_value = MagicMock(status_code=status)
+            assert _send(_ENDPOINT, b"[]") is expected
 
-        mock_send.assert_called_once()
-        _, payload_bytes = mock_send.call_args[0]
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        assert payload["data"]["baseData"]["properties"]["duration_seconds"] == "15.3"
-
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_omits_duration_when_none(self, mock_resolve, mock_send):
-        """Worker omits duration_seconds from properties when not provided."""
-        mock_resolve.return_value = None
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="success",
-        )
+    @patch("fabric_jumpstart.http_client.get_http_client")
+    def test_network_error_is_spooled(self, mock_get_client):
+        mock_get_client.return_value.post.side_effect = OSError("offline")
+        assert _send(_ENDPOINT, b"[]") is False
 
-        mock_send.assert_called_once()
-        _, payload_bytes = mock_send.call_args[0]
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        assert "duration_seconds" not in payload["data"]["baseData"]["properties"]
-
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_includes_install_mode_in_properties(self, mock_resolve, mock_send):
-        """Worker includes install_mode in event properties."""
-        mock_resolve.return_value = None
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="success",
-            install_mode="update",
-        )
+
+class TestTelemetrySender:
+    """Tests for the batching background sender."""
+
+    @patch("fabric_jumpstart.telemetry._send", return_value=True)
+    @patch("fabric_jumpstart.telemetry._get_user_hash", return_value="hashed_user_id")
+    def test_batches_events_into_one_post(self, _mock_hash, mock_send, tmp_path):
+        """Events queued together are sent as a single JSON array."""
+        sender = _TelemetrySender(spool_dir=tmp_path)
+        for status in ("success", "failure", "success"):
+            sender.enqueue(_ENDPOINT, "test-key", "jumpstart_installed", {"status": status})
+
+        assert sender.flush(timeout=5)
 
         mock_send.assert_called_once()
-        _, payload_bytes = mock_send.call_args[0]
+        endpoint, payload_bytes = mock_send.call_args[0]
         payload = json.loads(payload_bytes.decode("utf-8"))
-        assert payload["data"]["baseData"]["properties"]["install_mode"] == "update"
-
-    @patch("fabric_jumpstart.telemetry._send")
-    @patch("fabric_jumpstart.telemetry._resolve_user_hash")
-    def test_omits_install_mode_when_none(self, mock_resolve, mock_send):
-        """Worker omits install_mode from properties when not provided."""
-        mock_resolve.return_value = None
-        conn_str = "InstrumentationKey=test-key;IngestionEndpoint=https://example.com"
-
-        _track_install_worker(
-            conn_str=conn_str,
-            jumpstart_id="test-js",
-            jumpstart_numeric_id=42,
-            jumpstart_type="Demo",
-            status="success",
-        )
+        assert endpoint == _ENDPOINT
+        assert [e["data"]["baseData"]["properties"]["status"] for e in payload] == [
+            "success", "failure", "success",
+        ]
+        assert all(e["tags"]["ai.user.id"] == "hashed_user_id" for e in payload)
+
+    @patch("fabric_jumpstart.telemetry._send", return_value=True)
+    @patch("fabric_jumpstart.telemetry._get_user_hash", return_value=None)
+    def test_sends_without_tags_when_hash_unavailable(self, _mock_hash, mock_send, tmp_path):
+        """Envelopes have no tags when the user hash is unavailable."""
+        sender = _TelemetrySender(spool_dir=tmp_path)
+        sender.enqueue(_ENDPOINT, "test-key", "jumpstart_installed", {"status": "failure"})
+        assert sender.flush(timeout=5)
+
+        payload = json.loads(mock_send.call_args[0][1].decode("utf-8"))
+        assert "tags" not in payload[0]
+
+    @patch("fabric_jumpstart.telemetry._send", return_value=False)
+    @patch("fabric_jumpstart.telemetry._get_user_hash", return_value=None)
+    def test_failed_batch_is_spooled_and_retried(self, _mock_hash, mock_send, tmp_path):
+        """Undelivered batches are written to the spool and sent on the next start."""
+        sender = _TelemetrySender(spool_dir=tmp_path)
+        sender.enqueue(_ENDPOINT, "test-key", "jumpstart_installed", {"status": "success"})
+        sender.flush(timeout=5)
+
+        spooled = list(tmp_path.glob("*.json"))
+        assert len(spooled) == 1
+        assert json.loads(spooled[0].read_text())["endpoint"] == _ENDPOINT
+
+        mock_send.reset_mock()
+        mock_send.return_value = True
+        retry_sender = _TelemetrySender(spool_dir=tmp_path)
+        retry_sender._drain_spool()
 
         mock_send.assert_called_once()
-        _, payload_bytes = mock_send.call_args[0]
-        payload = json.loads(payload_bytes.decode("utf-8"))
-        assert "install_mode" not in payload["data"]["baseData"]["properties"]
+        assert list(tmp_path.glob("*.json")) == []
+
+    @patch("fabric_jumpstart.telemetry._send", return_value=True)
+    def test_drops_events_when_queue_full(self, _mock_send, tmp_path):
+        """A full queue drops events instead of blocking the caller."""
+        sender = _TelemetrySender(spool_dir=tmp_path, maxsize=1)
+        with patch.object(sender, "_ensure_started"):
+            assert sender.enqueue(_ENDPOINT, "k", "e", {}) is True
+            assert sender.enqueue(_ENDPOINT, "k", "e", {}) is False
+        assert sender.dropped == 1
+
+    @patch("fabric_jumpstart.telemetry._send", return_value=True)
+    def test_flush_spools_unsent_events_after_deadline(self, mock_send, tmp_path):
+        """Events still queued at the flush deadline are spooled, not lost."""
+        sender = _TelemetrySender(spool_dir=tmp_path)
+        with patch.object(sender, "_ensure_started"):
+            sender.enqueue(_ENDPOINT, "test-key", "jumpstart_installed", {"status": "success"})
+        assert sender.flush(timeout=0.1) is False
+        mock_send.assert_not_called()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+class TestTrackInstall:
+    """Tests for track_install."""
+
+    def test_uses_single_sender_for_many_events(self):
+        """All events go through the process-wide sender (no thread per event)."""
+        sender = MagicMock()
+        with patch("fabric_jumpstart.telemetry._get_sender", return_value=sender), \
+                patch("fabric_jumpstart.telemetry._get_connection_string",
+                      return_value="InstrumentationKey=test-key;IngestionEndpoint=https://example.com"):
+            for _ in range(5):
+                telemetry.track_install("test-js", 1, "Demo", "success")
+
+        assert sender.enqueue.call_count == 5
+        endpoint, ikey, event_name, props = sender.enqueue.call_args[0]
+        assert (endpoint, ikey, event_name) == ("https://example.com", "test-key", "jumpstart_installed")
+        assert props["jumpstart_id"] == "test-js"
+
+    def test_does_not_queue_without_ikey(self):
+        """Nothing is queued if the connection string has no instrumentation key."""
+        with patch("fabric_jumpstart.telemetry._get_sender") as mock_get_sender, \
+                patch("fabric_jumpstart.telemetry._get_connection_string",
+                      return_value="IngestionEndpoint=https://example.com"):
+            telemetry.track_install("test-js", 1, "Tutorial", "success")
+        mock_get_sender.assert_not_called()
+
+
+class TestGetUserHash:
+    """Tests for the per-process user hash cache."""
+
+    def test_resolves_once(self):
+        """The token is only decoded once per process."""
+        with patch.object(telemetry, "_user_hash_resolved", False), \
+                patch.object(telemetry, "_user_hash", None), \
+                patch("fabric_jumpstart.telemetry._resolve_user_hash", return_value="h") as mock_resolve:
+            assert telemetry._get_user_hash() == "h"
+            assert telemetry._get_user_hash() == "h"
+        mock_resolve.assert_called_once()
+
+    def test_no_resolution_on_exit_path(self):
+        """resolve=False never acquires a token."""
+        with patch.object(telemetry, "_user_hash_resolved", False), \
+                patch.object(telemetry, "_user_hash", None), \
+                patch("fabric_jumpstart.telemetry._resolve_user_hash") as mock_resolve:
+            assert telemetry._get_user_hash(resolve=False) is None
+        mock_resolve.assert_not_called()
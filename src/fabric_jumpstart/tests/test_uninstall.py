@@ -0,0 +1,196 @@
+"""Tests for install manifests and manifest-driven uninstall."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fabric_jumpstart.core import jumpstart
+from fabric_jumpstart.installer import JumpstartInstaller
+from fabric_jumpstart.manifest import get_manifest_store, merge_manifests, new_manifest
+from fabric_jumpstart.uninstall import format_uninstall_report, plan_deletions, uninstall_manifest
+
+
+def _manifest(files=None):
+    manifest = new_manifest("demo", "ws-1", repo_ref="v1")
+    manifest["items"] = [
+        {"type": "Lakehouse", "name": "Bronze", "id": "lh-1", "preexisting": False},
+        {"type": "Notebook", "name": "Load", "id": "nb-1", "preexisting": False},
+        {"type": "SemanticModel", "name": "Model", "id": "sm-1", "preexisting": False},
+        {"type": "Report", "name": "Dash", "id": "rp-1", "preexisting": False},
+        {"type": "Notebook", "name": "Shared", "id": "nb-2", "preexisting": True},
+    ]
+    manifest["files"] = files or []
+    return manifest
+
+
+def _response(status):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = ""
+    return resp
+
+
+class TestPlanDeletions:
+    """Tests for deletion ordering and scoping."""
+
+    def test_dependents_are_deleted_before_dependencies(self):
+        tiers, _, kept = plan_deletions(_manifest())
+        order = [[i["type"] for i in tier] for tier in tiers]
+        assert order == [["Report"], ["SemanticModel"], ["Notebook"], ["Lakehouse"]]
+        assert [i["name"] for i in kept] == ["Shared"]
+
+    def test_include_preexisting(self):
+        tiers, _, kept = plan_deletions(_manifest(), include_preexisting=True)
+        assert kept == []
+        assert {i["name"] for i in tiers[2]} == {"Load", "Shared"}
+
+    def test_files_skipped_when_their_lakehouse_is_deleted(self):
+        files = [
+            {"lakehouse_id": "lh-1", "lakehouse_name": "Bronze", "paths": ["a.csv"]},
+            {"lakehouse_id": "lh-other", "lakehouse_name": "Existing", "paths": ["b.csv"]},
+        ]
+        _, planned_files, _ = plan_deletions(_manifest(files))
+        assert [f["lakehouse_id"] for f in planned_files] == ["lh-other"]
+
+
+class TestUninstallManifest:
+    """Tests for executing an uninstall."""
+
+    @patch("fabric_jumpstart.uninstall.get_http_client")
+    def test_dry_run_sends_nothing(self, mock_get_client):
+        report = uninstall_manifest(_manifest(), dry_run=True)
+        mock_get_client.assert_not_called()
+        assert [i["status"] for i in report["items"]] == ["planned"] * 4
+        assert "Would delete" in format_uninstall_report(report)
+
+    @patch("fabric_jumpstart.uninstall.get_http_client")
+    def test_deletes_in_tier_order_and_removes_manifest(self, mock_get_client):
+        store = get_manifest_store()
+        manifest = _manifest()
+        manifest["items"] = [i for i in manifest["items"] if not i["preexisting"]]
+        store.save(manifest)
+        client = mock_get_client.return_value
+        client.delete.side_effect = lambda url, **kw: _response(404 if url.endswith("nb-1") else 200)
+
+        report = uninstall_manifest(manifest)
+
+        urls = [c.args[0] for c in client.delete.call_args_list]
+        assert [u.rsplit("/", 1)[-1] for u in urls] == ["rp-1", "sm-1", "nb-1", "lh-1"]
+        statuses = {i["name"]: i["status"] for i in report["items"]}
+        assert statuses == {"Dash": "deleted", "Model": "deleted", "Load": "missing", "Bronze": "deleted"}
+        assert report["failed"] == 0
+        assert len(report["timings"]["tiers"]) == 4
+        assert store.load("ws-1", "demo") is None
+
+    @patch("fabric_jumpstart.uninstall.get_http_client")
+    def test_failures_and_kept_items_stay_in_manifest(self, mock_get_client):
+        store = get_manifest_store()
+        store.save(_manifest())
+        client = mock_get_client.return_value
+        client.delete.side_effect = lambda url, **kw: _response(500 if url.endswith("sm-1") else 200)
+
+        report = uninstall_manifest(_manifest())
+
+        assert report["failed"] == 1
+        saved = store.load("ws-1", "demo")
+        assert saved is not None
+        remaining = {i["name"] for i in saved["items"]}
+        assert remaining == {"Model", "Shared"}
+
+    @patch("fabric_jumpstart.utils._onelake_files_path", return_value="https://onelake/files")
+    @patch("fabric_jumpstart.uninstall.get_http_client")
+    def test_files_in_kept_lakehouse_are_deleted(self, mock_get_client, mock_files_path):
+        manifest = _manifest([{"lakehouse_id": "lh-x", "lakehouse_name": "Existing", "paths": ["a.csv", "b.csv"]}])
+        client = mock_get_client.return_value
+        client.delete.return_value = _response(200)
+
+        report = uninstall_manifest(manifest)
+
+        file_urls = {c.args[0] for c in client.delete.call_args_list if c.args[0].startswith("https://onelake")}
+        assert file_urls == {"https://onelake/files/a.csv", "https://onelake/files/b.csv"}
+        assert [f["status"] for f in report["files"]] == ["deleted", "deleted"]
+        mock_files_path.assert_called_once()
+
+
+class TestManifestRecording:
+    """Tests for building and merging manifests."""
+
+    def test_installer_records_deployed_items_and_files(self):
+        installer = JumpstartInstaller(
+            {"id": 1, "logical_id": "demo", "source": {"repo_ref": "v1"}}, workspace_id="ws-1", instance_name="js"
+        )
+        installer.existing_items = ["Shared.Notebook"]
+        installer.deployed_workspaces = [
+            MagicMock(repository_items={
+                "Notebook": {"Load": SimpleNamespace(guid="nb-1"), "Shared": SimpleNamespace(guid="nb-2")},
+                "Lakehouse": {"Unpublished": SimpleNamespace(guid="")},
+            })
+        ]
+        installer.uploaded_files = {"lakehouse_id": "lh-1", "lakehouse_name": "Bronze", "paths": ["raw/a.csv"]}
+
+        manifest = installer.build_manifest(prefix=None)
+
+        items = {i["name"]: i for i in manifest["items"]}
+        assert set(items) == {"Load", "Shared"}
+        assert items["Shared"]["preexisting"] is True
+        assert manifest["files"] == [{"lakehouse_id": "lh-1", "lakehouse_name": "Bronze", "paths": ["raw/a.csv"]}]
+
+    def test_merge_keeps_original_ownership(self):
+        first = _manifest()
+        second = new_manifest("demo", "ws-1")
+        second["items"] = [{"type": "Notebook", "name": "Load", "id": "nb-9", "preexisting": True}]
+
+        merged = merge_manifests(first, second)
+
+        load = next(i for i in merged["items"] if i["name"] == "Load")
+        assert load == {"type": "Notebook", "name": "Load", "id": "nb-9", "preexisting": False}
+        assert len(merged["items"]) == 5
+
+
+class TestUninstallApi:
+    """Tests for jumpstart.uninstall."""
+
+    def test_unknown_manifest_raises(self):
+        with pytest.raises(ValueError, match="No install manifest"):
+            jumpstart().uninstall("demo", workspace_id="ws-1")
+
+    def test_batch_returns_one_report_per_pair(self):
+        store = get_manifest_store()
+        for ws in ("ws-1", "ws-2"):
+            manifest = _manifest()
+            manifest["workspace_id"] = ws
+            store.save(manifest)
+
+        reports = jumpstart().uninstall(["demo"], workspace_id=["ws-1", "ws-2"], dry_run=True)
+
+        assert [r["workspace_id"] for r in reports] == ["ws-1", "ws-2"]
+        assert all(r["dry_run"] for r in reports)
+
+    def test_batch_runs_a_bounded_number_of_uninstalls_at_once(self):
+        store = get_manifest_store()
+        workspaces = [f"ws-{i}" for i in range(10)]
+        for ws in workspaces:
+            manifest = _manifest()
+            manifest["workspace_id"] = ws
+            store.save(manifest)
+        lock = threading.Lock()
+        running, peak = 0, 0
+
+        def _tracked(manifest, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return uninstall_manifest(manifest, **kwargs)
+
+        with patch("fabric_jumpstart.uninstall.uninstall_manifest", side_effect=_tracked):
+            reports = jumpstart().uninstall(["demo"], workspace_id=workspaces, dry_run=True)
+
+        assert len(reports) == 10
+        assert peak <= 4
@@ -46,20 +46,15 @@ def _mock_response(status_code, text=""):
 class TestUploadFilesToLakehouse:
     """Tests for the upload_files_to_lakehouse utility function."""
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
-    def test_upload_single_file(self, mock_requests, mock_cred, _mock_rt, tmp_path):
+    @patch("fabric_jumpstart.utils.get_http_client")
+    def test_upload_single_file(self, mock_get_client, tmp_path):
         """A single file triggers exactly one create + append + flush cycle."""
+        mock_client = mock_get_client.return_value
         single_file = tmp_path / "data.csv"
         single_file.write_text("a,b,c")
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
-
-        mock_requests.put.return_value = _mock_response(201)
-        mock_requests.patch.side_effect = [
+        mock_client.put.return_value = _mock_response(201)
+        mock_client.patch.side_effect = [
             _mock_response(202),  # append
             _mock_response(200),  # flush
         ]
@@ -67,30 +62,25 @@ class TestUploadFilesToLakehouse:
         count = upload_files_to_lakehouse(MagicMock(), "lh-1", single_file)
 
         assert count == 1
-        mock_requests.put.assert_called_once()
-        assert mock_requests.patch.call_count == 2
+        mock_client.put.assert_called_once()
+        assert mock_client.patch.call_count == 2
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
+    @patch("fabric_jumpstart.utils.get_http_client")
     def test_upload_folder_recursively(
-        self, mock_requests, mock_cred, _mock_rt, tmp_path
+        self, mock_get_client, tmp_path
     ):
         """A folder with nested files uploads all files recursively."""
+        mock_client = mock_get_client.return_value
         (tmp_path / "sub").mkdir()
         (tmp_path / "a.csv").write_text("1")
         (tmp_path / "sub" / "b.csv").write_text("2")
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
-
-        mock_requests.put.return_value = _mock_response(201)
-        mock_requests.patch.return_value = _mock_response(202)
+        mock_client.put.return_value = _mock_response(201)
+        mock_client.patch.return_value = _mock_response(202)
         # flush needs status 200
-        mock_requests.patch.side_effect = None
+        mock_client.patch.side_effect = None
         # We need alternating 202/200 for each file (append then flush)
-        mock_requests.patch.side_effect = [
+        mock_client.patch.side_effect = [
             _mock_response(202),
             _mock_response(200),  # file 1
             _mock_response(202),
@@ -100,58 +90,46 @@ class TestUploadFilesToLakehouse:
         count = upload_files_to_lakehouse(MagicMock(), "lh-1", tmp_path)
 
         assert count == 2
-        assert mock_requests.put.call_count == 2
+        assert mock_client.put.call_count == 2
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
+    @patch("fabric_jumpstart.utils.get_http_client")
     def test_upload_with_destination_path(
-        self, mock_requests, mock_cred, _mock_rt, tmp_path
+        self, mock_get_client, tmp_path
     ):
         """destination_path is included in the upload URL."""
+        mock_client = mock_get_client.return_value
         f = tmp_path / "file.json"
         f.write_text("{}")
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
-
-        mock_requests.put.return_value = _mock_response(201)
-        mock_requests.patch.side_effect = [_mock_response(202), _mock_response(200)]
+        mock_client.put.return_value = _mock_response(201)
+        mock_client.patch.side_effect = [_mock_response(202), _mock_response(200)]
 
-        mock_ws = MagicMock()
-        mock_ws.endpoint.invoke.return_value = {
-            "body": {"properties": {"oneLakeFilesPath": "https://onelake.dfs.fabric.microsoft.com/ws-1/lh-1/Files"}}
+        mock_client.get_json.return_value = {
+            "properties": {"oneLakeFilesPath": "https://onelake.dfs.fabric.microsoft.com/ws-1/lh-1/Files"}
         }
-        upload_files_to_lakehouse(mock_ws, "lh-1", f, destination_path="ref-data")
+        upload_files_to_lakehouse(MagicMock(), "lh-1", f, destination_path="ref-data")
 
-        put_url = mock_requests.put.call_args[0][0]
+        put_url = mock_client.put.call_args[0][0]
         assert "/Files/ref-data/file.json" in put_url
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
+    @patch("fabric_jumpstart.utils.get_http_client")
     def test_upload_empty_destination_path(
-        self, mock_requests, mock_cred, _mock_rt, tmp_path
+        self, mock_get_client, tmp_path
     ):
         """Empty destination_path uploads to the root of Files/."""
+        mock_client = mock_get_client.return_value
         f = tmp_path / "file.json"
         f.write_text("{}")
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
+        mock_client.put.return_value = _mock_response(201)
+        mock_client.patch.side_effect = [_mock_response(202), _mock_response(200)]
 
-        mock_requests.put.return_value = _mock_response(201)
-        mock_requests.patch.side_effect = [_mock_response(202), _mock_response(200)]
-
-        mock_ws = MagicMock()
-        mock_ws.endpoint.invoke.return_value = {
-            "body": {"properties": {"oneLakeFilesPath": "https://onelake.dfs.fabric.microsoft.com/ws-1/lh-1/Files"}}
+        mock_client.get_json.return_value = {
+            "properties": {"oneLakeFilesPath": "https://onelake.dfs.fabric.microsoft.com/ws-1/lh-1/Files"}
         }
-        upload_files_to_lakehouse(mock_ws, "lh-1", f, destination_path="")
+        upload_files_to_lakehouse(MagicMock(), "lh-1", f, destination_path="")
 
-        put_url = mock_requests.put.call_args[0][0]
+        put_url = mock_client.put.call_args[0][0]
         assert put_url.endswith("/Files/file.json")
 
     def test_upload_source_not_found_raises(self, tmp_path):
@@ -159,43 +137,33 @@ class TestUploadFilesToLakehouse:
         with pytest.raises(FileNotFoundError):
             upload_files_to_lakehouse(MagicMock(), "lh-1", tmp_path / "nope")
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
+    @patch("fabric_jumpstart.utils.get_http_client")
     def test_upload_create_failure_raises(
-        self, mock_requests, mock_cred, _mock_rt, tmp_path
+        self, mock_get_client, tmp_path
     ):
         """A non-201/409 status on file create raises RuntimeError."""
+        mock_client = mock_get_client.return_value
         f = tmp_path / "file.csv"
         f.write_text("x")
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
-
-        mock_requests.put.return_value = _mock_response(403, "Forbidden")
+        mock_client.put.return_value = _mock_response(403, "Forbidden")
 
         with pytest.raises(RuntimeError, match="Failed to create file"):
             upload_files_to_lakehouse(MagicMock(), "lh-1", f)
 
-    @patch("fabric_jumpstart.utils._is_fabric_runtime", return_value=False)
-    @patch("fabric_jumpstart.utils.resolve_token_credential")
-    @patch("fabric_jumpstart.utils.requests")
+    @patch("fabric_jumpstart.utils.get_http_client")
     def test_upload_empty_folder_returns_zero(
-        self, mock_requests, mock_cred, _mock_rt, tmp_path
+        self, mock_get_client, tmp_path
     ):
         """An empty directory results in 0 uploads."""
+        mock_client = mock_get_client.return_value
         empty_dir = tmp_path / "empty"
         empty_dir.mkdir()
 
-        cred = MagicMock()
-        cred.get_token.return_value = MagicMock(token="tok")
-        mock_cred.return_value = cred
-
         count = upload_files_to_lakehouse(MagicMock(), "lh-1", empty_dir)
 
         assert count == 0
-        mock_requests.put.assert_not_called()
+        mock_client.put.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -311,6 +279,28 @@ class TestInstallerUploadFiles:
         _, kwargs = mock_upload.call_args
         assert kwargs["destination_path"] == ""
 
+    @patch("fabric_jumpstart.installer.upload_files_to_lakehouse")
+    @patch("fabric_jumpstart.installer.upload_git_tree_to_lakehouse", return_value=4)
+    @patch(
+        "fabric_cicd._parameter._utils._extract_item_attribute", return_value="lh-id"
+    )
+    def test_streams_from_git_when_not_checked_out(self, mock_extract, mock_git_upload, mock_upload, tmp_path):
+        """Data left out of the sparse checkout is read from the object store."""
+        config = _make_config(
+            files_source_path="data/",
+            files_destination_lakehouse="MyLH",
+        )
+        installer = JumpstartInstaller(config, workspace_id="ws-1", instance_name="js")
+        installer.working_repo_path = tmp_path
+        installer.files_in_git_only = True
+
+        assert installer.upload_files(MagicMock(), prefix=None) == 4
+
+        mock_upload.assert_not_called()
+        _, kwargs = mock_git_upload.call_args
+        assert kwargs["repo_dir"] == tmp_path
+        assert kwargs["tree_path"] == "data/"
+
 
 # ---------------------------------------------------------------------------
 # Group 3: Schema validation (schemas.py)
@@ -0,0 +1,222 @@
+"""Tests for runtime registry validation."""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from fabric_jumpstart.registry import JumpstartRegistry
+from fabric_jumpstart.validation import (
+    RegistryValidationError,
+    get_validation_cache,
+    validate_entry,
+)
+
+from .schemas import Jumpstart
+from .test_registry import load_registry_data
+
+
+def _entry(**overrides):
+    entry = {
+        "id": 1,
+        "logical_id": "demo",
+        "name": "Demo",
+        "description": "Streams events into an Eventhouse.",
+        "date_added": "01/01/2025",
+        "workload_tags": ["Data Engineering"],
+        "scenario_tags": ["Streaming"],
+        "source": {"workspace_path": "src/"},
+        "items_in_scope": ["Notebook"],
+        "entry_point": "Explore.Notebook",
+        "owner_email": "owner@example.com",
+    }
+    entry.update(overrides)
+    return entry
+
+
+def _write_catalog(root, entries, folder="community"):
+    target = root / folder
+    target.mkdir(parents=True, exist_ok=True)
+    for entry in entries:
+        (target / f"{entry['logical_id']}.yml").write_text(yaml.safe_dump(entry), encoding="utf-8")
+    return root
+
+
+_INVALID_VARIANTS = {
+    "negative id": {"id": -1},
+    "bad slug": {"logical_id": "Not_A_Slug"},
+    "long description": {"description": "x" * 351},
+    "description repeats name": {"description": "Demo streams events."},
+    "bad date": {"date_added": "2025-01-01"},
+    "bad email": {"owner_email": "owner@example"},
+    "bad entry point": {"entry_point": "Explore.Spreadsheet"},
+    "unknown workload": {"workload_tags": ["Gardening"]},
+    "empty scenarios": {"scenario_tags": []},
+    "unknown type": {"type": "Workshop"},
+    "missing items_in_scope": {"items_in_scope": None},
+    "unknown item": {"items_in_scope": ["Spreadsheet"]},
+    "negative minutes": {"minutes_to_deploy": -5},
+    "bad difficulty": {"difficulty": "Expert"},
+    "unknown field": {"colour": "blue"},
+    "repo without ref": {"source": {"workspace_path": "src/", "repo_url": "https://example.com/r.git"}},
+    "half a file upload": {"source": {"workspace_path": "src/", "files_source_path": "data/"}},
+}
+
+# Edge cases where a lax or partial copy of the schema would drift from it.
+_EDGE_VARIANTS = {
+    "id as string": {"id": "3"},
+    "id as bool": {"id": True},
+    "id as float": {"id": 1.0},
+    "name as number": {"name": 5},
+    "single-digit date": {"date_added": "1/2/2025"},
+    "impossible date": {"date_added": "02/31/2025"},
+    "two-digit year": {"date_added": "01/01/25"},
+    "email with two ats": {"owner_email": "a@b@c.d"},
+    "listing as string": {"include_in_listing": "yes"},
+    "listing as number": {"include_in_listing": 1},
+    "listing unset": {"include_in_listing": None},
+    "core as string": {"core": "true"},
+    "type unset": {"type": None},
+    "no items in scope": {"items_in_scope": []},
+    "items as string": {"items_in_scope": "Notebook"},
+    "flags as string": {"feature_flags": "enable_x"},
+    "flags as numbers": {"feature_flags": [1]},
+    "flags": {"feature_flags": ["enable_x"]},
+    "minutes as string": {"minutes_to_deploy": "5"},
+    "minutes as list": {"minutes_to_deploy": [5]},
+    "minutes blank": {"minutes_to_deploy": ""},
+    "docs uri as number": {"jumpstart_docs_uri": 5},
+    "tags as string": {"workload_tags": "Data Engineering"},
+    "url entry point": {"entry_point": "https://example.com"},
+    "padded entry point": {"entry_point": " Explore.Notebook "},
+    "nameless entry point": {"entry_point": ".Notebook"},
+    "description at limit": {"description": "x" * 350},
+    "description repeats padded name": {"description": "  demo streams events."},
+    "unknown source field": {"source": {"workspace_path": "src/", "colour": "blue"}},
+    "source as string": {"source": "src/"},
+    "workspace path as number": {"source": {"workspace_path": 5}},
+    "repo url as number": {"source": {"workspace_path": "src/", "repo_url": 5, "repo_ref": "v1"}},
+    "blank repo ref": {"source": {"workspace_path": "src/", "repo_url": "https://example.com/r.git", "repo_ref": " "}},
+    "remote source": {"source": {"workspace_path": "src/", "repo_url": "https://example.com/r.git", "repo_ref": "v1"}},
+    "file upload": {"source": {"workspace_path": "src/", "files_source_path": "data/", "files_destination_lakehouse": "Bronze"}},
+}
+
+
+def _schema_accepts(entry):
+    try:
+        Jumpstart(**copy.deepcopy(entry))
+    except ValidationError:
+        return False
+    return True
+
+
+class TestValidateEntry:
+    """Tests for the per-entry rules."""
+
+    def test_shipped_registry_is_valid(self):
+        for entry in load_registry_data():
+            assert validate_entry(entry) == [], entry["logical_id"]
+
+    @pytest.mark.parametrize("overrides", _INVALID_VARIANTS.values(), ids=list(_INVALID_VARIANTS))
+    def test_agrees_with_test_schema(self, overrides):
+        entry = _entry(**overrides)
+        with pytest.raises(ValidationError):
+            Jumpstart(**copy.deepcopy(entry))
+        assert validate_entry(entry)
+
+    @pytest.mark.parametrize("entry", load_registry_data(), ids=lambda e: e["logical_id"])
+    def test_shipped_registry_verdicts_match_test_schema(self, entry):
+        assert (validate_entry(entry) == []) == _schema_accepts(entry)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        list(_INVALID_VARIANTS.values()) + list(_EDGE_VARIANTS.values()),
+        ids=list(_INVALID_VARIANTS) + list(_EDGE_VARIANTS),
+    )
+    def test_verdicts_match_test_schema(self, overrides):
+        entry = _entry(**overrides)
+        assert (validate_entry(entry) == []) == _schema_accepts(entry), validate_entry(entry)
+
+    def test_reports_every_error_at_once(self):
+        errors = validate_entry(_entry(id=0, owner_email="nobody", difficulty="Expert", description=None))
+        assert len(errors) == 4
+        assert errors[0].startswith("missing required field(s): description")
+
+    def test_optional_fields_may_be_omitted(self):
+        Jumpstart(**_entry())
+        assert validate_entry(_entry()) == []
+
+
+class TestRegistryLoadValidation:
+    """Tests for validation inside JumpstartRegistry.load."""
+
+    def test_strict_load_raises_with_all_failures(self, tmp_path):
+        _write_catalog(tmp_path, [
+            _entry(),
+            _entry(id=2, logical_id="broken", owner_email="nobody"),
+            _entry(id=1, logical_id="clash", difficulty="Expert"),
+        ])
+
+        with pytest.raises(RegistryValidationError) as exc:
+            JumpstartRegistry(tmp_path).load()
+
+        errors = {k.rsplit("/", 1)[-1]: v for k, v in exc.value.errors.items()}
+        assert set(errors) == {"broken.yml", "clash.yml"}
+        assert "owner_email" in errors["broken.yml"][0]
+        assert "difficulty" in errors["clash.yml"][0]
+
+    def test_duplicate_ids_across_files(self, tmp_path):
+        _write_catalog(tmp_path, [_entry(), _entry(logical_id="copy")])
+
+        with pytest.raises(RegistryValidationError, match="id: 1 is already used by"):
+            JumpstartRegistry(tmp_path).load()
+
+    @patch("fabric_jumpstart.registry.logger")
+    def test_lenient_load_skips_invalid_entries(self, mock_logger, tmp_path):
+        _write_catalog(tmp_path, [_entry(), _entry(id=2, logical_id="broken", type="Workshop")])
+        (tmp_path / "community" / "garbled.yml").write_text("id: [unclosed", encoding="utf-8")
+
+        jumpstarts = JumpstartRegistry(tmp_path, strict=False).load()
+
+        assert [j["logical_id"] for j in jumpstarts] == ["demo"]
+        assert jumpstarts[0]["core"] is False
+        warnings = [c.args[0] for c in mock_logger.warning.call_args_list]
+        assert len(warnings) == 2
+        assert any("garbled.yml" in w and "invalid YAML" in w for w in warnings)
+
+    def test_results_are_cached_by_content(self, tmp_path):
+        _write_catalog(tmp_path, [_entry(), _entry(id=2, logical_id="other")])
+        with pytest.raises(TypeError):
+            JumpstartRegistry(tmp_path).load()[0]["is_new"] = True  # type: ignore[index]  # records are read-only
+        cache = get_validation_cache()
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        _write_catalog(tmp_path, [_entry(id=2, logical_id="other", name="Edited")])
+        jumpstarts = JumpstartRegistry(tmp_path).load()
+
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert "is_new" not in jumpstarts[0]
+
+
+def test_unchanged_catalog_reloads_from_the_cache(tmp_path):
+    """Reloading a federated-size catalog reuses every cached result and
+    re-validates only the files whose bytes changed."""
+    entries = [_entry(id=i, logical_id=f"entry-{i}", name=f"Entry {i}") for i in range(1, 501)]
+    _write_catalog(tmp_path, entries[:250], folder="core")
+    _write_catalog(tmp_path, entries[250:])
+    cache = get_validation_cache()
+
+    cold = JumpstartRegistry(tmp_path)._load_from_directory(tmp_path)
+    assert (cache.hits, cache.misses) == (0, 500)
+
+    with patch("fabric_jumpstart.validation.validate_entry", wraps=validate_entry) as mock_validate:
+        warm = JumpstartRegistry(tmp_path)._load_from_directory(tmp_path)
+    mock_validate.assert_not_called()
+    assert (cache.hits, cache.misses) == (500, 500)
+    assert len(cold) == len(warm) == 500
+
+    _write_catalog(tmp_path, [_entry(id=500, logical_id="entry-500", name="Edited")])
+    JumpstartRegistry(tmp_path)._load_from_directory(tmp_path)
+    assert (cache.hits, cache.misses) == (999, 501)
@@ -5,18 +5,25 @@
  * Uses puppeteer to replicate the exact same rendering pipeline as the
  * client-side MermaidDiagram component: mermaid.render() → enhanceDiagram().
  *
- * Outputs dark + light SVGs to assets/images/diagrams/.
+ * Outputs dark + light SVGs to assets/images/diagrams/. Rendering is
+ * incremental: a manifest (assets/images/diagrams/.render-manifest.json)
+ * records the hash of each diagram's mermaid source together with a
+ * fingerprint of the renderer (mermaid version, theme config, enhance.ts,
+ * icon data). Only new or changed diagrams are rendered, across a pool of
+ * browser pages, and SVGs for jumpstarts that no longer exist are pruned.
  *
- * Usage: npx tsx tools/render-diagrams.ts
+ * Usage: npx tsx tools/render-diagrams.ts [--force] [--concurrency N]
  */
 
+import * as crypto from 'crypto';
 import * as fs from 'fs';
+import * as os from 'os';
 import * as path from 'path';
 import * as yaml from 'js-yaml';
 import { glob } from 'glob';
 import { execSync } from 'child_process';
 import { fileURLToPath } from 'url';
-import puppeteer from 'puppeteer';
+import puppeteer, { type Browser, type Page } from 'puppeteer';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -28,7 +35,13 @@ const JUMPSTARTS_DIRS = [
   path.resolve(REPO_ROOT, 'src/fabric_jumpstart/fabric_jumpstart/jumpstarts/community'),
 ];
 const OUTPUT_DIR = path.resolve(REPO_ROOT, 'assets/images/diagrams');
+const PUBLIC_DIR = path.resolve(WEB_ROOT, 'public/images/diagrams');
 const ICONS_JSON = path.join(WEB_ROOT, 'src/data/fabric-item-icons.json');
+const MANIFEST_PATH = path.join(OUTPUT_DIR, '.render-manifest.json');
+// Bump when the render pipeline changes in a way the fingerprint can't see.
+const MANIFEST_VERSION = 1;
+const THEMES = ['light', 'dark'] as const;
+type ThemeName = (typeof THEMES)[number];
 
 /** Generate fabric-item-icons.json from @fabric-msft/svg-icons if stale/missing. */
 function ensureItemIconsJson(): void {
@@ -167,39 +180,93 @@ async function buildEnhancePayload(): Promise<{
   return { enhanceScript, itemIcons, itemDisplayNames };
 }
 
-async function main(): Promise<void> {
-  console.log('🎨 Rendering Mermaid mermaid_diagram diagrams...');
+/** Mermaid config — same as MermaidDiagram/index.tsx. */
+function mermaidConfig(dark: boolean): Record<string, unknown> {
+  return {
+    startOnLoad: false,
+    theme: 'base',
+    themeVariables: {
+      primaryColor: dark ? '#2a2a32' : '#f5f8fa',
+      primaryTextColor: dark ? '#e0e0e0' : '#242424',
+      primaryBorderColor: dark ? '#4a4a55' : '#c8c8c8',
+      lineColor: dark ? '#5a8a9a' : '#219580',
+      fontFamily: '"Segoe UI", -apple-system, BlinkMacSystemFont, sans-serif',
+      fontSize: '13px',
+    },
+    flowchart: {
+      useMaxWidth: false,
+      htmlLabels: true,
+      curve: 'basis',
+      padding: 22,
+      nodeSpacing: 70,
+      rankSpacing: 85,
+    },
+  };
+}
 
-  ensureItemIconsJson();
+function sha256(...parts: string[]): string {
+  const hash = crypto.createHash('sha256');
+  for (const part of parts) hash.update(part).update('\0');
+  return hash.digest('hex');
+}
 
-  const extraLibPath = ensureChromeLibs();
-  if (extraLibPath) {
-    process.env.LD_LIBRARY_PATH = extraLibPath +
-      (process.env.LD_LIBRARY_PATH ? ':' + process.env.LD_LIBRARY_PATH : '');
-  }
+interface ManifestEntry {
+  hash: string;
+  files: string[];
+}
 
-  const jumpstarts = loadJumpstarts();
-  console.log(`  Found ${jumpstarts.length} jumpstarts with mermaid_diagram diagrams`);
+interface RenderManifest {
+  version: number;
+  renderer: string;
+  diagrams: Record<string, ManifestEntry>;
+}
 
-  fs.mkdirSync(OUTPUT_DIR, { recursive: true });
+function loadManifest(): RenderManifest {
+  const empty: RenderManifest = { version: MANIFEST_VERSION, renderer: '', diagrams: {} };
+  if (!fs.existsSync(MANIFEST_PATH)) return empty;
+  try {
+    const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf8')) as RenderManifest;
+    return manifest.version === MANIFEST_VERSION ? manifest : empty;
+  } catch {
+    console.warn('  ⚠ Unreadable render manifest — rendering everything');
+    return empty;
+  }
+}
 
-  const payload = await buildEnhancePayload();
+function saveManifest(manifest: RenderManifest): void {
+  const sorted: Record<string, ManifestEntry> = {};
+  for (const id of Object.keys(manifest.diagrams).sort()) sorted[id] = manifest.diagrams[id];
+  fs.writeFileSync(MANIFEST_PATH, JSON.stringify({ ...manifest, diagrams: sorted }, null, 2) + '\n');
+}
 
-  // Launch browser
-  const browser = await puppeteer.launch({
-    headless: true,
-    args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu'],
-  });
+/**
+ * Fingerprint everything besides the mermaid source that affects the output,
+ * so upgrading mermaid or editing enhance.ts re-renders every diagram.
+ */
+function rendererFingerprint(payload: Awaited<ReturnType<typeof buildEnhancePayload>>): string {
+  const mermaidPkg = path.join(WEB_ROOT, 'node_modules/mermaid/package.json');
+  const mermaidVersion = JSON.parse(fs.readFileSync(mermaidPkg, 'utf8')).version as string;
+  return sha256(
+    mermaidVersion,
+    JSON.stringify(THEMES.map(t => mermaidConfig(t === 'dark'))),
+    payload.enhanceScript,
+    JSON.stringify(payload.itemIcons),
+    JSON.stringify(payload.itemDisplayNames)
+  );
+}
 
-  const page = await browser.newPage();
+function outputFiles(logicalId: string): string[] {
+  return THEMES.map(theme => `${logicalId}_${theme}.svg`);
+}
 
-  // Load Mermaid from node_modules
-  const mermaidJs = fs.readFileSync(
-    path.join(WEB_ROOT, 'node_modules/mermaid/dist/mermaid.min.js'),
-    'utf8'
-  );
+/** Load Mermaid and the enhance script into a fresh page. */
+async function setupPage(
+  browser: Browser,
+  mermaidJs: string,
+  payload: Awaited<ReturnType<typeof buildEnhancePayload>>
+): Promise<Page> {
+  const page = await browser.newPage();
 
-  // Set up the page with Mermaid + enhance logic
   await page.setContent(`<!DOCTYPE html>
     <html><head><style>body{margin:0;padding:0;}</style></head>
     <body><div id="container"></div></body></html>`);
@@ -228,90 +295,202 @@ async function main(): Promise<void> {
     payload.enhanceScript
   );
 
-  let success = 0;
-  let failed = 0;
+  return page;
+}
 
-  for (const js of jumpstarts) {
-    for (const isDark of [false, true]) {
-      const themeName = isDark ? 'dark' : 'light';
-      const outFile = path.join(OUTPUT_DIR, `${js.logicalId}_${themeName}.svg`);
-
-      try {
-        const svg = await page.evaluate(
-          async (chart: string, dark: boolean) => {
-            const mermaid = (window as Record<string, unknown>).mermaid as {
-              initialize: (cfg: Record<string, unknown>) => void;
-              render: (id: string, chart: string) => Promise<{ svg: string }>;
-            };
-            const enhance = (window as { enhanceDiagram?: (root: SVGSVGElement, chart: string, isDark: boolean) => void }).enhanceDiagram;
-
-            // Same config as MermaidDiagram/index.tsx
-            mermaid.initialize({
-              startOnLoad: false,
-              theme: 'base',
-              themeVariables: {
-                primaryColor: dark ? '#2a2a32' : '#f5f8fa',
-                primaryTextColor: dark ? '#e0e0e0' : '#242424',
-                primaryBorderColor: dark ? '#4a4a55' : '#c8c8c8',
-                lineColor: dark ? '#5a8a9a' : '#219580',
-                fontFamily: '"Segoe UI", -apple-system, BlinkMacSystemFont, sans-serif',
-                fontSize: '13px',
-              },
-              flowchart: {
-                useMaxWidth: false,
-                htmlLabels: true,
-                curve: 'basis',
-                padding: 22,
-                nodeSpacing: 70,
-                rankSpacing: 85,
-              },
-            });
-
-            const id = `diagram-${Date.now()}-${Math.random().toString(36).slice(2, 6)}`;
-            const container = document.getElementById('container')!;
-            // Strip :::Type from subgraph lines (Mermaid doesn't support it)
-            const mermaidChart = chart.replace(/^(\s*subgraph\s+.+?):::(\w+)\s*$/gm, '$1');
-            const { svg } = await mermaid.render(id, mermaidChart);
-            container.innerHTML = svg;
-
-            const svgEl = container.querySelector('svg') as SVGSVGElement;
-            if (svgEl && enhance) {
-              // Pass original chart so enhance can parse :::Type
-              enhance(svgEl, chart, dark);
-            }
+/**
+ * Render one theme of a diagram. The element id is derived from the source
+ * hash so unchanged input produces byte-identical SVGs across runs.
+ */
+async function renderSvg(page: Page, chart: string, theme: ThemeName, diagramId: string): Promise<string> {
+  const dark = theme === 'dark';
+  return page.evaluate(
+    async (chart: string, dark: boolean, config: Record<string, unknown>, id: string) => {
+      const mermaid = (window as Record<string, unknown>).mermaid as {
+        initialize: (cfg: Record<string, unknown>) => void;
+        render: (id: string, chart: string) => Promise<{ svg: string }>;
+      };
+      const enhance = (window as { enhanceDiagram?: (root: SVGSVGElement, chart: string, isDark: boolean) => void }).enhanceDiagram;
+
+      mermaid.initialize(config);
+
+      const container = document.getElementById('container')!;
+      // Strip :::Type from subgraph lines (Mermaid doesn't support it)
+      const mermaidChart = chart.replace(/^(\s*subgraph\s+.+?):::(\w+)\s*$/gm, '$1');
+      const { svg } = await mermaid.render(id, mermaidChart);
+      container.innerHTML = svg;
+
+      const svgEl = container.querySelector('svg') as SVGSVGElement;
+      if (svgEl && enhance) {
+        // Pass original chart so enhance can parse :::Type
+        enhance(svgEl, chart, dark);
+      }
+
+      return container.innerHTML;
+    },
+    chart,
+    dark,
+    mermaidConfig(dark),
+    `diagram-${diagramId}-${theme}`
+  );
+}
 
-            return container.innerHTML;
-          },
-          js.mermaid_diagram,
-          isDark
-        );
-
-        fs.writeFileSync(outFile, svg);
-        success++;
-      } catch (e) {
-        const msg = e instanceof Error ? e.message.split('\n')[0] : String(e);
-        console.error(`  ✗ ${js.logicalId} (${themeName}): ${msg}`);
-        failed++;
+/** Delete SVGs (in both output dirs) for jumpstarts that no longer have a diagram. */
+function pruneStale(manifest: RenderManifest, liveIds: Set<string>): number {
+  let pruned = 0;
+  for (const id of Object.keys(manifest.diagrams)) {
+    if (!liveIds.has(id)) delete manifest.diagrams[id];
+  }
+  for (const dir of [OUTPUT_DIR, PUBLIC_DIR]) {
+    if (!fs.existsSync(dir)) continue;
+    for (const f of fs.readdirSync(dir)) {
+      const match = f.match(/^(.+)_(light|dark)\.svg$/);
+      if (match && !liveIds.has(match[1])) {
+        fs.rmSync(path.join(dir, f));
+        if (dir === OUTPUT_DIR) pruned++;
       }
     }
-    console.log(`  ✓ ${js.logicalId}`);
   }
+  return pruned;
+}
 
-  await browser.close();
-
-  // Copy rendered SVGs to public directory for dev server
-  const PUBLIC_DIR = path.resolve(WEB_ROOT, 'public/images/diagrams');
+/** Mirror rendered SVGs into public/ for the dev server, copying only what differs. */
+function syncPublicDir(): number {
   fs.mkdirSync(PUBLIC_DIR, { recursive: true });
-  const svgFiles = fs.readdirSync(OUTPUT_DIR).filter(f => f.endsWith('.svg'));
-  for (const f of svgFiles) {
-    fs.copyFileSync(path.join(OUTPUT_DIR, f), path.join(PUBLIC_DIR, f));
+  let copied = 0;
+  for (const f of fs.readdirSync(OUTPUT_DIR).filter(f => f.endsWith('.svg'))) {
+    const src = path.join(OUTPUT_DIR, f);
+    const dest = path.join(PUBLIC_DIR, f);
+    if (fs.existsSync(dest) && fs.readFileSync(dest).equals(fs.readFileSync(src))) continue;
+    fs.copyFileSync(src, dest);
+    copied++;
   }
+  return copied;
+}
+
+function parseArgs(argv: string[]): { force: boolean; concurrency: number } {
+  let force = false;
+  let concurrency = Math.min(4, os.cpus().length || 1);
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--force') force = true;
+    else if (argv[i] === '--concurrency') concurrency = Math.max(1, parseInt(argv[++i], 10) || 1);
+  }
+  return { force, concurrency };
+}
+
+async function main(): Promise<void> {
+  const args = parseArgs(process.argv.slice(2));
+  console.log('🎨 Rendering Mermaid mermaid_diagram diagrams...');
+
+  ensureItemIconsJson();
+
+  const jumpstarts = loadJumpstarts();
+  console.log(`  Found ${jumpstarts.length} jumpstarts with mermaid_diagram diagrams`);
+
+  fs.mkdirSync(OUTPUT_DIR, { recursive: true });
+
+  const payload = await buildEnhancePayload();
+  const renderer = rendererFingerprint(payload);
+  const manifest = loadManifest();
+  if (manifest.renderer !== renderer) {
+    if (manifest.renderer) console.log('  Renderer changed — re-rendering all diagrams');
+    manifest.renderer = renderer;
+    manifest.diagrams = {};
+  }
+
+  const pruned = pruneStale(manifest, new Set(jumpstarts.map(js => js.logicalId)));
+
+  // A diagram is current when its source hash matches and its files still exist.
+  const pending = jumpstarts
+    .map(js => ({ ...js, hash: sha256(js.mermaid_diagram) }))
+    .filter(js => {
+      const entry = manifest.diagrams[js.logicalId];
+      return (
+        args.force ||
+        !entry ||
+        entry.hash !== js.hash ||
+        !outputFiles(js.logicalId).every(f => fs.existsSync(path.join(OUTPUT_DIR, f)))
+      );
+    });
+
+  let success = 0;
+  let failed = 0;
+
+  if (pending.length === 0) {
+    console.log('  All diagrams up to date');
+  } else {
+    console.log(`  Rendering ${pending.length} new or changed diagrams`);
+
+    const extraLibPath = ensureChromeLibs();
+    if (extraLibPath) {
+      process.env.LD_LIBRARY_PATH = extraLibPath +
+        (process.env.LD_LIBRARY_PATH ? ':' + process.env.LD_LIBRARY_PATH : '');
+    }
+
+    // Load Mermaid from node_modules
+    const mermaidJs = fs.readFileSync(
+      path.join(WEB_ROOT, 'node_modules/mermaid/dist/mermaid.min.js'),
+      'utf8'
+    );
+
+    // Launch browser
+    const browser = await puppeteer.launch({
+      headless: true,
+      args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu'],
+    });
+
+    try {
+      const poolSize = Math.min(args.concurrency, pending.length);
+      const pages = await Promise.all(
+        Array.from({ length: poolSize }, () => setupPage(browser, mermaidJs, payload))
+      );
+
+      // Each page pulls the next diagram from the shared queue until it's drained.
+      const queue = [...pending];
+      await Promise.all(
+        pages.map(async page => {
+          for (let js = queue.shift(); js; js = queue.shift()) {
+            const rendered: Partial<Record<ThemeName, string>> = {};
+            let ok = true;
+            for (const theme of THEMES) {
+              try {
+                rendered[theme] = await renderSvg(page, js.mermaid_diagram, theme, js.hash.slice(0, 12));
+                success++;
+              } catch (e) {
+                const msg = e instanceof Error ? e.message.split('\n')[0] : String(e);
+                console.error(`  ✗ ${js.logicalId} (${theme}): ${msg}`);
+                failed++;
+                ok = false;
+              }
+            }
+            for (const theme of THEMES) {
+              const svg = rendered[theme];
+              if (svg !== undefined) fs.writeFileSync(path.join(OUTPUT_DIR, `${js.logicalId}_${theme}.svg`), svg);
+            }
+            // Failed diagrams stay out of the manifest so the next run retries them.
+            if (ok) {
+              manifest.diagrams[js.logicalId] = { hash: js.hash, files: outputFiles(js.logicalId) };
+              console.log(`  ✓ ${js.logicalId}`);
+            } else {
+              delete manifest.diagrams[js.logicalId];
+            }
+          }
+        })
+      );
+    } finally {
+      await browser.close();
+    }
+  }
+
+  saveManifest(manifest);
+
+  const copied = syncPublicDir();
 
   console.log(
-    `✅ Rendered ${success} SVGs (${failed} failed) to ${path.relative(REPO_ROOT, OUTPUT_DIR)}/`
+    `✅ Rendered ${success} SVGs (${failed} failed, ${jumpstarts.length - pending.length} unchanged, ${pruned} stale SVGs pruned) in ${path.relative(REPO_ROOT, OUTPUT_DIR)}/`
   );
   console.log(
-    `   Copied ${svgFiles.length} SVGs to ${path.relative(REPO_ROOT, PUBLIC_DIR)}/`
+    `   Copied ${copied} SVGs to ${path.relative(REPO_ROOT, PUBLIC_DIR)}/`
   );
 }
 